@@ -3,15 +3,20 @@ CCTV/MJPEG App for Picoware
 Copyright (c) 2026 JBlanked
 GPL-3.0 License
 https://www.github.com/jblanked/Picoware
-Last Updated: 2026-03-01
+Last Updated: 2026-10-19
 
 Users need a word list of CCTV stream URLs in "picoware/cctv/list.txt" on the device's storage, with one URL per line.
 The app connects to each URL in turn and displays the MJPEG stream.
 Use the UP/DOWN or LEFT/RIGHT buttons to switch between cameras, and BACK to exit.
 
 In my testing I saw 113kb frames so its possible on the Pico2W and Pimoroni 2W only... although so endpoints may have smaller frames
+
+With PSRAM, frames are received into two slots: while the second core decodes
+one frame, the next one is received into the other slot, and frames that
+arrive faster than they can be decoded are dropped (only the newest is kept).
 """
 
+from micropython import const
 from picoware.system.buttons import (
     BUTTON_BACK,
     BUTTON_UP,
@@ -19,8 +24,7 @@ from picoware.system.buttons import (
     BUTTON_LEFT,
     BUTTON_RIGHT,
 )
-from picoware.system.vector import Vector
-from gc import mem_alloc, mem_free
+from gc import mem_free
 
 tv_list = []
 
@@ -30,6 +34,31 @@ _cctv = None
 _psram = None
 _frame_addr = 0
 MAX_FRAME_SIZE = 320000
+HEAP_FRAME_SIZE = 65536  # largest frame on boards without PSRAM
+
+# receive buffer and multipart parser states
+_RX_SIZE = const(4096)
+_PART_BOUNDARY = const(0)  # looking for the boundary line
+_PART_HEADERS = const(1)  # reading the part headers
+_PART_BODY = const(2)  # reading Content-Length bytes
+_PART_SCAN = const(3)  # no Content-Length: reading up to the next boundary
+_EAGAIN = const(11)
+_ETIMEDOUT = const(110)
+
+# frame slots: (psram, address or heap buffer, size) per slot
+_slots = []
+_recv_slot = -1
+_ready_slot = -1
+_ready_size = 0
+_decoding_slot = -1
+_heap_frame = None
+_jpeg = None
+_top = 0
+
+# achieved frame rate, in tenths of a frame per second
+_fps = 0
+_fps_frames = 0
+_fps_start = 0
 
 
 class PSRAMReader:
@@ -76,24 +105,81 @@ class PSRAMReader:
         return data
 
 
+class BufferReader(PSRAMReader):
+    """File-like reader over the first *size* bytes of a heap buffer."""
+
+    def __init__(self, buffer, size: int):
+        super().__init__(None, 0, size)
+        self._buffer = memoryview(buffer)
+
+    def readinto(self, buf) -> int:
+        n = min(len(buf), self._size - self._pos)
+        if n <= 0:
+            return 0
+        buf[:n] = self._buffer[self._pos : self._pos + n]
+        self._pos += n
+        return n
+
+    def read(self, n: int = -1) -> bytes:
+        avail = self._size - self._pos
+        if avail <= 0:
+            return b""
+        if n < 0 or n > avail:
+            n = avail
+        data = bytes(self._buffer[self._pos : self._pos + n])
+        self._pos += n
+        return data
+
+
 class CCTV:
-    """Class to manage MJPEG socket connection and frame retrieval from a CCTV stream."""
+    """Class to manage MJPEG socket connection and frame retrieval from a CCTV stream.
+
+    The stream is read through one receive buffer and parsed as multipart
+    parts: lines are split in the buffer, Content-Length bodies are copied
+    out in buffer-sized chunks, and bodies without a length are cut at the
+    next boundary, searched a buffer at a time. Frames are written to the
+    target set with set_target() (a PSRAM region or a heap buffer).
+    """
 
     def __init__(self):
         self._sock = None
         self._boundary = b"--frame"
         self._error_msg = ""
         self._is_running = False
+        self._rx = bytearray(_RX_SIZE)
+        self._rx_pos = 0
+        self._rx_end = 0
+        self._blocking = True
+        self._state = _PART_BOUNDARY
+        self._length = 0
+        self._received = 0
+        self._oversize = False
+        self._dropped = 0
+        self._target_psram = None
+        self._target = None
+        self._target_size = 0
 
     def __del__(self):
         self.close_socket()
         self._sock = None
+        self._rx = None
+        self._target = None
 
     @property
     def boundary(self) -> bytes:
         """Boundary string used to separate MJPEG frames. Default is b"--frame"."""
         return self._boundary
 
+    @property
+    def dropped(self) -> int:
+        """Frames discarded (too large, or replaced by a newer frame before being shown)."""
+        return self._dropped
+
+    @dropped.setter
+    def dropped(self, value: int):
+        """Set the dropped frame count."""
+        self._dropped = value
+
     @property
     def is_connected(self) -> bool:
         """True if the socket is currently connected."""
@@ -119,6 +205,57 @@ class CCTV:
         """The underlying socket object, or None if not connected."""
         return self._sock
 
+    def __fill(self, block: bool) -> int:
+        """Receive into the buffer. Returns bytes added, 0 if none are waiting, -1 on error."""
+        rx = self._rx
+        if self._rx_pos:
+            remaining = self._rx_end - self._rx_pos
+            rx[:remaining] = rx[self._rx_pos : self._rx_end]
+            self._rx_pos = 0
+            self._rx_end = remaining
+        if block != self._blocking:
+            self._sock.settimeout(10 if block else 0)
+            self._blocking = block
+        try:
+            n = self._sock.readinto(memoryview(rx)[self._rx_end :])
+        except OSError as e:
+            if not block and e.args and e.args[0] in (_EAGAIN, _ETIMEDOUT):
+                return 0
+            self._error_msg = str(e)
+            return -1
+        if n is None:
+            return 0  # non-blocking and nothing waiting
+        if n == 0:
+            self._error_msg = "Connection closed"
+            return -1
+        self._rx_end += n
+        return n
+
+    def __line(self):
+        """Take one line (without CR/LF) from the buffer, or None if it is incomplete."""
+        rx = self._rx
+        end = rx.find(b"\n", self._rx_pos, self._rx_end)
+        if end < 0:
+            if self._rx_pos == 0 and self._rx_end == len(rx):
+                self._rx_end = 0  # not a header line, drop it
+            return None
+        stop = end - 1 if end > self._rx_pos and rx[end - 1] == 0x0D else end
+        line = bytes(rx[self._rx_pos : stop])
+        self._rx_pos = end + 1
+        return line
+
+    def __store(self, view) -> None:
+        """Write received body bytes to the frame target."""
+        n = len(view)
+        offset = self._received
+        if offset + n > self._target_size:
+            self._oversize = True
+        elif self._target_psram is not None:
+            self._target_psram.write(self._target + offset, view)
+        else:
+            self._target[offset : offset + n] = view
+        self._received = offset + n
+
     def close_socket(self):
         """Close the socket if it's open"""
         if self._sock is not None:
@@ -127,17 +264,26 @@ class CCTV:
             except Exception:
                 pass
             self._sock = None
+        self._rx_pos = 0
+        self._rx_end = 0
+        self._state = _PART_BOUNDARY
 
-    def connect(self, url: str) -> bool:
+    def connect(self, url: str, width: int = 320, height: int = 240) -> bool:
         """Open the MJPEG socket and consume HTTP response headers."""
         import usocket as socket
 
         try:
             self._is_running = True
             host, port, path = self._decode_url(url)
-            path += "?width=320&height=240"
+            path += "{}width={}&height={}".format(
+                "&" if "?" in path else "?", width, height
+            )
             self._sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             self._sock.settimeout(10)
+            self._blocking = True
+            self._rx_pos = 0
+            self._rx_end = 0
+            self._state = _PART_BOUNDARY
             addr = socket.getaddrinfo(host, port)[0][-1]
             self._sock.connect(addr)
 
@@ -152,9 +298,13 @@ class CCTV:
                 if not self._is_running:
                     self.close_socket()
                     return False
-                line = self._readline()
-                if line is None or line == b"":
-                    break  # None = error, b"" = blank line (end of headers)
+                line = self.__line()
+                if line is None:
+                    if self.__fill(True) < 0:
+                        break
+                    continue
+                if line == b"":
+                    break  # blank line = end of headers
                 lower = line.lower()
                 if b"boundary=" in lower:
                     idx = lower.find(b"boundary=") + 9
@@ -174,9 +324,9 @@ class CCTV:
             self.close_socket()
             return False
 
-    def next_frame(self):
+    def receive(self, block: bool = True) -> int:
         """
-        Read the next JPEG frame from the open MJPEG socket.
+        Advance the frame being received into the target.
 
         Server format (per frame):
             --frame\\r\\n
@@ -184,63 +334,79 @@ class CCTV:
             Content-Length: <n>\\r\\n
             \\r\\n
             <JPEG bytes>\\r\\n
-        """
 
-        if self._sock is None:
-            return None
+        Args:
+            block: Wait for data; False only uses what has already arrived
 
-        try:
-            # Consume lines until a boundary marker
-            for _ in range(64):  # safety cap to avoid infinite loop
-                if not self._is_running:
-                    return None
-                line = self._readline()
-                if line is None:
-                    return None  # connection closed / error
-                if line.startswith(b"--"):
-                    break
-            else:
-                return None  # never found boundary
+        Returns:
+            Size of the completed frame, 0 if more data is needed, or -1 on error
+        """
+        if self._sock is None:
+            return -1
 
-            # Read part headers
-            content_length = 0
-            for _ in range(16):
-                if not self._is_running:
-                    return None
-                line = self._readline()
-                if line is None:
-                    return None
-                if line == b"":
-                    break  # blank line = body follows
-                if line.lower().startswith(b"content-length:"):
-                    try:
-                        content_length = int(line.split(b":", 1)[1].strip())
-                    except ValueError:
-                        pass
-
-            # Read JPEG payload
-            if content_length > 0:
-                data = self._read_exactly_to_psram(
-                    content_length, _psram, _frame_addr, MAX_FRAME_SIZE
-                )
+        rx = self._rx
+        while self._is_running:
+            state = self._state
+            if state == _PART_BODY or state == _PART_SCAN:
+                pos = self._rx_pos
+                end = self._rx_end
+                if state == _PART_BODY:
+                    take = min(end - pos, self._length - self._received)
+                    done = self._received + take >= self._length
+                else:
+                    mark = rx.find(self._boundary, pos, end)
+                    done = mark >= 0
+                    if done:
+                        take = mark - pos
+                    else:
+                        # a boundary may straddle the end of the buffer
+                        take = max(0, end - len(self._boundary) + 1 - pos)
+                if take:
+                    self.__store(memoryview(rx)[pos : pos + take])
+                    self._rx_pos = pos + take
+                if done:
+                    self._state = _PART_BOUNDARY
+                    if self._oversize or self._received <= 4:
+                        self._dropped += 1
+                        continue
+                    return self._received
             else:
-                # Fallback: accumulate until JPEG EOI marker FF D9
-                buf = bytearray()
-                while len(buf) < 65536:  # 64 KB safety cap
-                    if not self._is_running:
-                        return None
-                    b = self._sock.read(1)
-                    if not b:
-                        break
-                    buf += b
-                    if len(buf) >= 2 and buf[-2] == 0xFF and buf[-1] == 0xD9:
-                        break
-                data = bytes(buf) if buf else None
-
-            return data if data and len(data) > 4 else None
+                line = self.__line()
+                if line is not None:
+                    if state == _PART_BOUNDARY:
+                        if line.startswith(b"--"):
+                            self._state = _PART_HEADERS
+                            self._length = 0
+                    elif line:
+                        if line[:15].lower() == b"content-length:":
+                            try:
+                                self._length = int(line[15:].strip())
+                            except ValueError:
+                                pass
+                    else:
+                        # blank line = body follows
+                        self._received = 0
+                        self._oversize = False
+                        self._state = _PART_BODY if self._length > 0 else _PART_SCAN
+                    continue
+
+            got = self.__fill(block)
+            if got <= 0:
+                return got
+        return -1
+
+    def set_target(self, psram, target, size: int) -> None:
+        """
+        Set where the next frame is written (call between frames only).
 
-        except OSError:
-            return None
+        Args:
+            psram: The PSRAM instance, or None to write to a heap buffer
+            target: PSRAM address, or the heap buffer
+            size: Capacity in bytes; larger frames are dropped
+        """
+        self._target_psram = psram
+        self._target = target
+        self._target_size = size
 
     def _decode_url(self, url) -> (str, int, str):
         """Parse a URL into (host, port, path). Port defaults to 80 if not specified."""
@@ -255,138 +421,6 @@ class CCTV:
             return host, port, path
         raise ValueError("Invalid URL format: {}".format(url))
 
-    def _readline(self):
-        """Read one CRLF-terminated line (byte-at-a-time). Returns bytes or None on error."""
-        line = bytearray()
-        try:
-            while True:
-                if not self._is_running:
-                    return None
-                ch = self._sock.read(1)
-                if not ch:
-                    return None  # EOF / connection closed
-                if ch == b"\n":
-                    break
-                if ch != b"\r":
-                    line += ch
-        except OSError:
-            return None
-        return bytes(line)
-
-    def _read_exactly(self, n):
-        """Read exactly *n* bytes. Returns bytes or None on error."""
-        buf = bytearray(n)
-        view = memoryview(buf)
-        received = 0
-        try:
-            while received < n:
-                if not self._is_running:
-                    return None
-                chunk = self._sock.readinto(view[received:], n - received)
-                if not chunk:
-                    return None
-                received += chunk
-        except OSError:
-            return None
-        return bytes(buf)
-
-    def _read_exactly_to_psram(
-        self, n: int, psram, addr: int, chunk_size: int = 2048
-    ) -> int:
-        """Stream exactly *n* bytes directly into PSRAM. Returns bytes written or -1 on error."""
-        chunk_buf = bytearray(chunk_size)
-        view = memoryview(chunk_buf)
-        received = 0
-        try:
-            while received < n:
-                if not self._is_running:
-                    return -1
-                to_read = min(chunk_size, n - received)
-                got = self._sock.readinto(view[:to_read])
-                if not got:
-                    return -1
-                psram.write(addr + received, view[:got])
-                received += got
-        except OSError:
-            return -1
-        return received
-
-    def next_frame_to_psram(
-        self, psram, addr: int, max_size: int = MAX_FRAME_SIZE
-    ) -> int:
-        """Read the next JPEG frame directly into PSRAM.
-
-        Streams the payload chunk-by-chunk so the full frame is never on heap.
-        Returns the number of bytes written, or -1 on failure.
-        """
-        if self._sock is None:
-            return -1
-
-        try:
-            # Find boundary marker
-            for _ in range(64):
-                if not self._is_running:
-                    return -1
-                line = self._readline()
-                if line is None:
-                    return -1
-                if line.startswith(b"--"):
-                    break
-            else:
-                return -1
-
-            # Read part headers
-            content_length = 0
-            for _ in range(16):
-                if not self._is_running:
-                    return -1
-                line = self._readline()
-                if line is None:
-                    return -1
-                if line == b"":
-                    break
-                if line.lower().startswith(b"content-length:"):
-                    try:
-                        content_length = int(line.split(b":", 1)[1].strip())
-                    except ValueError:
-                        pass
-
-            if content_length > 0 and content_length <= max_size:
-                return self._read_exactly_to_psram(content_length, psram, addr)
-
-            # Fallback: stream byte-by-byte watching for JPEG EOI (FF D9)
-            chunk = bytearray(256)
-            cpos = 0
-            written = 0
-            prev_byte = 0
-            try:
-                while written + cpos < max_size:
-                    if not self._is_running:
-                        return -1
-                    b = self._sock.read(1)
-                    if not b:
-                        break
-                    byte_val = b[0]
-                    found_eoi = prev_byte == 0xFF and byte_val == 0xD9
-                    chunk[cpos] = byte_val
-                    cpos += 1
-                    if cpos >= 256 or found_eoi:
-                        psram.write(addr + written, memoryview(chunk)[:cpos])
-                        written += cpos
-                        cpos = 0
-                        if found_eoi:
-                            break
-                    prev_byte = byte_val
-                if cpos > 0:
-                    psram.write(addr + written, memoryview(chunk)[:cpos])
-                    written += cpos
-            except OSError:
-                return -1
-            return written if written > 4 else -1
-
-        except OSError:
-            return -1
-
 
 class CCTVAsync:
     """Async CCTV: connects in a background thread, reads frames from the main thread."""
@@ -404,6 +438,11 @@ class CCTVAsync:
         """Boundary string used to separate MJPEG frames. Default is b"--frame"."""
         return self._cctv.boundary
 
+    @property
+    def dropped(self) -> int:
+        """Frames received but never shown."""
+        return self._cctv.dropped
+
     @property
     def error_msg(self) -> str:
         """Error message from the last operation, if any."""
@@ -425,14 +464,15 @@ class CCTVAsync:
         self._connected = False
         self._cctv.is_running = False
         self._cctv.close_socket()
+        self._cctv.dropped = 0
         self._frame_count = 0
         self._connect_error = ""
 
-    def connect(self, url):
+    def connect(self, url, width: int = 320, height: int = 240):
         """Connect to the MJPEG stream in a background thread.
 
         The thread performs only the blocking connection handshake.
-        Once connected, call next_frame() from the main loop to read frames.
+        Once connected, call receive() from the main loop to read frames.
         """
         self._running = True
         self._connected = False
@@ -443,12 +483,8 @@ class CCTVAsync:
             self._cctv.is_running = True
             if not self._running:
                 return
-            if self._cctv.connect(url):
+            if self._cctv.connect(url, width, height):
                 if self._running:
-                    try:
-                        self._cctv._sock.settimeout(10)
-                    except Exception:
-                        pass
                     self._connected = True
                 else:
                     self._cctv.close_socket()
@@ -469,32 +505,97 @@ class CCTVAsync:
 
             _thread.start_new_thread(_connect_task, ())
 
-    def next_frame(self):
-        """Read the next JPEG frame (called from the main thread).
+    def drop(self) -> None:
+        """Count a received frame that was replaced before being shown."""
+        self._cctv.dropped += 1
 
-        Returns frame bytes, or None if not connected / no data yet.
-        """
-        if not self._connected or not self._running:
-            return None
-        frame = self._cctv.next_frame()
-        if frame:
-            self._frame_count += 1
-        return frame
-
-    def next_frame_to_psram(
-        self, psram, addr: int, max_size: int = MAX_FRAME_SIZE
-    ) -> int:
-        """Stream the next JPEG frame directly into PSRAM.
+    def receive(self, block: bool = True) -> int:
+        """Receive into the current target (called from the main thread).
 
-        Returns the number of bytes written, or -1 if not connected / error.
+        Returns the size of a completed frame, 0 if it is still incomplete,
+        or -1 if not connected / error.
         """
         if not self._connected or not self._running:
             return -1
-        size = self._cctv.next_frame_to_psram(psram, addr, max_size)
+        size = self._cctv.receive(block)
         if size > 0:
             self._frame_count += 1
         return size
 
+    def set_target(self, psram, target, size: int) -> None:
+        """Set where the next frame is written (a PSRAM address or a heap buffer)."""
+        self._cctv.set_target(psram, target, size)
+
+
+def __free_slot() -> int:
+    """Return a slot that is neither ready nor being decoded, or -1."""
+    for i in range(len(_slots)):
+        if i != _ready_slot and i != _decoding_slot:
+            return i
+    return -1
+
+
+def __idle() -> None:
+    """Receive the next frame while the second core decodes."""
+    __receive(False)
+
+
+def __receive(block: bool) -> int:
+    """
+    Receive frames into the free slot, keeping only the newest complete one.
+
+    After the first completed frame only data that has already arrived is
+    used, so a stream that outruns the decoder drops its older frames.
+
+    Returns:
+        -1 on error, otherwise 0
+    """
+    global _recv_slot, _ready_slot, _ready_size
+
+    while True:
+        if _recv_slot < 0:
+            _recv_slot = __free_slot()
+            if _recv_slot < 0:
+                return 0  # every slot is in use until the decoder finishes
+            psram, target, size = _slots[_recv_slot]
+            _cctv.set_target(psram, target, size)
+        size = _cctv.receive(block)
+        if size <= 0:
+            return size
+        if _ready_slot >= 0:
+            _cctv.drop()  # never shown, the newer frame replaces it
+        _ready_slot = _recv_slot
+        _ready_size = size
+        _recv_slot = -1
+        block = False
+
+
+def __reset_slots() -> None:
+    """Forget received frames (on reconnect)."""
+    global _recv_slot, _ready_slot, _decoding_slot, _fps, _fps_frames, _fps_start
+    from utime import ticks_ms
+
+    _recv_slot = -1
+    _ready_slot = -1
+    _decoding_slot = -1
+    _fps = 0
+    _fps_frames = 0
+    _fps_start = ticks_ms()
+
+
+def __update_fps() -> None:
+    """Count a shown frame and refresh the frame rate about once a second."""
+    global _fps, _fps_frames, _fps_start
+    from utime import ticks_ms, ticks_diff
+
+    _fps_frames += 1
+    now = ticks_ms()
+    elapsed = ticks_diff(now, _fps_start)
+    if elapsed >= 1000:
+        _fps = _fps_frames * 10000 // elapsed
+        _fps_frames = 0
+        _fps_start = now
+
 
 def load_tv_list(storage):
     """Load the list of CCTV URLs from storage."""
@@ -555,8 +656,8 @@ def start(view_manager):
     _streaming = False
     _tv_index = 0
 
-    # Reserve a PSRAM address region for the frame buffer if the board supports it
-    global _psram, _frame_addr
+    # Reserve two PSRAM frame slots if the board supports it
+    global _psram, _frame_addr, _slots, _heap_frame
     _psram = None
     _frame_addr = 0
     if view_manager.has_psram:
@@ -570,10 +671,30 @@ def start(view_manager):
             _psram = None
             _frame_addr = 0
 
+    if _psram and _frame_addr:
+        _slots = [
+            (_psram, _frame_addr, MAX_FRAME_SIZE),
+            (_psram, _frame_addr + MAX_FRAME_SIZE, MAX_FRAME_SIZE),
+        ]
+    else:
+        # one heap slot: receive and decode take turns
+        _heap_frame = bytearray(HEAP_FRAME_SIZE)
+        _slots = [(None, _heap_frame, HEAP_FRAME_SIZE)]
+    __reset_slots()
+
     draw = view_manager.draw
     fg = view_manager.foreground_color
     bg = view_manager.background_color
 
+    # frames are decoded below the status bar, scaled by JPEGDEC (1/2, 1/4
+    # or 1/8) to fit and centred in the space left
+    global _jpeg, _top
+    from picoware.gui.jpeg import JPEG
+
+    _top = draw.scale(5, 5)[1] * 16
+    _jpeg = JPEG(screen_width=draw.width, screen_height=draw.height - _top)
+    _jpeg._init_buffers()
+
     _status(draw, fg, bg, "CCTV Viewer", "Starting...")
 
     return True
@@ -581,7 +702,7 @@ def start(view_manager):
 
 def run(view_manager):
     """Run the CCTV viewer — called repeatedly by the ViewManager loop."""
-    global _streaming, _tv_index
+    global _streaming, _tv_index, _ready_slot, _decoding_slot
 
     draw = view_manager.draw
     fg = view_manager.foreground_color
@@ -615,7 +736,8 @@ def run(view_manager):
             "Connecting...",
             tv_list[_tv_index],
         )
-        _cctv.connect(tv_list[_tv_index])
+        __reset_slots()
+        _cctv.connect(tv_list[_tv_index], draw.width, draw.height - _top)
         _streaming = True
         return
 
@@ -647,127 +769,80 @@ def run(view_manager):
             )
         return
 
-    if _psram and _frame_addr:
-        frame_size = _cctv.next_frame_to_psram(_psram, _frame_addr, MAX_FRAME_SIZE)
-
-        if frame_size <= 0:
-            if _cctv.error_msg:
-                err = _cctv.error_msg
-                _status(
-                    draw,
-                    fg,
-                    bg,
-                    "CCTV Viewer",
-                    "Stream lost:",
-                    err[:36],
-                    "BACK to exit",
-                )
-                _cctv.close()
-                _streaming = False
-            else:
-                _status(
-                    draw,
-                    fg,
-                    bg,
-                    "CCTV Viewer",
-                    "Waiting for frame...",
-                    "Frame #{}".format(_cctv.frame_count + 1),
-                    "BACK to exit",
-                )
-            return
-
-        _status(
-            draw,
-            fg,
-            bg,
-            f"CCTV Viewer {mem_alloc() // 1024} KB used",
-            "Decoding... (PSRAM)",
-            "Frame #{} ({} B)".format(_cctv.frame_count, frame_size),
-        )
-        try:
-            from picoware.gui.jpeg import JPEG
+    # wait for a frame unless one arrived while the last one was decoded,
+    # then take whatever else has arrived so only the newest is shown
+    if _ready_slot < 0:
+        __receive(True)
+    else:
+        __receive(False)
 
-            jpeg = JPEG(screen_width=draw.width, screen_height=draw.height)
-            jpeg._init_buffers()
-            reader = PSRAMReader(_psram, _frame_addr, frame_size)
-            _pos = draw.scale(40, 120)
-            jpeg._decode_split(reader, frame_size, _pos[0], _pos[1])
-        except Exception as e:
+    if _ready_slot < 0:
+        if _cctv.error_msg:
+            err = _cctv.error_msg
             _status(
                 draw,
                 fg,
                 bg,
                 "CCTV Viewer",
-                "Decode failed...{}".format(e),
-                "Frame #{}".format(_cctv.frame_count),
-                "Size: {} B".format(frame_size),
-                tv_list[_tv_index],
+                "Stream lost:",
+                err[:36],
                 "BACK to exit",
             )
-            return
-    else:
-        # Heap fallback for boards without PSRAM
-        frame = _cctv.next_frame()
-
-        if frame is None:
-            if _cctv.error_msg:
-                err = _cctv.error_msg
-                _status(
-                    draw,
-                    fg,
-                    bg,
-                    "CCTV Viewer",
-                    "Stream lost:",
-                    err[:36],
-                    "BACK to exit",
-                )
-                _cctv.close()
-                _streaming = False
-            else:
-                _status(
-                    draw,
-                    fg,
-                    bg,
-                    "CCTV Viewer",
-                    "Waiting for frame...",
-                    "Frame #{}".format(_cctv.frame_count + 1),
-                    "BACK to exit",
-                )
-            return
-        _status(
-            draw,
-            fg,
-            bg,
-            "CCTV Viewer",
-            "Decoding...",
-            "Frame #{} ({} B)".format(_cctv.frame_count, len(frame)),
-            "Heap free: {} B".format(mem_free()),
-        )
-        try:
-            _pos = draw.scale(40, 120)
-            draw.image_jpeg_buffer(Vector(_pos[0], _pos[1]), frame)
-        except Exception:
+            _cctv.close()
+            _streaming = False
+        else:
             _status(
                 draw,
                 fg,
                 bg,
                 "CCTV Viewer",
-                "Decode failed...",
-                "Frame #{}".format(_cctv.frame_count),
-                "Size: {} B".format(len(frame)),
-                tv_list[_tv_index],
+                "Waiting for frame...",
+                "Frame #{}".format(_cctv.frame_count + 1),
                 "BACK to exit",
             )
-            return
+        return
+
+    _decoding_slot = _ready_slot
+    _ready_slot = -1
+    frame_size = _ready_size
+    psram, target, _ = _slots[_decoding_slot]
+    try:
+        if psram is not None:
+            reader = PSRAMReader(psram, target, frame_size)
+        else:
+            reader = BufferReader(target, frame_size)
+        # with a second slot, the next frame is received during the decode
+        _jpeg._decode_split(
+            reader, frame_size, 0, _top, __idle if len(_slots) > 1 else None
+        )
+    except Exception as e:
+        _jpeg._cleanup()
+        _status(
+            draw,
+            fg,
+            bg,
+            "CCTV Viewer",
+            "Decode failed...{}".format(e),
+            "Frame #{}".format(_cctv.frame_count),
+            "Size: {} B".format(frame_size),
+            tv_list[_tv_index],
+            "BACK to exit",
+        )
+        return
+    finally:
+        _decoding_slot = -1
+
+    __update_fps()
     _status(
         draw,
         fg,
         bg,
-        f"CCTV Viewer {mem_alloc() // 1024} KB used",
-        "Displaying...",
-        "Frame #{}".format(_cctv.frame_count),
+        "CCTV Viewer {}.{} fps".format(_fps // 10, _fps % 10),
+        "Frame #{} ({} B), {} dropped".format(
+            _cctv.frame_count, frame_size, _cctv.dropped
+        ),
+        "PSRAM" if psram is not None else "Heap free: {} B".format(mem_free()),
     )
-    draw.swap()
 
 
 def stop(view_manager):
@@ -775,12 +850,20 @@ def stop(view_manager):
     from gc import collect
 
     global _cctv, _streaming, _tv_index, tv_list, _psram, _frame_addr
+    global _slots, _heap_frame, _jpeg
 
     if _cctv:
         _cctv.close()
         del _cctv
         _cctv = None
 
+    if _jpeg:
+        _jpeg._cleanup()
+        _jpeg = None
+
+    _slots = []
+    _heap_frame = None
+
     if _psram:
         _psram.collect()
         del _psram
@@ -1,7 +1,6 @@
 # picoware/apps/Github Downloader.py
 
 from micropython import const
-from json import loads
 from picoware.system.buttons import BUTTON_BACK
 
 STATE_KEYBOARD_AUTHOR = const(0)
@@ -60,18 +59,18 @@ def __parse_repo_info(view_manager) -> bool:
 
     _http.close()
 
-    # Read entire file at once
-    file_content = storage.read(file_path)
-    if not file_content:
-        print("Failed to read repository info file")
-        return False
+    from picoware.system.json_stream import JSONStream
 
-    # Parse the JSON to get the tree array
+    # Stream the tree entries one at a time; recursive trees of large
+    # repositories are several MB and do not fit in RAM as a whole
     try:
-        data = loads(file_content)
-        tree = data.get("tree", [])
+        stream = JSONStream(file_path, storage)
+    except OSError as e:
+        print(f"Failed to read repository info file: {e}")
+        return False
 
-        for entry in tree:
+    try:
+        for entry in stream.items("tree[*]"):
             if entry.get("type") == "blob":
                 path = entry.get("path")
                 if path:
@@ -86,6 +85,8 @@ def __parse_repo_info(view_manager) -> bool:
     except Exception as e:
         print(f"Error parsing JSON: {e}")
         return False
+    finally:
+        stream.close()
 
     if _total_files == 0:
         print("No files to download found in repository")
@@ -260,6 +261,7 @@ def run(view_manager) -> None:
         # Download files one-by-one
         if not _http.is_request_complete():
             if _loading:
+                _loading.set_progress(*_http.progress)
                 _loading.animate()
             return
 
@@ -1,6 +1,8 @@
 # translated from https://github.com/lazerduck/PicoCalc_Dashboard/blob/main/graph/graph.py
 # graph.py - Simple Graphing Calculator for PicoCalc
 # Enter y=f(x) at the bottom, graph is drawn above
+# On the graph: arrows pan, +/- zoom, 0 resets the view, any other key edits
+from micropython import const
 
 SCREEN_WIDTH = 320
 SCREEN_HEIGHT = 320
@@ -14,6 +16,15 @@ YMIN, YMAX = -10, 10
 # Parametric mode t range
 TMIN, TMAX = -10, 10
 
+_STEEP_PX = const(6)  # neighbouring samples further apart (in pixels) are refined
+_REFINE_DEPTH = const(5)  # bisection levels when refining a steep segment
+_PAN_COLUMNS = const(40)  # pixels moved per arrow press
+_NAN = float("nan")
+
+_namespace = None  # names available to expressions, built once
+_curve = None  # last y=f(x) samples: (expression, x0, dx, ys, joins, y span)
+_param = None  # last parametric samples: (expression x, expression y, xs, ys)
+
 
 # Map x in [-10,10] to pixel in [0,319]
 def x_to_px(x):
@@ -37,16 +48,18 @@ def draw_axes(fb):
     from picoware.system.colors import TFT_BLUE
 
     # Draw axes
-    # Y axis
+    # Y axis (unless panned out of view)
     x0 = x_to_px(0)
-    _x, _y = fb.scale(x0, 1)
-    _w, _h = fb.scale(1, GRAPH_HEIGHT)
-    fb._fill_rectangle(_x, _y, _w, _h, TFT_BLUE)
+    if 0 <= x0 < SCREEN_WIDTH:
+        _x, _y = fb.scale(x0, 1)
+        _w, _h = fb.scale(1, GRAPH_HEIGHT)
+        fb._fill_rectangle(_x, _y, _w, _h, TFT_BLUE)
     # X axis
     y0 = y_to_py(0)
-    _x, _y = fb.scale(1, y0)
-    _w, _h = fb.scale(SCREEN_WIDTH, 1)
-    fb._fill_rectangle(_x, _y, _w, _h, TFT_BLUE)
+    if 0 <= y0 < GRAPH_HEIGHT:
+        _x, _y = fb.scale(1, y0)
+        _w, _h = fb.scale(SCREEN_WIDTH, 1)
+        fb._fill_rectangle(_x, _y, _w, _h, TFT_BLUE)
 
     # Draw border
     fb._rectangle(0, 0, SCREEN_WIDTH, GRAPH_HEIGHT, TFT_BLUE)
@@ -109,81 +122,210 @@ def __exp_list() -> list[tuple[str, object]]:
     ]
 
 
-def __param_exp_list() -> list[tuple[str, object]]:
-    import math
+def __compile(expr: str, var: str):
+    """
+    Compile expr once into a function of var.
+
+    The function's globals are one namespace of math names built on first
+    use, so evaluating a sample is a plain call: no dict is built per sample.
+    Raises SyntaxError (or another exception) for a bad expression.
+    """
+    global _namespace
+
+    if _namespace is None:
+        _namespace = {}
+        for k, v in __exp_list():
+            _namespace[k] = v
+    compile(expr, "<expr>", "eval")  # report errors against the expression itself
+    return eval(f"lambda {var}: ({expr})", _namespace)
+
+
+def __evaluate(function, value: float) -> float:
+    """Return function(value) as a float, or NaN if it fails or is not finite."""
+    try:
+        y = function(value)
+    except Exception:
+        return _NAN
+    if not isinstance(y, (int, float)):
+        return _NAN
+    y = float(y)
+    if y - y != 0.0:  # inf or nan
+        return _NAN
+    return y
+
+
+def __continuous(function, xa: float, ya: float, xb: float, yb: float, depth: int):
+    """
+    Return True if the curve joins (xa, ya) and (xb, yb) without a break.
+
+    Steep segments are bisected: along a continuous curve the vertical gap
+    shrinks with every halving, across a jump or a pole (tan, 1/x, floor) it
+    does not.
+    """
+    scale = (GRAPH_HEIGHT - 1) / (YMAX - YMIN)
+    gap = abs(yb - ya) * scale
+    while gap > _STEEP_PX:
+        if depth == 0:
+            return True  # still shrinking: steep but unbroken
+        depth -= 1
+        xm = (xa + xb) / 2
+        ym = __evaluate(function, xm)
+        if ym != ym:
+            return False
+        # follow the half that holds most of the gap
+        if abs(ym - ya) > abs(yb - ym):
+            xb, yb = xm, ym
+        else:
+            xa, ya = xm, ym
+        half = abs(yb - ya) * scale
+        if half > gap * 0.75:
+            return False  # the gap does not shrink: a jump or a pole
+        gap = half
+    return True
 
-    return [
-        ("abs", abs),
-        ("min", min),
-        ("max", max),
-        ("pow", pow),
-        ("round", round),
-        ("int", int),
-        ("float", float),
-        ("sin", math.sin),
-        ("cos", math.cos),
-        ("tan", math.tan),
-        ("asin", math.asin),
-        ("acos", math.acos),
-        ("atan", math.atan),
-        ("atan2", math.atan2),
-        ("log", math.log),
-        ("log10", math.log10),
-        ("exp", math.exp),
-        ("sqrt", math.sqrt),
-        ("pi", math.pi),
-        ("e", math.e),
-        ("floor", math.floor),
-        ("ceil", math.ceil),
-        ("sinh", math.sinh),
-        ("cosh", math.cosh),
-        ("tanh", math.tanh),
-        ("degrees", math.degrees),
-        ("radians", math.radians),
-        ("math", math),
-    ]
+
+def __sample_curve(expr: str, function):
+    """
+    Return (ys, joins) for the pixel columns of the current view.
+
+    ys holds y per column (NaN where undefined). joins[i] records whether
+    columns i and i + 1 are connected: 0 not decided yet, 1 joined, 2 a
+    break. Samples of the last plot are reused wherever a column lands on
+    an old sample: a pan only evaluates the newly exposed columns and a 2x
+    zoom about the centre half of them. Joins are reused for pairs that
+    were neighbours before at the same vertical scale, so a pan does not
+    refine them again.
+    """
+    from array import array
+
+    global _curve
+
+    width = SCREEN_WIDTH
+    dx = (XMAX - XMIN) / (width - 1)
+    span = YMAX - YMIN
+    ys = array("f", bytes(4 * width))
+    joins = bytearray(width)
+    old = None
+    old_joins = None
+    if _curve is not None and _curve[0] == expr and len(_curve[3]) == width:
+        old = _curve[3]
+        if _curve[5] == span:
+            old_joins = _curve[4]
+        offset = (XMIN - _curve[1]) / _curve[2]
+        ratio = dx / _curve[2]
+    last = -2  # old column reused for the previous column
+    for i in range(width):
+        if old is not None:
+            j = offset + i * ratio
+            k = int(j + 0.5) if j >= 0 else -1
+            if 0 <= k < width and abs(j - k) < 0.01:
+                ys[i] = old[k]
+                if old_joins is not None and last == k - 1:
+                    joins[i - 1] = old_joins[k - 1]
+                last = k
+                continue
+        last = -2
+        ys[i] = __evaluate(function, XMIN + i * dx)
+    _curve = (expr, XMIN, dx, ys, joins, span)
+    return ys, joins
+
+
+def __view_reset() -> None:
+    """Show the default range."""
+    global XMIN, XMAX, YMIN, YMAX
+
+    XMIN, XMAX = -10, 10
+    YMIN, YMAX = -10, 10
+
+
+def __view_pan(columns: int, rows: int) -> None:
+    """Move the view by whole pixel columns and rows."""
+    global XMIN, XMAX, YMIN, YMAX
+
+    dx = (XMAX - XMIN) / (SCREEN_WIDTH - 1) * columns
+    dy = (YMAX - YMIN) / (GRAPH_HEIGHT - 1) * rows
+    XMIN, XMAX = XMIN + dx, XMAX + dx
+    YMIN, YMAX = YMIN + dy, YMAX + dy
+
+
+def __view_zoom(factor: float) -> None:
+    """Scale the view by factor (0.5 zooms in) about its centre column."""
+    global XMIN, XMAX, YMIN, YMAX
+
+    centre = SCREEN_WIDTH // 2
+    dx = (XMAX - XMIN) / (SCREEN_WIDTH - 1)
+    x = XMIN + centre * dx
+    XMIN = x - centre * dx * factor
+    XMAX = XMIN + (SCREEN_WIDTH - 1) * dx * factor
+    y = (YMIN + YMAX) / 2
+    half = (YMAX - YMIN) / 2 * factor
+    YMIN, YMAX = y - half, y + half
 
 
 def graph_equation(fb, expr):
-    import math
     from picoware.system.colors import TFT_BLACK, TFT_GREEN
 
     fb.fill_screen(TFT_BLACK)
     draw_axes(fb)
     # Try to compile the expression
     try:
-        code = compile(expr, "<expr>", "eval")
+        function = __compile(expr, "x")
     except Exception as e:
         draw_input_line(fb, expr, f"Syntax Error: {e}")
         fb.swap()
         return
-    # Draw graph pixel by pixel
-    points = []
-    exp_list = __exp_list()
-    for px in range(SCREEN_WIDTH):
-        x = px_to_x(px)
-        try:
-            # Provide a safe eval environment with math functions and common built-ins
-            env = {"x": x}
-            for k, v in exp_list:
-                env[k] = v
-            y = eval(code, env)
-        except Exception:
+    ys, joins = __sample_curve(expr, function)
+    width = SCREEN_WIDTH
+    dx = (XMAX - XMIN) / (width - 1)
+    bottom = GRAPH_HEIGHT - 1
+    scale = bottom / (YMAX - YMIN)
+
+    # each column is a vertical span reaching halfway to its neighbours it
+    # joins, so steep parts stay solid and breaks stay open
+    joined = False  # column px - 1 joins column px
+    for px in range(width):
+        y = ys[px]
+        if y != y:
+            joined = False
             continue
-        if not isinstance(y, (int, float)) or math.isnan(y) or math.isinf(y):
+        py = (YMAX - y) * scale
+        top = low = py
+        if joined:
+            mid = (py + (YMAX - ys[px - 1]) * scale) / 2
+            top, low = min(top, mid), max(low, mid)
+        joined = False
+        if px + 1 < width:
+            y2 = ys[px + 1]
+            join = joins[px]
+            # a pair beyond the same edge is not drawn either way: leave it
+            # undecided rather than refine it
+            if (
+                join == 0
+                and y2 == y2
+                and not (y > YMAX and y2 > YMAX)
+                and not (y < YMIN and y2 < YMIN)
+            ):
+                join = 2
+                if __continuous(
+                    function,
+                    XMIN + px * dx,
+                    y,
+                    XMIN + (px + 1) * dx,
+                    y2,
+                    _REFINE_DEPTH,
+                ):
+                    join = 1
+                joins[px] = join
+            if join == 1:
+                joined = True
+                mid = (py + (YMAX - y2) * scale) / 2
+                top, low = min(top, mid), max(low, mid)
+        if low < 0 or top > bottom:
             continue
-        py = y_to_py(y)
-        if 0 <= py < GRAPH_HEIGHT:
-            points.append((px, py))
-        # Draw in batches for animation
-        if px % 16 == 0:
-            for ppx, ppy in points:
-                fb._pixel(ppx, ppy, TFT_GREEN)
-            fb.swap()
-            points = []
-    # Draw any remaining points
-    for ppx, ppy in points:
-        fb._pixel(ppx, ppy, TFT_GREEN)
+        top = 0 if top < 0 else int(top)
+        low = bottom if low > bottom else int(low)
+        fb._fill_rectangle(px, top, 1, low - top + 1, TFT_GREEN)
+    draw_input_line(fb, expr)
     fb.swap()
 
 
@@ -191,49 +333,70 @@ def graph_parametric(fb, expr_x, expr_y):
     """
     Graph parametric equations x(t), y(t)
     """
-    import math
-    from picoware.system.vector import Vector
+    from array import array
     from picoware.system.colors import TFT_BLACK, TFT_GREEN
 
+    global _param
+
     fb.fill_screen(TFT_BLACK)
     draw_axes(fb)
     # Try to compile the expressions
     try:
-        code_x = compile(expr_x, "<expr_x>", "eval")
-        code_y = compile(expr_y, "<expr_y>", "eval")
+        function_x = __compile(expr_x, "t")
+        function_y = __compile(expr_y, "t")
     except Exception as e:
         draw_input_line(fb, expr_x, f"Syntax Error: {e}", mode="param", expr2=expr_y)
         fb.swap()
         return
-    points = []
     N = SCREEN_WIDTH  # Number of steps
-    exp_list = __param_exp_list()
+    dt = (TMAX - TMIN) / (N - 1)
+    # the samples do not depend on the view, so pan and zoom reuse them all
+    if _param is None or _param[0] != expr_x or _param[1] != expr_y:
+        xs = array("f", bytes(4 * N))
+        ys = array("f", bytes(4 * N))
+        for i in range(N):
+            t = TMIN + i * dt
+            xs[i] = __evaluate(function_x, t)
+            ys[i] = __evaluate(function_y, t)
+        _param = (expr_x, expr_y, xs, ys)
+    xs, ys = _param[2], _param[3]
+
+    sx = (SCREEN_WIDTH - 1) / (XMAX - XMIN)
+    sy = (GRAPH_HEIGHT - 1) / (YMAX - YMIN)
+
+    def plot(x: float, y: float):
+        px = int((x - XMIN) * sx)
+        py = int((YMAX - y) * sy)
+        if 0 <= px < SCREEN_WIDTH and 0 <= py < GRAPH_HEIGHT:
+            fb._pixel(px, py, TFT_GREEN)
+        return px, py
+
+    last = None
     for i in range(N):
-        t = TMIN + (TMAX - TMIN) * i / (N - 1)
-        try:
-            env = {"t": t}
-            for k, v in exp_list:
-                env[k] = v
-            x = eval(code_x, env)
-            y = eval(code_y, env)
-        except Exception:
-            continue
-        if not (isinstance(x, (int, float)) and isinstance(y, (int, float))):
+        x, y = xs[i], ys[i]
+        if x != x or y != y:
+            last = None
             continue
-        if math.isnan(x) or math.isinf(x) or math.isnan(y) or math.isinf(y):
-            continue
-        px = x_to_px(x)
-        py = y_to_py(y)
-        if 0 <= px < SCREEN_WIDTH and 0 <= py < GRAPH_HEIGHT:
-            points.append((px, py))
-        # Draw in batches for animation
-        if i % 16 == 0:
-            for ppx, ppy in points:
-                fb._pixel(ppx, ppy, TFT_GREEN)
-            fb.swap()
-            points = []
-    for ppx, ppy in points:
-        fb._pixel(ppx, ppy, TFT_GREEN)
+        point = plot(x, y)
+        if last is not None and (
+            abs(point[0] - last[0]) > 1 or abs(point[1] - last[1]) > 1
+        ):
+            # fill the gap with extra samples, halving the step each level
+            t0 = TMIN + (i - 1) * dt
+            steps = 2
+            for _ in range(_REFINE_DEPTH):
+                gap = max(abs(point[0] - last[0]), abs(point[1] - last[1]))
+                if gap <= steps:
+                    break
+                steps *= 2
+            for k in range(1, steps):
+                t = t0 + dt * k / steps
+                x = __evaluate(function_x, t)
+                y = __evaluate(function_y, t)
+                if x == x and y == y:
+                    plot(x, y)
+        last = point
+    draw_input_line(fb, expr_x, mode="param", expr2=expr_y)
     fb.swap()
 
 
@@ -271,10 +434,16 @@ def run(view_manager) -> None:
         BUTTON_BACK,
         BUTTON_LEFT,
         BUTTON_RIGHT,
+        BUTTON_UP,
+        BUTTON_DOWN,
         BUTTON_CENTER,
         BUTTON_BACKSPACE,
         BUTTON_M,
         BUTTON_NONE,
+        BUTTON_PLUS,
+        BUTTON_EQUAL,
+        BUTTON_MINUS,
+        BUTTON_0,
     )
     from picoware.system.colors import TFT_BLACK, TFT_WHITE
 
@@ -405,11 +574,32 @@ def run(view_manager) -> None:
     else:
         graph_equation(fb, "".join(input_buffer))
 
-    # Wait for any key to return to input
-    button = inp.button
-    while button == BUTTON_NONE:
+    # Pan and zoom until any other key returns to input
+    while True:
         button = inp.button
-    inp.reset()
+        while button == BUTTON_NONE:
+            button = inp.button
+        inp.reset()
+        if button == BUTTON_LEFT:
+            __view_pan(-_PAN_COLUMNS, 0)
+        elif button == BUTTON_RIGHT:
+            __view_pan(_PAN_COLUMNS, 0)
+        elif button == BUTTON_UP:
+            __view_pan(0, _PAN_COLUMNS)
+        elif button == BUTTON_DOWN:
+            __view_pan(0, -_PAN_COLUMNS)
+        elif button in (BUTTON_PLUS, BUTTON_EQUAL):
+            __view_zoom(0.5)
+        elif button == BUTTON_MINUS:
+            __view_zoom(2)
+        elif button == BUTTON_0:
+            __view_reset()
+        else:
+            break
+        if mode == "param":
+            graph_parametric(fb, "".join(input_buffer), "".join(input_buffer2))
+        else:
+            graph_equation(fb, "".join(input_buffer))
 
 
 def stop(view_manager) -> None:
@@ -417,6 +607,7 @@ def stop(view_manager) -> None:
     from gc import collect
 
     global mode, expr, expr2, input_buffer, input_buffer2, cursor, cursor2
+    global _namespace, _curve, _param
 
     mode = ""  # 'normal' or 'param'
     expr = ""
@@ -425,5 +616,9 @@ def stop(view_manager) -> None:
     input_buffer2 = None
     cursor = 0
     cursor2 = 0
+    _namespace = None
+    _curve = None
+    _param = None
+    __view_reset()
 
     collect()
@@ -32,7 +32,7 @@ _info_view_dirty = True
 
 def __fetch_news(view_manager) -> bool:
     """Fetch news from JB-News API"""
-    from picoware.system.http import HTTP
+    from picoware.system.http import HTTP, HTTPCache
 
     global _http
 
@@ -40,7 +40,11 @@ def __fetch_news(view_manager) -> bool:
         _http.close()
         del _http
 
-    _http = HTTP(thread_manager=view_manager.thread_manager)
+    # unchanged calendars are revalidated (304) instead of downloaded again
+    _http = HTTP(
+        thread_manager=view_manager.thread_manager,
+        cache=HTTPCache(view_manager.storage),
+    )
 
     _api_key = __load_setting("api_key", view_manager)
     _source = __load_setting("news_source", view_manager)
@@ -41,9 +41,17 @@ STATE_ERROR = const(4)
 KEYBOARD_WAITING = const(-1)
 KEYBOARD_ENTERING = const(0)
 
-# History file and max entries
-_HISTORY_FILE = "picoware/ssh/history.txt"
-_HISTORY_MAX = const(50)
+# Shell channel flow control: bytes the server may send before we adjust
+_LOCAL_WINDOW = const(0x8000)
+_LOCAL_MAX_PACKET = const(0x4000)
+_POLL_PACKETS = const(8)  # packets handled per poll() before drawing
+
+# Terminal parser states
+_VT_NORMAL = const(0)
+_VT_ESCAPE = const(1)
+_VT_CSI = const(2)
+_VT_OSC = const(3)
+_VT_CHARSET = const(4)
 
 # SSH Message Types
 SSH_MSG_DISCONNECT = const(1)
@@ -98,6 +106,10 @@ _DH_P = int(
 _X25519_P = (1 << 255) - 19
 _X25519_A24 = const(121665)
 
+# AES-CTR fallback: counter blocks encrypted per ECB call
+_CTR_BLOCKS = const(64)
+_CTR_MASK = (1 << 128) - 1
+
 # Globals
 current_view = VIEW_MAIN_MENU
 keyboard_index = KEYBOARD_WAITING
@@ -108,11 +120,9 @@ _loading = None
 _ssh_client = None
 
 # Terminal state
-_input_line = ""  # current typed command
-_history = []  # command history (in-memory)
-_history_index = -1  # -1 = not navigating; otherwise index into _history
-_history_saved = ""  # saved input when navigating history
-_terminal_dirty = True  # whether the terminal display needs a redraw
+_terminal_dirty = True  # whether the whole terminal needs a redraw
+_shown_cursor = (0, 0)  # cursor cell as last drawn
+_ctrl_armed = False  # Control was pressed: the next letter is sent as Ctrl+letter
 
 # SSH connection details
 ssh_host = ""
@@ -183,51 +193,56 @@ def _parse_name_list(data, offset):
 # --- HMAC Implementations ---
 
 
-def _hmac_compute(key, msg, hash_cls, block_size):
-    """Compute HMAC with the given hash class and block size"""
-    if len(key) > block_size:
-        h = hash_cls()
-        h.update(key)
-        key = h.digest()
-    if len(key) < block_size:
-        key = key + b"\x00" * (block_size - len(key))
-    o_pad = bytes(b ^ 0x5C for b in key)
-    i_pad = bytes(b ^ 0x36 for b in key)
-    hi = hash_cls()
-    hi.update(i_pad)
-    hi.update(msg)
-    inner = hi.digest()
-    ho = hash_cls()
-    ho.update(o_pad)
-    ho.update(inner)
-    return ho.digest()
-
-
-def _hmac_sha256(key, msg):
-    """HMAC-SHA-256"""
-    return _hmac_compute(key, msg, hashlib.sha256, 64)
-
-
-def _hmac_sha1(key, msg):
-    """HMAC-SHA-1"""
-    return _hmac_compute(key, msg, hashlib.sha1, 64)
+class _HMAC:
+    """HMAC with the key's inner and outer pad states computed once.
+
+    SSH MACs every packet with the same key, so the padded key blocks are
+    built (and, where hash objects support copy(), hashed) only once."""
+
+    def __init__(self, key, hash_cls, block_size=64):
+        if len(key) > block_size:
+            key = hash_cls(key).digest()
+        key = bytes(key) + b"\x00" * (block_size - len(key))
+        self._hash_cls = hash_cls
+        self._i_pad = bytes(b ^ 0x36 for b in key)
+        self._o_pad = bytes(b ^ 0x5C for b in key)
+        self._inner = None
+        self._outer = None
+        inner = hash_cls(self._i_pad)
+        if hasattr(inner, "copy"):
+            self._inner = inner
+            self._outer = hash_cls(self._o_pad)
+
+    def digest(self, *parts):
+        """MAC of the concatenation of parts (no joined copy is made)"""
+        if self._inner is not None:
+            hi = self._inner.copy()
+            ho = self._outer.copy()
+        else:
+            hi = self._hash_cls(self._i_pad)
+            ho = self._hash_cls(self._o_pad)
+        for part in parts:
+            hi.update(part)
+        ho.update(hi.digest())
+        return ho.digest()
 
 
 # --- X25519 Diffie-Hellman (RFC 7748) ---
 
 
 def _x25519(k_bytes, u_bytes):
-    """X25519 scalar multiplication with aggressive GC"""
+    """X25519 scalar multiplication.
+
+    Scalar bits are read from the clamped bytes rather than by shifting a
+    255-bit integer each step, and sums and differences are left unreduced
+    (only products are taken mod p), so each step makes fewer big integers."""
     p = _X25519_P
     a24 = _X25519_A24
 
-    k_list = bytearray(k_bytes)
-    k_list[0] &= 248
-    k_list[31] &= 127
-    k_list[31] |= 64
-    scalar = int.from_bytes(bytes(k_list), "little")
-    del k_list
-    collect()
+    k = bytearray(k_bytes)
+    k[0] &= 248
+    k[31] &= 127
+    k[31] |= 64
 
     u = int.from_bytes(u_bytes, "little") & ((1 << 255) - 1)
 
@@ -236,38 +251,32 @@ def _x25519(k_bytes, u_bytes):
     swap = 0
 
     for t in range(254, -1, -1):
-        k_t = (scalar >> t) & 1
-        swap ^= k_t
-        if swap:
+        k_t = (k[t >> 3] >> (t & 7)) & 1
+        if swap ^ k_t:
             x_2, x_3 = x_3, x_2
             z_2, z_3 = z_3, z_2
         swap = k_t
 
-        A = (x_2 + z_2) % p
-        AA = (A * A) % p
-        B = (x_2 - z_2) % p
-        BB = (B * B) % p
-        E = (AA - BB) % p
-        C = (x_3 + z_3) % p
-        D = (x_3 - z_3) % p
-        DA = (D * A) % p
-        CB = (C * B) % p
-        sum_dc = (DA + CB) % p
-        diff_dc = (DA - CB) % p
-        x_3 = (sum_dc * sum_dc) % p
-        z_3 = (u * ((diff_dc * diff_dc) % p)) % p
-        x_2 = (AA * BB) % p
-        z_2 = (E * ((AA + (a24 * E) % p) % p)) % p
-
-        if t % 32 == 0:
-            collect()
+        A = x_2 + z_2
+        B = x_2 - z_2
+        AA = A * A % p
+        BB = B * B % p
+        E = AA - BB
+        DA = (x_3 - z_3) * A % p
+        CB = (x_3 + z_3) * B % p
+        x_3 = DA + CB
+        x_3 = x_3 * x_3 % p
+        z_3 = DA - CB
+        z_3 = z_3 * z_3 % p * u % p
+        x_2 = AA * BB % p
+        z_2 = E * (AA + a24 * E) % p
 
     if swap:
         x_2, x_3 = x_3, x_2
         z_2, z_3 = z_3, z_2
 
-    result = (x_2 * pow(z_2, p - 2, p)) % p
-    del x_2, z_2, x_3, z_3, scalar, u
+    result = x_2 * pow(z_2, p - 2, p) % p
+    del x_2, z_2, x_3, z_3, k, u
     collect()
 
     return result.to_bytes(32, "little")
@@ -280,9 +289,19 @@ _X25519_BASE = b"\x09" + b"\x00" * 31
 # --- AES-CTR Cipher ---
 
 
+def _xor(a, b):
+    """XOR two equal-length buffers as whole integers"""
+    n = len(a)
+    return (int.from_bytes(a, "big") ^ int.from_bytes(b, "big")).to_bytes(n, "big")
+
+
 class _AES_CTR:
     """AES in Counter mode. Tries native CTR (mode 6) first,
-    falls back to manual CTR built on ECB."""
+    falls back to manual CTR built on ECB.
+
+    The fallback encrypts up to _CTR_BLOCKS counter blocks with one ECB call
+    and XORs whole runs of keystream; unused keystream carries over to the
+    next call."""
 
     def __init__(self, key, iv):
         try:
@@ -295,33 +314,315 @@ class _AES_CTR:
             self._native = True
         except Exception:
             self._ecb = aes(key, 1)
-            self._ctr = bytearray(iv[:16])
-            self._buf = bytearray(16)
-            self._pos = 16
-
-    def _inc_counter(self):
-        """Increment 128-bit big-endian counter by 1"""
-        for i in range(15, -1, -1):
-            self._ctr[i] = (self._ctr[i] + 1) & 0xFF
-            if self._ctr[i]:
-                break
+            self._ctr = int.from_bytes(iv[:16], "big")
+            self._ks = bytearray(16 * _CTR_BLOCKS)
+            self._ks_view = memoryview(self._ks)
+            self._pos = 0
+            self._end = 0
+
+    def _refill(self, needed):
+        """Encrypt the next counter blocks (enough for needed bytes)"""
+        blocks = min(_CTR_BLOCKS, (needed + 15) >> 4)
+        ks = self._ks
+        ctr = self._ctr
+        for i in range(0, blocks << 4, 16):
+            ks[i : i + 16] = ctr.to_bytes(16, "big")
+            ctr = (ctr + 1) & _CTR_MASK
+        self._ctr = ctr
+        view = self._ks_view[: blocks << 4]
+        self._ecb.encrypt(view, view)
+        self._pos = 0
+        self._end = blocks << 4
 
     def process(self, data):
         """Encrypt or decrypt data (XOR with AES-CTR keystream)"""
         if self._native:
             return self._aes.encrypt(data)
 
-        out = bytearray(len(data))
-        for i in range(len(data)):
-            if self._pos >= 16:
-                ks = self._ecb.encrypt(bytes(self._ctr))
-                for j in range(16):
-                    self._buf[j] = ks[j]
-                self._inc_counter()
-                self._pos = 0
-            out[i] = data[i] ^ self._buf[self._pos]
-            self._pos += 1
-        return bytes(out)
+        n = len(data)
+        data = memoryview(data)
+        out = bytearray(n)
+        i = 0
+        while i < n:
+            if self._pos >= self._end:
+                self._refill(n - i)
+            take = min(self._end - self._pos, n - i)
+            out[i : i + take] = _xor(
+                data[i : i + take], self._ks_view[self._pos : self._pos + take]
+            )
+            self._pos += take
+            i += take
+        return out
+
+
+# --- VT100 Terminal Buffer ---
+
+
+class _Terminal:
+    """Character grid fed incrementally with a PTY's output.
+
+    Understands the control characters and the common VT100/xterm escape
+    sequences (cursor movement, erase, insert/delete, scroll margins) that
+    shells and tools like top or less emit; colors and other attributes
+    are ignored. Rows written since the last draw are flagged in dirty."""
+
+    def __init__(self, cols, rows):
+        self.cols = cols
+        self.rows = rows
+        self.lines = [bytearray(b" " * cols) for _ in range(rows)]
+        self.dirty = bytearray(b"\x01" * rows)
+        self.reply = bytearray()  # answers to status queries, for the server
+        self.x = 0
+        self.y = 0
+        self._top = 0
+        self._bottom = rows - 1
+        self._saved = (0, 0)
+        self._state = _VT_NORMAL
+        self._params = bytearray()
+
+    def clear(self):
+        """Blank the screen and home the cursor"""
+        for y in range(self.rows):
+            self.lines[y][:] = b" " * self.cols
+            self.dirty[y] = 1
+        self.x = self.y = 0
+        self._top = 0
+        self._bottom = self.rows - 1
+
+    def write(self, text):
+        """Show local text (status messages) as if the server sent it"""
+        self.feed(text.replace("\n", "\r\n").encode())
+
+    def feed(self, data):
+        """Process received bytes"""
+        n = len(data)
+        i = 0
+        while i < n:
+            b = data[i]
+            if self._state == _VT_NORMAL and 0x20 <= b < 0x7F:
+                # copy a run of printable characters in one slice per row
+                j = i + 1
+                while j < n and 0x20 <= data[j] < 0x7F:
+                    j += 1
+                self._put(data, i, j)
+                i = j
+                continue
+            i += 1
+            state = self._state
+            if state == _VT_NORMAL:
+                if b == 0x1B:
+                    self._state = _VT_ESCAPE
+                elif b >= 0xC0:
+                    self._put(b"?", 0, 1)  # one cell per UTF-8 character
+                elif b >= 0x80:
+                    pass  # UTF-8 continuation byte
+                else:
+                    self._control(b)
+            elif state == _VT_ESCAPE:
+                self._escape(b)
+            elif state == _VT_CSI:
+                if 0x40 <= b <= 0x7E:
+                    self._state = _VT_NORMAL
+                    self._csi(b)
+                elif b == 0x1B:
+                    self._state = _VT_ESCAPE
+                elif b >= 0x20:
+                    self._params.append(b)
+            elif state == _VT_OSC:
+                # title strings etc. end with BEL or ESC \
+                if b == 0x07:
+                    self._state = _VT_NORMAL
+                elif b == 0x1B:
+                    self._state = _VT_ESCAPE
+            else:  # _VT_CHARSET: the designator byte after ESC ( or ESC )
+                self._state = _VT_NORMAL
+
+    def _put(self, data, start, end):
+        """Write data[start:end] at the cursor, wrapping at the right edge"""
+        cols = self.cols
+        while start < end:
+            if self.x >= cols:
+                self.x = 0
+                self._index()
+            take = min(end - start, cols - self.x)
+            self.lines[self.y][self.x : self.x + take] = data[start : start + take]
+            self.dirty[self.y] = 1
+            self.x += take
+            start += take
+
+    def _control(self, b):
+        """Handle a C0 control character"""
+        if b == 0x0D:
+            self.x = 0
+        elif b in (0x0A, 0x0B, 0x0C):
+            self._index()
+        elif b == 0x08:
+            if self.x > 0:
+                self.x = min(self.x, self.cols) - 1
+        elif b == 0x09:
+            self.x = min(self.cols - 1, (self.x & ~7) + 8)
+
+    def _escape(self, b):
+        """Handle the byte after ESC"""
+        self._state = _VT_NORMAL
+        if b == 0x5B:  # [
+            self._state = _VT_CSI
+            self._params = bytearray()
+        elif b == 0x5D:  # ]
+            self._state = _VT_OSC
+        elif b in (0x28, 0x29):  # ( )
+            self._state = _VT_CHARSET
+        elif b == 0x44:  # D: index
+            self._index()
+        elif b == 0x45:  # E: next line
+            self.x = 0
+            self._index()
+        elif b == 0x4D:  # M: reverse index
+            if self.y == self._top:
+                self._scroll_down(self._top, 1)
+            elif self.y > 0:
+                self.y -= 1
+        elif b == 0x37:  # 7: save cursor
+            self._saved = (self.x, self.y)
+        elif b == 0x38:  # 8: restore cursor
+            self.x, self.y = self._saved
+        elif b == 0x63:  # c: reset
+            self.clear()
+
+    def _csi(self, final):
+        """Handle a complete CSI sequence"""
+        params = self._params
+        private = params and params[0] in (0x3F, 0x3E, 0x3D)  # ? > =
+        if private:
+            return  # mode switches (cursor keys, bracketed paste, ...)
+        try:
+            args = [int(p) if p else 0 for p in str(params, "utf-8").split(";")]
+        except ValueError:
+            return  # sub-parameters or intermediates we do not support
+        n = args[0] or 1
+        cols, rows = self.cols, self.rows
+        if final == 0x41:  # A: up
+            self.y = max(self._top if self.y >= self._top else 0, self.y - n)
+        elif final == 0x42:  # B: down
+            self.y = min(
+                self._bottom if self.y <= self._bottom else rows - 1, self.y + n
+            )
+        elif final == 0x43:  # C: forward
+            self.x = min(cols - 1, self.x + n)
+        elif final == 0x44:  # D: back
+            self.x = max(0, min(self.x, cols - 1) - n)
+        elif final == 0x45:  # E: next line
+            self.x = 0
+            self.y = min(rows - 1, self.y + n)
+        elif final == 0x46:  # F: previous line
+            self.x = 0
+            self.y = max(0, self.y - n)
+        elif final == 0x47 or final == 0x60:  # G `: column
+            self.x = min(cols - 1, n - 1)
+        elif final == 0x64:  # d: row
+            self.y = min(rows - 1, n - 1)
+        elif final == 0x48 or final == 0x66:  # H f: position
+            self.y = min(rows - 1, n - 1)
+            self.x = min(cols - 1, (args[1] if len(args) > 1 else 0) or 1) - 1
+            self.x = max(0, self.x)
+        elif final == 0x4A:  # J: erase in display
+            mode = args[0]
+            if mode == 0:
+                self._erase(self.y, self.x, cols)
+                for y in range(self.y + 1, rows):
+                    self._erase(y, 0, cols)
+            elif mode == 1:
+                for y in range(self.y):
+                    self._erase(y, 0, cols)
+                self._erase(self.y, 0, self.x + 1)
+            else:
+                for y in range(rows):
+                    self._erase(y, 0, cols)
+        elif final == 0x4B:  # K: erase in line
+            mode = args[0]
+            if mode == 0:
+                self._erase(self.y, self.x, cols)
+            elif mode == 1:
+                self._erase(self.y, 0, self.x + 1)
+            else:
+                self._erase(self.y, 0, cols)
+        elif final == 0x58:  # X: erase characters
+            self._erase(self.y, self.x, self.x + n)
+        elif final == 0x50:  # P: delete characters
+            line = self.lines[self.y]
+            x = min(self.x, cols - 1)
+            n = min(n, cols - x)
+            line[x : cols - n] = line[x + n :]
+            line[cols - n :] = b" " * n
+            self.dirty[self.y] = 1
+        elif final == 0x40:  # @: insert blanks
+            line = self.lines[self.y]
+            x = min(self.x, cols - 1)
+            n = min(n, cols - x)
+            line[x + n :] = line[x : cols - n]
+            line[x : x + n] = b" " * n
+            self.dirty[self.y] = 1
+        elif final == 0x4C:  # L: insert lines
+            if self._top <= self.y <= self._bottom:
+                self._scroll_down(self.y, n)
+        elif final == 0x4D:  # M: delete lines
+            if self._top <= self.y <= self._bottom:
+                self._scroll_up(self.y, n)
+        elif final == 0x53:  # S: scroll up
+            self._scroll_up(self._top, n)
+        elif final == 0x54:  # T: scroll down
+            self._scroll_down(self._top, n)
+        elif final == 0x72:  # r: scroll margins
+            top = (args[0] or 1) - 1
+            bottom = ((args[1] if len(args) > 1 else 0) or rows) - 1
+            if top < bottom < rows:
+                self._top, self._bottom = top, bottom
+                self.x = self.y = 0
+        elif final == 0x73:  # s: save cursor
+            self._saved = (self.x, self.y)
+        elif final == 0x75:  # u: restore cursor
+            self.x, self.y = self._saved
+        elif final == 0x6E and args[0] == 6:  # n: cursor position report
+            report = "\x1b[%d;%dR" % (self.y + 1, min(self.x, cols - 1) + 1)
+            self.reply.extend(report.encode())
+
+    def _erase(self, y, start, end):
+        """Blank columns start..end-1 of row y"""
+        end = min(end, self.cols)
+        if start < end:
+            self.lines[y][start:end] = b" " * (end - start)
+            self.dirty[y] = 1
+
+    def _index(self):
+        """Move down a row, scrolling at the bottom margin"""
+        if self.y == self._bottom:
+            self._scroll_up(self._top, 1)
+        elif self.y < self.rows - 1:
+            self.y += 1
+
+    def _scroll_up(self, top, n):
+        """Scroll rows top.._bottom up by n, blanking the freed rows"""
+        lines = self.lines
+        bottom = self._bottom
+        n = min(n, bottom - top + 1)
+        for _ in range(n):
+            line = lines.pop(top)
+            line[:] = b" " * self.cols
+            lines.insert(bottom, line)
+        for y in range(top, bottom + 1):
+            self.dirty[y] = 1
+
+    def _scroll_down(self, top, n):
+        """Scroll rows top.._bottom down by n, blanking the freed rows"""
+        lines = self.lines
+        bottom = self._bottom
+        n = min(n, bottom - top + 1)
+        for _ in range(n):
+            line = lines.pop(bottom)
+            line[:] = b" " * self.cols
+            lines.insert(top, line)
+        for y in range(top, bottom + 1):
+            self.dirty[y] = 1
 
 
 # --- Full SSH-2 Client ---
@@ -352,7 +653,6 @@ class SSHClient:
         self._authenticated = False
         self._error = None
         self._lock = _thread.allocate_lock()
-        self._output = []
 
         self._server_version = ""
         self._send_seq = 0
@@ -365,7 +665,6 @@ class SSHClient:
         self._mac_key_c2s = None
         self._mac_key_s2c = None
         self._mac_len = 0
-        self._mac_func = None
 
         self._kex_algorithm = None
         self._cipher_c2s = None
@@ -381,6 +680,10 @@ class SSHClient:
         self._remote_max_pkt = 0
         self._channel_eof = False
         self._channel_closed = True  # start as closed; no channel open yet
+        self._local_window = 0
+        self._pending = bytearray()  # input waiting for remote window
+        self._poller = None
+        self._terminal = None
 
     @property
     def is_connected(self) -> bool:
@@ -393,9 +696,14 @@ class SSHClient:
             return self._error
 
     @property
-    def output(self) -> list:
-        with self._lock:
-            return self._output.copy()
+    def shell_open(self) -> bool:
+        """True while the interactive shell channel is open"""
+        return self._terminal is not None and not self._channel_closed
+
+    @property
+    def terminal(self):
+        """The shell's _Terminal screen buffer (None before open_shell)"""
+        return self._terminal
 
     # ---- Low-level transport ----
 
@@ -434,7 +742,7 @@ class SSHClient:
             mac_recv = self._recv_exact(self._mac_len)
 
             seq_b = struct.pack(">I", self._recv_seq)
-            mac_calc = self._mac_func(self._mac_key_s2c, seq_b + dec4 + dec_rest)
+            mac_calc = self._mac_key_s2c.digest(seq_b, dec4, dec_rest)
             if mac_calc[: self._mac_len] != mac_recv:
                 raise Exception("MAC verification failed")
 
@@ -465,7 +773,7 @@ class SSHClient:
 
         if self._encrypted:
             seq_b = struct.pack(">I", self._send_seq)
-            mac = self._mac_func(self._mac_key_c2s, seq_b + packet)
+            mac = self._mac_key_c2s.digest(seq_b, packet)
             mac = mac[: self._mac_len]
             enc = self._enc_cipher.process(packet)
             self._send_all(enc + mac)
@@ -754,18 +1062,18 @@ class SSHClient:
         if self._mac_c2s == "hmac-sha2-256":
             mac_key_len = 32
             self._mac_len = 32
-            self._mac_func = _hmac_sha256
+            mac_hash = hashlib.sha256
         else:
             mac_key_len = 20
             self._mac_len = 20
-            self._mac_func = _hmac_sha1
+            mac_hash = hashlib.sha1
 
         iv_c2s = derive("A", 16)
         iv_s2c = derive("B", 16)
         key_c2s = derive("C", c2s_key_len)
         key_s2c = derive("D", s2c_key_len)
-        self._mac_key_c2s = derive("E", mac_key_len)
-        self._mac_key_s2c = derive("F", mac_key_len)
+        self._mac_key_c2s = _HMAC(derive("E", mac_key_len), mac_hash)
+        self._mac_key_s2c = _HMAC(derive("F", mac_key_len), mac_hash)
 
         self._enc_cipher = _AES_CTR(key_c2s, iv_c2s)
         self._dec_cipher = _AES_CTR(key_s2c, iv_s2c)
@@ -842,13 +1150,14 @@ class SSHClient:
         self._drain_channel()
 
         self._channel_id = 0
-        local_win = 0x200000  # 2 MB
-        local_max = 0x8000  # 32 KB
+        self._local_window = _LOCAL_WINDOW
 
         p = bytearray()
         p.append(SSH_MSG_CHANNEL_OPEN)
         p.extend(_ssh_string("session"))
-        p.extend(struct.pack(">III", self._channel_id, local_win, local_max))
+        p.extend(
+            struct.pack(">III", self._channel_id, _LOCAL_WINDOW, _LOCAL_MAX_PACKET)
+        )
         self._send_packet(bytes(p))
 
         while True:
@@ -875,16 +1184,26 @@ class SSHClient:
             else:
                 continue
 
-    def _send_exec(self, command):
-        """Send exec request on the channel"""
+    def _channel_request(self, rtype, data=b""):
+        """Send a channel request and wait for its reply; True on success"""
         p = bytearray()
         p.append(SSH_MSG_CHANNEL_REQUEST)
         p.extend(struct.pack(">I", self._remote_channel))
-        p.extend(_ssh_string("exec"))
+        p.extend(_ssh_string(rtype))
         p.append(1)  # want reply
-        p.extend(_ssh_string(command))
+        p.extend(data)
         self._send_packet(bytes(p))
 
+        while not self._channel_closed:
+            resp = self._read_ssh_packet()
+            t = resp[0]
+            if t == SSH_MSG_CHANNEL_SUCCESS:
+                return True
+            if t == SSH_MSG_CHANNEL_FAILURE:
+                return False
+            self._handle_channel_packet(resp)
+        return False
+
     def _window_adjust(self, amount):
         """Send window adjust to allow server to send more data"""
         p = bytearray()
@@ -892,92 +1211,77 @@ class SSHClient:
         p.extend(struct.pack(">II", self._remote_channel, amount))
         self._send_packet(bytes(p))
 
-    def _collect_output(self):
-        """Read channel data until EOF or close, return list of lines."""
-        lines = []
-
-        while not self._channel_closed:
-            try:
-                self._sock.settimeout(15.0)
-                resp = self._read_ssh_packet()
-            except Exception as e:
-                s = str(e)
-                if "timed out" in s or "ETIMEDOUT" in s:
-                    try:
-                        cp = bytearray()
-                        cp.append(SSH_MSG_CHANNEL_CLOSE)
-                        cp.extend(struct.pack(">I", self._remote_channel))
-                        self._send_packet(bytes(cp))
-                    except Exception:
-                        pass
-                    break
-                raise
-
-            t = resp[0]
-
-            if t == SSH_MSG_CHANNEL_SUCCESS:
-                continue
-
-            if t == SSH_MSG_CHANNEL_FAILURE:
-                lines.append("[Server rejected command]")
-                break
-
-            if t == SSH_MSG_CHANNEL_DATA:
-                off = 1
-                _, off = _parse_uint32(resp, off)
-                data, _ = _parse_string(resp, off)
-                text = data.decode("utf-8", "ignore")
-                for ln in text.split("\n"):
-                    lines.append(ln)
-                continue
-
-            if t == SSH_MSG_CHANNEL_EXTENDED_DATA:
-                off = 1
-                _, off = _parse_uint32(resp, off)
-                dtype, off = _parse_uint32(resp, off)
-                data, _ = _parse_string(resp, off)
-                text = data.decode("utf-8", "ignore")
-                prefix = "[stderr] " if dtype == 1 else ""
-                for ln in text.split("\n"):
-                    lines.append(prefix + ln)
-                continue
+    def _flush_pending(self):
+        """Send queued input as far as the server's window allows"""
+        pending = self._pending
+        while pending and self._remote_window > 0 and not self._channel_closed:
+            n = min(len(pending), self._remote_window, self._remote_max_pkt or 1024)
+            p = bytearray()
+            p.append(SSH_MSG_CHANNEL_DATA)
+            p.extend(struct.pack(">I", self._remote_channel))
+            p.extend(_ssh_string(bytes(pending[:n])))
+            self._send_packet(bytes(p))
+            self._remote_window -= n
+            del pending[:n]
+
+    def _handle_channel_packet(self, resp):
+        """Apply one channel message to the session; True if the screen changed"""
+        t = resp[0]
+
+        if t in (SSH_MSG_CHANNEL_DATA, SSH_MSG_CHANNEL_EXTENDED_DATA):
+            off = 5 if t == SSH_MSG_CHANNEL_DATA else 9  # skip channel (and type)
+            length, off = _parse_uint32(resp, off)
+            data = memoryview(resp)[off : off + length]
+            if self._terminal is not None:
+                self._terminal.feed(data)
+                if self._terminal.reply:
+                    self._pending.extend(self._terminal.reply)
+                    self._terminal.reply = bytearray()
+                    self._flush_pending()
+            # give back the window once half of it is used up
+            self._local_window -= length
+            if self._local_window < _LOCAL_WINDOW // 2:
+                self._window_adjust(_LOCAL_WINDOW - self._local_window)
+                self._local_window = _LOCAL_WINDOW
+            return True
 
-            if t == SSH_MSG_CHANNEL_EOF:
-                self._channel_eof = True
-                continue
+        if t == SSH_MSG_CHANNEL_WINDOW_ADJUST:
+            off = 1
+            _, off = _parse_uint32(resp, off)
+            adj, _ = _parse_uint32(resp, off)
+            self._remote_window += adj
+            self._flush_pending()
+            return False
 
-            if t == SSH_MSG_CHANNEL_CLOSE:
-                self._channel_closed = True
-                # Echo CLOSE back
-                cp = bytearray()
-                cp.append(SSH_MSG_CHANNEL_CLOSE)
-                cp.extend(struct.pack(">I", self._remote_channel))
-                self._send_packet(bytes(cp))
-                break
+        if t == SSH_MSG_CHANNEL_EOF:
+            self._channel_eof = True
+            return False
 
-            if t == SSH_MSG_CHANNEL_WINDOW_ADJUST:
-                off = 1
-                _, off = _parse_uint32(resp, off)
-                adj, _ = _parse_uint32(resp, off)
-                self._remote_window += adj
-                continue
+        if t == SSH_MSG_CHANNEL_CLOSE:
+            self._channel_closed = True
+            # Echo CLOSE back
+            cp = bytearray()
+            cp.append(SSH_MSG_CHANNEL_CLOSE)
+            cp.extend(struct.pack(">I", self._remote_channel))
+            self._send_packet(bytes(cp))
+            if self._terminal is not None:
+                self._terminal.write("\n[Session closed]\n")
+            return True
 
-            if t == SSH_MSG_CHANNEL_REQUEST:
-                off = 1
-                _, off = _parse_uint32(resp, off)
-                rtype, off = _parse_string(resp, off)
-                want = resp[off] if off < len(resp) else 0
-                if want:
-                    sp = bytearray()
-                    sp.append(SSH_MSG_CHANNEL_SUCCESS)
-                    sp.extend(struct.pack(">I", self._remote_channel))
-                    self._send_packet(bytes(sp))
-                continue
+        if t == SSH_MSG_CHANNEL_REQUEST:
+            # exit-status, exit-signal, keepalive@openssh.com, ...
+            off = 1
+            _, off = _parse_uint32(resp, off)
+            rtype, off = _parse_string(resp, off)
+            want = resp[off] if off < len(resp) else 0
+            if want:
+                sp = bytearray()
+                sp.append(SSH_MSG_CHANNEL_SUCCESS)
+                sp.extend(struct.pack(">I", self._remote_channel))
+                self._send_packet(bytes(sp))
+            return False
 
-        # Trim trailing empty lines
-        while lines and not lines[-1].strip():
-            lines.pop()
-        return lines
+        return False
 
     # ---- Public API ----
 
@@ -1095,43 +1399,82 @@ class SSHClient:
             self._close_socket()
             return False
 
-    def execute_command(self, command):
-        """Execute a command over the encrypted SSH channel"""
+    def open_shell(self, cols, rows):
+        """Open the interactive shell: one session channel with a cols x rows
+        PTY, kept open for the whole connection"""
         with self._lock:
             if not self._connected or not self._authenticated:
                 self._error = "Not connected"
                 return False
 
         try:
-            self._sock.settimeout(15.0)
+            try:
+                import select
+            except ImportError:
+                import uselect as select
 
-            # Open a fresh session channel (drains any previous channel first)
+            self._sock.settimeout(15.0)
             self._open_session_channel()
+            self._terminal = _Terminal(cols, rows)
+            self._pending = bytearray()
+
+            pty = bytearray(_ssh_string("vt100"))
+            pty.extend(struct.pack(">IIII", cols, rows, 0, 0))
+            pty.extend(_ssh_string(b"\x00"))  # no terminal modes (TTY_OP_END)
+            if not self._channel_request("pty-req", pty):
+                raise Exception("Server refused a terminal")
+            if not self._channel_request("shell"):
+                raise Exception("Server refused a shell")
+
+            self._poller = select.poll()
+            self._poller.register(self._sock, select.POLLIN)
+            return True
 
-            # Request exec
-            self._send_exec(command)
+        except Exception as e:
+            with self._lock:
+                self._error = str(e)
+            return False
 
-            # Collect output
-            lines = self._collect_output()
+    def poll(self):
+        """Handle the packets that have already arrived, without waiting.
 
+        Returns True if the terminal changed. A packet is only read once its
+        first bytes are in, so the socket timeout never splits a packet."""
+        if self._poller is None or self._channel_closed:
+            return False
+
+        changed = False
+        try:
+            for _ in range(_POLL_PACKETS):
+                if not self._poller.poll(0):
+                    break
+                if self._handle_channel_packet(self._read_ssh_packet()):
+                    changed = True
+                if self._channel_closed:
+                    break
+        except Exception as e:
             with self._lock:
-                self._output.append("$ " + command)
-                self._output.extend(lines)
+                self._error = str(e)
+            self._channel_closed = True
+            self._terminal.write("\n[Error: %s]\n" % str(e))
+            changed = True
+        return changed
 
+    def send(self, data):
+        """Send keystrokes to the shell; the server echoes them back"""
+        if not self.shell_open:
+            return False
+        try:
+            self._pending.extend(data)
+            self._flush_pending()
             return True
-
         except Exception as e:
             with self._lock:
                 self._error = str(e)
-                self._output.append("$ " + command)
-                self._output.append("[Error: %s]" % str(e))
+            self._channel_closed = True
+            self._terminal.write("\n[Error: %s]\n" % str(e))
             return False
 
-    def clear_output(self):
-        """Clear all accumulated command output"""
-        with self._lock:
-            self._output.clear()
-
     def disconnect(self):
         """Send SSH_MSG_DISCONNECT and clean up"""
         with self._lock:
@@ -1157,7 +1500,9 @@ class SSHClient:
             self._send_seq = 0
             self._recv_seq = 0
             self._channel_closed = True
-            self._output.clear()
+            self._pending = bytearray()
+            self._poller = None
+            self._terminal = None
 
         self._close_socket()
 
@@ -1173,121 +1518,117 @@ class SSHClient:
         self.disconnect()
 
 
-def _load_history(storage) -> list:
-    """Load command history from SD card"""
-    text = storage.read(_HISTORY_FILE)
-    if not text:
-        return []
-    return [line for line in text.split("\n") if line.strip()]
-
-
-def _save_history(storage) -> None:
-    """Persist in-memory command history to SD card"""
-    global _history
-    entries = _history[-_HISTORY_MAX:]
-    storage.write(_HISTORY_FILE, "\n".join(entries))
-
-
 def _render_terminal(view_manager) -> None:
-    """Render the interactive terminal: colored output lines + inline prompt"""
-    from picoware.system.colors import (
-        TFT_GREEN,
-        TFT_CYAN,
-        TFT_RED,
-        TFT_YELLOW,
-        TFT_WHITE,
-    )
-    from picoware.system.vector import Vector
+    """Draw the terminal rows that changed and send only those to the display"""
+    from picoware.system.colors import TFT_WHITE, TFT_YELLOW
 
-    global _terminal_dirty
-    if not _terminal_dirty:
+    global _terminal_dirty, _shown_cursor
+
+    term = _ssh_client.terminal if _ssh_client else None
+    if term is None:
         return
-    _terminal_dirty = False
 
     draw = view_manager.draw
     cw = draw.font_size.x
     ch = draw.font_size.y
-    sw = draw.size.x
-    sh = draw.size.y
-    max_chars = sw // cw
-    max_lines = (sh // ch) - 1
-
-    wrapped = []
-    if _ssh_client:
-        for line in _ssh_client.output:
-            if line.startswith("[stderr]") or line.startswith("[Error"):
-                color = TFT_RED
-            elif line.startswith("$ "):
-                color = TFT_CYAN
-            else:
-                color = TFT_WHITE
-            while len(line) > max_chars:
-                wrapped.append((line[:max_chars], color))
-                line = line[max_chars:]
-            wrapped.append((line, color))
-
-    start = max(0, len(wrapped) - max_lines)
-    visible = wrapped[start:]
-
-    draw.erase()
-
-    pos = Vector(0, 0)
-    for i, (text, color) in enumerate(visible):
+    bg = draw.background
+    width = term.cols * cw
+    dirty = term.dirty
+
+    full = _terminal_dirty
+    if full:
+        _terminal_dirty = False
+        draw.erase()
+        for y in range(term.rows):
+            dirty[y] = 1
+
+    # the cursor is drawn over its row, so its old and new rows redraw
+    cursor = (min(term.x, term.cols - 1), term.y)
+    if cursor != _shown_cursor:
+        dirty[_shown_cursor[1]] = 1
+        dirty[cursor[1]] = 1
+        _shown_cursor = cursor
+
+    first = -1
+    last = -1
+    for y in range(term.rows):
+        if not dirty[y]:
+            continue
+        dirty[y] = 0
+        if first < 0:
+            first = y
+        last = y
+        if not full:
+            draw._fill_rectangle(0, y * ch, width, ch, bg)
+        text = str(term.lines[y], "utf-8").rstrip()
         if text:
-            pos.x = 0
-            pos.y = i * ch
-            draw.text(pos, text, color)
-
-    # --- Prompt line at the bottom ---
-    prompt_user = ssh_username or "user"
-    prompt_host = (ssh_host.split(":")[0] if ssh_host else "") or "host"
-    if len(prompt_host) > 12:
-        prompt_host = prompt_host[:12]
-
-    y = max_lines * ch
-    x = 0
-    pos.y = y
-
-    pos.x = x
-    draw.text(pos, prompt_user, TFT_GREEN)
-    x += len(prompt_user) * cw
-
-    pos.x = x
-    draw.text(pos, "@", TFT_WHITE)
-    x += cw
-
-    pos.x = x
-    draw.text(pos, prompt_host, TFT_CYAN)
-    x += len(prompt_host) * cw
+            draw._text(0, y * ch, text, TFT_WHITE)
+        if y == cursor[1] and _ssh_client.shell_open:
+            draw._fill_rectangle(cursor[0] * cw, y * ch + ch - 2, cw, 2, TFT_YELLOW)
 
-    pos.x = x
-    draw.text(pos, ":~$ ", TFT_WHITE)
-    x += 4 * cw
+    if full:
+        draw.swap()
+    elif first >= 0:
+        draw._swap_region(0, first * ch, width, (last - first + 1) * ch)
 
-    avail = max(1, (sw - x) // cw - 1)
-    disp_input = _input_line[-avail:] if len(_input_line) > avail else _input_line
 
-    pos.x = x
-    draw.text(pos, disp_input + "_", TFT_YELLOW)
-
-    draw.swap()
-    collect()
-
-
-def _handle_terminal_input(view_manager) -> None:
-    """Process key presses while in the interactive terminal view"""
+def _key_sequence(inp, button):
+    """Bytes a terminal sends for button, or None for keys it does not send"""
     from picoware.system.buttons import (
-        BUTTON_BACK,
         BUTTON_UP,
         BUTTON_DOWN,
+        BUTTON_LEFT,
+        BUTTON_RIGHT,
+        BUTTON_CENTER,
+        BUTTON_ENTER,
         BUTTON_BACKSPACE,
         BUTTON_DELETE,
-        BUTTON_ENTER,
-        BUTTON_CENTER,
+        BUTTON_TAB,
+        BUTTON_ESCAPE,
+        BUTTON_HOME,
+        BUTTON_END,
     )
 
-    global _input_line, _history_index, _history_saved, _terminal_dirty
-    global current_view, connection_state
+    global _ctrl_armed
+
+    if button == BUTTON_UP:
+        return b"\x1b[A"
+    if button == BUTTON_DOWN:
+        return b"\x1b[B"
+    if button == BUTTON_RIGHT:
+        return b"\x1b[C"
+    if button == BUTTON_LEFT:
+        return b"\x1b[D"
+    if button in (BUTTON_ENTER, BUTTON_CENTER):
+        return b"\r"
+    if button == BUTTON_BACKSPACE:
+        return b"\x7f"
+    if button == BUTTON_DELETE:
+        return b"\x1b[3~"
+    if button == BUTTON_TAB:
+        return b"\t"
+    if button == BUTTON_ESCAPE:
+        return b"\x1b"
+    if button == BUTTON_HOME:
+        return b"\x1b[H"
+    if button == BUTTON_END:
+        return b"\x1b[F"
+
+    char = inp.button_to_char(button)
+    if not char:
+        return None
+    if _ctrl_armed:
+        _ctrl_armed = False
+        if char.isalpha() or char in "[\\]^_":
+            return bytes([ord(char.upper()) & 0x1F])  # Ctrl+C is 0x03
+    return char.encode()
+
+
+def _handle_terminal_input(view_manager) -> None:
+    """Send key presses in the terminal view to the remote shell"""
+    from picoware.system.buttons import BUTTON_BACK, BUTTON_CONTROL
+
+    global current_view, connection_state, _ctrl_armed
 
     inp = view_manager.input_manager
     button = inp.button
@@ -1295,73 +1636,29 @@ def _handle_terminal_input(view_manager) -> None:
     if button == -1:
         return
 
+    inp.reset()
+
     if button == BUTTON_BACK:
-        inp.reset()
         current_view = VIEW_MAIN_MENU
         _menu_start(view_manager)
         return
 
-    if button in (BUTTON_ENTER, BUTTON_CENTER):
-        inp.reset()
-        cmd = _input_line.strip()
-        _input_line = ""
-        _history_index = -1
-        _history_saved = ""
-        _terminal_dirty = True
-        if not cmd:
-            return
-        _history.append(cmd)
-        if len(_history) > _HISTORY_MAX:
-            _history.pop(0)
-        _save_history(view_manager.storage)
-        if cmd == "clear":
-            if _ssh_client:
-                _ssh_client.clear_output()
-            return
+    if not _ssh_client or not _ssh_client.shell_open:
+        # the shell has exited: any key ends the connection
         if _ssh_client:
-            _ssh_client.execute_command(cmd)
-        return
-
-    if button == BUTTON_UP:
-        inp.reset()
-        if not _history:
-            return
-        if _history_index == -1:
-            _history_saved = _input_line
-            _history_index = len(_history) - 1
-        elif _history_index > 0:
-            _history_index -= 1
-        _input_line = _history[_history_index]
-        _terminal_dirty = True
-        return
-
-    if button == BUTTON_DOWN:
-        inp.reset()
-        if _history_index == -1:
-            return
-        if _history_index < len(_history) - 1:
-            _history_index += 1
-            _input_line = _history[_history_index]
-        else:
-            _history_index = -1
-            _input_line = _history_saved
-            _history_saved = ""
-        _terminal_dirty = True
+            _ssh_client.disconnect()
+        connection_state = STATE_DISCONNECTED
+        current_view = VIEW_MAIN_MENU
+        _menu_start(view_manager)
         return
 
-    if button in (BUTTON_BACKSPACE, BUTTON_DELETE):
-        inp.reset()
-        if _input_line:
-            _input_line = _input_line[:-1]
-            _terminal_dirty = True
+    if button == BUTTON_CONTROL:
+        _ctrl_armed = not _ctrl_armed
         return
 
-    char = inp.button_to_char(button)
-    if char is not None:
-        _input_line += char
-        _history_index = -1
-        _terminal_dirty = True
-    inp.reset()
+    data = _key_sequence(inp, button)
+    if data:
+        _ssh_client.send(data)
 
 
 def __load_ssh_credentials(view_manager) -> bool:
@@ -1538,11 +1835,10 @@ def start(view_manager) -> bool:
 
     __load_ssh_credentials(view_manager)
 
-    global _ssh_client, _history, _terminal_dirty
+    global _ssh_client, _terminal_dirty
 
     _ssh_client = SSHClient()
 
-    _history = _load_history(view_manager.storage)
     _terminal_dirty = True
 
     _menu_start(view_manager)
@@ -1622,8 +1918,11 @@ def run(view_manager) -> None:
                 view_manager.log(
                     f"Connecting to {ssh_host}:{port} as {ssh_username}..."
                 )
+                draw = view_manager.draw
                 success = _ssh_client.connect(
                     ssh_host, port, ssh_username, ssh_password
+                ) and _ssh_client.open_shell(
+                    draw.size.x // draw.font_size.x, draw.size.y // draw.font_size.y
                 )
 
                 if success:
@@ -1635,6 +1934,7 @@ def run(view_manager) -> None:
                         _loading = None
                 else:
                     error = _ssh_client.error or "Connection failed"
+                    _ssh_client.disconnect()
                     view_manager.log(f"[SSH]: {error}")
                     view_manager.alert(error, False)
                     connection_state = STATE_DISCONNECTED
@@ -1648,7 +1948,10 @@ def run(view_manager) -> None:
 
     elif current_view == VIEW_TERMINAL:
         _handle_terminal_input(view_manager)
-        _render_terminal(view_manager)
+        if current_view == VIEW_TERMINAL and _ssh_client:
+            # remote output is drawn as it arrives
+            _ssh_client.poll()
+            _render_terminal(view_manager)
 
     elif current_view in (
         VIEW_KEYBOARD_HOST,
@@ -1663,7 +1966,7 @@ def stop(view_manager) -> None:
     """Stop the SSH app"""
     global _ssh_client, _menu, _loading
     global ssh_host, ssh_port, ssh_username, ssh_password
-    global _history, _history_index, _history_saved, _input_line, _terminal_dirty
+    global _terminal_dirty, _shown_cursor, _ctrl_armed
 
     if _ssh_client:
         _ssh_client.disconnect()
@@ -1683,11 +1986,9 @@ def stop(view_manager) -> None:
     ssh_username = ""
     ssh_password = ""
 
-    _history.clear()
-    _history_index = -1
-    _history_saved = ""
-    _input_line = ""
     _terminal_dirty = True
+    _shown_cursor = (0, 0)
+    _ctrl_armed = False
 
     view_manager.keyboard.reset()
     collect()
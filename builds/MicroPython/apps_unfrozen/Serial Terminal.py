@@ -9,6 +9,7 @@ STATE_SENDING = const(2)
 _textbox = None
 _uart = None
 _loading = None
+_line = None  # receive buffer for one line
 state = STATE_TYPING
 message = ""
 
@@ -96,7 +97,7 @@ def start(view_manager) -> bool:
         BOARD_CARDPUTER,
     )
 
-    global _textbox, _uart, state, _loading
+    global _textbox, _uart, state, _loading, _line
 
     if _textbox is not None:
         del _textbox
@@ -123,6 +124,7 @@ def start(view_manager) -> bool:
     else:  # PicoCalc
         _uart = UART(uart_id=0, tx_pin=0, rx_pin=1)
         is_pico_calc = True
+    _line = bytearray(256)
 
     # first show info screen about connection
     d = view_manager.draw
@@ -189,8 +191,20 @@ def run(view_manager) -> None:
         else:
             __loading_run(view_manager)
     elif state == STATE_VIEWING:
-        if _uart.has_data:
-            _textbox.current_text += f"Friend: {_uart.read_line()}\n"
+        # non-blocking: drain every complete line, partial lines stay
+        # buffered until their newline arrives
+        lines = []
+        while True:
+            count = _uart.readline_into(_line)
+            if count < 0:
+                break
+            try:
+                line = str(_line[:count], "utf-8").rstrip("\r")
+            except UnicodeError:
+                line = ""
+            lines.append(f"Friend: {line}\n")
+        if lines:
+            _textbox.current_text += "".join(lines)
             _textbox.refresh()
 
 
@@ -198,7 +212,7 @@ def stop(view_manager) -> None:
     """Stop the app"""
     from gc import collect
 
-    global _textbox, _uart, _loading, state, message
+    global _textbox, _uart, _loading, _line, state, message
 
     if _textbox is not None:
         del _textbox
@@ -209,6 +223,7 @@ def stop(view_manager) -> None:
     if _loading is not None:
         del _loading
         _loading = None
+    _line = None
     state = STATE_TYPING
     message = ""
 
@@ -17,6 +17,17 @@ MENU_ITEM_SET_CHAT_ID = const(3)  # Menu item to set chat ID
 CHANNEL_FETCHING = const(0)  # Fetching messages
 CHANNEL_DISPLAYING = const(1)  # Displaying messages
 
+# long-polling constants
+POLL_TIMEOUT = const(25)  # seconds the server may hold getUpdates open
+POLL_RETRY_MS = const(5000)  # wait before polling again after an error
+HISTORY_SHOWN = const(50)  # messages loaded into the feed view
+
+# history files: messages are appended to HISTORY_FILE and the byte offset
+# of each one is appended to HISTORY_INDEX (uint32, little endian)
+HISTORY_FILE = "picoware/telegram/history.txt"
+HISTORY_INDEX = "picoware/telegram/history.idx"
+OFFSET_FILE = "picoware/telegram/offset.txt"
+
 # sending constants
 SENDING_WAITING = const(-1)  # Waiting to send
 SENDING_KEYBOARD = const(0)  # Keyboard for message input
@@ -34,6 +45,9 @@ sending_index = SENDING_WAITING
 keyboard_index = KEYBOARD_WAITING
 
 _http = None
+_poll_http = None
+_poll_offset = -1
+_poll_retry_at = 0
 _menu = None
 _loading = None
 _textbox = None
@@ -42,7 +56,7 @@ _message_to_send = ""
 
 
 def __channel_display(view_manager) -> None:
-    """Display channel messages from saved file"""
+    """Display channel messages from the history while polling for new ones"""
     from picoware.system.buttons import BUTTON_UP, BUTTON_DOWN, BUTTON_BACK
 
     inp = view_manager.input_manager
@@ -58,22 +72,31 @@ def __channel_display(view_manager) -> None:
         inp.reset()
         current_view = VIEW_MAIN_MENU
         channel_index = CHANNEL_FETCHING
+        __channel_stop()
         _menu_start(view_manager)
+        return
 
+    if __channel_poll(view_manager):
+        _textbox.set_text(__history_tail(view_manager.storage))
+        _textbox.jump_to_bottom()
 
-def __channel_parse(view_manager) -> bool:
-    """Parse channel messages from saved file"""
-    global _http
 
-    data = _http.response.json()
+def __channel_parse(view_manager) -> int:
+    """Append the updates of the last poll to the history, returns the number of new messages"""
+    global _poll_offset
 
+    data = _poll_http.response.json()
+    if not data.get("ok", False):
+        raise ValueError(data.get("description", "request rejected"))
     results = data.get("result", [])
-    if not results:
-        view_manager.alert("No messages found in feed.", False)
-        return False
-    parsed_text = ""
+
+    entries = []
     for item in results:
-        channel_post = item.get("channel_post", {})
+        # acknowledge every update, including ones without a post
+        _poll_offset = max(_poll_offset, item.get("update_id", 0) + 1)
+        channel_post = item.get("channel_post") or item.get("message")
+        if not channel_post:
+            continue
         text = channel_post.get("text", "")
         date = channel_post.get("date", 0)
         # check for username
@@ -81,13 +104,74 @@ def __channel_parse(view_manager) -> bool:
         username = sender_chat.get("username", "")
 
         if username:
-            parsed_text += f"@{username} ({date}):\n{text}\n\n"
+            entries.append(f"@{username} ({date}):\n{text}\n\n")
         else:
-            parsed_text += f"(ID: {channel_post.get('chat', {}).get('id', 'N/A')}, Date: {date}):\n{text}\n\n"
+            entries.append(
+                f"(ID: {channel_post.get('chat', {}).get('id', 'N/A')}, Date: {date}):\n{text}\n\n"
+            )
+
+    storage = view_manager.storage
+    if results:
+        storage.write(OFFSET_FILE, str(_poll_offset))
+    if entries:
+        __history_append(storage, entries)
+    return len(entries)
+
+
+def __channel_poll(view_manager) -> bool:
+    """Run the long-poll loop, returns True when new messages were stored"""
+    from utime import ticks_ms, ticks_diff
+
+    global _poll_retry_at
 
+    if _poll_http is None:
+        return False
+
+    if _poll_http.in_progress:
+        return False
+
+    received = 0
+    if _poll_http.is_finished:
+        if _poll_http.is_successful:
+            try:
+                received = __channel_parse(view_manager)
+            except Exception as e:
+                print(f"Telegram: bad getUpdates response: {e}")
+                _poll_retry_at = ticks_ms() + POLL_RETRY_MS
+        else:
+            print(f"Telegram: getUpdates failed: {_poll_http.error}")
+            _poll_http.disconnect()
+            _poll_retry_at = ticks_ms() + POLL_RETRY_MS
+        _poll_http.close()
+
+    # only keep polling while the feed is on screen
+    if current_view == VIEW_CHANNEL and ticks_diff(ticks_ms(), _poll_retry_at) >= 0:
+        __telegram_fetch(view_manager)
+    return received > 0
+
+
+def __channel_start(view_manager) -> bool:
+    """Show the stored history and start long-polling for new messages"""
     from picoware.gui.textbox import TextBox
 
-    global _textbox
+    global _textbox, _poll_http, _poll_offset, channel_index
+
+    storage = view_manager.storage
+    if not storage.read("picoware/telegram/token.txt"):
+        view_manager.alert("Bot token not set.", False)
+        return False
+
+    if _poll_offset < 0:
+        saved = storage.read(OFFSET_FILE) if storage.exists(OFFSET_FILE) else ""
+        _poll_offset = int(saved) if saved.strip().isdigit() else 0
+
+    if _poll_http is None:
+        from picoware.system.http import HTTP
+
+        # one connection is kept open and reused for every poll
+        _poll_http = HTTP(
+            chunk_size=1024, thread_manager=view_manager.thread_manager, keep_alive=True
+        )
 
     if _textbox is not None:
         del _textbox
@@ -101,14 +185,68 @@ def __channel_parse(view_manager) -> bool:
         view_manager.foreground_color,
         view_manager.background_color,
     )
+    text = __history_tail(storage)
+    _textbox.set_text(text if text else "Waiting for messages...")
+    _textbox.jump_to_bottom()
 
-    _textbox.set_text(parsed_text)
+    channel_index = CHANNEL_DISPLAYING
+    __channel_poll(view_manager)
+    return True
 
-    _http.close()
-    del _http
-    _http = None
 
-    return True
+def __channel_stop() -> None:
+    """Cancel the pending poll so it does not hold up other requests"""
+    if _poll_http is None:
+        return
+    # the ThreadManager runs one task at a time, so a poll held open by the
+    # server would delay every request queued after it by up to POLL_TIMEOUT;
+    # closing the connection wakes the read and stopping the task drops it
+    _poll_http.close()
+    _poll_http.disconnect()
+
+
+def __history_append(storage, entries: list) -> None:
+    """Append messages to the history file and their offsets to the index"""
+    position = storage.size(HISTORY_FILE) if storage.exists(HISTORY_FILE) else 0
+    index = bytearray(4 * len(entries))
+    for i, entry in enumerate(entries):
+        index[i * 4 : i * 4 + 4] = position.to_bytes(4, "little")
+        position += len(entry.encode("utf-8"))
+    storage.write(HISTORY_FILE, "".join(entries), "a")
+    storage.write(HISTORY_INDEX, bytes(index), "ab")
+
+
+def __history_read(storage, path: str, position: int, count: int) -> bytes:
+    """Read count bytes of an existing file from position through a seeked handle"""
+    handle = storage.file_open(path)
+    if handle is None:
+        return b""
+    try:
+        if not storage.file_seek(handle, position):
+            return b""
+        buffer = bytearray(count)
+        read = storage.file_readinto(handle, buffer)
+        return bytes(buffer[: max(0, read)]) if read < count else bytes(buffer)
+    finally:
+        storage.file_close(handle)
+
+
+def __history_tail(storage) -> str:
+    """Return the last HISTORY_SHOWN messages of the history"""
+    if not storage.exists(HISTORY_INDEX) or not storage.exists(HISTORY_FILE):
+        return ""
+    count = storage.size(HISTORY_INDEX) // 4
+    if count == 0:
+        return ""
+    first = max(0, count - HISTORY_SHOWN)
+    entry = __history_read(storage, HISTORY_INDEX, first * 4, 4)
+    if len(entry) < 4:
+        return ""
+    start = int.from_bytes(entry, "little")
+    end = storage.size(HISTORY_FILE)
+    if end <= start:
+        return ""
+    return __history_read(storage, HISTORY_FILE, start, end - start).decode("utf-8")
 
 
 def _http_await(view_manager) -> None:
@@ -122,10 +260,7 @@ def _http_await(view_manager) -> None:
         return
 
     if not _http.is_finished:
-        message = (
-            "Sending..." if current_view == VIEW_SENDING_MESSAGE else "Fetching..."
-        )
-        _loading_run(view_manager, message)
+        _loading_run(view_manager, "Sending...")
         return
 
     if not _http.is_successful:
@@ -144,13 +279,6 @@ def _http_await(view_manager) -> None:
         current_view = VIEW_MAIN_MENU
         sending_index = SENDING_WAITING
         _menu_start(view_manager)
-    elif current_view == VIEW_CHANNEL:
-        channel_index = CHANNEL_DISPLAYING
-
-        if not __channel_parse(view_manager):
-            current_view = VIEW_MAIN_MENU
-            channel_index = CHANNEL_FETCHING
-            _menu_start(view_manager)
 
 
 def _keyboard_save(view_manager) -> bool:
@@ -300,6 +428,7 @@ def __reset(view_manager) -> None:
     """Reset globals"""
     global current_view, menu_index, _http, _menu, _loading, fetch_started
     global sending_index, keyboard_index, channel_index, _message_to_send, _textbox
+    global _poll_http, _poll_offset, _poll_retry_at
 
     current_view = VIEW_MAIN_MENU
     menu_index = MENU_ITEM_SEND_MESSAGE
@@ -310,6 +439,12 @@ def __reset(view_manager) -> None:
     if _http is not None:
         del _http
         _http = None
+    if _poll_http is not None:
+        __channel_stop()
+        del _poll_http
+        _poll_http = None
+    _poll_offset = -1
+    _poll_retry_at = 0
     if _menu is not None:
         del _menu
         _menu = None
@@ -324,28 +459,21 @@ def __reset(view_manager) -> None:
 
 
 def __telegram_fetch(view_manager) -> bool:
-    """Fetch Telegram messages"""
-    from picoware.system.http import HTTP
-
-    global _http
-    if _http is not None:
-        _http.close()
-        del _http
-        _http = None
-
-    _http = HTTP(thread_manager=view_manager.thread_manager)
-
-    storage = view_manager.storage
-    token = storage.read("picoware/telegram/token.txt")
+    """Long-poll Telegram for updates after the acknowledged offset"""
+    token = view_manager.storage.read("picoware/telegram/token.txt")
 
     if not token:
-        view_manager.alert("Bot token not set.", False)
         return False
 
-    return _http.get_async(
-        url=f"https://api.telegram.org/bot{token}/getUpdates",
-        # save_to_file="picoware/telegram/messages.json",
-        # storage=storage,
+    # the server holds the request until an update arrives or POLL_TIMEOUT
+    # passes, and only returns updates newer than the offset
+    return _poll_http.get_async(
+        url=(
+            f"https://api.telegram.org/bot{token}/getUpdates"
+            f"?offset={_poll_offset}&timeout={POLL_TIMEOUT}"
+            "&allowed_updates=%5B%22channel_post%22%2C%22message%22%5D"
+        ),
+        timeout=POLL_TIMEOUT + 10,
     )
 
 
@@ -359,6 +487,8 @@ def __telegram_send(view_manager, text: str) -> bool:
         del _http
         _http = None
 
+    __channel_stop()
+
     _http = HTTP(thread_manager=view_manager.thread_manager)
 
     storage = view_manager.storage
@@ -450,8 +580,11 @@ def run(view_manager) -> None:
                 _keyboard_run(view_manager)
             elif menu_index == MENU_ITEM_VIEW_CHANNEL:
                 current_view = VIEW_CHANNEL
-                if __telegram_fetch(view_manager):
+                if __channel_start(view_manager):
                     fetch_started = True
+                else:
+                    current_view = VIEW_MAIN_MENU
+                    _menu_start(view_manager)
             elif menu_index == MENU_ITEM_SET_BOT_TOKEN:
                 current_view = VIEW_KEYBOARD_TOKEN
                 _keyboard_run(view_manager)
@@ -474,9 +607,8 @@ def run(view_manager) -> None:
             current_view = VIEW_MAIN_MENU
             fetch_started = False
             channel_index = CHANNEL_FETCHING
+            __channel_stop()
             _menu_start(view_manager)
-        elif channel_index == CHANNEL_FETCHING:
-            _http_await(view_manager)
         elif channel_index == CHANNEL_DISPLAYING:
             __channel_display(view_manager)
     elif current_view in (VIEW_KEYBOARD_TOKEN, VIEW_KEYBOARD_CHAT_ID):
@@ -99,6 +99,7 @@ def run(view_manager) -> None:
 
     if _http and _request_started:
         if _loading:
+            _loading.set_progress(*_http.progress)
             _loading.animate()
         return
 
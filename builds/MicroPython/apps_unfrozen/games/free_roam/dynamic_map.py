@@ -33,6 +33,7 @@ class DynamicMap:
         self._name: str = name
         self._tiles = [[TILE_EMPTY for _ in range(width)] for _ in range(height)]
         self._render_walls = []
+        self._mini_map = None  # tile types row by row, rebuilt after set_tile
 
         if add_border:
             self.add_border_walls()
@@ -41,6 +42,7 @@ class DynamicMap:
         """Clean up the map resources"""
         del self._tiles
         del self._render_walls
+        self._mini_map = None
 
     @property
     def width(self) -> int:
@@ -214,6 +216,7 @@ class DynamicMap:
         """Set the tile type at a specific position"""
         if 0 <= x < self._width and 0 <= y < self._height:
             self._tiles[y][x] = tile_type
+            self._mini_map = None
 
     def release_render_walls(self) -> None:
         """Release all the Sprite3D wall resources"""
@@ -249,24 +252,51 @@ class DynamicMap:
         draw._fill_rectangle(position.x, position.y, size.x, size.y, background_color)
         draw._rectangle(position.x, position.y, size.x, size.y, foreground_color)
 
-        # scale factors: pixels per map tile
-        scale_x: float = size.x / self._width
-        scale_y: float = size.y / self._height
-
-        for i in range(self._height):
-            for j in range(self._width):
-                tile = self._tiles[i][j]
-                if tile == TILE_EMPTY:
-                    continue
-
-                pos_x = position.x + j * scale_x
-                pos_y = position.y + i * scale_y
-                size_x = scale_x + 0.5
-                size_y = scale_y + 0.5
-                size_x = max(size_x, 1)  # ensure at least 1 pixel
-                size_y = max(size_y, 1)
-
-                draw._fill_rectangle(pos_x, pos_y, size_x, size_y, foreground_color)
+        # whole pixels per map tile, so the map can be drawn in one grid call
+        cell: int = min(size.x // self._width, size.y // self._height)
+        if cell > 0:
+            if self._mini_map is None:
+                cells = bytearray(self._width * self._height)
+                k = 0
+                for row in self._tiles:
+                    for tile in row:
+                        cells[k] = tile
+                        k += 1
+                self._mini_map = cells
+            from array import array
+
+            # empty tiles are index 0, every other tile type uses the last color
+            origin = Vector(
+                position.x + (size.x - cell * self._width) // 2,
+                position.y + (size.y - cell * self._height) // 2,
+            )
+            draw.grid(
+                origin,
+                self._width,
+                self._height,
+                cell,
+                self._mini_map,
+                array("H", (background_color, foreground_color)),
+            )
+            scale_x: float = cell
+            scale_y: float = cell
+            position = origin
+        else:
+            # map larger than the area: scale factors below one pixel per tile
+            scale_x: float = size.x / self._width
+            scale_y: float = size.y / self._height
+
+            for i in range(self._height):
+                for j in range(self._width):
+                    if self._tiles[i][j] == TILE_EMPTY:
+                        continue
+                    draw._fill_rectangle(
+                        position.x + j * scale_x,
+                        position.y + i * scale_y,
+                        1,
+                        1,
+                        foreground_color,
+                    )
 
         # draw player dot + direction arrow
         if player_pos.x < 0 or player_pos.y < 0:
@@ -7,163 +7,379 @@
 # License: Apache 2.0
 #
 # A simple implementation of Conway's Game of Life
-from random import random, choice
+#
+# The universe is a toroidal bitboard: each row is one integer with a bit per
+# cell, so a generation is a few dozen bitwise operations per row (neighbour
+# counts come from full adders over whole rows) instead of a Python loop per
+# cell. The screen is a viewport onto it that can be panned and zoomed.
+#
+# Controls:
+#   arrows      pan the viewport
+#   + / -       zoom in / out
+#   center      new random universe
+#   L           load the next .rle pattern from picoware/life on the SD card
+#   S           show / hide the generation rate
+from micropython import const
+from array import array
+from random import getrandbits
 from picoware.system.vector import Vector
-from picoware.system.colors import TFT_BLACK, TFT_RED, TFT_GREEN, TFT_BLUE
-from picoware.system.buttons import BUTTON_BACK, BUTTON_CENTER
+from picoware.system.colors import TFT_BLACK, TFT_GREEN, TFT_WHITE
+from picoware.system.buttons import (
+    BUTTON_BACK,
+    BUTTON_CENTER,
+    BUTTON_DOWN,
+    BUTTON_EQUAL,
+    BUTTON_L,
+    BUTTON_LEFT,
+    BUTTON_MINUS,
+    BUTTON_PLUS,
+    BUTTON_RIGHT,
+    BUTTON_S,
+    BUTTON_UP,
+)
 
 # === Settings ===
-CELL_SIZE = 6  # 6 pixels per cell (53x53 grid)
+UNIVERSE_WIDTH = const(256)  # cells per row (bits per row integer)
+UNIVERSE_HEIGHT = const(256)
+PATTERN_FOLDER = "picoware/life"
+
+_ZOOMS = (1, 2, 3, 4, 6, 8, 12)  # cell sizes in pixels
+_DEFAULT_ZOOM = const(4)  # index into _ZOOMS: 6 pixels per cell (53x53 view)
+_STATS_MS = const(1000)  # generation rate averaging window
+
 GRID_PIXELS = 320
-GRID_SIZE = GRID_PIXELS // CELL_SIZE  # 53x53 grid
-GRID_BYTES = GRID_SIZE * GRID_SIZE
 
-LIVE_CHANCE = 0.3  # 30% of cells alive initially
+_rows = None  # one int per universe row, bit x is column x
+_mask = (1 << UNIVERSE_WIDTH) - 1
+
+# viewport
+_zoom = _DEFAULT_ZOOM
+_view_x = 0
+_view_y = 0
+_columns = 0  # visible cells
+_lines = 0
+_cells = None  # visible window as palette indices for draw.grid()
+_scratch = None  # one row expanded a byte (8 cells) at a time
+_blank = None  # an empty row
+_expand = None  # byte -> its 8 bits as 8 bytes
+_COLORS = None  # palette: cell value -> RGB565
+_vec_pos = None
+_clear = True  # the viewport no longer covers the old picture
+
+# patterns and stats
+_patterns = None
+_pattern_index = -1
+_generation = 0
+_stats_generation = 0
+_stats_ticks = 0
+_rate = 0  # generations per second, in tenths
+_show_stats = True
+
+
+def __parse_rle(text: str):
+    """Return (width, height, rows) for an RLE pattern, rows as ints."""
+    width = height = 0
+    body = []
+    for line in text.split("\n"):
+        line = line.strip()
+        if not line or line[0] == "#":
+            continue
+        if line[0] == "x":
+            # x = 3, y = 3, rule = B3/S23
+            for field in line.split(","):
+                name, _, value = field.partition("=")
+                name = name.strip()
+                if name == "x":
+                    width = int(value)
+                elif name == "y":
+                    height = int(value)
+            continue
+        body.append(line)
+        if "!" in line:
+            break
+
+    rows = []
+    row = 0
+    x = 0
+    count = 0
+    for c in "".join(body):
+        if "0" <= c <= "9":
+            count = count * 10 + ord(c) - 48
+            continue
+        run = count or 1
+        count = 0
+        if c == "!":
+            break
+        if c == "$":
+            rows.append(row)
+            for _ in range(run - 1):
+                rows.append(0)
+            row = 0
+            x = 0
+        elif c == "b" or c == ".":
+            x += run
+        else:
+            # "o" and the letters of multi-state rules are all live cells
+            row |= ((1 << run) - 1) << x
+            x += run
+    rows.append(row)
+    if x > width:
+        width = x
+    return width, max(height, len(rows)), rows
+
+
+def __resize_view(draw) -> None:
+    """Fit the viewport to the zoom level and clamp it to the universe."""
+    global _columns, _lines, _cells, _scratch, _blank, _vec_pos, _clear
+
+    cell = _ZOOMS[_zoom]
+    _columns = min(draw.size.x // cell, UNIVERSE_WIDTH)
+    _lines = min(draw.size.y // cell, UNIVERSE_HEIGHT)
+    _cells = bytearray(_columns * _lines)
+    _scratch = bytearray((_columns + 7) & ~7)
+    _blank = bytes(_columns)
+    # centre a view smaller than the screen
+    _vec_pos = Vector(
+        (draw.size.x - _columns * cell) // 2, (draw.size.y - _lines * cell) // 2
+    )
+    _clear = True
+
+
+def __update_stats() -> None:
+    """Refresh the generations per second figure about once a second."""
+    from utime import ticks_ms, ticks_diff
+
+    global _stats_generation, _stats_ticks, _rate
+
+    now = ticks_ms()
+    elapsed = ticks_diff(now, _stats_ticks)
+    if elapsed >= _STATS_MS:
+        _rate = (_generation - _stats_generation) * 10000 // elapsed
+        _stats_generation = _generation
+        _stats_ticks = now
+
+
+def center_view() -> None:
+    """Centre the viewport on the middle of the universe."""
+    global _view_x, _view_y
+
+    _view_x = (UNIVERSE_WIDTH - _columns) // 2 % UNIVERSE_WIDTH
+    _view_y = (UNIVERSE_HEIGHT - _lines) // 2 % UNIVERSE_HEIGHT
+
+
+def load_pattern(storage, path: str) -> bool:
+    """Clear the universe and place an RLE pattern in its centre."""
+    global _rows, _generation
+
+    text = storage.read(path)
+    if not text:
+        return False
+    try:
+        width, height, rows = __parse_rle(text)
+    except ValueError as e:
+        print(f"Invalid RLE pattern {path}: {e}")
+        return False
+    if width > UNIVERSE_WIDTH or height > UNIVERSE_HEIGHT:
+        print(f"Pattern {path} is larger than {UNIVERSE_WIDTH}x{UNIVERSE_HEIGHT}")
+        return False
+
+    left = (UNIVERSE_WIDTH - width) // 2
+    top = (UNIVERSE_HEIGHT - height) // 2
+    _rows = [0] * UNIVERSE_HEIGHT
+    for i, row in enumerate(rows):
+        _rows[top + i] = row << left
+    _generation = 0
+    center_view()
+    print(f"Loaded {path} ({width}x{height})")
+    return True
+
 
-_current_grid = None  # Current state
-_next_grid = None  # Next state
-_neighbor_counts = None  # Neighbor counts
+def next_pattern(view_manager) -> bool:
+    """Load the next RLE file from PATTERN_FOLDER, wrapping around."""
+    global _patterns, _pattern_index
+
+    storage = view_manager.storage
+    if _patterns is None:
+        _patterns = sorted(
+            name
+            for name in storage.listdir(PATTERN_FOLDER)
+            if name.lower().endswith(".rle")
+        )
+    if not _patterns:
+        view_manager.alert(f"No .rle patterns in {PATTERN_FOLDER}", False)
+        return False
+    _pattern_index = (_pattern_index + 1) % len(_patterns)
+    return load_pattern(storage, f"{PATTERN_FOLDER}/{_patterns[_pattern_index]}")
 
 
 # === Initialize Grid ===
 def random_grid():
-    """Fill the grid with random initial state."""
-    global _current_grid
-
-    for i in range(GRID_BYTES):
-        _current_grid[i] = choice([1, 2, 3]) if random() < LIVE_CHANCE else 0
+    """Fill the universe with random cells, about 34% alive."""
+    global _rows, _generation
+
+    words = (UNIVERSE_WIDTH + 31) // 32
+    rows = []
+    for _ in range(UNIVERSE_HEIGHT):
+        row = 0
+        for _ in range(words):
+            # P(alive) = 1/4 + 1/8 - 1/32
+            bits = getrandbits(32) & getrandbits(32)
+            bits |= getrandbits(32) & getrandbits(32) & getrandbits(32)
+            row = row << 32 | bits
+        rows.append(row & _mask)
+    _rows = rows
+    _generation = 0
 
 
 # === Game Update ===
 def update():
-    global _current_grid, _next_grid, _neighbor_counts
-
-    # Clear neighbor counts and next grid
-    for i in range(GRID_BYTES):
-        _neighbor_counts[i] = 0
-        _next_grid[i] = 0
-
-    # Count neighbors
-    for y in range(GRID_SIZE):
-        y_offset = y * GRID_SIZE
-        y_prev = ((y - 1) % GRID_SIZE) * GRID_SIZE
-        y_next = ((y + 1) % GRID_SIZE) * GRID_SIZE
-
-        for x in range(GRID_SIZE):
-            idx = y_offset + x
-            cell = _current_grid[idx]
-
-            if cell != 0:
-                x_prev = (x - 1) % GRID_SIZE
-                x_next = (x + 1) % GRID_SIZE
-
-                # Increment all 8 neighbors at once
-                _neighbor_counts[y_prev + x_prev] += 1
-                _neighbor_counts[y_prev + x] += 1
-                _neighbor_counts[y_prev + x_next] += 1
-                _neighbor_counts[y_offset + x_prev] += 1
-                _neighbor_counts[y_offset + x_next] += 1
-                _neighbor_counts[y_next + x_prev] += 1
-                _neighbor_counts[y_next + x] += 1
-                _neighbor_counts[y_next + x_next] += 1
-
-    # Apply rules
-    for i in range(GRID_BYTES):
-        neighbor_count = _neighbor_counts[i]
-        cell_value = _current_grid[i]
-
-        if cell_value != 0:
-            if neighbor_count in (2, 3):
-                _next_grid[i] = cell_value  # Stay alive
-        elif neighbor_count == 3:
-            # Get birth color from neighbors
-            y = i // GRID_SIZE
-            x = i % GRID_SIZE
-            color = pick_birth_color_ram(x, y, _current_grid)
-            _next_grid[i] = color
-
-    # Swap buffers
-    _current_grid, _next_grid = _next_grid, _current_grid
-
-
-def pick_birth_color_ram(x, y, grid_data):
-    """Optimized birth color picker reading."""
-    x_prev = (x - 1) % GRID_SIZE
-    x_next = (x + 1) % GRID_SIZE
-    y_prev = ((y - 1) % GRID_SIZE) * GRID_SIZE
-    y_curr = y * GRID_SIZE
-    y_next = ((y + 1) % GRID_SIZE) * GRID_SIZE
-
-    # Check all 8 neighbors
-    for idx in (
-        y_prev + x_prev,
-        y_prev + x,
-        y_prev + x_next,
-        y_curr + x_prev,
-        y_curr + x_next,
-        y_next + x_prev,
-        y_next + x,
-        y_next + x_next,
-    ):
-        cell = grid_data[idx]
-        if cell != 0:
-            return cell
-
-    return choice([1, 2, 3])
-
-
-_COLORS = {}
-_vec_size = None
-_vec_pos = None
+    """Advance the universe by one generation."""
+    global _rows, _generation
+
+    rows = _rows
+    mask = _mask
+    top = UNIVERSE_WIDTH - 1
+
+    # horizontal neighbour sums of every row, as bit planes:
+    # pair (left + right) for the row itself, triple (left + cell + right)
+    # for the rows above and below
+    pair_1 = []
+    pair_2 = []
+    triple_1 = []
+    triple_2 = []
+    for row in rows:
+        left = (row << 1) & mask | row >> top
+        right = row >> 1 | (row & 1) << top
+        ones = left ^ right
+        twos = left & right
+        pair_1.append(ones)
+        pair_2.append(twos)
+        triple_1.append(ones ^ row)
+        triple_2.append(twos | row & ones)
+
+    height = len(rows)
+    new_rows = [0] * height
+    above = height - 1
+    for y in range(height):
+        below = y + 1 if y + 1 < height else 0
+        row = rows[y]
+        if row or rows[above] or rows[below]:
+            # add the three sums: ones plane, then the four weight-two
+            # planes reduced to "odd" (twos) and "two or more" (high)
+            a = triple_1[above]
+            b = triple_1[below]
+            c = pair_1[y]
+            ones = a ^ b ^ c
+            carry = a & b | c & (a ^ b)
+            a = triple_2[above]
+            b = triple_2[below]
+            c = pair_2[y]
+            d = a ^ b
+            e = c ^ carry
+            twos = d ^ e
+            high = a & b | c & carry | d & e
+            # 3 neighbours: born or survives; 2: survives
+            alive = (ones | row) & twos
+            new_rows[y] = alive ^ (alive & high)
+        above = y
+
+    _rows = new_rows
+    _generation += 1
 
 
 def draw(display):
-    # Color mappings
-    display.fill_screen(TFT_BLACK)
-    idx = 0
-    for y in range(GRID_SIZE):
-        for x in range(GRID_SIZE):
-            color = _COLORS.get(_current_grid[idx], TFT_BLACK)
-            if color != TFT_BLACK:  # Skip drawing black pixels for speed
-                _vec_pos.x = x * CELL_SIZE
-                _vec_pos.y = y * CELL_SIZE
-                display._fill_rectangle(
-                    _vec_pos.x, _vec_pos.y, _vec_size.x, _vec_size.y, color
-                )
-            idx += 1
+    """Draw the viewport (and the stats line) and show it."""
+    global _clear
+
+    if _clear:
+        # the grid may leave a strip at the edges, clear it once
+        display.fill_screen(TFT_BLACK)
+        _clear = False
+
+    rows = _rows
+    cells = _cells
+    view = memoryview(cells)
+    expand = memoryview(_expand)
+    columns = _columns
+    width = UNIVERSE_WIDTH
+    shift = _view_x
+    mask = (1 << columns) - 1
+    count = (columns + 7) >> 3
+    scratch = _scratch
+    visible = memoryview(scratch)[:columns]
+    blank = _blank
+    y = _view_y
+    offset = 0
+    for _ in range(_lines):
+        row = rows[y]
+        if row:
+            # rotate the view's first column down to bit 0
+            if shift:
+                row = row >> shift | row << (width - shift)
+            row &= mask
+        if row:
+            i = 0
+            for byte in row.to_bytes(count, "little"):
+                scratch[i : i + 8] = expand[byte * 8 : byte * 8 + 8]
+                i += 8
+            view[offset : offset + columns] = visible
+        else:
+            view[offset : offset + columns] = blank
+        offset += columns
+        y += 1
+        if y == UNIVERSE_HEIGHT:
+            y = 0
+
+    # one call scales every cell up and maps it through the palette
+    display.grid(_vec_pos, columns, _lines, _ZOOMS[_zoom], cells, _COLORS)
+    if _show_stats:
+        display._text(
+            2,
+            2,
+            f"gen {_generation}  {_rate // 10}.{_rate % 10}/s  x{_ZOOMS[_zoom]}",
+            TFT_WHITE,
+        )
     display.swap()
 
 
 def start(view_manager) -> bool:
     """Start the app"""
-    global _current_grid, _next_grid, _neighbor_counts, _vec_size, _vec_pos, _COLORS, GRID_PIXELS, CELL_SIZE, GRID_SIZE, GRID_BYTES
-
-    GRID_PIXELS = view_manager.draw.size.x  # 320 pixels
-    CELL_SIZE = GRID_PIXELS // 53  # 6 pixels per cell (53x53 grid)
-    GRID_SIZE = GRID_PIXELS // CELL_SIZE  # 53x53 grid
-    GRID_BYTES = GRID_SIZE * GRID_SIZE
+    global _vec_pos, _COLORS, _expand, GRID_PIXELS, _zoom, _patterns, _pattern_index
+    global _stats_generation, _stats_ticks, _rate
 
-    _vec_size = Vector(CELL_SIZE, CELL_SIZE)
-    _vec_pos = Vector(0, 0)
+    from utime import ticks_ms
 
-    _COLORS = {
-        0: TFT_BLACK,  # dead = black
-        1: TFT_RED,  # red
-        2: TFT_GREEN,  # green
-        3: TFT_BLUE,  # blue
-    }
-
-    _current_grid = bytearray(GRID_BYTES)
-    _next_grid = bytearray(GRID_BYTES)
-    _neighbor_counts = bytearray(GRID_BYTES)
+    GRID_PIXELS = view_manager.draw.size.x  # 320 pixels
 
+    _COLORS = array(
+        "H",
+        (
+            TFT_BLACK,  # dead = black
+            TFT_GREEN,  # alive
+        ),
+    )
+
+    # 8 cells per table entry, so a row is expanded a byte at a time
+    _expand = bytes(b >> i & 1 for b in range(256) for i in range(8))
+
+    _zoom = _DEFAULT_ZOOM
+    _patterns = None
+    _pattern_index = -1
+    __resize_view(view_manager.draw)
+    center_view()
     random_grid()
 
+    _stats_generation = 0
+    _stats_ticks = ticks_ms()
+    _rate = 0
+
     return True
 
 
 def run(view_manager) -> None:
     """Run the app"""
+    global _view_x, _view_y, _zoom, _show_stats
+
     inp = view_manager.input_manager
     button = inp.button
 
@@ -172,27 +388,57 @@ def run(view_manager) -> None:
         view_manager.back()
         return
 
-    if button == BUTTON_CENTER:
+    if button != -1:
         inp.reset()
-        random_grid()
+        step = max(1, _columns // 8)
+        if button == BUTTON_CENTER:
+            random_grid()
+        elif button == BUTTON_LEFT:
+            _view_x = (_view_x - step) % UNIVERSE_WIDTH
+        elif button == BUTTON_RIGHT:
+            _view_x = (_view_x + step) % UNIVERSE_WIDTH
+        elif button == BUTTON_UP:
+            _view_y = (_view_y - step) % UNIVERSE_HEIGHT
+        elif button == BUTTON_DOWN:
+            _view_y = (_view_y + step) % UNIVERSE_HEIGHT
+        elif button in (BUTTON_PLUS, BUTTON_EQUAL, BUTTON_MINUS):
+            zoom = _zoom + (-1 if button == BUTTON_MINUS else 1)
+            if 0 <= zoom < len(_ZOOMS):
+                # keep the middle of the view in place
+                middle_x = _view_x + _columns // 2
+                middle_y = _view_y + _lines // 2
+                _zoom = zoom
+                __resize_view(view_manager.draw)
+                _view_x = (middle_x - _columns // 2) % UNIVERSE_WIDTH
+                _view_y = (middle_y - _lines // 2) % UNIVERSE_HEIGHT
+        elif button == BUTTON_L:
+            next_pattern(view_manager)
+        elif button == BUTTON_S:
+            _show_stats = not _show_stats
 
     draw(view_manager.draw)
 
     update()
+    __update_stats()
 
 
 def stop(view_manager) -> None:
     """Stop the app and free resources"""
     from gc import collect
 
-    global _current_grid, _next_grid, _neighbor_counts, _vec_size, _vec_pos, _COLORS
+    global _rows, _cells, _scratch, _blank, _expand, _vec_pos, _COLORS, _patterns
 
-    _vec_size = None
-    _vec_pos = None
-    _COLORS = {}
+    if _generation:
+        print(f"Game of Life: {_generation} generations, {_rate / 10} gen/s")
 
-    _current_grid = None
-    _next_grid = None
-    _neighbor_counts = None
+    _vec_pos = None
+    _COLORS = None
+
+    _rows = None
+    _cells = None
+    _scratch = None
+    _blank = None
+    _expand = None
+    _patterns = None
 
     collect()
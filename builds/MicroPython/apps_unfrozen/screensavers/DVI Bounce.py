@@ -1,4478 +1,253 @@
 # translated from PicoDVI's logobounce.ino Arduino sketch
 
-LOGO = bytes(
-    [
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x0F,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xE0,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x03,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xC0,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x0F,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xE0,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x07,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0x80,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x0F,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xE0,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x07,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0x80,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x1F,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xF0,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x0F,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0x80,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x1F,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xF0,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x1F,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0x80,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x1F,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xF0,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x3F,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x1F,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xF8,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x7F,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x1F,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xF8,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x3F,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFC,
-        0x00,
-        0x00,
-        0x00,
-        0x01,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x3F,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFC,
-        0x00,
-        0x00,
-        0x00,
-        0x01,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFE,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x3F,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFC,
-        0x00,
-        0x00,
-        0x00,
-        0x03,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFE,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x3F,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFE,
-        0x00,
-        0x00,
-        0x00,
-        0x07,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFE,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x7F,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFE,
-        0x00,
-        0x00,
-        0x00,
-        0x0F,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFE,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x7F,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFE,
-        0x00,
-        0x00,
-        0x00,
-        0x1F,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFC,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x1F,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x3F,
-        0xFF,
-        0xFF,
-        0xFC,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x3F,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x3F,
-        0xFF,
-        0xFF,
-        0xF8,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x07,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x7F,
-        0xFF,
-        0xFF,
-        0xF8,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x01,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0x80,
-        0x00,
-        0x00,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xF0,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0xFF,
-        0xFF,
-        0x80,
-        0x00,
-        0x00,
-        0x7F,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0x80,
-        0x00,
-        0x01,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xEF,
-        0xFF,
-        0xFF,
-        0xF8,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0xFF,
-        0xFF,
-        0x80,
-        0x00,
-        0x00,
-        0x3F,
-        0xFF,
-        0xFF,
-        0xFF,
-        0x7F,
-        0xFF,
-        0xFF,
-        0x80,
-        0x00,
-        0x03,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xDF,
-        0xFF,
-        0xFF,
-        0xF8,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x01,
-        0xFF,
-        0xFF,
-        0xFF,
-        0x80,
-        0x00,
-        0x00,
-        0x1F,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xC0,
-        0x00,
-        0x07,
-        0xFF,
-        0xFF,
-        0xFF,
-        0x9F,
-        0xFF,
-        0xFF,
-        0xF8,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x01,
-        0xFF,
-        0xFF,
-        0xFF,
-        0x80,
-        0x00,
-        0x00,
-        0x0F,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xC0,
-        0x00,
-        0x07,
-        0xFF,
-        0xFF,
-        0xFF,
-        0x1F,
-        0xFF,
-        0xFF,
-        0xF8,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x01,
-        0xFF,
-        0xFF,
-        0xFF,
-        0x80,
-        0x00,
-        0x00,
-        0x07,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xBF,
-        0xFF,
-        0xFF,
-        0xC0,
-        0x00,
-        0x0F,
-        0xFF,
-        0xFF,
-        0xFE,
-        0x1F,
-        0xFF,
-        0xFF,
-        0xF0,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x01,
-        0xFF,
-        0xFF,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x07,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xBF,
-        0xFF,
-        0xFF,
-        0xE0,
-        0x00,
-        0x1F,
-        0xFF,
-        0xFF,
-        0xFC,
-        0x3F,
-        0xFF,
-        0xFF,
-        0xF0,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x03,
-        0xFF,
-        0xFF,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x03,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xBF,
-        0xFF,
-        0xFF,
-        0xE0,
-        0x00,
-        0x3F,
-        0xFF,
-        0xFF,
-        0xF8,
-        0x3F,
-        0xFF,
-        0xFF,
-        0xF0,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x03,
-        0xFF,
-        0xFF,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x03,
-        0xFF,
-        0xFF,
-        0xFF,
-        0x9F,
-        0xFF,
-        0xFF,
-        0xE0,
-        0x00,
-        0x7F,
-        0xFF,
-        0xFF,
-        0xF8,
-        0x3F,
-        0xFF,
-        0xFF,
-        0xF0,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x03,
-        0xFF,
-        0xFF,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x03,
-        0xFF,
-        0xFF,
-        0xFF,
-        0x9F,
-        0xFF,
-        0xFF,
-        0xF0,
-        0x00,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xF0,
-        0x3F,
-        0xFF,
-        0xFF,
-        0xE0,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x03,
-        0xFF,
-        0xFF,
-        0xFE,
-        0x00,
-        0x00,
-        0x00,
-        0x03,
-        0xFF,
-        0xFF,
-        0xFF,
-        0x9F,
-        0xFF,
-        0xFF,
-        0xF0,
-        0x00,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xE0,
-        0x7F,
-        0xFF,
-        0xFF,
-        0xE0,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x03,
-        0xFF,
-        0xFF,
-        0xFE,
-        0x00,
-        0x00,
-        0x00,
-        0x03,
-        0xFF,
-        0xFF,
-        0xFF,
-        0x8F,
-        0xFF,
-        0xFF,
-        0xF0,
-        0x01,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xC0,
-        0x7F,
-        0xFF,
-        0xFF,
-        0xE0,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x07,
-        0xFF,
-        0xFF,
-        0xFE,
-        0x00,
-        0x00,
-        0x00,
-        0x03,
-        0xFF,
-        0xFF,
-        0xFF,
-        0x8F,
-        0xFF,
-        0xFF,
-        0xF8,
-        0x03,
-        0xFF,
-        0xFF,
-        0xFF,
-        0x80,
-        0x7F,
-        0xFF,
-        0xFF,
-        0xE0,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x07,
-        0xFF,
-        0xFF,
-        0xFE,
-        0x00,
-        0x00,
-        0x00,
-        0x03,
-        0xFF,
-        0xFF,
-        0xFF,
-        0x8F,
-        0xFF,
-        0xFF,
-        0xF8,
-        0x07,
-        0xFF,
-        0xFF,
-        0xFF,
-        0x00,
-        0x7F,
-        0xFF,
-        0xFF,
-        0xC0,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x07,
-        0xFF,
-        0xFF,
-        0xFC,
-        0x00,
-        0x00,
-        0x00,
-        0x03,
-        0xFF,
-        0xFF,
-        0xFF,
-        0x07,
-        0xFF,
-        0xFF,
-        0xF8,
-        0x07,
-        0xFF,
-        0xFF,
-        0xFE,
-        0x00,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xC0,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x07,
-        0xFF,
-        0xFF,
-        0xFC,
-        0x00,
-        0x00,
-        0x00,
-        0x03,
-        0xFF,
-        0xFF,
-        0xFF,
-        0x07,
-        0xFF,
-        0xFF,
-        0xFC,
-        0x0F,
-        0xFF,
-        0xFF,
-        0xFC,
-        0x00,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xC0,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x0F,
-        0xFF,
-        0xFF,
-        0xFC,
-        0x00,
-        0x00,
-        0x00,
-        0x07,
-        0xFF,
-        0xFF,
-        0xFF,
-        0x03,
-        0xFF,
-        0xFF,
-        0xFC,
-        0x1F,
-        0xFF,
-        0xFF,
-        0xF8,
-        0x00,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xC0,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x0F,
-        0xFF,
-        0xFF,
-        0xFC,
-        0x00,
-        0x00,
-        0x00,
-        0x07,
-        0xFF,
-        0xFF,
-        0xFF,
-        0x03,
-        0xFF,
-        0xFF,
-        0xFC,
-        0x3F,
-        0xFF,
-        0xFF,
-        0xF8,
-        0x00,
-        0xFF,
-        0xFF,
-        0xFF,
-        0x80,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x0F,
-        0xFF,
-        0xFF,
-        0xFC,
-        0x00,
-        0x00,
-        0x00,
-        0x0F,
-        0xFF,
-        0xFF,
-        0xFE,
-        0x03,
-        0xFF,
-        0xFF,
-        0xFC,
-        0x3F,
-        0xFF,
-        0xFF,
-        0xF0,
-        0x00,
-        0xFF,
-        0xFF,
-        0xFF,
-        0x80,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x0F,
-        0xFF,
-        0xFF,
-        0xF8,
-        0x00,
-        0x00,
-        0x00,
-        0x0F,
-        0xFF,
-        0xFF,
-        0xFE,
-        0x01,
-        0xFF,
-        0xFF,
-        0xFE,
-        0x7F,
-        0xFF,
-        0xFF,
-        0xE0,
-        0x01,
-        0xFF,
-        0xFF,
-        0xFF,
-        0x80,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x1F,
-        0xFF,
-        0xFF,
-        0xF8,
-        0x00,
-        0x00,
-        0x00,
-        0x1F,
-        0xFF,
-        0xFF,
-        0xFC,
-        0x01,
-        0xFF,
-        0xFF,
-        0xFE,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xC0,
-        0x01,
-        0xFF,
-        0xFF,
-        0xFF,
-        0x80,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x1F,
-        0xFF,
-        0xFF,
-        0xF8,
-        0x00,
-        0x00,
-        0x00,
-        0x3F,
-        0xFF,
-        0xFF,
-        0xFC,
-        0x01,
-        0xFF,
-        0xFF,
-        0xFE,
-        0xFF,
-        0xFF,
-        0xFF,
-        0x80,
-        0x01,
-        0xFF,
-        0xFF,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x1F,
-        0xFF,
-        0xFF,
-        0xF8,
-        0x00,
-        0x00,
-        0x00,
-        0x7F,
-        0xFF,
-        0xFF,
-        0xF8,
-        0x00,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0x00,
-        0x01,
-        0xFF,
-        0xFF,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x1F,
-        0xFF,
-        0xFF,
-        0xF0,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xF8,
-        0x00,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFE,
-        0x00,
-        0x03,
-        0xFF,
-        0xFF,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x3F,
-        0xFF,
-        0xFF,
-        0xF0,
-        0x00,
-        0x00,
-        0x01,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xF0,
-        0x00,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFC,
-        0x00,
-        0x03,
-        0xFF,
-        0xFF,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x3F,
-        0xFF,
-        0xFF,
-        0xF0,
-        0x00,
-        0x00,
-        0x03,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xE0,
-        0x00,
-        0x7F,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFC,
-        0x00,
-        0x03,
-        0xFF,
-        0xFF,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x3F,
-        0xFF,
-        0xFF,
-        0xF0,
-        0x00,
-        0x00,
-        0x0F,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xC0,
-        0x00,
-        0x7F,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xF8,
-        0x00,
-        0x03,
-        0xFF,
-        0xFF,
-        0xFE,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x3F,
-        0xFF,
-        0xFF,
-        0xE0,
-        0x00,
-        0x00,
-        0x3F,
-        0xFF,
-        0xFF,
-        0xFF,
-        0x80,
-        0x00,
-        0x7F,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xF0,
-        0x00,
-        0x07,
-        0xFF,
-        0xFF,
-        0xFE,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x7F,
-        0xFF,
-        0xFF,
-        0xE0,
-        0x00,
-        0x00,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0x00,
-        0x00,
-        0x3F,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xE0,
-        0x00,
-        0x07,
-        0xFF,
-        0xFF,
-        0xFE,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x7F,
-        0xFF,
-        0xFF,
-        0xE0,
-        0x00,
-        0x07,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFE,
-        0x00,
-        0x00,
-        0x3F,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xC0,
-        0x00,
-        0x07,
-        0xFF,
-        0xFF,
-        0xFE,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x7F,
-        0xFF,
-        0xFF,
-        0xE0,
-        0x00,
-        0x7F,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFC,
-        0x00,
-        0x00,
-        0x1F,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0x80,
-        0x00,
-        0x07,
-        0xFF,
-        0xFF,
-        0xFC,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x7F,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xF8,
-        0x00,
-        0x00,
-        0x1F,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0x00,
-        0x00,
-        0x0F,
-        0xFF,
-        0xFF,
-        0xFC,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x7F,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xF0,
-        0x00,
-        0x00,
-        0x1F,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFE,
-        0x00,
-        0x00,
-        0x0F,
-        0xFF,
-        0xFF,
-        0xFC,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xE0,
-        0x00,
-        0x00,
-        0x0F,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFC,
-        0x00,
-        0x00,
-        0x0F,
-        0xFF,
-        0xFF,
-        0xFC,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0x80,
-        0x00,
-        0x00,
-        0x0F,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFC,
-        0x00,
-        0x00,
-        0x0F,
-        0xFF,
-        0xFF,
-        0xF8,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x0F,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xF8,
-        0x00,
-        0x00,
-        0x1F,
-        0xFF,
-        0xFF,
-        0xF8,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFC,
-        0x00,
-        0x00,
-        0x00,
-        0x07,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xF0,
-        0x00,
-        0x00,
-        0x1F,
-        0xFF,
-        0xFF,
-        0xF8,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x01,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xF0,
-        0x00,
-        0x00,
-        0x00,
-        0x07,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xE0,
-        0x00,
-        0x00,
-        0x1F,
-        0xFF,
-        0xFF,
-        0xF8,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x01,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xC0,
-        0x00,
-        0x00,
-        0x00,
-        0x07,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xC0,
-        0x00,
-        0x00,
-        0x1F,
-        0xFF,
-        0xFF,
-        0xF0,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x01,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x03,
-        0xFF,
-        0xFF,
-        0xFF,
-        0x80,
-        0x00,
-        0x00,
-        0x1F,
-        0xFF,
-        0xFF,
-        0xF0,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x01,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFC,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x03,
-        0xFF,
-        0xFF,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x3F,
-        0xFF,
-        0xFF,
-        0xF0,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x03,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xF0,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x03,
-        0xFF,
-        0xFF,
-        0xFE,
-        0x00,
-        0x00,
-        0x00,
-        0x3F,
-        0xFF,
-        0xFF,
-        0xF0,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x03,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0x80,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x01,
-        0xFF,
-        0xFF,
-        0xFC,
-        0x00,
-        0x00,
-        0x00,
-        0x3F,
-        0xFF,
-        0xFF,
-        0xF0,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x03,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xF8,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x01,
-        0xFF,
-        0xFF,
-        0xFC,
-        0x00,
-        0x00,
-        0x00,
-        0x3F,
-        0xFF,
-        0xFF,
-        0xE0,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x03,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0x80,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x01,
-        0xFF,
-        0xFF,
-        0xF8,
-        0x00,
-        0x00,
-        0x00,
-        0x7F,
-        0xFF,
-        0xFF,
-        0xE0,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x07,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xF0,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0xFF,
-        0xF0,
-        0x00,
-        0x00,
-        0x00,
-        0x7F,
-        0xFF,
-        0xFF,
-        0xE0,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0xFF,
-        0xE0,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x7F,
-        0xFF,
-        0xC0,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x7F,
-        0xFF,
-        0x80,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x7F,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x3F,
-        0xFE,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x3F,
-        0xFC,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x3F,
-        0xFC,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x1F,
-        0xF8,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x1F,
-        0xF0,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x1F,
-        0xE0,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x0F,
-        0xC0,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x0F,
-        0x80,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x0F,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x06,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x0F,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xE0,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x01,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x7F,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFC,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x01,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x03,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0x80,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x01,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x7F,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFC,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x0F,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xE0,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFE,
-        0x00,
-        0x00,
-        0x00,
-        0x0F,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xE0,
-        0x00,
-        0x00,
-        0x7F,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFC,
-        0x00,
-        0x03,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0x80,
-        0x0F,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xE0,
-        0x3F,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFC,
-        0x00,
-        0x00,
-        0x00,
-        0x7F,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xF8,
-        0x7F,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x01,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFC,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xF0,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x3F,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFE,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xC0,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x0F,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFE,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0x80,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x03,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFE,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0x80,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x07,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFE,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xC0,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x0F,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFE,
-        0x7F,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xF8,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x7F,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFC,
-        0x3F,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0x80,
-        0x00,
-        0x00,
-        0x00,
-        0x07,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xF8,
-        0x0F,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0x80,
-        0x00,
-        0x03,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xE0,
-        0x03,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0x80,
-        0x00,
-        0x7F,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFC,
-        0x00,
-        0x00,
-        0x0F,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xE0,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFE,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x0F,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xE0,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x7F,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFC,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x01,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x03,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0x80,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x01,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x7F,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFC,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x01,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0x80,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x0F,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xE0,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x7F,
-        0x80,
-        0x01,
-        0xFE,
-        0x00,
-        0x03,
-        0xF8,
-        0x00,
-        0x01,
-        0xFF,
-        0xFE,
-        0x00,
-        0x00,
-        0x00,
-        0x3F,
-        0xFF,
-        0xF0,
-        0x00,
-        0x00,
-        0x0F,
-        0xFF,
-        0xF0,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x7F,
-        0xC0,
-        0x01,
-        0xFE,
-        0x00,
-        0x03,
-        0xF8,
-        0x00,
-        0x01,
-        0xFF,
-        0xFF,
-        0xC0,
-        0x00,
-        0x00,
-        0x3F,
-        0xFF,
-        0xF0,
-        0x00,
-        0x00,
-        0x3F,
-        0xFF,
-        0xFE,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x3F,
-        0xC0,
-        0x03,
-        0xFC,
-        0x00,
-        0x03,
-        0xF8,
-        0x00,
-        0x01,
-        0xFF,
-        0xFF,
-        0xF0,
-        0x00,
-        0x00,
-        0x3F,
-        0xFF,
-        0xF0,
-        0x00,
-        0x00,
-        0xFF,
-        0xFF,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x3F,
-        0xE0,
-        0x03,
-        0xFC,
-        0x00,
-        0x03,
-        0xF8,
-        0x00,
-        0x01,
-        0xFF,
-        0xFF,
-        0xFC,
-        0x00,
-        0x00,
-        0x3F,
-        0xFF,
-        0xF0,
-        0x00,
-        0x01,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xC0,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x1F,
-        0xE0,
-        0x07,
-        0xF8,
-        0x00,
-        0x03,
-        0xF8,
-        0x00,
-        0x01,
-        0xFF,
-        0xFF,
-        0xFE,
-        0x00,
-        0x00,
-        0x3F,
-        0xFF,
-        0xF0,
-        0x00,
-        0x03,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xE0,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x0F,
-        0xF0,
-        0x07,
-        0xF8,
-        0x00,
-        0x03,
-        0xF8,
-        0x00,
-        0x01,
-        0xFE,
-        0x07,
-        0xFF,
-        0x00,
-        0x00,
-        0x3F,
-        0x80,
-        0x00,
-        0x00,
-        0x07,
-        0xFF,
-        0x00,
-        0x7F,
-        0xE0,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x0F,
-        0xF0,
-        0x0F,
-        0xF0,
-        0x00,
-        0x03,
-        0xF8,
-        0x00,
-        0x01,
-        0xFE,
-        0x01,
-        0xFF,
-        0x00,
-        0x00,
-        0x3F,
-        0x80,
-        0x00,
-        0x00,
-        0x07,
-        0xFC,
-        0x00,
-        0x3F,
-        0xF0,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x07,
-        0xF8,
-        0x0F,
-        0xE0,
-        0x00,
-        0x03,
-        0xF8,
-        0x00,
-        0x01,
-        0xFE,
-        0x00,
-        0xFF,
-        0x80,
-        0x00,
-        0x3F,
-        0x80,
-        0x00,
-        0x00,
-        0x0F,
-        0xF8,
-        0x00,
-        0x0F,
-        0xF8,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x07,
-        0xFC,
-        0x1F,
-        0xE0,
-        0x00,
-        0x03,
-        0xF8,
-        0x00,
-        0x01,
-        0xFE,
-        0x00,
-        0x7F,
-        0x80,
-        0x00,
-        0x3F,
-        0xFF,
-        0xE0,
-        0x00,
-        0x0F,
-        0xF0,
-        0x00,
-        0x0F,
-        0xF8,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x03,
-        0xFC,
-        0x1F,
-        0xC0,
-        0x00,
-        0x03,
-        0xF8,
-        0x00,
-        0x01,
-        0xFE,
-        0x00,
-        0x7F,
-        0x80,
-        0x00,
-        0x3F,
-        0xFF,
-        0xE0,
-        0x00,
-        0x0F,
-        0xF0,
-        0x00,
-        0x07,
-        0xF8,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x03,
-        0xFE,
-        0x3F,
-        0xC0,
-        0x00,
-        0x03,
-        0xF8,
-        0x00,
-        0x01,
-        0xFE,
-        0x00,
-        0x3F,
-        0x80,
-        0x00,
-        0x3F,
-        0xFF,
-        0xE0,
-        0x00,
-        0x1F,
-        0xE0,
-        0x00,
-        0x07,
-        0xF8,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x01,
-        0xFE,
-        0x3F,
-        0x80,
-        0x00,
-        0x03,
-        0xF8,
-        0x00,
-        0x01,
-        0xFE,
-        0x00,
-        0x3F,
-        0x80,
-        0x00,
-        0x3F,
-        0xFF,
-        0xE0,
-        0x00,
-        0x1F,
-        0xE0,
-        0x00,
-        0x07,
-        0xF8,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x01,
-        0xFF,
-        0x7F,
-        0x80,
-        0x00,
-        0x03,
-        0xF8,
-        0x00,
-        0x01,
-        0xFE,
-        0x00,
-        0x3F,
-        0x80,
-        0x00,
-        0x3F,
-        0xFF,
-        0xE0,
-        0x00,
-        0x0F,
-        0xF0,
-        0x00,
-        0x07,
-        0xF8,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0x7F,
-        0x00,
-        0x00,
-        0x03,
-        0xF8,
-        0x00,
-        0x01,
-        0xFE,
-        0x00,
-        0x7F,
-        0x80,
-        0x00,
-        0x3F,
-        0x80,
-        0x00,
-        0x00,
-        0x0F,
-        0xF0,
-        0x00,
-        0x07,
-        0xF8,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x7F,
-        0xFF,
-        0x00,
-        0x00,
-        0x03,
-        0xF8,
-        0x00,
-        0x01,
-        0xFE,
-        0x00,
-        0x7F,
-        0x80,
-        0x00,
-        0x3F,
-        0x80,
-        0x00,
-        0x00,
-        0x0F,
-        0xF8,
-        0x00,
-        0x0F,
-        0xF8,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x7F,
-        0xFE,
-        0x00,
-        0x00,
-        0x03,
-        0xF8,
-        0x00,
-        0x01,
-        0xFE,
-        0x00,
-        0xFF,
-        0x80,
-        0x00,
-        0x3F,
-        0x80,
-        0x00,
-        0x00,
-        0x0F,
-        0xFC,
-        0x00,
-        0x1F,
-        0xF0,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x3F,
-        0xFC,
-        0x00,
-        0x00,
-        0x03,
-        0xF8,
-        0x00,
-        0x01,
-        0xFE,
-        0x01,
-        0xFF,
-        0x00,
-        0x00,
-        0x3F,
-        0x80,
-        0x00,
-        0x00,
-        0x07,
-        0xFE,
-        0x00,
-        0x3F,
-        0xF0,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x3F,
-        0xFC,
-        0x00,
-        0x00,
-        0x03,
-        0xF8,
-        0x00,
-        0x01,
-        0xFE,
-        0x0F,
-        0xFE,
-        0x00,
-        0x00,
-        0x3F,
-        0x80,
-        0x00,
-        0x00,
-        0x07,
-        0xFF,
-        0x80,
-        0xFF,
-        0xE0,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x1F,
-        0xF8,
-        0x00,
-        0x00,
-        0x03,
-        0xF8,
-        0x00,
-        0x01,
-        0xFF,
-        0xFF,
-        0xFC,
-        0x00,
-        0x00,
-        0x3F,
-        0xFF,
-        0xF0,
-        0x00,
-        0x03,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xC0,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x1F,
-        0xF8,
-        0x00,
-        0x00,
-        0x03,
-        0xF8,
-        0x00,
-        0x01,
-        0xFF,
-        0xFF,
-        0xF8,
-        0x00,
-        0x00,
-        0x3F,
-        0xFF,
-        0xF0,
-        0x00,
-        0x01,
-        0xFF,
-        0xFF,
-        0xFF,
-        0x80,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x0F,
-        0xF0,
-        0x00,
-        0x00,
-        0x03,
-        0xF8,
-        0x00,
-        0x01,
-        0xFF,
-        0xFF,
-        0xF0,
-        0x00,
-        0x00,
-        0x3F,
-        0xFF,
-        0xF0,
-        0x00,
-        0x00,
-        0x7F,
-        0xFF,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x07,
-        0xF0,
-        0x00,
-        0x00,
-        0x03,
-        0xF8,
-        0x00,
-        0x01,
-        0xFF,
-        0xFF,
-        0xC0,
-        0x00,
-        0x00,
-        0x3F,
-        0xFF,
-        0xF0,
-        0x00,
-        0x00,
-        0x3F,
-        0xFF,
-        0xFC,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x07,
-        0xE0,
-        0x00,
-        0x00,
-        0x03,
-        0xF8,
-        0x00,
-        0x01,
-        0xFF,
-        0xFC,
-        0x00,
-        0x00,
-        0x00,
-        0x3F,
-        0xFF,
-        0xF0,
-        0x00,
-        0x00,
-        0x07,
-        0xFF,
-        0xF0,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-    ]
+PACK = (
+    b"PAK1\x01\x00\x00\x00logo\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xef\x00\x95\x00\x03\x00"
+    b"4\x00\x00\x00v\x11\x00\x00\x00\x00\x00\x00\x00\x00\x0f\xff\xff\xff\xff\xff"
+    b"\xff\xff\xff\xff\xff\xff\xe0\x00\x00\x00\x00\x03\xff\xff\xff\xff\xff\xc0"
+    b"\x00\x00\x00\x00\x00\x00\x0f\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff"
+    b"\xe0\x00\x00\x00\x00\x07\xff\xff\xff\xff\xff\x80\x00\x00\x00\x00\x00\x00"
+    b"\x0f\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xe0\x00\x00\x00\x00\x07"
+    b"\xff\xff\xff\xff\xff\x80\x00\x00\x00\x00\x00\x00\x1f\xff\xff\xff\xff\xff"
+    b"\xff\xff\xff\xff\xff\xff\xf0\x00\x00\x00\x00\x0f\xff\xff\xff\xff\xff\x80"
+    b"\x00\x00\x00\x00\x00\x00\x1f\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff"
+    b"\xf0\x00\x00\x00\x00\x1f\xff\xff\xff\xff\xff\x80\x00\x00\x00\x00\x00\x00"
+    b"\x1f\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf0\x00\x00\x00\x00?\xff"
+    b"\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x1f\xff\xff\xff\xff\xff\xff"
+    b"\xff\xff\xff\xff\xff\xf8\x00\x00\x00\x00\x7f\xff\xff\xff\xff\xff\x00\x00"
+    b"\x00\x00\x00\x00\x00\x1f\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf8"
+    b"\x00\x00\x00\x00\xff\xff\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00?\xff"
+    b"\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfc\x00\x00\x00\x01\xff\xff\xff"
+    b"\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00?\xff\xff\xff\xff\xff\xff\xff\xff"
+    b"\xff\xff\xff\xfc\x00\x00\x00\x01\xff\xff\xff\xff\xff\xfe\x00\x00\x00\x00"
+    b"\x00\x00\x00?\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfc\x00\x00\x00"
+    b"\x03\xff\xff\xff\xff\xff\xfe\x00\x00\x00\x00\x00\x00\x00?\xff\xff\xff\xff"
+    b"\xff\xff\xff\xff\xff\xff\xff\xfe\x00\x00\x00\x07\xff\xff\xff\xff\xff\xfe"
+    b"\x00\x00\x00\x00\x00\x00\x00\x7f\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff"
+    b"\xff\xfe\x00\x00\x00\x0f\xff\xff\xff\xff\xff\xfe\x00\x00\x00\x00\x00\x00"
+    b"\x00\x7f\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\x00\x00\x00\x1f"
+    b"\xff\xff\xff\xff\xff\xfc\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1f"
+    b"\xff\xff\xff\xff\xff\xff\xff\xff\x00\x00\x00?\xff\xff\xfc\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00?\xff\xff\xff\xff\xff\xff\xff"
+    b"\x00\x00\x00?\xff\xff\xf8\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x07\xff\xff\xff\xff\xff\xff\xff\x00\x00\x00\x7f\xff\xff\xf8"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\xff\xff"
+    b"\xff\xff\xff\xff\xff\x80\x00\x00\xff\xff\xff\xf0\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\xff\xff\xff\x80\x00\x00\x7f\xff\xff\xff\xff\xff\xff\x80"
+    b"\x00\x01\xff\xff\xff\xef\xff\xff\xf8\x00\x00\x00\x00\x00\x00\x00\xff\xff"
+    b"\xff\x80\x00\x00?\xff\xff\xff\x7f\xff\xff\x80\x00\x03\xff\xff\xff\xdf\xff"
+    b"\xff\xf8\x00\x00\x00\x00\x00\x00\x01\xff\xff\xff\x80\x00\x00\x1f\xff\xff"
+    b"\xff\xff\xff\xff\xc0\x00\x07\xff\xff\xff\x9f\xff\xff\xf8\x00\x00\x00\x00"
+    b"\x00\x00\x01\xff\xff\xff\x80\x00\x00\x0f\xff\xff\xff\xff\xff\xff\xc0\x00"
+    b"\x07\xff\xff\xff\x1f\xff\xff\xf8\x00\x00\x00\x00\x00\x00\x01\xff\xff\xff"
+    b"\x80\x00\x00\x07\xff\xff\xff\xbf\xff\xff\xc0\x00\x0f\xff\xff\xfe\x1f\xff"
+    b"\xff\xf0\x00\x00\x00\x00\x00\x00\x01\xff\xff\xff\x00\x00\x00\x07\xff\xff"
+    b"\xff\xbf\xff\xff\xe0\x00\x1f\xff\xff\xfc?\xff\xff\xf0\x00\x00\x00\x00\x00"
+    b"\x00\x03\xff\xff\xff\x00\x00\x00\x03\xff\xff\xff\xbf\xff\xff\xe0\x00?\xff"
+    b"\xff\xf8?\xff\xff\xf0\x00\x00\x00\x00\x00\x00\x03\xff\xff\xff\x00\x00\x00"
+    b"\x03\xff\xff\xff\x9f\xff\xff\xe0\x00\x7f\xff\xff\xf8?\xff\xff\xf0\x00\x00"
+    b"\x00\x00\x00\x00\x03\xff\xff\xff\x00\x00\x00\x03\xff\xff\xff\x9f\xff\xff"
+    b"\xf0\x00\xff\xff\xff\xf0?\xff\xff\xe0\x00\x00\x00\x00\x00\x00\x03\xff\xff"
+    b"\xfe\x00\x00\x00\x03\xff\xff\xff\x9f\xff\xff\xf0\x00\xff\xff\xff\xe0\x7f"
+    b"\xff\xff\xe0\x00\x00\x00\x00\x00\x00\x03\xff\xff\xfe\x00\x00\x00\x03\xff"
+    b"\xff\xff\x8f\xff\xff\xf0\x01\xff\xff\xff\xc0\x7f\xff\xff\xe0\x00\x00\x00"
+    b"\x00\x00\x00\x07\xff\xff\xfe\x00\x00\x00\x03\xff\xff\xff\x8f\xff\xff\xf8"
+    b"\x03\xff\xff\xff\x80\x7f\xff\xff\xe0\x00\x00\x00\x00\x00\x00\x07\xff\xff"
+    b"\xfe\x00\x00\x00\x03\xff\xff\xff\x8f\xff\xff\xf8\x07\xff\xff\xff\x00\x7f"
+    b"\xff\xff\xc0\x00\x00\x00\x00\x00\x00\x07\xff\xff\xfc\x00\x00\x00\x03\xff"
+    b"\xff\xff\x07\xff\xff\xf8\x07\xff\xff\xfe\x00\xff\xff\xff\xc0\x00\x00\x00"
+    b"\x00\x00\x00\x07\xff\xff\xfc\x00\x00\x00\x03\xff\xff\xff\x07\xff\xff\xfc"
+    b"\x0f\xff\xff\xfc\x00\xff\xff\xff\xc0\x00\x00\x00\x00\x00\x00\x0f\xff\xff"
+    b"\xfc\x00\x00\x00\x07\xff\xff\xff\x03\xff\xff\xfc\x1f\xff\xff\xf8\x00\xff"
+    b"\xff\xff\xc0\x00\x00\x00\x00\x00\x00\x0f\xff\xff\xfc\x00\x00\x00\x07\xff"
+    b"\xff\xff\x03\xff\xff\xfc?\xff\xff\xf8\x00\xff\xff\xff\x80\x00\x00\x00\x00"
+    b"\x00\x00\x0f\xff\xff\xfc\x00\x00\x00\x0f\xff\xff\xfe\x03\xff\xff\xfc?\xff"
+    b"\xff\xf0\x00\xff\xff\xff\x80\x00\x00\x00\x00\x00\x00\x0f\xff\xff\xf8\x00"
+    b"\x00\x00\x0f\xff\xff\xfe\x01\xff\xff\xfe\x7f\xff\xff\xe0\x01\xff\xff\xff"
+    b"\x80\x00\x00\x00\x00\x00\x00\x1f\xff\xff\xf8\x00\x00\x00\x1f\xff\xff\xfc"
+    b"\x01\xff\xff\xfe\xff\xff\xff\xc0\x01\xff\xff\xff\x80\x00\x00\x00\x00\x00"
+    b"\x00\x1f\xff\xff\xf8\x00\x00\x00?\xff\xff\xfc\x01\xff\xff\xfe\xff\xff\xff"
+    b"\x80\x01\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x1f\xff\xff\xf8\x00\x00"
+    b"\x00\x7f\xff\xff\xf8\x00\xff\xff\xff\xff\xff\xff\x00\x01\xff\xff\xff\x00"
+    b"\x00\x00\x00\x00\x00\x00\x1f\xff\xff\xf0\x00\x00\x00\xff\xff\xff\xf8\x00"
+    b"\xff\xff\xff\xff\xff\xfe\x00\x03\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00"
+    b"?\xff\xff\xf0\x00\x00\x01\xff\xff\xff\xf0\x00\xff\xff\xff\xff\xff\xfc\x00"
+    b"\x03\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00?\xff\xff\xf0\x00\x00\x03\xff"
+    b"\xff\xff\xe0\x00\x7f\xff\xff\xff\xff\xfc\x00\x03\xff\xff\xff\x00\x00\x00"
+    b"\x00\x00\x00\x00?\xff\xff\xf0\x00\x00\x0f\xff\xff\xff\xc0\x00\x7f\xff\xff"
+    b"\xff\xff\xf8\x00\x03\xff\xff\xfe\x00\x00\x00\x00\x00\x00\x00?\xff\xff\xe0"
+    b"\x00\x00?\xff\xff\xff\x80\x00\x7f\xff\xff\xff\xff\xf0\x00\x07\xff\xff\xfe"
+    b"\x00\x00\x00\x00\x00\x00\x00\x7f\xff\xff\xe0\x00\x00\xff\xff\xff\xff\x00"
+    b"\x00?\xff\xff\xff\xff\xe0\x00\x07\xff\xff\xfe\x00\x00\x00\x00\x00\x00\x00"
+    b"\x7f\xff\xff\xe0\x00\x07\xff\xff\xff\xfe\x00\x00?\xff\xff\xff\xff\xc0\x00"
+    b"\x07\xff\xff\xfe\x00\x00\x00\x00\x00\x00\x00\x7f\xff\xff\xe0\x00\x7f\xff"
+    b"\xff\xff\xfc\x00\x00\x1f\xff\xff\xff\xff\x80\x00\x07\xff\xff\xfc\x00\x00"
+    b"\x00\x00\x00\x00\x00\x7f\xff\xff\xff\xff\xff\xff\xff\xff\xf8\x00\x00\x1f"
+    b"\xff\xff\xff\xff\x00\x00\x0f\xff\xff\xfc\x00\x00\x00\x00\x00\x00\x00\x7f"
+    b"\xff\xff\xff\xff\xff\xff\xff\xff\xf0\x00\x00\x1f\xff\xff\xff\xfe\x00\x00"
+    b"\x0f\xff\xff\xfc\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xff\xff\xff"
+    b"\xff\xff\xe0\x00\x00\x0f\xff\xff\xff\xfc\x00\x00\x0f\xff\xff\xfc\x00\x00"
+    b"\x00\x00\x00\x00\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\x80\x00\x00\x0f"
+    b"\xff\xff\xff\xfc\x00\x00\x0f\xff\xff\xf8\x00\x00\x00\x00\x00\x00\x00\xff"
+    b"\xff\xff\xff\xff\xff\xff\xff\xff\x00\x00\x00\x0f\xff\xff\xff\xf8\x00\x00"
+    b"\x1f\xff\xff\xf8\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xff\xff\xff"
+    b"\xff\xfc\x00\x00\x00\x07\xff\xff\xff\xf0\x00\x00\x1f\xff\xff\xf8\x00\x00"
+    b"\x00\x00\x00\x00\x01\xff\xff\xff\xff\xff\xff\xff\xff\xf0\x00\x00\x00\x07"
+    b"\xff\xff\xff\xe0\x00\x00\x1f\xff\xff\xf8\x00\x00\x00\x00\x00\x00\x01\xff"
+    b"\xff\xff\xff\xff\xff\xff\xff\xc0\x00\x00\x00\x07\xff\xff\xff\xc0\x00\x00"
+    b"\x1f\xff\xff\xf0\x00\x00\x00\x00\x00\x00\x01\xff\xff\xff\xff\xff\xff\xff"
+    b"\xff\x00\x00\x00\x00\x03\xff\xff\xff\x80\x00\x00\x1f\xff\xff\xf0\x00\x00"
+    b"\x00\x00\x00\x00\x01\xff\xff\xff\xff\xff\xff\xff\xfc\x00\x00\x00\x00\x03"
+    b"\xff\xff\xff\x00\x00\x00?\xff\xff\xf0\x00\x00\x00\x00\x00\x00\x03\xff\xff"
+    b"\xff\xff\xff\xff\xff\xf0\x00\x00\x00\x00\x03\xff\xff\xfe\x00\x00\x00?\xff"
+    b"\xff\xf0\x00\x00\x00\x00\x00\x00\x03\xff\xff\xff\xff\xff\xff\xff\x80\x00"
+    b"\x00\x00\x00\x01\xff\xff\xfc\x00\x00\x00?\xff\xff\xf0\x00\x00\x00\x00\x00"
+    b"\x00\x03\xff\xff\xff\xff\xff\xff\xf8\x00\x00\x00\x00\x00\x01\xff\xff\xfc"
+    b"\x00\x00\x00?\xff\xff\xe0\x00\x00\x00\x00\x00\x00\x03\xff\xff\xff\xff\xff"
+    b"\xff\x80\x00\x00\x00\x00\x00\x01\xff\xff\xf8\x00\x00\x00\x7f\xff\xff\xe0"
+    b"\x00\x00\x00\x00\x00\x00\x07\xff\xff\xff\xff\xff\xf0\x00\x00\x00\x00\x00"
+    b"\x00\x00\xff\xff\xf0\x00\x00\x00\x7f\xff\xff\xe0\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xe0\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x7f\xff\xc0\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x7f\xff\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7f\xff\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00?\xfe\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00?\xfc\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00?\xfc\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x1f\xf8\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1f"
+    b"\xf0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1f\xe0\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x0f\xc0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0f"
+    b"\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0f\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x06\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0f\xff\xff\xff\xff\xff"
+    b"\xff\xe0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x01\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7f\xff\xff\xff"
+    b"\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfc\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x01\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff"
+    b"\xff\xff\xff\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03"
+    b"\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff"
+    b"\xff\xff\x80\x00\x00\x00\x00\x00\x00\x00\x01\xff\xff\xff\xff\xff\xff\xff"
+    b"\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x00\x00\x00"
+    b"\x00\x00\x00\x00\x7f\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff"
+    b"\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfc\x00\x00\x00\x00\x00\x0f\xff\xff"
+    b"\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff"
+    b"\xff\xff\xff\xff\xe0\x00\x00\x00\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff"
+    b"\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\x00"
+    b"\x00\x00\x0f\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff"
+    b"\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xe0\x00\x00\x7f\xff\xff\xff"
+    b"\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff"
+    b"\xff\xff\xff\xff\xff\xfc\x00\x03\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff"
+    b"\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff"
+    b"\x80\x0f\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff"
+    b"\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xe0?\xff\xff\xff\xff\xff"
+    b"\xff\xff\xff\xff\xff\xff\xfc\x00\x00\x00\x7f\xff\xff\xff\xff\xff\xff\xff"
+    b"\xff\xff\xff\xff\xff\xf8\x7f\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff"
+    b"\x00\x00\x00\x00\x01\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfc"
+    b"\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf0\x00\x00\x00\x00\x00?\xff"
+    b"\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\xff\xff\xff\xff\xff\xff\xff"
+    b"\xff\xff\xff\xff\xc0\x00\x00\x00\x00\x00\x0f\xff\xff\xff\xff\xff\xff\xff"
+    b"\xff\xff\xff\xff\xfe\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x80\x00"
+    b"\x00\x00\x00\x00\x03\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\xff"
+    b"\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x80\x00\x00\x00\x00\x00\x07\xff"
+    b"\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\xff\xff\xff\xff\xff\xff\xff"
+    b"\xff\xff\xff\xff\xc0\x00\x00\x00\x00\x00\x0f\xff\xff\xff\xff\xff\xff\xff"
+    b"\xff\xff\xff\xff\xfe\x7f\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf8\x00"
+    b"\x00\x00\x00\x00\x7f\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfc?\xff"
+    b"\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x80\x00\x00\x00\x07\xff\xff\xff"
+    b"\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf8\x0f\xff\xff\xff\xff\xff\xff\xff"
+    b"\xff\xff\xff\xff\xff\x80\x00\x03\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff"
+    b"\xff\xff\xff\xe0\x03\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff"
+    b"\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x80\x00\x7f"
+    b"\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff"
+    b"\xff\xff\xff\xff\xff\xff\xff\xff\xfc\x00\x00\x0f\xff\xff\xff\xff\xff\xff"
+    b"\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff"
+    b"\xff\xff\xe0\x00\x00\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff"
+    b"\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\x00\x00\x00\x00"
+    b"\x0f\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff"
+    b"\xff\xff\xff\xff\xff\xff\xff\xe0\x00\x00\x00\x00\x00\x7f\xff\xff\xff\xff"
+    b"\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff"
+    b"\xfc\x00\x00\x00\x00\x00\x00\x01\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff"
+    b"\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x03\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff"
+    b"\xff\xff\xff\xff\xff\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\xff\xff"
+    b"\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7f\xff\xff\xff\xff\xff\xff"
+    b"\xff\xff\xff\xff\xff\xff\xff\xff\xfc\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x01\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff"
+    b"\xff\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x0f\xff\xff\xff\xff\xff\xff\xe0\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7f\x80\x01\xfe\x00"
+    b"\x03\xf8\x00\x01\xff\xfe\x00\x00\x00?\xff\xf0\x00\x00\x0f\xff\xf0\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x7f\xc0\x01\xfe\x00\x03\xf8\x00\x01\xff\xff\xc0"
+    b"\x00\x00?\xff\xf0\x00\x00?\xff\xfe\x00\x00\x00\x00\x00\x00\x00\x00?\xc0\x03"
+    b"\xfc\x00\x03\xf8\x00\x01\xff\xff\xf0\x00\x00?\xff\xf0\x00\x00\xff\xff\xff"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00?\xe0\x03\xfc\x00\x03\xf8\x00\x01\xff\xff"
+    b"\xfc\x00\x00?\xff\xf0\x00\x01\xff\xff\xff\xc0\x00\x00\x00\x00\x00\x00\x00"
+    b"\x1f\xe0\x07\xf8\x00\x03\xf8\x00\x01\xff\xff\xfe\x00\x00?\xff\xf0\x00\x03"
+    b"\xff\xff\xff\xe0\x00\x00\x00\x00\x00\x00\x00\x0f\xf0\x07\xf8\x00\x03\xf8"
+    b"\x00\x01\xfe\x07\xff\x00\x00?\x80\x00\x00\x07\xff\x00\x7f\xe0\x00\x00\x00"
+    b"\x00\x00\x00\x00\x0f\xf0\x0f\xf0\x00\x03\xf8\x00\x01\xfe\x01\xff\x00\x00"
+    b"?\x80\x00\x00\x07\xfc\x00?\xf0\x00\x00\x00\x00\x00\x00\x00\x07\xf8\x0f\xe0"
+    b"\x00\x03\xf8\x00\x01\xfe\x00\xff\x80\x00?\x80\x00\x00\x0f\xf8\x00\x0f\xf8"
+    b"\x00\x00\x00\x00\x00\x00\x00\x07\xfc\x1f\xe0\x00\x03\xf8\x00\x01\xfe\x00"
+    b"\x7f\x80\x00?\xff\xe0\x00\x0f\xf0\x00\x0f\xf8\x00\x00\x00\x00\x00\x00\x00"
+    b"\x03\xfc\x1f\xc0\x00\x03\xf8\x00\x01\xfe\x00\x7f\x80\x00?\xff\xe0\x00\x0f"
+    b"\xf0\x00\x07\xf8\x00\x00\x00\x00\x00\x00\x00\x03\xfe?\xc0\x00\x03\xf8\x00"
+    b"\x01\xfe\x00?\x80\x00?\xff\xe0\x00\x1f\xe0\x00\x07\xf8\x00\x00\x00\x00\x00"
+    b"\x00\x00\x01\xfe?\x80\x00\x03\xf8\x00\x01\xfe\x00?\x80\x00?\xff\xe0\x00\x1f"
+    b"\xe0\x00\x07\xf8\x00\x00\x00\x00\x00\x00\x00\x01\xff\x7f\x80\x00\x03\xf8"
+    b"\x00\x01\xfe\x00?\x80\x00?\xff\xe0\x00\x0f\xf0\x00\x07\xf8\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\xff\x7f\x00\x00\x03\xf8\x00\x01\xfe\x00\x7f\x80\x00?\x80"
+    b"\x00\x00\x0f\xf0\x00\x07\xf8\x00\x00\x00\x00\x00\x00\x00\x00\x7f\xff\x00"
+    b"\x00\x03\xf8\x00\x01\xfe\x00\x7f\x80\x00?\x80\x00\x00\x0f\xf8\x00\x0f\xf8"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x7f\xfe\x00\x00\x03\xf8\x00\x01\xfe\x00"
+    b"\xff\x80\x00?\x80\x00\x00\x0f\xfc\x00\x1f\xf0\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00?\xfc\x00\x00\x03\xf8\x00\x01\xfe\x01\xff\x00\x00?\x80\x00\x00\x07\xfe"
+    b"\x00?\xf0\x00\x00\x00\x00\x00\x00\x00\x00?\xfc\x00\x00\x03\xf8\x00\x01\xfe"
+    b"\x0f\xfe\x00\x00?\x80\x00\x00\x07\xff\x80\xff\xe0\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x1f\xf8\x00\x00\x03\xf8\x00\x01\xff\xff\xfc\x00\x00?\xff\xf0\x00"
+    b"\x03\xff\xff\xff\xc0\x00\x00\x00\x00\x00\x00\x00\x00\x1f\xf8\x00\x00\x03"
+    b"\xf8\x00\x01\xff\xff\xf8\x00\x00?\xff\xf0\x00\x01\xff\xff\xff\x80\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x0f\xf0\x00\x00\x03\xf8\x00\x01\xff\xff\xf0\x00"
+    b"\x00?\xff\xf0\x00\x00\x7f\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x07"
+    b"\xf0\x00\x00\x03\xf8\x00\x01\xff\xff\xc0\x00\x00?\xff\xf0\x00\x00?\xff\xfc"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x07\xe0\x00\x00\x03\xf8\x00\x01\xff"
+    b"\xfc\x00\x00\x00?\xff\xf0\x00\x00\x07\xff\xf0\x00\x00\x00\x00\x00"
 )
 
 from micropython import const
@@ -4490,11 +265,14 @@ vy: int = 1  # and down
 
 pos: Vector = None
 size: Vector = None
+logo = None  # 1-bit logo bitmap, a view into PACK
 
 
 def start(view_manager) -> bool:
     """Start the app"""
-    global x, y, vx, vy, pos, size
+    from picoware.system.asset_pack import AssetPack
+
+    global x, y, vx, vy, pos, size, logo
 
     # Reset position to top-left corner
     x = 0
@@ -4503,6 +281,7 @@ def start(view_manager) -> bool:
     vy = 5
     pos = Vector(x, y)
     size = Vector(SPRITE_WIDTH, SPRITE_HEIGHT)
+    logo = AssetPack(PACK).get("logo")
 
     return True
 
@@ -4523,7 +302,7 @@ def run(view_manager) -> None:
     draw.fill_screen(TFT_BLACK)
     pos.x = x
     pos.y = y
-    draw.image_bytearray_1bit(pos, size, LOGO)
+    draw.image_bytearray_1bit(pos, size, logo)
     draw.swap()
 
     # Update sprite position, bouncing off all 4 sides
@@ -4541,7 +320,7 @@ def stop(view_manager) -> None:
     """Stop the app"""
     from gc import collect
 
-    global x, y, vx, vy, pos, size
+    global x, y, vx, vy, pos, size, logo
 
     # Reset position to top-left corner
     x = 0
@@ -4550,5 +329,6 @@ def stop(view_manager) -> None:
     vy = 5
     pos = None
     size = None
+    logo = None
 
     collect()
@@ -1,4 +1,5 @@
 # Fire effect screensaver with rising flames
+from array import array
 from random import randint
 from picoware.system.buttons import BUTTON_BACK
 from picoware.system.colors import TFT_BLACK
@@ -26,7 +27,7 @@ def start(view_manager) -> bool:
     height = screen_size.y // 4
 
     # Pre-calculate fire color palette (0-255)
-    fire_palette = []
+    fire_palette = array("H")
     for value in range(256):
         if value < 85:
             # Black to red
@@ -46,8 +47,8 @@ def start(view_manager) -> bool:
         # Convert to RGB565
         fire_palette.append(((r & 0xF8) << 8) | ((g & 0xFC) << 3) | (b >> 3))
 
-    # Initialize fire buffer
-    fire_buffer = [[0 for _ in range(width)] for _ in range(height)]
+    # Initialize fire buffer (one palette index per cell, row by row)
+    fire_buffer = bytearray(width * height)
 
     pixel_w = screen_size.x // width
     pixel_h = screen_size.y // height
@@ -76,47 +77,38 @@ def run(view_manager) -> None:
     draw = view_manager.draw
 
     # Generate fire at the bottom row
-    bottom_row = fire_buffer[height - 1]
+    bottom = (height - 1) * width
     for x in range(width):
-        bottom_row[x] = randint(200, 255)
+        fire_buffer[bottom + x] = randint(200, 255)
 
     # Propagate fire upward with cooling
+    last = width - 1
     for y in range(height - 1):
-        curr_row = fire_buffer[y]
-        next_row = fire_buffer[y + 1]
+        curr = y * width
+        below = curr + width
 
         for x in range(width):
             # Average neighboring pixels with cooling factor
-            total = next_row[x]
+            total = fire_buffer[below + x]
             count = 1
 
             # Check below-left
             if x > 0:
-                total += next_row[x - 1]
+                total += fire_buffer[below + x - 1]
                 count += 1
 
             # Check below-right
-            if x < width - 1:
-                total += next_row[x + 1]
+            if x < last:
+                total += fire_buffer[below + x + 1]
                 count += 1
 
             avg = total // count
             # Cool down the fire as it rises
             cooling = randint(0, 10)
-            curr_row[x] = max(0, avg - cooling)
-
-    # Draw fire buffer to screen
-    draw.fill_screen(TFT_BLACK)
+            fire_buffer[curr + x] = max(0, avg - cooling)
 
-    for y in range(height):
-        row = fire_buffer[y]
-        y_pos = y * pixel_h
-        for x in range(width):
-            value = row[x]
-            if value > 0:
-                draw._fill_rectangle(
-                    x * pixel_w, y_pos, pixel_w, pixel_h, fire_palette[value]
-                )
+    # Draw fire buffer to screen (index 0 is black)
+    draw.grid(pos, width, height, pixel_w, fire_buffer, fire_palette)
 
     draw.swap()
 
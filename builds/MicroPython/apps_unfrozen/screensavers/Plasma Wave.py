@@ -1,5 +1,6 @@
 # Animated plasma wave effect screensaver
-from math import sin
+from array import array
+from picoware.system.fastmath import TURN, hypot, radians, sine_table
 from picoware.system.buttons import BUTTON_BACK
 from picoware.system.colors import TFT_BLACK
 from picoware.system.vector import Vector
@@ -7,13 +8,21 @@ from picoware.system.vector import Vector
 screen_size = None
 time_offset = 0
 sample_rate = 8
+columns = 0
+rows = 0
+cells = None
+palette = None
 
+# per-cell and per-row/column wave phases (binary angle units), built in start()
+dist_phase = None
+x_phase = None
+y_phase = None
+diagonal_x = None
+diagonal_y = None
 
-def plasma_color(value: float) -> int:
-    """Convert plasma value (-1 to 1) to RGB565 color"""
-    # Map value to 0-255
-    val = int((value + 1.0) * 127.5)
 
+def palette_color(val: int) -> int:
+    """Convert a palette index (0-255) to RGB565 color"""
     # Create a rainbow effect
     if val < 85:
         r = val * 3
@@ -36,12 +45,32 @@ def plasma_color(value: float) -> int:
 
 def start(view_manager) -> bool:
     """Start the app"""
-    global screen_size, time_offset
+    global screen_size, time_offset, columns, rows, cells, palette
 
     draw = view_manager.draw
     screen_size = Vector(draw.size.x, draw.size.y)
     time_offset = 0
 
+    # one palette index per sample_rate x sample_rate cell
+    columns = (screen_size.x + sample_rate - 1) // sample_rate
+    rows = (screen_size.y + sample_rate - 1) // sample_rate
+    cells = bytearray(columns * rows)
+    palette = array("H", [palette_color(val) for val in range(256)])
+
+    # the spatial part of every wave is fixed, only the time offset moves
+    global dist_phase, x_phase, y_phase, diagonal_x, diagonal_y
+    cx = screen_size.x // 2
+    cy = screen_size.y // 2
+    xs = range(0, screen_size.x, sample_rate)
+    ys = range(0, screen_size.y, sample_rate)
+    x_phase = array("h", [radians(x * 0.03) for x in xs])
+    y_phase = array("h", [radians(y * 0.02) for y in ys])
+    diagonal_x = array("h", [radians(x * 0.025) for x in xs])
+    diagonal_y = array("h", [radians(y * 0.025) for y in ys])
+    dist_phase = array(
+        "h", [radians(hypot(x - cx, y - cy) * 0.05) for y in ys for x in xs]
+    )
+
     draw.fill_screen(TFT_BLACK)
     draw.swap()
 
@@ -62,27 +91,29 @@ def run(view_manager) -> None:
 
     draw = view_manager.draw
 
-    # Draw plasma effect
+    # Draw plasma effect: four sine waves from the Q14 table, summed as integers
     time_offset += 0.05
-    cx = screen_size.x / 2
-    cy = screen_size.y / 2
-
-    for y in range(0, screen_size.y, sample_rate):
-        for x in range(0, screen_size.x, sample_rate):
-            # Calculate plasma value using multiple sine waves
-            dx = x - cx
-            dy = y - cy
-            dist = (dx * dx + dy * dy) ** 0.5
-
-            value = sin(dist * 0.05 + time_offset)
-            value += sin(x * 0.03 + time_offset * 1.5)
-            value += sin(y * 0.02 - time_offset * 2)
-            value += sin((x + y) * 0.025 + time_offset)
-            value /= 4.0
-
-            color = plasma_color(value)
-            draw._fill_rectangle(x, y, sample_rate, sample_rate, color)
-
+    t1 = radians(time_offset)
+    t2 = radians(time_offset * 1.5)
+    t3 = radians(time_offset * 2)
+    table = sine_table()
+    mask = TURN - 1
+
+    i = 0
+    for row in range(rows):
+        wave_y = table[(y_phase[row] - t3) & mask]
+        diagonal = diagonal_y[row] + t1
+        for col in range(columns):
+            value = table[(dist_phase[i] + t1) & mask]
+            value += table[(x_phase[col] + t2) & mask]
+            value += wave_y
+            value += table[(diagonal_x[col] + diagonal) & mask]
+
+            # Map value (-4.0 to 4.0 in Q14) to a palette index
+            cells[i] = ((value + 65536) * 255) >> 17
+            i += 1
+
+    draw.grid(Vector(0, 0), columns, rows, sample_rate, cells, palette)
     draw.swap()
 
 
@@ -90,9 +121,17 @@ def stop(view_manager) -> None:
     """Stop the app"""
     from gc import collect
 
-    global screen_size, time_offset
+    global screen_size, time_offset, cells, palette
+    global dist_phase, x_phase, y_phase, diagonal_x, diagonal_y
 
     screen_size = None
     time_offset = 0
+    cells = None
+    palette = None
+    dist_phase = None
+    x_phase = None
+    y_phase = None
+    diagonal_x = None
+    diagonal_y = None
 
     collect()
@@ -1,7 +1,8 @@
 # download from: http://commondatastorage.googleapis.com/gtv-videos-bucket/sample/BigBuckBunny.mp4
 # then convert to png frames with: mkdir big-buck-bunny && ffmpeg -i ~/Downloads/BigBuckBunny.mp4 -vf "fps=10,scale=320:320:force_original_aspect_ratio=decrease,pad=320:320:(ow-iw)/2:(oh-ih)/2" big-buck-bunny/frame_%04d.png
-# then convert to .bin using the png2fb.py script in tools: python png2fb.py <folder> --8bit
+# then convert to .bin using the png2fb.py script in tools: python png2fb.py <folder> --8bit --delta --fps 10
 # then rename to  `big-buck-bunny.bin` and copy to the root of your SD card
+# (raw frame streams made with just --8bit still play, without frame skipping)
 from micropython import const
 from picoware.system.vector import Vector
 from picoware.system.buttons import BUTTON_BACK
@@ -12,12 +13,167 @@ FRAME_WIDTH = 320
 FRAME_HEIGHT = 320
 CHUNK_SIZE = FRAME_WIDTH * FRAME_HEIGHT
 
+# packed container written by png2fb.py --delta (see tools/png2fb.py)
+_MAGIC = b"PFB1"
+_HEADER_SIZE = const(16)
+_CODEC_DELTA = const(2)
+_FRAME_KEY = const(0)
+_KEY_FLAG = const(0x80000000)
+_OFFSET_MASK = const(0x7FFFFFFF)
+_OP_SKIP = const(0)
+_OP_LITERAL = const(1)
+_DEFAULT_FPS = const(10)
+
 current_frame = 0
 position = None
 size = None
 file_obj = None
 frame_data = None
 
+# video state (None when playing a raw frame stream)
+video_index = None
+video_fps = _DEFAULT_FPS
+frame_count = 0
+read_buffer = None
+start_ticks = 0
+shown_frames = 0
+skipped_frames = 0
+
+
+def __decode(data, count: int) -> None:
+    """Apply one encoded frame to frame_data, in place."""
+    frame = memoryview(frame_data)
+    src = memoryview(data)
+    end = len(frame_data)
+    out = 0
+    i = 1
+    while i < count and out < end:
+        op = data[i]
+        length = op & 0x3F
+        i += 1
+        if not length:
+            length = data[i] | data[i + 1] << 8 | data[i + 2] << 16
+            i += 3
+        op >>= 6
+        if op == _OP_SKIP:
+            out += length
+        elif op == _OP_LITERAL:
+            frame[out : out + length] = src[i : i + length]
+            i += length
+            out += length
+        else:
+            # fill: one pixel, then double the filled span until it is done
+            frame[out] = data[i]
+            i += 1
+            done = 1
+            while done < length:
+                step = min(done, length - done)
+                frame[out + done : out + done + step] = frame[out : out + step]
+                done += step
+            out += length
+
+
+def __frame_range(index: int):
+    """Return (file offset, size, is key frame) of a frame from the index."""
+    entry = video_index[index]
+    start = entry & _OFFSET_MASK
+    return start, (video_index[index + 1] & _OFFSET_MASK) - start, entry & _KEY_FLAG
+
+
+def __load_frame(storage, index: int) -> bool:
+    """Read and decode one frame of the video into frame_data."""
+    global read_buffer
+
+    start, count, _ = __frame_range(index)
+    if read_buffer is None or len(read_buffer) < count:
+        read_buffer = bytearray(count)
+    if not storage.file_seek(file_obj, start):
+        return False
+    view = memoryview(read_buffer)[:count]
+    if storage.file_readinto(file_obj, view) < count:
+        return False
+    __decode(read_buffer, count)
+    return True
+
+
+def __open_video(storage) -> bool:
+    """Read the container header and frame index, if the file has one."""
+    global video_index, video_fps, frame_count
+
+    from array import array
+    from struct import unpack
+
+    header = bytearray(_HEADER_SIZE)
+    storage.file_readinto(file_obj, header)
+    magic, width, height, bpp, codec, fps, count = unpack("<4sHHBBHI", header)
+    if magic != _MAGIC:
+        storage.file_seek(file_obj, 0)
+        return False  # raw frame stream
+    if codec != _CODEC_DELTA or bpp != 8 or width * height != CHUNK_SIZE:
+        raise ValueError(f"unsupported video: {width}x{height} {bpp}-bit codec {codec}")
+
+    # the offset table (frame count + 1 entries) stays in RAM for seeking
+    video_index = array("I", bytes(4 * (count + 1)))
+    storage.file_readinto(file_obj, video_index)
+    video_fps = fps or _DEFAULT_FPS
+    frame_count = count
+    return True
+
+
+def __play_video(view_manager) -> None:
+    """Show the frame due now, skipping decodes that cannot be caught up."""
+    from utime import ticks_ms, ticks_diff
+
+    global current_frame, start_ticks, shown_frames, skipped_frames
+
+    storage = view_manager.storage
+    due = ticks_diff(ticks_ms(), start_ticks) * video_fps // 1000
+    if due >= frame_count:
+        # loop from the start
+        start_ticks = ticks_ms()
+        due = 0
+        current_frame = 0
+    elif due < current_frame:
+        return  # ahead of time: the previous frame stays on screen
+
+    # behind: catch up (via a key frame when one is closer than the screen)
+    skipped_frames += due - current_frame
+    if not __seek(storage, due) or not __load_frame(storage, current_frame):
+        # a frame could not be read and the deltas after it would be wrong:
+        # start over from the first (key) frame
+        print(f"Video: cannot read frame {current_frame}, restarting")
+        start_ticks = ticks_ms()
+        current_frame = 0
+        return
+    current_frame += 1
+
+    draw = view_manager.draw
+    draw._bytearray(position.x, position.y, size.x, size.y, frame_data)
+    draw.swap()
+    shown_frames += 1
+
+
+def __seek(storage, target: int) -> bool:
+    """
+    Decode up to (not including) target.
+
+    Decoding restarts at the last key frame before target only when that
+    is ahead of the frame already decoded; otherwise it continues forward.
+    Returns False if a frame could not be read.
+    """
+    global current_frame
+
+    key = target
+    while key > 0 and not video_index[key] & _KEY_FLAG:
+        key -= 1
+    if key > current_frame or current_frame > target:
+        current_frame = key
+    while current_frame < target:
+        if not __load_frame(storage, current_frame):
+            return False
+        current_frame += 1
+    return True
+
 
 def start(view_manager) -> bool:
     """Start the app"""
@@ -41,7 +197,7 @@ def start(view_manager) -> bool:
         "Follow these steps to get started:\n\n"
         "- download from: http://commondatastorage.googleapis.com/gtv-videos-bucket/sample/BigBuckBunny.mp4\n\n"
         '- then convert to png frames with:\nmkdir big-buck-bunny && ffmpeg -i ~/Downloads/BigBuckBunny.mp4 -vf "fps=10,scale={FRAME_WIDTH}:{FRAME_HEIGHT}:force_original_aspect_ratio=decrease,pad={FRAME_WIDTH}:{FRAME_HEIGHT}:(ow-iw)/2:(oh-ih)/2" big-buck-bunny/frame_%04d.png\n\n'
-        "- then convert to .bin using the png2fb.py script in tools:\npython png2fb.py <folder> --8bit\n\n"
+        "- then convert to .bin using the png2fb.py script in tools:\npython png2fb.py <folder> --8bit --delta --fps 10\n\n"
         "- then rename to  `big-buck-bunny.bin` and copy to the root of your SD card"
     )
     d._text(0, 0, info, fg)
@@ -56,6 +212,7 @@ def start(view_manager) -> bool:
             break
 
     global position, size, current_frame, file_obj, frame_data
+    global start_ticks, shown_frames, skipped_frames
     current_frame = FRAME_START
     position = Vector(0, 0)
     size = Vector(FRAME_WIDTH, FRAME_HEIGHT)
@@ -70,9 +227,24 @@ def start(view_manager) -> bool:
     file_obj = storage.file_open("big-buck-bunny.bin")
     print(file_obj)
 
-    # Pre-allocate frame buffer once
+    # Pre-allocate frame buffer once; deltas are applied to it in place while
+    # the previous frame stays on screen, and on boards with PSRAM the split
+    # heap places it there
     frame_data = bytearray(CHUNK_SIZE)
 
+    try:
+        if __open_video(storage):
+            from utime import ticks_ms
+
+            current_frame = 0
+            shown_frames = 0
+            skipped_frames = 0
+            start_ticks = ticks_ms()
+    except Exception as e:
+        print(f"Error reading video: {e}")
+        view_manager.alert(f"Cannot play big-buck-bunny.bin:\n{e}", False)
+        return False
+
     return True
 
 
@@ -87,6 +259,8 @@ def run(view_manager) -> None:
     if button == BUTTON_BACK:
         inp.reset()
         view_manager.back()
+    elif video_index is not None:
+        __play_video(view_manager)
     else:
         # Direct read into pre-allocated buffer
         bytes_read = storage.file_readinto(file_obj, frame_data)
@@ -113,9 +287,12 @@ def stop(view_manager) -> None:
     """Stop the app"""
     from gc import collect
 
-    global position, size, file_obj, frame_data
+    global position, size, file_obj, frame_data, video_index, read_buffer
     storage = view_manager.storage
 
+    if video_index is not None and shown_frames:
+        print(f"Video: {shown_frames} frames shown, {skipped_frames} skipped")
+
     if file_obj:
         storage.file_close(file_obj)
         file_obj = None
@@ -128,5 +305,7 @@ def stop(view_manager) -> None:
     size = None
     del frame_data
     frame_data = None
+    video_index = None
+    read_buffer = None
 
     collect()
@@ -649,6 +649,95 @@ mp_obj_t lcd_mp_fill_triangle(size_t n_args, const mp_obj_t *args)
 }
 static MP_DEFINE_CONST_FUN_OBJ_VAR_BETWEEN(lcd_mp_fill_triangle_obj, 8, 8, lcd_mp_fill_triangle);
 
+mp_obj_t lcd_mp_grid(size_t n_args, const mp_obj_t *args)
+{
+    // Arguments: self, x, y, columns, rows, cell_size, indices, palette
+    if (n_args != 8)
+    {
+        mp_raise_ValueError(MP_ERROR_TEXT("grid requires 8 arguments: self, x, y, columns, rows, cell_size, indices, palette"));
+    }
+
+    lcd_mp_obj_t *self = MP_OBJ_TO_PTR(args[0]);
+    if (!self->initialized)
+    {
+        mp_raise_ValueError(MP_ERROR_TEXT("LCD object is not initialized"));
+    }
+
+    uint16_t x = lcd_obj_to_int(args[1]);
+    uint16_t y = lcd_obj_to_int(args[2]);
+    uint16_t columns = lcd_obj_to_int(args[3]);
+    uint16_t rows = lcd_obj_to_int(args[4]);
+    uint16_t cell_size = lcd_obj_to_int(args[5]);
+
+    mp_buffer_info_t cells;
+    mp_get_buffer_raise(args[6], &cells, MP_BUFFER_READ);
+    mp_buffer_info_t palette;
+    mp_get_buffer_raise(args[7], &palette, MP_BUFFER_READ);
+
+    if (cells.len < (size_t)columns * rows)
+    {
+        mp_raise_ValueError(MP_ERROR_TEXT("indices too small for grid"));
+    }
+    size_t palette_len = palette.len / sizeof(uint16_t);
+    if (palette_len == 0)
+    {
+        mp_raise_ValueError(MP_ERROR_TEXT("palette is empty"));
+    }
+
+    if (self->scale_position)
+    {
+        x = lcd_scale_x(self, x);
+        y = lcd_scale_y(self, y);
+    }
+    uint16_t cell_w = lcd_scale_x(self, cell_size);
+    uint16_t cell_h = lcd_scale_y(self, cell_size);
+    if (cell_w == 0 || cell_h == 0 || columns == 0 || x >= self->width || y >= self->height)
+    {
+        return mp_const_none;
+    }
+
+    // Expand each grid row once into a row of pixels, then blit it cell_h times
+    uint32_t dst_w = (uint32_t)columns * cell_w;
+    if (dst_w > (uint32_t)(self->width - x))
+    {
+        dst_w = self->width - x;
+    }
+    const uint8_t *src = (const uint8_t *)cells.buf;
+    const uint16_t *colors = (const uint16_t *)palette.buf;
+    uint16_t *row_buf = m_new(uint16_t, dst_w);
+    for (uint16_t row = 0; row < rows; row++)
+    {
+        uint32_t dst_y = y + (uint32_t)row * cell_h;
+        if (dst_y >= self->height)
+        {
+            break;
+        }
+        const uint8_t *src_row = &src[(size_t)row * columns];
+        uint32_t dx = 0;
+        for (uint16_t col = 0; col < columns && dx < dst_w; col++)
+        {
+            uint8_t index = src_row[col];
+            uint16_t color = colors[index < palette_len ? index : palette_len - 1];
+            for (uint16_t k = 0; k < cell_w && dx < dst_w; k++)
+            {
+                row_buf[dx++] = color;
+            }
+        }
+        uint32_t height = cell_h;
+        if (dst_y + height > self->height)
+        {
+            height = self->height - dst_y;
+        }
+        for (uint32_t k = 0; k < height; k++)
+        {
+            LCD_MP_BLIT_16BIT(x, dst_y + k, dst_w, 1, row_buf);
+        }
+    }
+    m_del(uint16_t, row_buf, dst_w);
+    return mp_const_none;
+}
+static MP_DEFINE_CONST_FUN_OBJ_VAR_BETWEEN(lcd_mp_grid_obj, 8, 8, lcd_mp_grid);
+
 mp_obj_t lcd_mp_image_bytearray(size_t n_args, const mp_obj_t *args)
 {
     // Arguments: self, x, y, width, height, buffer
@@ -1163,6 +1252,64 @@ mp_obj_t lcd_mp_swap(mp_obj_t self_in)
 }
 static MP_DEFINE_CONST_FUN_OBJ_1(lcd_mp_swap_obj, lcd_mp_swap);
 
+mp_obj_t lcd_mp_swap_region(size_t n_args, const mp_obj_t *args)
+{
+    // Arguments: self, x, y, width, height
+    if (n_args != 5)
+    {
+        mp_raise_ValueError(MP_ERROR_TEXT("swap_region requires 5 arguments: self, x, y, width, height"));
+    }
+
+    lcd_mp_obj_t *self = MP_OBJ_TO_PTR(args[0]);
+    if (!self->initialized)
+    {
+        mp_raise_ValueError(MP_ERROR_TEXT("LCD object is not initialized"));
+    }
+
+    int x = lcd_obj_to_int(args[1]);
+    int y = lcd_obj_to_int(args[2]);
+    int width = lcd_obj_to_int(args[3]);
+    int height = lcd_obj_to_int(args[4]);
+
+    // clip to the screen
+    if (x < 0)
+    {
+        width += x;
+        x = 0;
+    }
+    if (y < 0)
+    {
+        height += y;
+        y = 0;
+    }
+    if (width <= 0 || height <= 0)
+        return mp_const_none;
+
+    // same coordinates as the drawing calls that filled the region
+    if (self->scale_position)
+    {
+        x = lcd_scale_x(self, x);
+        y = lcd_scale_y(self, y);
+    }
+    width = lcd_scale_x(self, width);
+    height = lcd_scale_y(self, height);
+
+    if (x + width > LCD_MP_WIDTH)
+        width = LCD_MP_WIDTH - x;
+    if (y + height > LCD_MP_HEIGHT)
+        height = LCD_MP_HEIGHT - y;
+    if (width <= 0 || height <= 0)
+        return mp_const_none;
+
+#ifdef LCD_MP_SWAP_REGION
+    LCD_MP_SWAP_REGION(x, y, width, height);
+#else
+    LCD_MP_SWAP(); // no partial transfer on this board
+#endif
+    return mp_const_none;
+}
+static MP_DEFINE_CONST_FUN_OBJ_VAR_BETWEEN(lcd_mp_swap_region_obj, 5, 5, lcd_mp_swap_region);
+
 mp_obj_t lcd_mp_text(size_t n_args, const mp_obj_t *args)
 {
     // Arguments: self, x, y, text, color, font_size (optional)
@@ -1245,6 +1392,7 @@ static const mp_rom_map_elem_t lcd_mp_locals_dict_table[] = {
     {MP_ROM_QSTR(MP_QSTR__fill_round_rectangle), MP_ROM_PTR(&lcd_mp_fill_round_rectangle_obj)}, // self._fill_round_rectangle()
     {MP_ROM_QSTR(MP_QSTR__fill_triangle), MP_ROM_PTR(&lcd_mp_fill_triangle_obj)},               // self._fill_triangle()
     {MP_ROM_QSTR(MP_QSTR__bytearray), MP_ROM_PTR(&lcd_mp_image_bytearray_obj)},                 // self._bytearray()
+    {MP_ROM_QSTR(MP_QSTR__grid), MP_ROM_PTR(&lcd_mp_grid_obj)},                                 // self._grid()
     {MP_ROM_QSTR(MP_QSTR__line), MP_ROM_PTR(&lcd_mp_line_obj)},                                 // self._line()
     {MP_ROM_QSTR(MP_QSTR__pixel), MP_ROM_PTR(&lcd_mp_pixel_obj)},                               // self._pixel()
     {MP_ROM_QSTR(MP_QSTR__psram), MP_ROM_PTR(&lcd_mp_psram_obj)},                               // self._psram()
@@ -1257,6 +1405,7 @@ static const mp_rom_map_elem_t lcd_mp_locals_dict_table[] = {
     {MP_ROM_QSTR(MP_QSTR_set_mode), MP_ROM_PTR(&lcd_mp_set_mode_obj)},                          // self.set_mode()
     {MP_ROM_QSTR(MP_QSTR_set_scaling), MP_ROM_PTR(&lcd_mp_set_scaling_obj)},                    // self.set_scaling()
     {MP_ROM_QSTR(MP_QSTR_swap), MP_ROM_PTR(&lcd_mp_swap_obj)},                                  // self.swap()
+    {MP_ROM_QSTR(MP_QSTR__swap_region), MP_ROM_PTR(&lcd_mp_swap_region_obj)},                   // self._swap_region()
     {MP_ROM_QSTR(MP_QSTR__text), MP_ROM_PTR(&lcd_mp_text_obj)},                                 // self._text()
     {MP_ROM_QSTR(MP_QSTR__triangle), MP_ROM_PTR(&lcd_mp_triangle_obj)},                         // self._triangle()
 
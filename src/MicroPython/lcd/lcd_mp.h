@@ -40,6 +40,7 @@ mp_obj_t lcd_mp_fill_circle(size_t n_args, const mp_obj_t *args);          // fi
 mp_obj_t lcd_mp_fill_rectangle(size_t n_args, const mp_obj_t *args);       // fill a rectangle on the LCD
 mp_obj_t lcd_mp_fill_round_rectangle(size_t n_args, const mp_obj_t *args); // fill a rounded rectangle on the LCD
 mp_obj_t lcd_mp_fill_triangle(size_t n_args, const mp_obj_t *args);        // fill a triangle
+mp_obj_t lcd_mp_grid(size_t n_args, const mp_obj_t *args);                 // draw a grid of palette indices scaled up into cells
 mp_obj_t lcd_mp_image_bytearray(size_t n_args, const mp_obj_t *args);      // draw an image from a bytearray on the LCD
 mp_obj_t lcd_mp_line(size_t n_args, const mp_obj_t *args);                 // draw a line on the LCD
 mp_obj_t lcd_mp_pixel(size_t n_args, const mp_obj_t *args);                // draw a pixel on the LCD
@@ -53,5 +54,6 @@ mp_obj_t lcd_mp_screenshot(mp_obj_t self_in, mp_obj_t file_path);          // ta
 mp_obj_t lcd_mp_set_mode(mp_obj_t self_in, mp_obj_t mode);                 // set the LCD mode (PSRAM or HEAP)
 mp_obj_t lcd_mp_set_scaling(size_t n_args, const mp_obj_t *args);          // set the LCD scaling parameters
 mp_obj_t lcd_mp_swap(mp_obj_t self_in);                                    // swap function to update the display with the current framebuffer contents
+mp_obj_t lcd_mp_swap_region(size_t n_args, const mp_obj_t *args);          // update only a rectangle of the display from the framebuffer
 mp_obj_t lcd_mp_text(size_t n_args, const mp_obj_t *args);                 // draw text on the LCD
 mp_obj_t lcd_mp_triangle(size_t n_args, const mp_obj_t *args);             // draw a triangle on the LCD
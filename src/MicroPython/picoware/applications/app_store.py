@@ -23,6 +23,7 @@ MAX_ITEMS = const(100)
 
 _current_file_index: int = 0
 _http = None
+_http_cache = None
 _loading = None
 _files_to_download: list = []
 _app_menu = None
@@ -40,15 +41,28 @@ _main_menu = None  # Main menu reference
 _update_check_data: dict = None  # Response from update check API
 
 
+def __cache(view_manager):
+    """Return the HTTP cache shared by the API requests"""
+    global _http_cache
+
+    if _http_cache is None:
+        from picoware.system.http import HTTPCache
+
+        _http_cache = HTTPCache(view_manager.storage)
+    return _http_cache
+
+
 def __reset() -> None:
     """Reset the app store state"""
     global _http, _loading, _files_to_download, _current_file_index, _app_menu
     global _app_state, _current_list_index, _apps_data, _selected_app_id, _selected_app_details
     global _download_all_mode, _current_app_index, _total_apps_to_download
     global _installed_apps, _updates_available, _main_menu, _update_check_data
+    global _http_cache
     if _http:
         del _http
         _http = None
+    _http_cache = None
     if _loading:
         del _loading
         _loading = None
@@ -277,6 +291,7 @@ def __check_single_app_update(view_manager, app_id: int, current_version: str) -
         _http = HTTP(thread_manager=view_manager.thread_manager)
 
     storage = view_manager.storage
+    _http.cache = __cache(view_manager)
     url = f"https://www.jblanked.com/picoware/api/app/{app_id}/check_update/{current_version}/"
 
     return _http.get_async(
@@ -396,6 +411,7 @@ def __fetch_app_list(view_manager) -> bool:
 
     storage = view_manager.storage
     storage.mkdir("picoware/cache")
+    _http.cache = __cache(view_manager)
 
     url = (
         f"https://www.jblanked.com/picoware/api/apps/{MAX_ITEMS}/{_current_list_index}/"
@@ -409,6 +425,13 @@ def __fetch_app_list(view_manager) -> bool:
     )
 
 
+def __app_list_item(index: int) -> str:
+    """Menu text for a row of the app list (row 0 downloads everything)."""
+    if index == 0:
+        return "[Download All Apps]"
+    return _apps_data["apps"][index - 1]["title"]
+
+
 def __parse_app_list(view_manager) -> bool:
     """Parse the app list JSON and populate the menu"""
     global _apps_data, _app_menu
@@ -417,17 +440,31 @@ def __parse_app_list(view_manager) -> bool:
     file_path = f"picoware/cache/app_list_{_current_list_index}.json"
 
     try:
-        data = storage.read(file_path)
-        if not data:
-            return False
-
-        from json import loads
+        from picoware.system.json_stream import JSONStream
 
-        _apps_data = loads(data)
+        # stream the list and keep only what the menu needs from each app
+        stream = JSONStream(file_path, storage, max_item=8192)
+        success = False
+        apps = []
+        try:
+            for index, value in stream.select(("success", "apps[*]")):
+                if index == 0:
+                    success = value
+                else:
+                    apps.append(
+                        {
+                            "id": value.get("id"),
+                            "title": value.get("title", "Unknown App"),
+                        }
+                    )
+        finally:
+            stream.close()
 
-        if not _apps_data.get("success") or not _apps_data.get("apps"):
+        if not success or not apps:
             return False
 
+        _apps_data = {"success": success, "apps": apps}
+
         # Create menu if it doesn't exist
         if not _app_menu:
             from picoware.gui.menu import Menu
@@ -444,13 +481,10 @@ def __parse_app_list(view_manager) -> bool:
                 view_manager.foreground_color,
             )
 
-        # Clear and populate menu
+        # Clear the menu and show the apps straight from the parsed list,
+        # with the "Download All Apps" option at the top
         _app_menu.clear()
-        # Add "Download All Apps" option at the top
-        _app_menu.add_item("[Download All Apps]")
-        for app in _apps_data["apps"]:
-            title = app.get("title", "Unknown App")
-            _app_menu.add_item(title)
+        _app_menu.set_provider(len(apps) + 1, __app_list_item)
 
         return True
     except Exception as e:
@@ -468,6 +502,7 @@ def __fetch_app_details(view_manager, app_id: int) -> bool:
         _http = HTTP(thread_manager=view_manager.thread_manager)
 
     storage = view_manager.storage
+    _http.cache = __cache(view_manager)
     url = f"https://www.jblanked.com/picoware/api/app/{app_id}/"
 
     return _http.get_async(
@@ -598,6 +633,7 @@ def __download_next_file(view_manager) -> bool:
     dir_path = "/".join(file_path.split("/")[:-1])
     storage.mkdir(dir_path)
 
+    _http.cache = None  # app files are written straight to their destination
     return _http.get_async(
         file_url,
         save_to_file=file_path,
@@ -3,46 +3,20 @@
 _menu = None
 _bluetooth = None
 _loading = None
-_addresses = []
-_scanned_devices = []  # List of (addr_type, addr_bytes, name, rssi)
+_table = None  # ScanTable with one row per device
+_scanned_devices = []  # Table rows in menu order (strongest first)
 
 
-def bluetooth_callback(event, data):
-    """Bluetooth callback function for scan results"""
+def __fill_menu() -> None:
+    """Rebuild the device list from the scan table, strongest signal first."""
     global _scanned_devices
 
-    if event == 5:  # _IRQ_SCAN_RESULT
-        addr_type, addr, adv_type, rssi, adv_data = data
-
-        # Format the address
-        addr_str = ":".join("{:02X}".format(b) for b in addr)
-
-        # Skip if already seen
-        if addr_str in _addresses:
-            return
-
-        _addresses.append(addr_str)
-
-        # Try to decode the device name
-        name = ""
-        if _bluetooth is not None:
-            name = _bluetooth.decode_name(adv_data)
-
-        # Store device info
-        _scanned_devices.append((addr_type, bytes(addr), name, rssi))
-
-        # Create display string
-        if name:
-            display_str = f"{name} ({rssi}dB)"
-        else:
-            display_str = f"{addr_str[:17]} ({rssi}dB)"
-
-        # Add to menu
-        if _menu is not None:
-            _menu.add_item(display_str)
-
-    elif event == 6:  # _IRQ_SCAN_DONE
-        _addresses.clear()
+    _scanned_devices = _table.sorted_indices()
+    for i in _scanned_devices:
+        name = _table.name(i)
+        if not name:
+            name = ":".join("{:02X}".format(b) for b in _table.address(i))[:17]
+        _menu.add_item(f"{name} ({_table.best_rssi(i)}dB)")
 
 
 def start(view_manager) -> bool:
@@ -50,8 +24,9 @@ def start(view_manager) -> bool:
     from picoware.gui.loading import Loading
     from picoware.gui.menu import Menu
     from picoware.system.bluetooth import Bluetooth
+    from picoware.system.bluetooth_scan import ScanTable
 
-    global _menu, _bluetooth, _loading, _scanned_devices
+    global _menu, _bluetooth, _loading, _table, _scanned_devices
 
     # Cleanup
     if _menu is not None:
@@ -89,9 +64,10 @@ def start(view_manager) -> bool:
     )
     _loading.text = "Scanning for Bluetooth devices..."
 
+    # repeat advertisements are folded into the table instead of reaching the UI
+    _table = ScanTable(capacity=64, interval_ms=500)
     _bluetooth = Bluetooth()
-    _bluetooth.callback = bluetooth_callback
-    _bluetooth.scan()
+    _bluetooth.scan(table=_table)
 
     return True
 
@@ -119,6 +95,8 @@ def run(view_manager) -> None:
     # If scan is still active, show loading animation
     if _bluetooth.is_scanning:
         if _loading:
+            if _table.changed():
+                _loading.text = f"Scanning... {len(_table)} devices found"
             _loading.animate()
         return
 
@@ -128,6 +106,7 @@ def run(view_manager) -> None:
         del _loading
         _loading = None
 
+        __fill_menu()
         if _menu.item_count == 0:
             view_manager.alert("No Bluetooth devices found.", True)
         else:
@@ -143,7 +122,10 @@ def run(view_manager) -> None:
         # Show device details
         idx = _menu.selected_index
         if 0 <= idx < len(_scanned_devices):
-            addr_type, addr, name, rssi = _scanned_devices[idx]
+            row = _scanned_devices[idx]
+            addr_type = _table.address_type(row)
+            addr = _table.address(row)
+            name = _table.name(row)
             addr_str = ":".join("{:02X}".format(b) for b in addr)
 
             draw = view_manager.draw
@@ -160,7 +142,11 @@ def run(view_manager) -> None:
             text_vec.y = 90
             draw.text(text_vec, f"Type: {'Public' if addr_type == 0 else 'Random'}")
             text_vec.y = 110
-            draw.text(text_vec, f"RSSI: {rssi} dB")
+            draw.text(
+                text_vec, f"RSSI: {_table.rssi(row)} dB (best {_table.best_rssi(row)})"
+            )
+            text_vec.y = 130
+            draw.text(text_vec, f"Adverts: {_table.count(row)}")
             text_vec.y = draw.size.y - 20
             draw.text(text_vec, "Press BACK to return")
             draw.swap()
@@ -170,7 +156,7 @@ def stop(view_manager) -> None:
     """Stop the app"""
     from gc import collect
 
-    global _menu, _bluetooth, _loading, _addresses, _scanned_devices
+    global _menu, _bluetooth, _loading, _table, _scanned_devices
 
     if _bluetooth is not None:
         if _bluetooth.is_scanning:
@@ -184,6 +170,6 @@ def stop(view_manager) -> None:
         del _loading
         _loading = None
 
-    _addresses.clear()
+    _table = None
     _scanned_devices = []
     collect()
@@ -3,6 +3,7 @@
 from micropython import const
 
 _bluetooth = None
+_stream = None
 _menu = None
 _loading = None
 _messages = []  # List of (is_sent, text)
@@ -84,9 +85,12 @@ def start(view_manager) -> bool:
     """Start the UART Chat app"""
     from picoware.gui.menu import Menu
 
-    global _bluetooth, _menu, _state, _messages, _scanned_devices, _addresses, _mode
+    global _bluetooth, _stream, _menu, _state, _messages, _scanned_devices, _addresses, _mode
 
     # Cleanup
+    if _stream is not None:
+        del _stream
+        _stream = None
     if _bluetooth is not None:
         del _bluetooth
         _bluetooth = None
@@ -132,7 +136,7 @@ def run(view_manager) -> None:
     from picoware.system.vector import Vector
     from utime import ticks_ms, ticks_diff
 
-    global _state, _mode, _bluetooth, _menu, _loading
+    global _state, _mode, _bluetooth, _stream, _menu, _loading
     global _selected_device, _scanned_devices, _addresses, _last_update
 
     button: int = view_manager.button
@@ -166,16 +170,18 @@ def run(view_manager) -> None:
             _menu.scroll_down()
         elif button == BUTTON_CENTER:
             from picoware.system.bluetooth import Bluetooth
+            from picoware.system.bluetooth_stream import BluetoothStream
 
             _bluetooth = Bluetooth()
             _bluetooth.callback = bluetooth_callback
+            # fragments messages to the MTU and reassembles them on the other side
+            _stream = BluetoothStream(_bluetooth, on_data_received)
 
             if _menu.selected_index == 0:
                 from picoware.gui.menu import Menu
 
                 # Central mode - scan for devices
                 _mode = "central"
-                _bluetooth.on_notify(on_data_received)
                 _scanned_devices = []
                 _addresses = []
 
@@ -209,7 +215,6 @@ def run(view_manager) -> None:
             else:
                 # Peripheral mode - wait for connection
                 _mode = "peripheral"
-                _bluetooth.on_write(on_data_received)
                 _bluetooth.start_peripheral(name="Picoware-Chat")
                 _state = STATE_PERIPHERAL_WAIT
         return
@@ -290,6 +295,9 @@ def run(view_manager) -> None:
             del _loading
             _loading = None
 
+        if _stream.pending:
+            _stream.update()
+
         now = ticks_ms()
         if ticks_diff(now, _last_update) < 100:
             return
@@ -341,10 +349,7 @@ def run(view_manager) -> None:
             # Message entered
             if result:
                 _messages.append((True, result))
-                if _mode == "central":
-                    _bluetooth.write(result)
-                else:
-                    _bluetooth.send(result)
+                _stream.send(result)
 
             _keyboard.reset()
             _state = STATE_CHAT
@@ -354,9 +359,13 @@ def stop(view_manager) -> None:
     """Stop the app"""
     from gc import collect
 
-    global _bluetooth, _menu, _loading, _messages
+    global _bluetooth, _stream, _menu, _loading, _messages
     global _scanned_devices, _addresses, _selected_device, _state, _mode
 
+    if _stream is not None:
+        del _stream
+        _stream = None
+
     if _bluetooth is not None:
         if _bluetooth.is_connected or _bluetooth.is_peripheral_connected:
             _bluetooth.disconnect()
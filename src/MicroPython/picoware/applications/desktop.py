@@ -1,5 +1,8 @@
+from micropython import const
 from picoware.applications.wifi.utils import connect_to_saved_wifi
 
+_IDLE_SLEEP_MS = const(50)  # nap per loop once the screen is static (input latency)
+
 
 class PicowareAnimation:
     """Class to draw "Picoware" animation"""
@@ -11,6 +14,7 @@ class PicowareAnimation:
         self.circle_radius = 0
         self.circle_max_radius = 80
         self.circle_opacity = 100
+        self.is_idle = False  # letters settled and the last ring pulse finished
         self.size = self.display.size
         self.center_x = self.size.x // 2
         self.center_y = self.size.y // 2
@@ -78,13 +82,20 @@ class PicowareAnimation:
             self.letter_states.append(letter_state)
 
     def draw(self) -> None:
-        """Draw the animated 'Picoware' text."""
+        """
+        Draw the animated 'Picoware' text.
+
+        The ring pulses until the letters have settled and then stops at the
+        end of its pulse, leaving a static frame (is_idle).
+        """
 
         # Draw background animations
         if self.circle_radius < self.circle_max_radius:
             self.circle_radius += 2
+        elif self.animation_complete:
+            self.is_idle = True
         else:
-            # Reset for continuous animation
+            # Reset for the next pulse
             self.circle_radius = 0
             self.circle_opacity = 100
 
@@ -93,7 +104,7 @@ class PicowareAnimation:
             self.circle_opacity = max(0, self.circle_opacity - 3)
 
         # Draw circle with fade effect
-        if self.circle_opacity > 20:  # Only draw if visible enough
+        if not self.is_idle and self.circle_opacity > 20:  # Only draw if visible enough
             color = 0x4208
 
             # Draw if opacity threshold is met
@@ -156,13 +167,16 @@ _desktop_update_parsed = False
 _desktop_http = None
 _desktop_request_cancelled = False
 _desktop_update_available = False
+_desktop_redraw = True  # paint the whole screen on the next frame
 
 
 def start(view_manager) -> bool:
     """Start the loading animation."""
     from picoware.gui.desktop import Desktop
 
-    global _desktop, _desktop_picoware, _has_wifi, _desktop_request_cancelled, _desktop_update_fetched, _desktop_update_parsed, _desktop_update_available
+    global _desktop, _desktop_picoware, _has_wifi, _desktop_request_cancelled, _desktop_update_fetched, _desktop_update_parsed, _desktop_update_available, _desktop_redraw
+
+    _desktop_redraw = True
 
     if _desktop is None:
         _desktop = Desktop(
@@ -201,7 +215,7 @@ def run(view_manager) -> None:
     """Animate the loading spinner."""
     from picoware.system.buttons import BUTTON_LEFT, BUTTON_CENTER, BUTTON_UP
 
-    global _desktop_time_updated, _desktop_update_fetched, _desktop_update_parsed, _desktop_http, _desktop_update_available
+    global _desktop_time_updated, _desktop_update_fetched, _desktop_update_parsed, _desktop_http, _desktop_update_available, _desktop_redraw
 
     button: int = view_manager.button
 
@@ -224,16 +238,26 @@ def run(view_manager) -> None:
 
     battery_level: int = view_manager.input_manager.battery
     _desktop.set_battery(battery_level)
+    wifi_is_connected = False if not _has_wifi else view_manager.wifi.is_connected()
+
+    if _desktop_redraw or not _desktop_picoware.is_idle:
+        # Clear and draw header
+        view_manager.draw.erase()
+        _desktop.draw_header(wifi_is_connected)
 
-    # Clear and draw header
-    view_manager.draw.erase()
-    _desktop.draw_header(False if not _has_wifi else view_manager.wifi.is_connected())
+        # Draw animated picoware text every frame until it settles
+        _desktop_picoware.draw()
 
-    # Draw animated picoware text every frame
-    _desktop_picoware.draw()
+        # Swap buffer to display
+        view_manager.draw.swap()
+        _desktop_redraw = False
+    elif not _desktop.update_header(wifi_is_connected) and (
+        _desktop_http is None and not view_manager.time.is_fetching
+    ):
+        # static screen and nothing in flight: nap instead of spinning
+        from utime import sleep_ms
 
-    # Swap buffer to display
-    view_manager.draw.swap()
+        sleep_ms(_IDLE_SLEEP_MS)
 
     if not _has_wifi:
         return
@@ -289,6 +313,7 @@ def run(view_manager) -> None:
                 _should_download = view_manager.alert(
                     "There's a new Picoware update available!! Press `Center` to start downloading in the background or `Back` to decline. Do not leave the desktop to allow the download to complete."
                 )
+                _desktop_redraw = True  # the alert covered the desktop
                 if not _should_download:
                     view_manager.log("User declined update download")
                     _desktop_update_parsed = True
@@ -298,6 +323,7 @@ def run(view_manager) -> None:
                     _desktop_http, view_manager.storage
                 ):
                     view_manager.alert("Failed to start update download")
+                    _desktop_redraw = True
             else:
                 view_manager.log("No update available")
             _desktop_update_parsed = True  # only parse once even on fail...
@@ -316,6 +342,7 @@ def run(view_manager) -> None:
                 __draw_download_complete(view_manager)
             else:
                 view_manager.alert("There was an error downloading the update")
+            _desktop_redraw = True
             _desktop_http.close()
             del _desktop_http
             _desktop_http = None
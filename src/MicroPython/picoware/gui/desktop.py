@@ -1,1080 +1,7 @@
+from micropython import const
 from picoware.system.vector import Vector
 
-_WIFI_ON_BLACK = bytes(
-    [
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0xFF,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0xFF,
-        0x00,
-        0xFF,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-    ]
-)
-
-_WIFI_OFF_BLACK = bytes(
-    [
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0xFF,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0xFF,
-        0x00,
-        0xFF,
-        0x00,
-        0xFF,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0xFF,
-        0x00,
-        0xFF,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-    ]
-)
-
-_BLUETOOTH_ON_BLACK = bytes(
-    [
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0xFF,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0xFF,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-    ]
-)
-
-_BLUETOOTH_OFF_BLACK = bytes(
-    [
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0xFF,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0xFF,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-    ]
-)
+_BATTERY_JITTER = const(1)  # gauge wobble (in %) that does not update the header
 
 
 class Desktop:
@@ -1083,6 +10,8 @@ class Desktop:
     def __init__(
         self, draw, text_color: int = 0xFFFF, background_color: int = 0x0000
     ) -> None:
+        from picoware.gui.desktop_icons import PACK
+        from picoware.system.asset_pack import AssetPack
         from picoware.system.system import System
 
         system = System()
@@ -1098,10 +27,24 @@ class Desktop:
 
         self.size = self.display.size
         self.font_size_x = self.display.font_size.x
+        self.font_size_y = self.display.font_size.y
+
+        # what the header shows, so update_header() redraws only what changed
+        self._battery_level = -1
+        self._region = None
+        self._shown_battery = None  # (x, y, text); None until the header is drawn
+        self._shown_time = None
+        self._shown_wifi = False
 
         self.position = Vector(0, 0)
-        self.wifi_size = Vector(19, 16)
-        self.bluetooth_size = Vector(14, 16)
+        # icons are views into the (frozen, in flash) pack, not RAM copies
+        icons = AssetPack(PACK)
+        self.wifi_size = icons.size("wifi_on")
+        self.bluetooth_size = icons.size("bluetooth_on")
+        self._wifi_on = icons.get("wifi_on")
+        self._wifi_off = icons.get("wifi_off")
+        self._bluetooth_on = icons.get("bluetooth_on")
+        self._bluetooth_off = icons.get("bluetooth_off")
         self.wifi_pos = Vector(0, 0)
         self.name_pos = Vector(0, 0)
         self.time_pos = Vector(int(self.size.x * 0.4375), 5)
@@ -1145,11 +88,88 @@ class Desktop:
         self.position = None
         self.wifi_size = None
         self.bluetooth_size = None
+        self._wifi_on = None
+        self._wifi_off = None
+        self._bluetooth_on = None
+        self._bluetooth_off = None
         self.wifi_pos = None
         self.name_pos = None
         self.time_pos = None
         self.bluetooth_pos = None
         self.battery_pos = None
+        self._region = None
+
+    def __draw_text(self, shown: tuple, position: Vector, text: str) -> tuple:
+        """
+        Redraw the cells of a header field whose text changed.
+
+        Args:
+            shown: (x, y, text) currently on screen
+            position: Where the field is drawn now
+            text: The new text
+
+        Returns:
+            The new (x, y, text)
+        """
+        x, y = position.x, position.y
+        old_x, old_y, old = shown
+        if old == text and old_x == x and old_y == y:
+            return shown
+        display = self.display
+        cell = self.font_size_x
+        if old_x != x or old_y != y:
+            # moved (centred on round screens): repaint the whole field
+            if old:
+                display._fill_rectangle(
+                    old_x,
+                    old_y,
+                    len(old) * cell,
+                    self.font_size_y,
+                    self.background_color,
+                )
+                self.__mark(old_x, old_y, len(old) * cell, self.font_size_y)
+            first, end = 0, len(text)
+            if text:
+                display._fill_rectangle(
+                    x, y, end * cell, self.font_size_y, self.background_color
+                )
+        else:
+            # only the cells from the first to the last differing character
+            first = 0
+            common = min(len(old), len(text))
+            while first < common and old[first] == text[first]:
+                first += 1
+            end = max(len(old), len(text))
+            if len(old) == len(text):
+                while end > first and old[end - 1] == text[end - 1]:
+                    end -= 1
+            display._fill_rectangle(
+                x + first * cell,
+                y,
+                (end - first) * cell,
+                self.font_size_y,
+                self.background_color,
+            )
+        if end > first:
+            self.__mark(x + first * cell, y, (end - first) * cell, self.font_size_y)
+            if first < len(text):
+                display._text(x + first * cell, y, text[first:end], self.text_color)
+        return (x, y, text)
+
+    def __mark(self, x: int, y: int, width: int, height: int) -> None:
+        """Add a rectangle to the region sent to the display."""
+        region = self._region
+        if region is None:
+            self._region = [x, y, x + width, y + height]
+            return
+        if x < region[0]:
+            region[0] = x
+        if y < region[1]:
+            region[1] = y
+        if x + width > region[2]:
+            region[2] = x + width
+        if y + height > region[3]:
+            region[3] = y + height
 
     def clear(self) -> None:
         """Clear the display with the background color."""
@@ -1171,7 +191,14 @@ class Desktop:
         self.display.swap()
 
     def draw_header(self, wifi_is_connected: bool = True) -> None:
-        """Draw the header with the board name and Wi-Fi status."""
+        """
+        Draw the header with the board name and Wi-Fi status.
+
+        The whole header is drawn into the framebuffer (the caller swaps);
+        update_header() then redraws only what changes.
+        """
+        wifi_on = self.has_wifi and wifi_is_connected
+
         # draw board name
         self.display.text(self.name_pos, self.name, self.text_color)
 
@@ -1187,7 +214,7 @@ class Desktop:
         self.display.image_bytearray(
             self.wifi_pos,
             self.wifi_size,
-            _WIFI_ON_BLACK if self.has_wifi and wifi_is_connected else _WIFI_OFF_BLACK,
+            self._wifi_on if wifi_on else self._wifi_off,
             invert=not self.is_dark_mode,
         )
 
@@ -1195,7 +222,7 @@ class Desktop:
         self.display.image_bytearray(
             self.bluetooth_pos,
             self.bluetooth_size,
-            (_BLUETOOTH_ON_BLACK if self.has_wifi else _BLUETOOTH_OFF_BLACK),
+            (self._bluetooth_on if self.has_wifi else self._bluetooth_off),
             invert=not self.is_dark_mode,
         )
 
@@ -1206,8 +233,27 @@ class Desktop:
             self.text_color,
         )
 
+        self._shown_time = (self.time_pos.x, self.time_pos.y, self.time_str)
+        self._shown_battery = (
+            self.battery_pos.x,
+            self.battery_pos.y,
+            self.battery_level_str,
+        )
+        self._shown_wifi = wifi_on
+
     def set_battery(self, battery_level: int) -> None:
-        """Set the battery level on the header."""
+        """
+        Set the battery level on the header.
+
+        Readings within _BATTERY_JITTER of the shown level are ignored, so
+        gauge noise does not redraw the header.
+        """
+        if (
+            self._battery_level >= 0
+            and abs(battery_level - self._battery_level) <= _BATTERY_JITTER
+        ):
+            return
+        self._battery_level = battery_level
         self.battery_level_str = f"{battery_level}%"
 
         if self.is_circular:
@@ -1227,3 +273,50 @@ class Desktop:
             time_width = len(self.time_str) * self.font_size_x
             time_x = (self.size.x - time_width) // 2
             self.time_pos.x, self.time_pos.y = time_x, int(self.size.y / 20) + 10
+
+    def update_header(self, wifi_is_connected: bool = True) -> bool:
+        """
+        Redraw only the parts of the header that changed since it was drawn.
+
+        Changed characters of the time and battery text and a changed Wi-Fi
+        icon are redrawn and sent to the display as one region; the rest of
+        the screen is left alone. Draws the whole header (and swaps) if it
+        has not been drawn yet.
+
+        Returns:
+            True if anything was sent to the display
+        """
+        display = self.display
+        if self._shown_time is None:
+            self.draw_header(wifi_is_connected)
+            display.swap()
+            return True
+
+        self._shown_time = self.__draw_text(
+            self._shown_time, self.time_pos, self.time_str
+        )
+        self._shown_battery = self.__draw_text(
+            self._shown_battery, self.battery_pos, self.battery_level_str
+        )
+
+        wifi_on = self.has_wifi and wifi_is_connected
+        if wifi_on != self._shown_wifi:
+            self._shown_wifi = wifi_on
+            display.image_bytearray(
+                self.wifi_pos,
+                self.wifi_size,
+                self._wifi_on if wifi_on else self._wifi_off,
+                invert=not self.is_dark_mode,
+            )
+            self.__mark(
+                self.wifi_pos.x, self.wifi_pos.y, self.wifi_size.x, self.wifi_size.y
+            )
+
+        region = self._region
+        if region is None:
+            return False
+        self._region = None
+        display._swap_region(
+            region[0], region[1], region[2] - region[0], region[3] - region[1]
+        )
+        return True
@@ -0,0 +1,70 @@
+# Generated by tools/pngpack.py; edit the images and regenerate.
+PACK = (
+    b"PAK1\x04\x00\x00\x00wifi_on\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x13\x00\x10\x00\x01\x00\xb0\x00\x00"
+    b"\x000\x01\x00\x00wifi_off\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x13\x00\x10\x00\x01\x00\xe0\x01\x00\x00"
+    b"0\x01\x00\x00bluetooth_on\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x0e\x00\x10\x00\x01\x00\x10\x03\x00\x00\xe0\x00\x00\x00"
+    b"bluetooth_off\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x0e\x00\x10\x00\x01\x00\xf0\x03\x00\x00\xe0\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\xff\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\xff\xff\x00\x00\x00\x00\x00\xff\xff\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\x00\x00\x00\x00"
+    b"\x00\xff\x00\x00\x00\x00\xff\xff\xff\xff\xff\x00\x00\x00\x00\xff\x00\x00"
+    b"\x00\xff\x00\x00\x00\xff\xff\x00\x00\x00\x00\x00\xff\xff\x00\x00\x00\xff"
+    b"\x00\xff\x00\x00\x00\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\x00\x00"
+    b"\x00\xff\x00\x00\x00\xff\x00\x00\x00\x00\xff\xff\xff\x00\x00\x00\x00\xff"
+    b"\x00\x00\x00\x00\x00\xff\x00\x00\x00\xff\xff\x00\x00\x00\xff\xff\x00\x00"
+    b"\x00\xff\x00\x00\x00\x00\x00\x00\x00\xff\x00\x00\x00\x00\x00\x00\x00\xff"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\x00\x00\x00\x00\xff\x00\x00\x00"
+    b"\x00\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\x00\xff\xff"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\x00\x00\x00\x00"
+    b"\x00\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff"
+    b"\x00\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\x00\x00\x00"
+    b"\x00\xff\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\x00"
+    b"\xff\xff\x00\x00\x00\x00\x00\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\x00\x00\x00\x00\x00\xff"
+    b"\x00\x00\xff\x00\xff\xff\xff\xff\xff\x00\x00\x00\x00\xff\x00\x00\x00\xff"
+    b"\x00\x00\x00\x00\xff\x00\x00\x00\x00\x00\xff\xff\x00\x00\x00\xff\x00\xff"
+    b"\x00\x00\x00\xff\x00\x00\xff\x00\x00\x00\x00\x00\x00\xff\x00\x00\x00\xff"
+    b"\x00\x00\x00\xff\x00\x00\x00\x00\xff\x00\xff\x00\x00\x00\x00\xff\x00\x00"
+    b"\x00\x00\x00\xff\x00\x00\x00\xff\xff\x00\xff\x00\xff\xff\x00\x00\x00\xff"
+    b"\x00\x00\x00\x00\x00\x00\x00\xff\x00\x00\x00\x00\xff\x00\x00\xff\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\xff\x00\x00\x00\x00\xff\x00\xff\x00\x00\xff"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\x00\xff\x00\xff\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\x00\x00\x00\x00\x00\x00"
+    b"\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\x00\x00"
+    b"\x00\x00\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\x00\xff"
+    b"\x00\x00\x00\x00\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff"
+    b"\x00\x00\x00\x00\x00\x00\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\x00\xff\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\xff\x00\x00\xff\x00\x00\x00\x00\x00\x00"
+    b"\xff\x00\x00\x00\xff\x00\x00\x00\xff\x00\x00\x00\x00\x00\x00\xff\x00\x00"
+    b"\xff\x00\x00\x00\xff\x00\x00\x00\x00\x00\x00\x00\xff\x00\xff\x00\x00\xff"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\x00\xff\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\xff\xff\x00\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\x00\xff\x00"
+    b"\x00\xff\x00\x00\x00\x00\x00\x00\x00\xff\x00\x00\xff\x00\x00\x00\xff\x00"
+    b"\x00\x00\x00\x00\xff\x00\x00\x00\xff\x00\x00\x00\xff\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\xff\x00\x00\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\xff\x00\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\xff\x00\x00\x00\x00\x00\x00\x00\xff\x00\x00\x00"
+    b"\x00\x00\xff\xff\x00\x00\x00\x00\x00\x00\x00\xff\x00\x00\x00\x00\xff\x00"
+    b"\xff\x00\x00\x00\x00\x00\x00\x00\xff\x00\x00\x00\xff\x00\x00\xff\x00\x00"
+    b"\x00\x00\x00\x00\x00\xff\x00\x00\xff\x00\x00\x00\xff\x00\x00\x00\x00\x00"
+    b"\x00\x00\xff\x00\x00\x00\x00\x00\xff\x00\x00\x00\x00\x00\x00\x00\x00\xff"
+    b"\x00\x00\x00\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\x00\xff\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\xff\x00\xff\x00\xff\x00\x00\x00\x00\x00\x00\x00\x00\xff"
+    b"\x00\x00\xff\x00\x00\xff\x00\x00\x00\x00\x00\x00\xff\x00\x00\x00\xff\x00"
+    b"\x00\x00\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\x00\x00\xff\x00\xff"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\xff\x00\xff\x00\x00\x00\xff\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\xff\x00\x00\x00\x00\x00\xff\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00"
+)
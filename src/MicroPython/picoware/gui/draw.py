@@ -24,6 +24,7 @@ class Draw(lcd.LCD):
         fill_screen(color=None): Fill the entire screen with a color
         fill_triangle(point1, point2, point3, color=None): Draw a filled triangle
         get_font(font_size=0): Get the FontSize object for a given font size
+        grid(position, columns, rows, cell_size, indices, palette): Draw a grid of palette indices, each cell as a cell_size square
         image(position, img): Draw an image object to the back buffer
         image_bmp(position, path, storage=None): Draw a 24-bit BMP image from a file path
         image_jpeg(position, path, storage=None): Draw a JPEG image from a file path
@@ -41,6 +42,7 @@ class Draw(lcd.LCD):
         set_mode(mode): Set the LCD mode (PSRAM or HEAP)
         set_scaling(scale_x, scale_y, scale_position=False): Set the LCD scaling parameters
         swap(): Update the display with the current framebuffer contents
+        swap_region(position, size): Update only a rectangle of the display from the framebuffer
         text(position, text, color=None, font_size=-1): Draw text on the display
         triangle(point1, point2, point3, color=None): Draw a triangle outline
 
@@ -227,6 +229,28 @@ class Draw(lcd.LCD):
 
         return FontSize(font_size)
 
+    def grid(
+        self,
+        position: Vector,
+        columns: int,
+        rows: int,
+        cell_size: int,
+        indices,
+        palette,
+    ):
+        """
+        Draw a low-resolution grid scaled up into the framebuffer in one call.
+
+        Args:
+            position: Top-left corner of the grid
+            columns: Cells per row
+            rows: Number of rows
+            cell_size: Width and height of each cell in pixels
+            indices: bytearray of columns * rows palette indices, row by row
+            palette: array("H") of RGB565 colors (indices past the end use the last color)
+        """
+        self._grid(position.x, position.y, columns, rows, cell_size, indices, palette)
+
     def image(self, position: Vector, img):
         """Draw an image object to the back buffer"""
         for y in range(img.size.y):
@@ -358,6 +382,15 @@ class Draw(lcd.LCD):
             _color,
         )
 
+    def swap_region(self, position: Vector, size: Vector):
+        """
+        Send one rectangle of the framebuffer to the display.
+
+        Much cheaper than swap() when only a small part of the screen changed;
+        boards without partial updates fall back to a full swap.
+        """
+        self._swap_region(position.x, position.y, size.x, size.y)
+
     def text(self, position: Vector, text: str, color=None, font_size: int = -1):
         """Draw text on the display"""
         _color = color if color is not None else self._foreground
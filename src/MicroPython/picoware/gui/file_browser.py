@@ -44,17 +44,18 @@ class FileBrowser:
         import json
         from picoware.system.vector import Vector
         from picoware.system.boards import BOARD_ID, BOARD_CARDPUTER
+        from picoware.system.directory import DirectoryModel
 
         # Link to system managers
         self._vm = view_manager
         self._mode = mode
 
-        # State tracking and caching
-        self._stat_cache = {}
+        # State tracking
         self._allowed_extensions = allowed_extensions
 
         # UI overlays
         self._loading = None
+        self._file_op = None  # background copy/move in progress
         self._is_help_screen = False
         self._show_options = False
         self._show_info = False
@@ -102,12 +103,13 @@ class FileBrowser:
 
         _start = start_directory if start_directory else "/"
 
+        # Compact per-pane directory listings, indexed by PANE_LEFT/PANE_RIGHT
+        self._files = (DirectoryModel(_start), DirectoryModel(_start))
+
         # Core application state to be saved/loaded
         self._app_state = {
             "left_path": _start,
             "right_path": _start,
-            "left_files": [],
-            "right_files": [],
             "left_index": 0,
             "right_index": 0,
             "left_top": 0,
@@ -144,6 +146,9 @@ class FileBrowser:
 
     def __del__(self):
         """Cleanup resources to prevent RAM build-up."""
+        if self._file_op:
+            self._file_op.cancel()
+            self._file_op = None
         if self._loading:
             self._loading.stop()
             del self._loading
@@ -165,7 +170,7 @@ class FileBrowser:
             self._text_editor = None
 
         self._app_state = None
-        self._stat_cache = None
+        self._files = None
         self._edit_file = None
         self._info_data = None
 
@@ -197,11 +202,7 @@ class FileBrowser:
             if act == self.PANE_LEFT
             else self._app_state["right_path"]
         )
-        f_lst = (
-            self._app_state["left_files"]
-            if act == self.PANE_LEFT
-            else self._app_state["right_files"]
-        )
+        f_lst = self._files[act]
         idx = (
             self._app_state["left_index"]
             if act == self.PANE_LEFT
@@ -339,44 +340,64 @@ class FileBrowser:
             self._vm.alert("Unsupported file format.")
             self._needs_redraw = True
 
-    def __load_directory_contents(self, path):
-        """Load the contents of a directory."""
-        items = []
-        show_hid = self._app_state.get("show_hidden", False)
-
-        try:
-            d_list = self._vm.storage.read_directory(path)
-            temp_list = []
+    def __load_directory_contents(self, pane: int) -> None:
+        """Stream the contents of a pane's directory into its model."""
+        path = (
+            self._app_state["left_path"]
+            if pane == self.PANE_LEFT
+            else self._app_state["right_path"]
+        )
+        model = self._files[pane]
+        if not model.load(
+            self._vm.storage,
+            path,
+            self._app_state.get("show_hidden", False),
+            self._allowed_extensions,
+        ):
+            self._vm.log(f"Error loading directory contents: {path}", 2)
+            model.append("<ERROR>")
 
-            for entry in d_list:
-                itm = entry["filename"]
-                if itm in (".", "..") or (not show_hid and itm.startswith(".")):
-                    continue
+    def __file_op_poll(self, cancel: bool) -> None:
+        """Update the Loading overlay for the background copy/move and finish it when done."""
+        from picoware.system.file_operation import FILE_OP_CANCELLED
 
-                if self._allowed_extensions and not entry["is_directory"]:
-                    ext = itm.split(".")[-1].lower() if "." in itm else ""
-                    if ext not in self._allowed_extensions:
-                        continue
+        op = self._file_op
+        if cancel:
+            op.cancel()
 
-                fp = f"/{itm}" if path == "/" else f"{path}/{itm}"
-                is_d = entry["is_directory"]
-                self._stat_cache[fp] = (is_d, -1)
-                temp_list.append((itm, is_d))
+        if op.is_running:
+            name = op.current_file.split("/")[-1]
+            detail = f"{name[:20]} {int(op.file_progress * 100)}%" if name else ""
+            self.__loading_run(op.status_text, min(op.progress, 0.99), detail)
+            self._needs_redraw = True
+            return
 
-            del d_list
+        self.__loading_run("Done", 1.0)
+        for path, error in op.errors:
+            self._vm.log(f"File operation error on {path}: {error}", 2)
+        if op.state == FILE_OP_CANCELLED:
+            self._vm.alert("Operation cancelled.")
+        elif op.errors:
+            self._vm.alert(f"{len(op.errors)} item(s) failed.")
+        self._file_op = None
+        self.__refresh_panes()
+        self._needs_redraw = True
 
-            # Sort by: Folders first, then name
-            temp_list.sort(key=lambda x: (not x[1], x[0].lower()))
+    def __file_op_start(self, operation: int, jobs: list) -> None:
+        """Start a background copy/move of (source, destination) pairs."""
+        from picoware.system.file_operation import FileOperation
 
-            items = [x[0] for x in temp_list]
-            del temp_list
-        except Exception as e:
-            self._vm.log(f"Error loading directory contents: {e}", 2)
-            items = ["<ERROR>"]
+        if not jobs:
+            return
 
-        return [".."] + items if path != "/" else items
+        op = FileOperation(self._vm.storage, self._vm.thread_manager)
+        if op.start(operation, jobs):
+            self._file_op = op
+        else:
+            self._vm.alert("Failed to start file operation.")
+        self._needs_redraw = True
 
-    def __loading_run(self, title: str, percentage: float) -> None:
+    def __loading_run(self, title: str, percentage: float, detail: str = "") -> None:
         """Run a loading animation with a title and percentage completion."""
         if percentage >= 1.0:
             if self._loading:
@@ -393,6 +414,7 @@ class FileBrowser:
             )
 
         self._loading.set_text(title)
+        self._loading.set_detail(detail)
         self._loading.animate(swap=True)
 
     def __menu_spawn(self, title: str, items: list):
@@ -409,27 +431,18 @@ class FileBrowser:
         m.set_selected(0)
         return m
 
-    def __refresh_panes(self) -> None:
-        """Refresh the file lists for both panes."""
-        self._stat_cache.clear()
-        self._app_state["left_files"].clear()
-        self._app_state["left_files"] = self.__load_directory_contents(
-            self._app_state["left_path"]
-        )
-        self._app_state["left_index"] = max(
-            0,
-            min(self._app_state["left_index"], len(self._app_state["left_files"]) - 1),
-        )
-        self._app_state["right_files"].clear()
-        self._app_state["right_files"] = self.__load_directory_contents(
-            self._app_state["right_path"]
-        )
-        self._app_state["right_index"] = max(
-            0,
-            min(
-                self._app_state["right_index"], len(self._app_state["right_files"]) - 1
-            ),
-        )
+    def __refresh_panes(self, pane: int = -1) -> None:
+        """Refresh the file lists for both panes (or only the given pane)."""
+        for pn, key in (
+            (self.PANE_LEFT, "left_index"),
+            (self.PANE_RIGHT, "right_index"),
+        ):
+            if pane not in (-1, pn):
+                continue
+            self.__load_directory_contents(pn)
+            self._app_state[key] = max(
+                0, min(self._app_state[key], len(self._files[pn]) - 1)
+            )
 
     def __render(self) -> None:
         """Draw the UI based on the current state."""
@@ -699,13 +712,12 @@ class FileBrowser:
         m_itm = max(1, list_height // row_h)
         ap = self._app_state["active_pane"]
 
-        storage = self._vm.storage
         for pn in (self.PANE_LEFT, self.PANE_RIGHT):
             il = pn == self.PANE_LEFT
             xb = 0 if il else mx + splitter_w
             pane_w = mx if il else sw - mx - splitter_w
             ps = self._app_state["left_path"] if il else self._app_state["right_path"]
-            fl = self._app_state["left_files"] if il else self._app_state["right_files"]
+            fl = self._files[pn]
             ix = self._app_state["left_index"] if il else self._app_state["right_index"]
 
             top_key = "left_top" if il else "right_top"
@@ -723,23 +735,9 @@ class FileBrowser:
             draw._text(xb + text_pad_x, path_text_y, ps[:c_lim], color_fg)
 
             yo = first_item_y
-            for i, fn in enumerate(fl[si : si + m_itm]):
-                ai = i + si
+            for ai, fn, isd, fz in fl.window(si, m_itm):
                 fp = f"/{fn}" if ps == "/" else f"{ps}/{fn}"
 
-                if fn == "..":
-                    isd, fz = True, 0
-                else:
-                    if fp in self._stat_cache:
-                        isd, fz = self._stat_cache[fp]
-                        if not isd and fz == -1:
-                            fz = storage.size(fp)
-                            self._stat_cache[fp] = (isd, fz)
-                    else:
-                        isd = storage.is_directory(fp)
-                        fz = storage.size(fp)
-                        self._stat_cache[fp] = (isd, fz)
-
                 if ap == pn:
                     if ai == ix:
                         draw._fill_rectangle(
@@ -871,6 +869,11 @@ class FileBrowser:
 
         btn = self._vm.button
 
+        # --- Background copy/move: only BACK (cancel) is accepted ---
+        if self._file_op is not None:
+            self.__file_op_poll(btn in (BUTTON_BACK, BUTTON_ESCAPE))
+            return True
+
         if btn is None or btn == BUTTON_NONE:
             if self._needs_redraw:
                 self.__render()
@@ -988,10 +991,11 @@ class FileBrowser:
                                 rn = True
                             self.__loading_run("Renamed", 1.0)
                         elif self._input_mode == self.MODE_COPY_SAME:
-                            self.__loading_run("Copying...", 0.0)
-                            if storage.copy(self._context_target_path, np):
-                                rn = True
-                            self.__loading_run("Copied", 1.0)
+                            from picoware.system.file_operation import FILE_OP_COPY
+
+                            self.__file_op_start(
+                                FILE_OP_COPY, [(self._context_target_path, np)]
+                            )
                     elif self._input_mode == self.MODE_MKDIR:
                         if not storage.exists(np):
                             if storage.mkdir(np):
@@ -1061,11 +1065,7 @@ class FileBrowser:
                     if ap == self.PANE_LEFT
                     else self._app_state["right_path"]
                 )
-                fl = (
-                    self._app_state["left_files"]
-                    if ap == self.PANE_LEFT
-                    else self._app_state["right_files"]
-                )
+                fl = self._files[ap]
                 ix = (
                     self._app_state["left_index"]
                     if ap == self.PANE_LEFT
@@ -1145,16 +1145,7 @@ class FileBrowser:
             and not self._show_info
         ):
             ap = self._app_state["active_pane"]
-            cp = (
-                self._app_state["left_path"]
-                if ap == self.PANE_LEFT
-                else self._app_state["right_path"]
-            )
-            fl = (
-                self._app_state["left_files"]
-                if ap == self.PANE_LEFT
-                else self._app_state["right_files"]
-            )
+            fl = self._files[ap]
             ix = (
                 self._app_state["left_index"]
                 if ap == self.PANE_LEFT
@@ -1164,16 +1155,8 @@ class FileBrowser:
             if len(fl) > 0:
                 sf = fl[ix]
                 if sf != "..":
-                    storage = self._vm.storage
-                    fp = f"/{sf}" if cp == "/" else f"{cp}/{sf}"
-                    isd = False
-                    fz = 0
-                    if fp in self._stat_cache:
-                        isd = self._stat_cache[fp][0]
-                        fz = storage.size(fp)
-                    else:
-                        isd = storage.is_directory(fp)
-                        fz = storage.size(fp)
+                    isd = fl.is_directory(ix)
+                    fz = fl.size(ix)
 
                     self._info_data = (
                         f"Name: {sf}\n"
@@ -1204,11 +1187,7 @@ class FileBrowser:
                         if ap == self.PANE_LEFT
                         else self._app_state["right_path"]
                     )
-                    fl = (
-                        self._app_state["left_files"]
-                        if ap == self.PANE_LEFT
-                        else self._app_state["right_files"]
-                    )
+                    fl = self._files[ap]
                     ix = (
                         self._app_state["left_index"]
                         if ap == self.PANE_LEFT
@@ -1284,22 +1263,13 @@ class FileBrowser:
                         self.__loading_run("Deleted", 1.0)
 
                     elif self._pending_action in (self.ACT_COPY, self.ACT_MOVE):
-                        total = len(targets)
-                        act_name = (
-                            "Copying"
-                            if self._pending_action == self.ACT_COPY
-                            else "Moving"
+                        from picoware.system.file_operation import (
+                            FILE_OP_COPY,
+                            FILE_OP_MOVE,
                         )
 
-                        if total == 1:
-                            self.__loading_run(f"{act_name}...", 0.5)
-
-                        for i, t in enumerate(targets):
-                            if total > 1:
-                                self.__loading_run(
-                                    f"Batch {act_name} {int((i/total)*100)}%", i / total
-                                )
-
+                        jobs = []
+                        for t in targets:
                             dp = self._pending_dest_path
                             if len(mk) > 0:
                                 dp = f"{dp}/{t.split('/')[-1]}".replace("//", "/")
@@ -1307,15 +1277,16 @@ class FileBrowser:
                             if t != dp:
                                 if storage.exists(dp):
                                     storage.remove(dp)
-
-                                if self._pending_action == self.ACT_COPY:
-                                    if not storage.copy(t, dp):
-                                        self._vm.log(f"Copy Error on: {t}", 2)
-                                else:
-                                    if not storage.move(t, dp):
-                                        self._vm.log(f"Move Error on: {t}", 2)
-
-                        self.__loading_run("Done", 1.0)
+                                jobs.append((t, dp))
+
+                        self.__file_op_start(
+                            (
+                                FILE_OP_COPY
+                                if self._pending_action == self.ACT_COPY
+                                else FILE_OP_MOVE
+                            ),
+                            jobs,
+                        )
 
                     elif self._pending_action == self.ACT_RENAME:
                         self.__loading_run("Renaming...", 0.0)
@@ -1434,7 +1405,6 @@ class FileBrowser:
                         pass
                     elif ac == "Clear Marks":
                         self._app_state["marked"].clear()
-                        self.__refresh_panes()
                     elif ac == "Open":
                         if self._app_state["active_pane"] == self.PANE_LEFT:
                             self._app_state["left_path"] = self._context_target_path
@@ -1442,7 +1412,7 @@ class FileBrowser:
                         else:
                             self._app_state["right_path"] = self._context_target_path
                             self._app_state["right_index"] = 0
-                        self.__refresh_panes()
+                        self.__refresh_panes(self._app_state["active_pane"])
                     elif ac == "View":
                         self.__file_view(self._context_target_path)
                     elif ac == "Edit":
@@ -1541,11 +1511,7 @@ class FileBrowser:
 
         elif btn == BUTTON_UP and not self._is_help_screen:
             ap = self._app_state["active_pane"]
-            fl = (
-                self._app_state["left_files"]
-                if ap == self.PANE_LEFT
-                else self._app_state["right_files"]
-            )
+            fl = self._files[ap]
             ix = (
                 self._app_state["left_index"]
                 if ap == self.PANE_LEFT
@@ -1562,11 +1528,7 @@ class FileBrowser:
 
         elif btn == BUTTON_DOWN and not self._is_help_screen:
             ap = self._app_state["active_pane"]
-            fl = (
-                self._app_state["left_files"]
-                if ap == self.PANE_LEFT
-                else self._app_state["right_files"]
-            )
+            fl = self._files[ap]
             ix = (
                 self._app_state["left_index"]
                 if ap == self.PANE_LEFT
@@ -1588,11 +1550,7 @@ class FileBrowser:
                 if ap == self.PANE_LEFT
                 else self._app_state["right_path"]
             )
-            fl = (
-                self._app_state["left_files"]
-                if ap == self.PANE_LEFT
-                else self._app_state["right_files"]
-            )
+            fl = self._files[ap]
             ix = (
                 self._app_state["left_index"]
                 if ap == self.PANE_LEFT
@@ -1613,13 +1571,9 @@ class FileBrowser:
                     else:
                         self._app_state["right_path"] = pr
 
-                    self.__refresh_panes()
+                    self.__refresh_panes(ap)
 
-                    nf = (
-                        self._app_state["left_files"]
-                        if ap == self.PANE_LEFT
-                        else self._app_state["right_files"]
-                    )
+                    nf = self._files[ap]
                     try:
                         nix = nf.index(fe)
                     except ValueError:
@@ -1632,11 +1586,7 @@ class FileBrowser:
                 else:
                     np = f"/{sf}" if cp == "/" else f"{cp}/{sf}"
 
-                    isd = False
-                    if np in self._stat_cache:
-                        isd = self._stat_cache[np][0]
-                    else:
-                        isd = self._vm.storage.is_directory(np)
+                    isd = fl.is_directory(ix)
 
                     if self._mode == FILE_BROWSER_SELECTOR and not isd:
                         self.__save_settings()
@@ -1656,7 +1606,7 @@ class FileBrowser:
                         else:
                             self._app_state["right_path"] = np
                             self._app_state["right_index"] = 0
-                        self.__refresh_panes()
+                        self.__refresh_panes(ap)
                     elif self._mode == FILE_BROWSER_MANAGER and len(mk) > 0:
                         self._context_target_path = np
                         items = ["Open"] if isd else []
@@ -147,7 +147,12 @@ class JPEG(jpegdec.JPEGDecoder):
         jpginfo = self.decode_split(fsize, buf, offset, None, ioption)
         return jpginfo[0]
 
-    def _decode_split(self, fi, fsize, x, y) -> bool:
+    def _decode_split(self, fi, fsize, x, y, idle=None) -> bool:
+        """Decode on the second core, feeding it from fi.
+
+        idle, if given, is called while core 0 waits for the decoder (e.g. to
+        receive the next frame); it must return quickly.
+        """
         buf_idx = 0
         buf = self._buffers[buf_idx]
         self._buffers_pos[buf_idx] = 0
@@ -169,6 +174,8 @@ class JPEG(jpegdec.JPEGDecoder):
                 retc = self.decode_split_wait()
                 if retc[0] == 0:  # running
                     if retc[1] < 0:  # fpos not set yet
+                        if idle is not None:
+                            idle()
                         continue
                     newpos = retc[1]
                     newsize = retc[2]
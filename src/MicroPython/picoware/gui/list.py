@@ -1,5 +1,19 @@
+from micropython import const
+
+_LABEL_CACHE_SIZE = const(48)  # truncated row labels kept between draws
+_DOTS_MAX_ITEMS = const(15)  # more items show "i/n" instead of dots
+
+
 class List:
-    """A simple list class for a GUI."""
+    """
+    A simple list class for a GUI.
+
+    Items are either held in the list (add_item) or fetched on demand from a
+    provider callback (set_provider), so a catalog of thousands of entries
+    never has to sit in RAM as strings. Only the visible rows are drawn, their
+    truncated labels are cached, and scrolling by one redraws only the
+    header and the rows that changed, at the same cost for any list length.
+    """
 
     def __init__(
         self,
@@ -29,6 +43,11 @@ class List:
         self.use_lvgl = draw.use_lvgl
         self._lvgl_list = None
 
+        # item model: a Python list, or a provider callback and a count
+        self.items = []
+        self._provider = None
+        self._count = 0
+
         # Initialize LVGL List if requested
         if self.use_lvgl:
             try:
@@ -68,7 +87,6 @@ class List:
             self.visible_item_count = (
                 self.size.y - 2 * border_width
             ) / self.item_height
-            self.items = []
             draw.swap()
 
             self.size_x = self.display.size.x
@@ -84,9 +102,17 @@ class List:
             self.box_height = int(self.size.y // 8)
             self.box_x = int((self.size_x - self.box_width) // 2)
             self.dot_size = Vector(self._five.x * 2, self._five.y * 2)
+
+            # what is on screen, so the next draw can skip what did not change
+            self._labels = {}  # index -> truncated row label
+            self._stale = set()  # rows to redraw even if unchanged on screen
+            self._first_visible = 0
+            self._drawn_first = -1  # -1: nothing drawn, repaint everything
+            self._drawn_selected = -1
+            self._font_height = 0
+            self.__layout()
         else:
             # For LVGL mode, we still need to track items in Python
-            self.items = []
             self._selected_index = 0
             self.position = Vector(0, y)
             self.size = Vector(draw.size.x, height)
@@ -100,9 +126,13 @@ class List:
             self._lvgl_list = None
             deinit()
             self.items = []
+            self._provider = None
             return
 
         self.items = []
+        self._provider = None
+        self._labels = None
+        self._stale = None
         self.size = None
         self.position = None
         self._dec_v = None
@@ -123,16 +153,15 @@ class List:
             item = self._lvgl_list.current_item()
             return item if item is not None else ""
 
-        # Get the currently selected item
-        if 0 <= self._selected_index < len(self.items):
-            return self.items[self._selected_index]
-        return ""
+        return self.get_item(self._selected_index)
 
     @property
     def item_count(self) -> int:
         """Get the number of items in the list."""
         if self.use_lvgl and self._lvgl_list is not None:
             return self._lvgl_list.item_count()
+        if self._provider is not None:
+            return self._count
         return len(self.items)
 
     @property
@@ -140,7 +169,7 @@ class List:
         """Get the height of the list."""
         if self.use_lvgl and self._lvgl_list is not None:
             return self._lvgl_list.list_height()
-        return len(self.items) * self.item_height
+        return self.item_count * self.item_height
 
     @property
     def selected_index(self) -> int:
@@ -149,23 +178,285 @@ class List:
             return self._lvgl_list.selected_index()
         return self._selected_index
 
+    def __draw_decorations(self, count: int) -> None:
+        """Draw the dotted lines above and (with items) below the header."""
+        display = self.display
+        self._dec_v.y = self.position.y + self._five.y + (display.size.y // 16)
+        for i in range(0, self.size_x, 10):
+            display._pixel(i, self._dec_v.y, self.border_color)
+        if not count:
+            return
+        self._dec_v_b.y = self.indicator_y + self._five.y * 5
+        for i in range(0, self.size_x, 10):
+            display._pixel(i, self._dec_v_b.y, self.border_color)
+
+    def __draw_header(self, count: int) -> None:
+        """Draw the selected item box, arrows and position indicator."""
+        display = self.display
+        selected = self._selected_index
+        current_item = self.get_item(selected)
+
+        # Draw selection box
+        display._fill_rectangle(
+            self.box_x,
+            self.menu_y - self._five.y * 6,
+            self.box_width,
+            self.box_height,
+            self.selected_color,
+        )
+
+        # Draw text centered
+        item_width = display.len(current_item, 2)
+        item_x = (self.size_x - item_width) // 2
+        display._text(
+            item_x,
+            self.menu_y - self._five.y * 4,
+            current_item,
+            self.text_color,
+            2,
+        )
+
+        # Draw navigation arrows
+        self.text_vec_pos.y = self.menu_y - self._sixteen
+        if selected > 0:
+            display._text(self._five.x, self.text_vec_pos.y, "<", self.border_color)
+        if selected < count - 1:
+            display._text(
+                self.size_x - self._five.x * 3,
+                self.text_vec_pos.y,
+                ">",
+                self.border_color,
+            )
+
+        # Draw indicator dots
+        indicator_y = self.indicator_y
+        if count <= _DOTS_MAX_ITEMS:
+            dots_spacing = self._five.x * 3
+            dots_start_x = (self.size_x - (count * dots_spacing)) // 2
+            for i in range(count):
+                if i == selected:
+                    display._fill_rectangle(
+                        dots_start_x + (i * dots_spacing),
+                        indicator_y,
+                        self.dot_size.x,
+                        self.dot_size.y,
+                        self.border_color,
+                    )
+                else:
+                    display._rectangle(
+                        dots_start_x + (i * dots_spacing),
+                        indicator_y,
+                        self.dot_size.x,
+                        self.dot_size.y,
+                        self.border_color,
+                    )
+        else:
+            # show the current selected item index and total count
+            index_text = "{}/{}".format(selected + 1, count)
+            index_text_width = len(index_text) * display.font_size.x
+            index_text_x = (self.size_x - index_text_width) // 2
+            display._text(
+                index_text_x,
+                indicator_y,
+                index_text,
+                self.border_color,
+            )
+
+    def __draw_row(self, index: int, first: int, clear: bool) -> None:
+        """Draw one visible row of the scrollable list."""
+        display = self.display
+        row_height = self.row_height
+        item_y = self.list_start_y + (index - first) * row_height
+
+        # Draw background (the selection bar, or a clear one when redrawing)
+        if index == self._selected_index:
+            display._fill_rectangle(
+                self.rec_vec_pos.x,
+                item_y,
+                self.rec_vec_size.x,
+                row_height,
+                self.selected_color,
+            )
+        elif clear:
+            display._fill_rectangle(
+                self.rec_vec_pos.x,
+                item_y,
+                self.rec_vec_size.x,
+                row_height,
+                self.background_color,
+            )
+
+        item_text = self.__label(index)
+
+        # Center text if circular display, otherwise left-align with padding
+        if self.is_circular:
+            text_x = (self.size_x - len(item_text) * display.font_size.x) // 2
+        else:
+            text_x = self._five.x * 2
+        display._text(text_x, item_y + self._three, item_text, self.text_color)
+
+    def __label(self, index: int) -> str:
+        """Return the row text for an item, truncated to fit (cached)."""
+        labels = self._labels
+        label = labels.get(index)
+        if label is None:
+            label = self.get_item(index)
+            if len(label) > self.max_chars:
+                label = label[: self.max_chars - 2] + ".."
+            if len(labels) >= _LABEL_CACHE_SIZE:
+                labels.clear()
+            labels[index] = label
+        return label
+
+    def __layout(self) -> None:
+        """Compute the row geometry for the current font."""
+        display = self.display
+        font_size = display.font_size
+        self._font_height = font_size.y
+        self.indicator_y = self.menu_y + self._five.y * 4
+        self.list_start_y = self.indicator_y + self._five.y * 8
+        available_height = (self.position.y + self.size.y) - self.list_start_y
+        self.row_height = font_size.y + self._three * 2  # Font height + padding
+        self.max_visible_items = max(1, int(available_height / self.row_height))
+        self.max_chars = (self.size_x - self._five.x * 4) // font_size.x
+        # header band redrawn on every change of selection, down to and
+        # including the dotted line under it
+        self.header_y = max(
+            self.position.y,
+            min(self.menu_y - self._five.y * 6, self.menu_y - self._sixteen),
+        )
+        self.header_height = (
+            max(
+                self.indicator_y + max(self.dot_size.y, font_size.y),
+                self.indicator_y + self._five.y * 5,
+            )
+            + 1
+            - self.header_y
+        )
+        self._labels = {}
+        self._drawn_first = -1
+
+    def __render(self, swap: bool) -> None:
+        """
+        Draw what changed since the last draw.
+
+        Only the header and the rows whose content or selection changed are
+        redrawn, unless the visible window moved (then every visible row) or
+        nothing is on screen yet (then the whole widget).
+        """
+        display = self.display
+        if display.font_size.y != self._font_height:
+            self.__layout()
+
+        count = self.item_count
+        if self._selected_index >= count:
+            self._selected_index = count - 1 if count > 0 else 0
+        selected = self._selected_index
+        first = self.__window(count)
+        last = min(count, first + self.max_visible_items)
+        repaint = self._drawn_first < 0
+
+        if repaint:
+            # Clear the display area
+            display._fill_rectangle(
+                self.position.x,
+                self.position.y,
+                self.size.x,
+                self.size.y,
+                self.background_color,
+            )
+        else:
+            # the header shows the selection, redraw its band
+            display._fill_rectangle(
+                self.position.x,
+                self.header_y,
+                self.size.x,
+                self.header_height,
+                self.background_color,
+            )
+        self.__draw_decorations(count)
+
+        if count:
+            self.__draw_header(count)
+
+        if repaint or first != self._drawn_first:
+            # window moved: every visible row changes
+            if not repaint:
+                display._fill_rectangle(
+                    self.position.x,
+                    self.list_start_y,
+                    self.size.x,
+                    self.max_visible_items * self.row_height,
+                    self.background_color,
+                )
+            for i in range(first, last):
+                self.__draw_row(i, first, False)
+        else:
+            rows = self._stale
+            rows.add(selected)
+            rows.add(self._drawn_selected)
+            for i in rows:
+                if first <= i < last:
+                    self.__draw_row(i, first, True)
+                elif i >= last and 0 <= i - first < self.max_visible_items:
+                    # a row left empty by removed items
+                    display._fill_rectangle(
+                        self.rec_vec_pos.x,
+                        self.list_start_y + (i - first) * self.row_height,
+                        self.rec_vec_size.x,
+                        self.row_height,
+                        self.background_color,
+                    )
+
+        self._stale.clear()
+        self._first_visible = first
+        self._drawn_first = first
+        self._drawn_selected = selected
+
+        # Swap buffers
+        if swap:
+            display.swap()
+
+    def __window(self, count: int) -> int:
+        """Return the first visible row, scrolling only to keep the selection in view."""
+        visible = self.max_visible_items
+        if count <= visible:
+            return 0
+        first = self._first_visible
+        selected = self._selected_index
+        if selected < first:
+            first = selected
+        elif selected >= first + visible:
+            first = selected - visible + 1
+        return max(0, min(first, count - visible))
+
     def add_item(self, item: str) -> None:
         """Add an item to the list."""
         if self.use_lvgl and self._lvgl_list is not None:
             self._lvgl_list.add_item(item)
+        if self._provider is not None:
+            # switching back from a provider keeps its items
+            self.items = [self._provider(i) for i in range(self._count)]
+            self._provider = None
+            self._count = 0
+            self.invalidate()
         self.items.append(item)
+        if not self.use_lvgl:
+            self._stale.add(len(self.items) - 1)
 
     def clear(self, swap: bool = True) -> None:
         """Clear the list."""
+        self.items = []
+        self._provider = None
+        self._count = 0
+        self._selected_index = 0
+
         if self.use_lvgl and self._lvgl_list is not None:
             self._lvgl_list.clear()
-            self.items = []
-            self._selected_index = 0
             return
 
-        # Clear the list of items
-        self.items = []
-        self._selected_index = 0
+        self._first_visible = 0
+        self.invalidate()
 
         # Clear the display area
         self.display._fill_rectangle(
@@ -179,7 +470,12 @@ class List:
             self.display.swap()
 
     def draw(self, swap: bool = True) -> None:
-        """Draw the list with new style."""
+        """
+        Draw the list with new style.
+
+        Repaints the whole widget (use it after anything else drew over the
+        list); scroll_up() and scroll_down() redraw only what changed.
+        """
         if self.use_lvgl and self._lvgl_list is not None:
             from picoware_lvgl import tick, task_handler
 
@@ -188,158 +484,8 @@ class List:
             task_handler()
             return
 
-        # Clear the display area
-        self.display._fill_rectangle(
-            self.position.x,
-            self.position.y,
-            self.size.x,
-            self.size.y,
-            self.background_color,
-        )
-
-        _len = len(self.items)
-
-        # Draw decorative pattern below underline
-        self._dec_v.y = self.position.y + self._five.y + (self.display.size.y // 16)
-        for i in range(0, self.size_x, 10):
-            self.display._pixel(i, self._dec_v.y, self.border_color)
-
-        # Get current selected item
-        if 0 <= self._selected_index < _len:
-            current_item = self.items[self._selected_index]
-
-            # Draw selection box
-            self.display._fill_rectangle(
-                self.box_x,
-                self.menu_y - self._five.y * 6,
-                self.box_width,
-                self.box_height,
-                self.selected_color,
-            )
-
-            # Draw text centered
-            item_width = self.display.len(current_item, 2)
-            item_x = (self.size_x - item_width) // 2
-            self.display._text(
-                item_x,
-                self.menu_y - self._five.y * 4,
-                current_item,
-                self.text_color,
-                2,
-            )
-
-            # Draw navigation arrows
-            self.text_vec_pos.y = self.menu_y - self._sixteen
-            if self._selected_index > 0:
-                self.display._text(
-                    self._five.x, self.text_vec_pos.y, "<", self.border_color
-                )
-            if self._selected_index < _len - 1:
-                self.display._text(
-                    self.size_x - self._five.x * 3,
-                    self.text_vec_pos.y,
-                    ">",
-                    self.border_color,
-                )
-
-            # Draw indicator dots
-            indicator_y = self.menu_y + self._five.y * 4
-            if _len <= self._five.x * 3:
-                dots_spacing = self._five.x * 3
-                dots_start_x = (self.size_x - (_len * dots_spacing)) // 2
-                for i in range(_len):
-                    if i == self._selected_index:
-                        self.display._fill_rectangle(
-                            dots_start_x + (i * dots_spacing),
-                            indicator_y,
-                            self.dot_size.x,
-                            self.dot_size.y,
-                            self.border_color,
-                        )
-                    else:
-                        self.display._rectangle(
-                            dots_start_x + (i * dots_spacing),
-                            indicator_y,
-                            self.dot_size.x,
-                            self.dot_size.y,
-                            self.border_color,
-                        )
-            else:
-                # show the current selected item index and total count
-                index_text = "{}/{}".format(self._selected_index + 1, _len)
-                index_text_width = len(index_text) * self.display.font_size.x
-                index_text_x = (self.size_x - index_text_width) // 2
-                self.display._text(
-                    index_text_x,
-                    indicator_y,
-                    index_text,
-                    self.border_color,
-                )
-
-            # Draw decorative bottom pattern
-            for i in range(0, self.size_x, 10):
-                self.display._pixel(
-                    i, indicator_y + self._five.y * 5, self.border_color
-                )
-
-            # Draw scrollable list below decorative pattern
-            list_start_y = indicator_y + self._five.y * 8
-            available_height = (self.position.y + self.size.y) - list_start_y
-            item_height = (
-                self.display.font_size.y + self._three * 2
-            )  # Font height + padding
-            max_visible_items = max(1, int(available_height / item_height))
-
-            # Calculate which items to show based on selected index
-            if _len <= max_visible_items:
-                # Show all items if they fit
-                first_visible = 0
-                last_visible = _len
-            else:
-                # Center the selected item when possible
-                half_visible = max_visible_items // 2
-                first_visible = max(0, self._selected_index - half_visible)
-                last_visible = min(_len, first_visible + max_visible_items)
-
-                # Adjust if we're near the end
-                if last_visible == _len:
-                    first_visible = max(0, _len - max_visible_items)
-
-            # Draw each visible item
-            for i in range(first_visible, last_visible):
-                visible_idx = i - first_visible
-                item_y = list_start_y + (visible_idx * item_height)
-
-                # Draw background for selected item
-                if i == self._selected_index:
-                    self.display._fill_rectangle(
-                        self.rec_vec_pos.x,
-                        item_y,
-                        self.rec_vec_size.x,
-                        item_height,
-                        self.selected_color,
-                    )
-
-                # Draw item text
-                text_y = item_y + self._three
-                item_text = self.items[i]
-
-                # Truncate text if too long
-                max_chars = (self.size_x - self._five.x * 4) // self.display.font_size.x
-                if len(item_text) > max_chars:
-                    item_text = item_text[: max_chars - 2] + ".."
-
-                # Center text if circular display, otherwise left-align with padding
-                if self.is_circular:
-                    text_width = len(item_text) * self.display.font_size.x
-                    text_x = (self.size_x - text_width) // 2
-                else:
-                    text_x = self._five.x * 2
-                self.display._text(text_x, text_y, item_text, self.text_color)
-
-        # Swap buffers
-        if swap:
-            self.display.swap()
+        self._drawn_first = -1
+        self.__render(swap)
 
     def get_item(self, index: int) -> str:
         """Get an item from the list."""
@@ -347,35 +493,67 @@ class List:
             item = self._lvgl_list.get_item(index)
             return item if item is not None else ""
 
+        if self._provider is not None:
+            if 0 <= index < self._count:
+                return self._provider(index)
+            return ""
+
         # Get the item from the list
         if 0 <= index < len(self.items):
             return self.items[index]
         return ""
 
+    def invalidate(self) -> None:
+        """Re-read every label and repaint the whole list on the next draw."""
+        if self.use_lvgl:
+            return
+        self._labels.clear()
+        self._stale.clear()
+        self._drawn_first = -1
+
     def item_exists(self, item: str) -> bool:
-        """Check if an item exists in the list."""
+        """Check if an item exists in the list (a provider is searched item by item)."""
         if self.use_lvgl and self._lvgl_list is not None:
             return self._lvgl_list.item_exists(item)
+        if self._provider is not None:
+            for i in range(self._count):
+                if self._provider(i) == item:
+                    return True
+            return False
         return item in self.items
 
     def remove_item(self, index: int) -> None:
         """Remove an item from the list and update the display."""
-        _len = len(self.items)
+        if self._provider is not None:
+            # the provider owns the data: it drops the item, the list its row
+            if 0 <= index < self._count:
+                self._count -= 1
+            _len = self._count
+        else:
+            if 0 <= index < len(self.items):
+                self.items.pop(index)
+            _len = len(self.items)
+
         if self.use_lvgl and self._lvgl_list is not None:
             self._lvgl_list.remove_item(index)
-            if 0 <= index < _len:
-                self.items.pop(index)
             if self._selected_index >= _len:
                 self._selected_index = _len - 1 if _len > 0 else 0
             return
 
-        # Remove the item from the list
-        if 0 <= index < _len:
-            self.items.pop(index)
-
         if self._selected_index >= _len:
             self._selected_index = _len - 1 if _len > 0 else 0
 
+        # every row from the removed one down moves up by one
+        labels = self._labels
+        for i in list(labels):
+            if i >= index:
+                del labels[i]
+        first = self._first_visible
+        for i in range(
+            max(index, first), min(_len + 1, first + self.max_visible_items)
+        ):
+            self._stale.add(i)
+
     def scroll_down(self, swap: bool = True) -> None:
         """Scroll the list down by one item."""
         if self.use_lvgl and self._lvgl_list is not None:
@@ -385,9 +563,9 @@ class List:
             return
 
         self._selected_index += 1
-        if self._selected_index >= len(self.items):
+        if self._selected_index >= self.item_count:
             self._selected_index = 0
-        self.draw(swap)
+        self.__render(swap)
 
     def scroll_up(self, swap: bool = True) -> None:
         """Scroll the list up by one item."""
@@ -399,8 +577,36 @@ class List:
 
         self._selected_index -= 1
         if self._selected_index < 0:
-            self._selected_index = len(self.items) - 1
-        self.draw(swap)
+            self._selected_index = self.item_count - 1
+        self.__render(swap)
+
+    def set_provider(self, count: int, provider) -> None:
+        """
+        Show count items fetched on demand instead of stored strings.
+
+        provider(index) returns the text of one item. It is only called for
+        the rows being drawn (and current_item/get_item), so the data can stay
+        in a parsed structure or on the SD card. Call it again when the count
+        changes, or update_item() when one item changes.
+
+        Example:
+            apps = catalog["apps"]
+            menu.set_provider(len(apps), lambda i: apps[i]["title"])
+        """
+        self.items = []
+        self._provider = provider
+        self._count = count
+        self._selected_index = 0
+
+        if self.use_lvgl and self._lvgl_list is not None:
+            # the LVGL widget needs its own copy of every item
+            self._lvgl_list.clear()
+            for i in range(count):
+                self._lvgl_list.add_item(provider(i))
+            return
+
+        self._first_visible = 0
+        self.invalidate()
 
     def set_selected(self, index: int, swap: bool = True) -> None:
         """Set the selected item in the list"""
@@ -410,6 +616,29 @@ class List:
             self.draw(swap)
             return
 
-        if 0 <= index < len(self.items):
+        if 0 <= index < self.item_count:
             self._selected_index = index
             self.draw(swap)
+
+    def update_item(self, index: int, item: str = None) -> None:
+        """
+        Change one item; only its row is redrawn on the next draw.
+
+        With a provider, leave item as None: the provider is asked again.
+        """
+        if self._provider is None:
+            if not 0 <= index < len(self.items):
+                return
+            if item is not None:
+                self.items[index] = item
+
+        if self.use_lvgl and self._lvgl_list is not None:
+            # the LVGL list has no item update, rebuild it
+            self._lvgl_list.clear()
+            for i in range(self.item_count):
+                self._lvgl_list.add_item(self.get_item(i))
+            self._lvgl_list.set_selected(self._selected_index)
+            return
+
+        self._labels.pop(index, None)
+        self._stale.add(index)
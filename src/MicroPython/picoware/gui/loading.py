@@ -1,5 +1,9 @@
-from utime import ticks_ms
-from math import cos, sin
+from micropython import const
+from utime import ticks_ms, ticks_diff
+from picoware.system.fastmath import degrees, mul_cos, mul_sin
+
+_BAR_HEIGHT = const(6)  # progress bar height in pixels
+_GAP = const(4)  # space between the lines under the spinner
 
 
 class Loading:
@@ -10,6 +14,7 @@ class Loading:
         draw,
         spinner_color: int = 0xFFFF,
         background_color: int = 0x0000,
+        frame_ms: int = 50,
     ) -> None:
         """
         Initialize the Loading spinner with drawing context and styling.
@@ -17,6 +22,7 @@ class Loading:
         :param draw: The drawing context to render the loading spinner.
         :param spinner_color: The color of the spinner.
         :param background_color: The background color.
+        :param frame_ms: Shortest time between two spinner-only frames; calls in between return at once.
         """
         from picoware.system.vector import Vector
 
@@ -28,6 +34,10 @@ class Loading:
         self.time_start = 0
         self.animating = False
         self.current_text = "Loading..."
+        self.detail_text = ""  # optional second line under the spinner
+        self.progress_done = 0
+        self.progress_total = 0  # 0 shows no progress bar
+        self.frame_ms = frame_ms
         self.radius = 20  # spinner radius
         self.span = 280  # degrees of arc
         self.step = 5  # degrees between segments (280/5 = 56 segments)
@@ -35,9 +45,26 @@ class Loading:
         self.vec_line_end = Vector(0, 0)
         self.text_vec = Vector(0, int(draw.size.y * 0.0625))
         self.text_vec_2 = Vector(0, draw.size.y - 15)
+        self.detail_y = draw.size.y // 2 + self.radius + max(4, draw.font_size.y)
         self.rad = (3.14159265358979323846) / 180.0
 
         self.font_size_x = self.display.font_size.x
+        self.font_size_y = self.display.font_size.y
+
+        # progress bar and its byte counts under the detail line
+        self.bar_width = draw.size.x // 2
+        self.bar_y = self.detail_y + self.font_size_y + _GAP
+        self.progress_y = self.bar_y + _BAR_HEIGHT + _GAP
+
+        # what is on screen, so a frame only redraws what changed
+        self._frame_ticks = 0
+        self._full_redraw = True
+        self._text_changed = False
+        self._detail_changed = False
+        self._time_text = ""
+        self._progress_fill = -1  # -1: no bar on screen
+        self._progress_text = ""
+        self._region = None  # [x0, y0, x1, y1] to send to the display
 
         # Calculate centered text position
         text_width = len(self.current_text) * self.font_size_x
@@ -75,6 +102,7 @@ class Loading:
             self._lvgl_loading = None
             deinit()
         self.current_text = ""
+        self.detail_text = ""
         self.animating = False
         self.time_elapsed = 0
         self.time_start = 0
@@ -85,6 +113,7 @@ class Loading:
         self.text_vec_2 = None
         self.rad = 0.0
         self.font_size_x = 0
+        self._region = None
 
     @property
     def text(self) -> str:
@@ -96,93 +125,209 @@ class Loading:
     @text.setter
     def text(self, value: str) -> None:
         """Set the current loading text."""
-        self.current_text = value
-
-        # Update LVGL Loading if using it
-        if self.use_lvgl and self._lvgl_loading is not None:
-            self._lvgl_loading.set_text(value)
-            return
-
-        # Calculate centered text position
-        text_width = len(self.current_text) * self.font_size_x
-        self.text_vec.x = (self.display.size.x - text_width) // 2
-
-    def animate(self, swap: bool = True) -> None:
-        """Animate the loading spinner."""
-        if self.use_lvgl and self._lvgl_loading is not None:
-            from picoware_lvgl import tick, task_handler
+        self.set_text(value)
+
+    def __draw_line(self, y: int, text: str, clear: bool) -> None:
+        """Draw a centred line of text, clearing its band first if asked."""
+        width = self.display.size.x
+        if clear:
+            self.display._fill_rectangle(
+                0, y, width, self.font_size_y, self.background_color
+            )
+            self.__mark(0, y, width, self.font_size_y)
+        if text:
+            self.display._text(
+                (width - len(text) * self.font_size_x) // 2,
+                y,
+                text,
+                self.spinner_color,
+            )
 
-            tick(10)
-            self._lvgl_loading.animate(swap)
-            task_handler()
+    def __draw_progress(self, clear: bool) -> None:
+        """Draw the progress bar and its byte counts, if a total is set."""
+        display = self.display
+        total = self.progress_total
+        x = (display.size.x - self.bar_width) // 2
+        if total <= 0:
+            if clear and self._progress_fill >= 0:
+                # the bar was hidden, wipe it
+                display._fill_rectangle(
+                    x, self.bar_y, self.bar_width, _BAR_HEIGHT, self.background_color
+                )
+                self.__mark(x, self.bar_y, self.bar_width, _BAR_HEIGHT)
+                self.__draw_line(self.progress_y, "", True)
+            self._progress_fill = -1
+            self._progress_text = ""
             return
 
-        if not self.animating:
-            self.animating = True
-            self.time_start = ticks_ms()
-
-        # Clear the screen
-        self.display.erase()
-
-        # Get screen center
-        screen_size = self.display.size
+        done = min(self.progress_done, total)
+        fill = (self.bar_width - 2) * done // total
+        text = f"{done * 100 // total}%  {done // 1024}/{total // 1024} KB"
+        if not clear or fill != self._progress_fill:
+            if not clear or self._progress_fill < 0 or fill < self._progress_fill:
+                # new, repainted or restarted bar: outline and empty inside
+                display._fill_rectangle(
+                    x, self.bar_y, self.bar_width, _BAR_HEIGHT, self.background_color
+                )
+                display._rectangle(
+                    x, self.bar_y, self.bar_width, _BAR_HEIGHT, self.spinner_color
+                )
+            if fill:
+                display._fill_rectangle(
+                    x + 1, self.bar_y + 1, fill, _BAR_HEIGHT - 2, self.spinner_color
+                )
+            self.__mark(x, self.bar_y, self.bar_width, _BAR_HEIGHT)
+            self._progress_fill = fill
+        if not clear or text != self._progress_text:
+            self.__draw_line(self.progress_y, text, clear)
+            self._progress_text = text
+
+    def __draw_spinner(self, clear: bool) -> None:
+        """Draw the spinner arc at its current position."""
+        display = self.display
+        screen_size = display.size
         center_x = screen_size.x // 2
         center_y = screen_size.y // 2
+        radius = self.radius
+
+        if clear:
+            box = radius + 1
+            display._fill_rectangle(
+                center_x - box,
+                center_y - box,
+                box * 2 + 1,
+                box * 2 + 1,
+                self.background_color,
+            )
+            self.__mark(center_x - box, center_y - box, box * 2 + 1, box * 2 + 1)
 
-        # Draw spinner
+        # table lookups; each segment starts where the last ended
         start_angle = self.spinner_position
+        angle = degrees(start_angle)
+        x2 = center_x + mul_cos(angle, radius)
+        y2 = center_y + mul_sin(angle, radius)
         for offset in range(0, self.span, self.step):
-            angle = (start_angle + offset) % 360
-            next_angle = (angle + self.step) % 360
-
-            # Convert to radians and calculate positions
-            x1 = center_x + int(self.radius * cos(angle * self.rad))
-            y1 = center_y + int(self.radius * sin(angle * self.rad))
-            x2 = center_x + int(self.radius * cos(next_angle * self.rad))
-            y2 = center_y + int(self.radius * sin(next_angle * self.rad))
+            x1 = x2
+            y1 = y2
+            angle = degrees(start_angle + offset + self.step)
+            x2 = center_x + mul_cos(angle, radius)
+            y2 = center_y + mul_sin(angle, radius)
 
             # Calculate fade color
             opacity = 255 - ((offset * 200) // self.span)
             color = self.fade_color(self.spinner_color, opacity)
 
             # Draw line segment
-            self.display._line(x1, y1, x2, y2, color)
-
-        # Draw text
-        self.display._text(
-            self.text_vec.x,
-            self.text_vec.y,
-            self.current_text,
-            self.spinner_color,
-        )
-
-        # draw time elapsed in seconds
-        time_str = ""
-        seconds = self.time_elapsed / 1000
+            display._line(x1, y1, x2, y2, color)
+
+    def __lvgl_text(self) -> None:
+        """Show the text, detail and progress as the LVGL spinner label."""
+        text = self.current_text
+        if self.detail_text:
+            text = f"{text}\n{self.detail_text}"
+        if self.progress_total > 0:
+            done = min(self.progress_done, self.progress_total)
+            text = f"{text}\n{done * 100 // self.progress_total}%"
+        self._lvgl_loading.set_text(text)
+
+    def __mark(self, x: int, y: int, width: int, height: int) -> None:
+        """Add a rectangle to the region sent to the display this frame."""
+        region = self._region
+        if region is None:
+            self._region = [x, y, x + width, y + height]
+            return
+        if x < region[0]:
+            region[0] = x
+        if y < region[1]:
+            region[1] = y
+        if x + width > region[2]:
+            region[2] = x + width
+        if y + height > region[3]:
+            region[3] = y + height
+
+    def __time_text(self) -> str:
+        """Return the elapsed time as shown under the spinner."""
+        seconds = self.time_elapsed // 1000
         if seconds < 60:
             if seconds <= 1:
-                time_str = f"{int(seconds)} second"
-            else:
-                time_str = f"{int(seconds)} seconds"
-            self.text_vec_2.x = (screen_size.x - len(time_str) * self.font_size_x) // 2
-            self.display._text(
-                self.text_vec_2.x, self.text_vec_2.y, time_str, self.spinner_color
-            )
+                return f"{seconds} second"
+            return f"{seconds} seconds"
+        return f"{seconds // 60}:{seconds % 60:02} minutes"
+
+    def animate(self, swap: bool = True) -> None:
+        """
+        Animate the loading spinner.
+
+        With swap=True the screen is painted once, then each frame redraws
+        and sends to the display only what changed (the spinner, and any text
+        that was updated). Spinner-only frames are drawn at most once every
+        frame_ms and calls in between return at once, so a loop polling a
+        download leaves the CPU and the SPI bus to the transfer. A frame after
+        set_text(), set_detail() or redraw() is always drawn.
+
+        With swap=False the whole screen is drawn on every call, for callers
+        that draw on top of it and swap themselves.
+        """
+        if self.use_lvgl and self._lvgl_loading is not None:
+            from picoware_lvgl import tick, task_handler
+
+            tick(10)
+            self._lvgl_loading.animate(swap)
+            task_handler()
+            return
+
+        now = ticks_ms()
+        if not self.animating:
+            self.animating = True
+            self.time_start = now
+            self._full_redraw = True
+        elif (
+            swap
+            and not (self._full_redraw or self._text_changed or self._detail_changed)
+            and ticks_diff(now, self._frame_ticks) < self.frame_ms
+        ):
+            return  # only the spinner would move
+        self._frame_ticks = now
+        self.time_elapsed = ticks_diff(now, self.time_start)
+
+        display = self.display
+        time_text = self.__time_text()
+
+        if self._full_redraw or not swap:
+            display.erase()
+            self.__draw_spinner(False)
+            self.__draw_line(self.text_vec.y, self.current_text, False)
+            self.__draw_line(self.detail_y, self.detail_text, False)
+            self.__draw_progress(False)
+            self.__draw_line(self.text_vec_2.y, time_text, False)
+            self._full_redraw = False
+            self._text_changed = False
+            self._detail_changed = False
+            self._time_text = time_text
+            self._region = None
+            if swap:
+                display.swap()
         else:
-            minutes = seconds / 60
-            remaining_seconds = seconds % 60
-            time_str = f"{int(minutes)}:{int(remaining_seconds):02} minutes"
-            self.text_vec_2.x = (screen_size.x - len(time_str) * self.font_size_x) // 2
-            self.display._text(
-                self.text_vec_2.x, self.text_vec_2.y, time_str, self.spinner_color
+            self.__draw_spinner(True)
+            if self._text_changed:
+                self.__draw_line(self.text_vec.y, self.current_text, True)
+                self._text_changed = False
+            if self._detail_changed:
+                self.__draw_line(self.detail_y, self.detail_text, True)
+                self._detail_changed = False
+            self.__draw_progress(True)
+            if time_text != self._time_text:
+                self.__draw_line(self.text_vec_2.y, time_text, True)
+                self._time_text = time_text
+
+            region = self._region
+            self._region = None
+            display._swap_region(
+                region[0], region[1], region[2] - region[0], region[3] - region[1]
             )
 
-        self.time_elapsed = ticks_ms() - self.time_start
         self.spinner_position = (self.spinner_position + 10) % 360
 
-        if swap:
-            self.display.swap()
-
     def fade_color(self, color: int, opacity: int) -> int:
         """Fast color fading."""
         if opacity >= 255:
@@ -195,13 +340,45 @@ class Loading:
 
         return (r << 11) | (g << 5) | b
 
+    def redraw(self) -> None:
+        """Paint the whole screen on the next frame (after something drew over it)."""
+        self._full_redraw = True
+
+    def set_detail(self, text: str) -> None:
+        """Set the optional detail line drawn under the spinner (e.g. the current file)."""
+        if text != self.detail_text:
+            self.detail_text = text
+            self._detail_changed = True
+
+        if self.use_lvgl and self._lvgl_loading is not None:
+            self.__lvgl_text()
+
+    def set_progress(self, done: int, total: int = 0) -> None:
+        """
+        Show a progress bar under the detail line, e.g. from byte counts.
+
+        :param done: Amount done so far (e.g. bytes received).
+        :param total: Amount when finished; 0 hides the bar (size unknown).
+
+        Example, while a download runs:
+            loading.set_progress(*http.progress)
+            loading.animate()
+        """
+        self.progress_done = done
+        self.progress_total = total
+
+        if self.use_lvgl and self._lvgl_loading is not None:
+            self.__lvgl_text()
+
     def set_text(self, text: str) -> None:
         """Set the loading text."""
-        self.current_text = text
+        if text != self.current_text:
+            self.current_text = text
+            self._text_changed = True
 
         # Update LVGL Loading if using it
         if self.use_lvgl and self._lvgl_loading is not None:
-            self._lvgl_loading.set_text(text)
+            self.__lvgl_text()
             return
 
         # Calculate centered text position
@@ -225,3 +402,8 @@ class Loading:
         self.time_elapsed = 0
         self.time_start = 0
         self.spinner_position = 0
+        self.progress_done = 0
+        self.progress_total = 0
+        self._progress_fill = -1
+        self._progress_text = ""
+        self._full_redraw = True
@@ -228,6 +228,10 @@ class Menu:
         """Get the item at the specified index."""
         return self.list.get_item(index)
 
+    def invalidate(self) -> None:
+        """Re-read every item and repaint the whole list on the next draw."""
+        self.list.invalidate()
+
     def item_exists(self, item: str) -> bool:
         """Check if an item exists in the menu."""
         return self.list.item_exists(item)
@@ -237,7 +241,7 @@ class Menu:
         if self.use_lvgl:
             self.list.set_selected(self.list.selected_index)
         else:
-            self.list.set_selected(self.list.selected_index, False)
+            self.list.draw(False)
             self.draw_title()
 
     def remove_item(self, index: int) -> None:
@@ -256,8 +260,16 @@ class Menu:
         if not self.use_lvgl:
             self.draw_title()
 
+    def set_provider(self, count: int, provider) -> None:
+        """Show count items fetched on demand with provider(index) (see List.set_provider)."""
+        self.list.set_provider(count, provider)
+
     def set_selected(self, index: int) -> None:
         """Set the selected item."""
         self.list.set_selected(index, False)
         if not self.use_lvgl:
             self.draw_title()
+
+    def update_item(self, index: int, item: str = None) -> None:
+        """Change one item; only its row is redrawn on the next draw."""
+        self.list.update_item(index, item)
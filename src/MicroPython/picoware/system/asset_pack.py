@@ -0,0 +1,217 @@
+from micropython import const
+from struct import unpack_from
+
+FORMAT_RAW = const(0)  # opaque bytes
+FORMAT_RGB332 = const(1)  # 8-bit pixels, for Draw.image_bytearray
+FORMAT_RGB565 = const(2)  # 16-bit pixels, high byte first (as png2fb.py writes)
+FORMAT_MONO = const(3)  # 1-bit, MSB first, rows padded to a byte
+
+MAGIC = b"PAK1"
+HEADER = "<4sHH"  # magic, entry count, reserved
+HEADER_SIZE = const(8)
+ENTRY = "<28sHHBBII"  # name, width, height, format, flags, offset, size
+ENTRY_SIZE = const(42)
+NAME_SIZE = const(28)
+
+
+class AssetPack:
+    """
+    Named images and blobs read from one indexed pack.
+
+    A pack is an 8-byte header, an index of fixed-size entries and the data:
+
+        header  "<4sHH"       b"PAK1", entry count, reserved
+        entry   "<28sHHBBII"  NUL-padded name, width, height, format,
+                              flags, data offset (from the start), size
+
+    Only the index is decoded when a pack is opened. A pack on the SD card
+    is read one entry at a time, on demand. A pack held in memory (a bytes
+    literal in a frozen module lives in flash, so importing it costs no RAM)
+    hands out zero-copy memoryview slices. tools/pngpack.py builds packs
+    from PNG files in both forms.
+
+    Example:
+        pack = AssetPack("picoware/assets/icons.pak", storage)
+        pack.draw(draw, "wifi_on", Vector(300, 2))
+        pack.close()
+    """
+
+    __slots__ = ("_data", "_entries", "_file", "_storage")
+
+    def __init__(self, source, storage=None) -> None:
+        """
+        Open a pack and read its index.
+
+        Args:
+            source: File path (when storage is given) or the pack's bytes
+            storage: The Storage instance to read the file from
+        """
+        self._storage = storage
+        self._data = None
+        self._file = None
+        self._entries = {}
+        if storage is not None:
+            if not storage.exists(source):
+                raise OSError(f"{source} not found")
+            self._file = storage.file_open(source)
+            if self._file is None:
+                raise OSError(f"cannot open {source}")
+            header = self.__read(0, HEADER_SIZE)
+            index = self.__read(HEADER_SIZE, self.__count(header) * ENTRY_SIZE)
+        else:
+            self._data = memoryview(source)
+            header = self._data
+            index = self._data[HEADER_SIZE:]
+        for i in range(self.__count(header)):
+            name, width, height, fmt, _, offset, size = unpack_from(
+                ENTRY, index, i * ENTRY_SIZE
+            )
+            end = name.find(b"\x00")
+            name = str(name if end < 0 else name[:end], "utf-8")
+            self._entries[name] = (width, height, fmt, offset, size)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._entries
+
+    def __del__(self):
+        self.close()
+        self._data = None
+        self._entries = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __count(self, header) -> int:
+        """Check the header and return the number of entries."""
+        if len(header) < HEADER_SIZE:
+            raise ValueError("truncated asset pack")
+        magic, count, _ = unpack_from(HEADER, header)
+        if magic != MAGIC:
+            raise ValueError("not an asset pack")
+        return count
+
+    def __entry(self, name: str) -> tuple:
+        """Return the index entry of name, raising KeyError if missing."""
+        entry = self._entries.get(name)
+        if entry is None:
+            raise KeyError(name)
+        return entry
+
+    def __read(self, offset: int, size: int) -> bytearray:
+        """Read size bytes at offset from the pack file."""
+        buffer = bytearray(size)
+        if size and self.__readinto(offset, buffer) != size:
+            raise OSError("truncated asset pack")
+        return buffer
+
+    def __readinto(self, offset: int, buffer) -> int:
+        """Fill buffer from offset in the pack file and return the bytes read."""
+        if not self._storage.file_seek(self._file, offset):
+            return 0
+        count = self._storage.file_readinto(self._file, buffer)
+        return count if count and count > 0 else 0
+
+    def close(self) -> None:
+        """Close the pack file (entries already returned stay valid)."""
+        if self._file is not None:
+            try:
+                self._storage.file_close(self._file)
+            except Exception:
+                pass
+            self._file = None
+
+    def draw(self, draw, name: str, position, invert: bool = False) -> bool:
+        """
+        Draw an image entry at position.
+
+        Args:
+            draw: The Draw instance
+            name: Entry name
+            position: Top-left corner as a Vector
+            invert: Passed to Draw.image_bytearray for RGB332 entries
+
+        Returns:
+            True if drawn, False for a missing entry or a format Draw cannot show
+        """
+        from picoware.system.vector import Vector
+
+        entry = self._entries.get(name)
+        if entry is None or entry[2] not in (FORMAT_RGB332, FORMAT_MONO):
+            return False
+        size = Vector(entry[0], entry[1])
+        if entry[2] == FORMAT_MONO:
+            draw.image_bytearray_1bit(position, size, self.get(name))
+        else:
+            draw.image_bytearray(position, size, self.get(name), invert=invert)
+        return True
+
+    def get(self, name: str):
+        """
+        Return the data of an entry.
+
+        A memoryview into the pack when it is held in memory, otherwise a new
+        bytearray read from the file. Raises KeyError for a missing entry.
+        """
+        _, _, _, offset, size = self.__entry(name)
+        if self._data is not None:
+            return self._data[offset : offset + size]
+        return self.__read(offset, size)
+
+    def info(self, name: str) -> tuple:
+        """Return (width, height, format, size) of an entry, or None if missing."""
+        entry = self._entries.get(name)
+        if entry is None:
+            return None
+        return entry[0], entry[1], entry[2], entry[4]
+
+    def names(self) -> list:
+        """Return the entry names."""
+        return list(self._entries)
+
+    def readinto(self, name: str, buffer) -> int:
+        """
+        Copy an entry into a pre-allocated buffer (e.g. one reused per frame).
+
+        Returns the number of bytes copied, at most len(buffer).
+        """
+        _, _, _, offset, size = self.__entry(name)
+        size = min(size, len(buffer))
+        if self._data is not None:
+            buffer[:size] = self._data[offset : offset + size]
+            return size
+        if size < len(buffer):
+            return self.__readinto(offset, memoryview(buffer)[:size])
+        return self.__readinto(offset, buffer)
+
+    def size(self, name: str):
+        """Return the (width, height) of an entry as a Vector, or None if missing."""
+        from picoware.system.vector import Vector
+
+        entry = self._entries.get(name)
+        if entry is None:
+            return None
+        return Vector(entry[0], entry[1])
+
+    def to_psram(self, name: str, psram, addr: int, chunk_size: int = 2048) -> int:
+        """
+        Copy an entry to PSRAM at addr, for Draw.psram() and big sprite sheets.
+
+        Returns the number of bytes written, or -1 if the entry is missing.
+        """
+        entry = self._entries.get(name)
+        if entry is None:
+            return -1
+        _, _, _, offset, size = entry
+        if self._data is not None:
+            psram.write(addr, self._data[offset : offset + size])
+            return size
+        buffer = bytearray(min(chunk_size, size))
+        written = 0
+        while written < size:
+            count = min(len(buffer), size - written)
+            chunk = buffer if count == len(buffer) else memoryview(buffer)[:count]
+            if self.__readinto(offset + written, chunk) != count:
+                break
+            psram.write(addr + written, chunk)
+            written += count
+        return written
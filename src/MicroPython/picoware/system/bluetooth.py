@@ -50,6 +50,13 @@ _ADV_TYPE_UUID128_COMPLETE = const(0x07)
 _ADV_TYPE_APPEARANCE = const(0x19)
 _ADV_MAX_PAYLOAD = const(31)
 
+# ATT MTU: 23 is the BLE default, 247 fits a full LE data-length PDU
+_MTU_DEFAULT = const(23)
+_MTU_PREFERRED = const(247)
+
+# RX characteristic buffer: writes that arrive before the IRQ reads it append
+_RX_BUFFER_SIZE = const(4 * (_MTU_PREFERRED - 3))
+
 # Nordic UART Service UUIDs
 _UART_SERVICE_UUID = "6E400001-B5A3-F393-E0A9-E50E24DCCA9E"
 _UART_RX_CHAR_UUID = "6E400002-B5A3-F393-E0A9-E50E24DCCA9E"
@@ -116,6 +123,7 @@ class Bluetooth:
         self._peripheral_rx_handle = None  # Remote RX handle (for writing data)
         self._notify_callback = None  # Callback when data received from peripheral
         self._scan_callback = None  # Callback for scan results
+        self._scan_table = None  # Optional ScanTable aggregating scan results
 
         # Service discovery results
         self._services = []
@@ -127,6 +135,13 @@ class Bluetooth:
         self._pairing = False
         self._passkey = None
 
+        # Negotiated ATT MTU of the current connection
+        self._mtu = _MTU_DEFAULT
+        try:
+            self._ble.config(mtu=_MTU_PREFERRED)
+        except Exception:
+            pass  # port without MTU configuration, stay at the default
+
     def __del__(self):
         """Clean up Bluetooth resources."""
         if self._ble is not None:
@@ -148,6 +163,7 @@ class Bluetooth:
         self._write_callback = None
         self._notify_callback = None
         self._scan_callback = None
+        self._scan_table = None
         self._tx_handle = None
         self._rx_handle = None
         self._peripheral_tx_handle = None
@@ -213,11 +229,21 @@ class Bluetooth:
             addr = addr[1]  # (addr_type, addr_bytes)
         return ":".join("{:02X}".format(b) for b in addr)
 
+    @property
+    def mtu(self) -> int:
+        """Get the negotiated ATT MTU (a notification/write carries mtu - 3 bytes)."""
+        return self._mtu
+
     @property
     def passkey(self) -> int:
         """Get the current passkey during pairing (if any)."""
         return self._passkey
 
+    @property
+    def scan_table(self):
+        """Get the ScanTable the current scan reports into (None if not aggregating)."""
+        return self._scan_table
+
     @property
     def services(self) -> list:
         """Get discovered services."""
@@ -238,6 +264,8 @@ class Bluetooth:
             # A central device disconnected from us (peripheral mode)
             conn_handle, addr_type, addr = data
             self._central_connections.discard(conn_handle)
+            if not self._central_connections:
+                self._mtu = _MTU_DEFAULT
             # Restart advertising to allow new connections
             if self._peripheral_registered:
                 self._start_advertising()
@@ -246,8 +274,10 @@ class Bluetooth:
         elif event == _IRQ_GATTS_WRITE:
             # A central wrote to one of our characteristics (peripheral mode)
             conn_handle, value_handle = data
+            # reading empties an append buffer: this is every write since the
+            # last IRQ (empty when an earlier IRQ already took them)
             value = self._ble.gatts_read(value_handle)
-            if value_handle == self._rx_handle and self._write_callback:
+            if value_handle == self._rx_handle and self._write_callback and value:
                 self._write_callback(value)
             _data = (conn_handle, value_handle, value)
 
@@ -256,11 +286,18 @@ class Bluetooth:
             # A single scan result
             addr_type, addr, adv_type, rssi, adv_data = data
             _data = (addr_type, addr, adv_type, rssi, adv_data)
+            index = -1
+            if self._scan_table is not None:
+                # fold into the per-address table (names decoded once per device)
+                index = self._scan_table.add(addr_type, addr, adv_type, rssi, adv_data)
             # If scan callback is set, call it for each result
             if self._scan_callback:
                 # Check if this is a connectable advertisement
                 if adv_type in (_ADV_IND, _ADV_DIRECT_IND):
-                    name = self.decode_name(adv_data)
+                    if index >= 0:
+                        name = self._scan_table.name(index)
+                    else:
+                        name = self.decode_name(adv_data)
                     self._scan_callback(addr_type, bytes(addr), name, rssi, adv_data)
 
         elif event == _IRQ_SCAN_DONE:
@@ -286,6 +323,7 @@ class Bluetooth:
             self._peripheral_rx_handle = None
             self._start_handle = None
             self._end_handle = None
+            self._mtu = _MTU_DEFAULT
             _data = (conn_handle, addr_type, addr)
 
         elif event == _IRQ_GATTC_SERVICE_RESULT:
@@ -345,6 +383,12 @@ class Bluetooth:
             conn_handle, value_handle, char_data = data
             _data = (conn_handle, value_handle, char_data)
 
+        elif event == _IRQ_MTU_EXCHANGED:
+            # ATT MTU negotiated (either side may have initiated it)
+            conn_handle, mtu = data
+            self._mtu = mtu
+            _data = (conn_handle, mtu)
+
         elif event == _IRQ_ENCRYPTION_UPDATE:
             # Encryption/bonding state changed
             conn_handle, encrypted, authenticated, bonded, key_size = data
@@ -559,6 +603,25 @@ class Bluetooth:
             print(f"[Bluetooth] Service discovery error: {e}")
             return False
 
+    def exchange_mtu(self) -> bool:
+        """Request a larger ATT MTU from the connected peripheral (central mode).
+
+        The result arrives as an _IRQ_MTU_EXCHANGED event and updates mtu.
+        In peripheral mode the central starts the exchange.
+
+        Returns:
+            bool: True if the request was sent
+        """
+        if not self._connected or self._conn_handle is None:
+            return False
+
+        try:
+            self._ble.gattc_exchange_mtu(self._conn_handle)
+            return True
+        except Exception as e:
+            print(f"[Bluetooth] MTU exchange error: {e}")
+            return False
+
     def is_device_paired(self, addr: str) -> bool:
         """Check if a device address is in the paired devices list."""
         devices = self.load_paired_devices()
@@ -694,6 +757,7 @@ class Bluetooth:
         window_us=30000,
         active=True,
         callback=None,
+        table=None,
     ):
         """Start scanning for BLE devices (central mode).
 
@@ -703,12 +767,14 @@ class Bluetooth:
             window_us: Scan window in microseconds
             active: If True, request scan response data for device names (default True)
             callback: Optional callback for scan results (addr_type, addr, name, rssi, adv_data)
+            table: Optional ScanTable that results are folded into (deduplicated per address)
 
         Returns:
             bool: True if scan started successfully
         """
         if callback:
             self._scan_callback = callback
+        self._scan_table = table
         self._scanning = True
         try:
             self._ble.gap_scan(duration_ms, interval_us, window_us, active)
@@ -762,6 +828,10 @@ class Bluetooth:
                     self._rx_handle,
                 ),
             ) = self._ble.gatts_register_services(SERVICES)
+            # the RX value buffer defaults to 20 bytes and each write replaces
+            # it; append so back-to-back writes-without-response queue up
+            # until the IRQ reads (and so empties) it
+            self._ble.gatts_set_buffer(self._rx_handle, _RX_BUFFER_SIZE, True)
             self._peripheral_registered = True
             return True
         except Exception as e:
@@ -822,6 +892,33 @@ class Bluetooth:
 
         return sent
 
+    def transmit(self, data) -> bool:
+        """Send one payload of at most mtu - 3 bytes to the UART peer without waiting.
+
+        Uses a notification in peripheral mode and a write-without-response
+        in central mode. Unlike send()/write(), a full controller queue is
+        not reported as an error.
+
+        Args:
+            data: Payload (bytes, bytearray or memoryview)
+
+        Returns:
+            bool: False if not connected or the controller is busy (retry later)
+        """
+        try:
+            if self._connected and self._peripheral_rx_handle is not None:
+                self._ble.gattc_write(
+                    self._conn_handle, self._peripheral_rx_handle, data, 0
+                )
+                return True
+            if self._central_connections and self._tx_handle is not None:
+                for conn_handle in self._central_connections:
+                    self._ble.gatts_notify(conn_handle, self._tx_handle, data)
+                return True
+        except OSError:
+            pass  # out of controller buffers
+        return False
+
     def on_write(self, callback):
         """Set callback for when data is received from a central (peripheral mode).
 
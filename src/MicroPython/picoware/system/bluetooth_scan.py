@@ -0,0 +1,229 @@
+from micropython import const
+from utime import ticks_ms, ticks_diff
+
+_ADDR_SIZE = const(7)  # address type + 6 address bytes
+_EMPTY = const(-1)
+
+
+class ScanTable:
+    """
+    Deduplicating table of BLE scan results.
+
+    Advertisements are folded into one row per address (best RSSI, name,
+    last seen, advertisement count) held in preallocated arrays, with an
+    open-addressing index so a repeat advertisement is matched without
+    allocating. The device name is decoded at most once per address and
+    advertisement type (the name usually arrives in the scan response).
+    The UI polls changed() to get coalesced updates at a bounded rate
+    instead of being called for every advertisement.
+
+    Example:
+        table = ScanTable(capacity=64, interval_ms=500)
+        bluetooth.scan(table=table)
+        ...
+        if table.changed():
+            redraw(table)
+    """
+
+    __slots__ = (
+        "_addrs",
+        "_best_rssi",
+        "_capacity",
+        "_changed",
+        "_counts",
+        "_dropped",
+        "_interval_ms",
+        "_last_emit",
+        "_last_seen",
+        "_names",
+        "_rssi",
+        "_size",
+        "_slots",
+        "_tried",
+    )
+
+    def __init__(self, capacity: int = 64, interval_ms: int = 250) -> None:
+        """
+        Initialize the table.
+
+        Args:
+            capacity: Maximum number of distinct devices kept (further ones are counted in dropped)
+            interval_ms: Minimum time between updates reported by changed()
+        """
+        from array import array
+
+        self._capacity = capacity
+        self._interval_ms = interval_ms
+        self._addrs = bytearray(capacity * _ADDR_SIZE)
+        self._rssi = array("b", bytes(capacity))
+        self._best_rssi = array("b", bytes(capacity))
+        self._counts = array("H", bytes(capacity * 2))
+        self._last_seen = array("I", bytes(capacity * 4))
+        self._tried = bytearray(capacity)  # adv types already checked for a name
+        self._names = [""] * capacity
+        slots = 8
+        while slots < capacity * 2:
+            slots *= 2
+        self._slots = array("h", [_EMPTY] * slots)
+        self._size = 0
+        self._dropped = 0
+        self._changed = False
+        self._last_emit = ticks_ms()
+
+    def __len__(self) -> int:
+        """Return the number of devices in the table."""
+        return self._size
+
+    @property
+    def dropped(self) -> int:
+        """Advertisements from new devices ignored because the table was full."""
+        return self._dropped
+
+    def __find(self, addr_type: int, addr) -> int:
+        """Return the slot holding addr, or the empty slot where it would go."""
+        h = addr_type
+        for b in addr:
+            h = (h * 31 + b) & 0xFFFF
+        mask = len(self._slots) - 1
+        slot = h & mask
+        addrs = self._addrs
+        while True:
+            i = self._slots[slot]
+            if i == _EMPTY:
+                return slot
+            base = i * _ADDR_SIZE
+            if addrs[base] == addr_type:
+                j = 0
+                while j < 6 and addrs[base + 1 + j] == addr[j]:
+                    j += 1
+                if j == 6:
+                    return slot
+            slot = (slot + 1) & mask
+
+    def add(self, addr_type: int, addr, adv_type: int, rssi: int, adv_data) -> int:
+        """
+        Fold one advertisement into the table (safe to call from the BLE IRQ).
+
+        Args:
+            addr_type: Address type (0 = public, 1 = random)
+            addr: 6 address bytes
+            adv_type: Advertisement type (ADV_IND, SCAN_RSP, ...)
+            rssi: Signal strength in dBm
+            adv_data: Raw advertising data
+
+        Returns:
+            Row index of the device, or -1 if the table is full
+        """
+        slot = self.__find(addr_type, addr)
+        i = self._slots[slot]
+        if i == _EMPTY:
+            if self._size >= self._capacity:
+                self._dropped += 1
+                return -1
+            i = self._size
+            self._size += 1
+            self._slots[slot] = i
+            base = i * _ADDR_SIZE
+            self._addrs[base] = addr_type
+            self._addrs[base + 1 : base + _ADDR_SIZE] = addr
+            self._best_rssi[i] = rssi
+            self._counts[i] = 0
+            self._names[i] = ""
+            self._tried[i] = 0
+            self._changed = True
+        elif rssi > self._best_rssi[i]:
+            self._best_rssi[i] = rssi
+
+        if self._rssi[i] != rssi:
+            self._rssi[i] = rssi
+            self._changed = True
+        if self._counts[i] < 0xFFFF:
+            self._counts[i] += 1
+        self._last_seen[i] = ticks_ms()
+
+        bit = 1 << (adv_type & 7)
+        if not self._names[i] and not self._tried[i] & bit:
+            self._tried[i] |= bit
+            name = self.decode_name(adv_data)
+            if name:
+                self._names[i] = name
+                self._changed = True
+        return i
+
+    def address(self, index: int) -> bytes:
+        """Return the 6 address bytes of a row."""
+        base = index * _ADDR_SIZE
+        return bytes(self._addrs[base + 1 : base + _ADDR_SIZE])
+
+    def address_type(self, index: int) -> int:
+        """Return the address type of a row."""
+        return self._addrs[index * _ADDR_SIZE]
+
+    def best_rssi(self, index: int) -> int:
+        """Return the strongest RSSI seen for a row."""
+        return self._best_rssi[index]
+
+    def changed(self, force: bool = False) -> bool:
+        """
+        Return True, at most once per interval, if the table changed since the last True.
+
+        Args:
+            force: Ignore the rate limit (e.g. when the scan finished)
+        """
+        if not self._changed:
+            return False
+        now = ticks_ms()
+        if not force and ticks_diff(now, self._last_emit) < self._interval_ms:
+            return False
+        self._changed = False
+        self._last_emit = now
+        return True
+
+    def clear(self) -> None:
+        """Remove all devices."""
+        slots = self._slots
+        for k in range(len(slots)):
+            slots[k] = _EMPTY
+        for k in range(self._size):
+            self._names[k] = ""
+        self._size = 0
+        self._dropped = 0
+        self._changed = True
+
+    def count(self, index: int) -> int:
+        """Return the number of advertisements received from a row."""
+        return self._counts[index]
+
+    def decode_name(self, adv_data) -> str:
+        """Decode the (shortened or complete) local name from advertising data."""
+        i = 0
+        while i + 1 < len(adv_data):
+            length = adv_data[i]
+            if length == 0:
+                break
+            if adv_data[i + 1] in (0x08, 0x09):
+                try:
+                    return str(bytes(adv_data[i + 2 : i + 1 + length]), "utf-8")
+                except Exception:
+                    pass
+            i += 1 + length
+        return ""
+
+    def last_seen(self, index: int) -> int:
+        """Return the ticks_ms() value of the last advertisement from a row."""
+        return self._last_seen[index]
+
+    def name(self, index: int) -> str:
+        """Return the decoded name of a row ("" if none was advertised)."""
+        return self._names[index]
+
+    def rssi(self, index: int) -> int:
+        """Return the latest RSSI of a row."""
+        return self._rssi[index]
+
+    def sorted_indices(self) -> list:
+        """Return row indices ordered by best RSSI, strongest first."""
+        best = self._best_rssi
+        order = list(range(self._size))
+        order.sort(key=lambda i: -best[i])
+        return order
@@ -0,0 +1,341 @@
+from micropython import const
+from utime import ticks_ms, ticks_diff
+
+# Fragment header: kind, 8-bit sequence number, payload length; a START
+# fragment then carries the total message length (uint32, LE). Both kinds
+# are bytes that never occur in UTF-8, so plain text is never mistaken for
+# a fragment.
+_KIND_START = const(0xFE)
+_KIND_NEXT = const(0xFD)
+_SEQ_MASK = const(0xFF)
+_START_HEADER = const(7)
+_HEADER = const(3)
+_MAX_PAYLOAD = const(255)  # the length field is one byte
+_ATT_OVERHEAD = const(3)
+
+
+class BluetoothStream:
+    """
+    Message stream over the BLE Nordic UART Service.
+
+    Messages of any size are split into fragments that fit the negotiated
+    ATT MTU, each tagged with a header (kind, sequence number and payload
+    length; the first fragment also carries the total length), and are
+    reassembled on the other side. Fragments are self-delimiting, so
+    several writes buffered together by the peripheral are split again. Outbound fragments are queued and sent
+    as notifications / writes-without-response, as many per update() as
+    the controller accepts, so transfers larger than a chat line (files,
+    screenshots) keep the link busy instead of waiting for each write.
+
+    Incoming data that does not carry the framing (e.g. a phone NUS
+    terminal) is delivered as-is, as it arrives.
+
+    Example:
+        bt = Bluetooth()
+        stream = BluetoothStream(bt, on_message=lambda data: print(data))
+        bt.start_peripheral(name="Picoware")
+        stream.send(storage.read("/picoware/screenshot.bmp", "rb"))
+        while stream.pending:
+            stream.update()
+    """
+
+    __slots__ = (
+        "_bluetooth",
+        "_bytes_received",
+        "_bytes_sent",
+        "_framed",
+        "_fragments_sent",
+        "_inbox",
+        "_max_message",
+        "_messages_received",
+        "_messages_sent",
+        "_mtu_requested",
+        "_on_message",
+        "_outbox",
+        "_pending",
+        "_retries",
+        "_rx_buffer",
+        "_rx_errors",
+        "_rx_filled",
+        "_rx_seq",
+        "_start_ms",
+        "_tx_buffer",
+        "_tx_offset",
+        "_tx_seq",
+        "_window",
+    )
+
+    def __init__(
+        self,
+        bluetooth,
+        on_message=None,
+        framed: bool = True,
+        max_message: int = 65536,
+        window: int = 8,
+    ) -> None:
+        """
+        Initialize the stream.
+
+        Args:
+            bluetooth: The Bluetooth instance (central or peripheral, UART service)
+            on_message: Callback receiving each complete message as bytes (otherwise use read())
+            framed: Add the fragment header; False sends raw MTU-sized chunks for plain NUS peers
+            max_message: Largest incoming message accepted, in bytes
+            window: Maximum fragments handed to the controller per update()
+        """
+        self._bluetooth = bluetooth
+        self._on_message = on_message
+        self._framed = framed
+        self._max_message = max_message
+        self._window = window
+        self._inbox = []
+        self._outbox = []
+        self._pending = 0
+        self._tx_buffer = bytearray(256)
+        self._tx_offset = 0
+        self._tx_seq = 0
+        self._rx_buffer = None
+        self._rx_filled = 0
+        self._rx_seq = 0
+        self._mtu_requested = False
+        self.reset_counters()
+
+        # the stream owns the UART data callbacks of both roles
+        bluetooth.on_write(self.__on_fragment)
+        bluetooth.on_notify(self.__on_fragment)
+
+    def __del__(self):
+        if self._bluetooth is not None:
+            self._bluetooth.on_write(None)
+            self._bluetooth.on_notify(None)
+        self._bluetooth = None
+        self._inbox = None
+        self._outbox = None
+        self._rx_buffer = None
+        self._tx_buffer = None
+
+    @property
+    def bytes_received(self) -> int:
+        """Bytes received (including fragment headers) since the counters were reset."""
+        return self._bytes_received
+
+    @property
+    def bytes_sent(self) -> int:
+        """Bytes sent (including fragment headers) since the counters were reset."""
+        return self._bytes_sent
+
+    @property
+    def fragments_sent(self) -> int:
+        """Notifications/writes handed to the controller."""
+        return self._fragments_sent
+
+    @property
+    def messages_received(self) -> int:
+        """Complete messages received."""
+        return self._messages_received
+
+    @property
+    def messages_sent(self) -> int:
+        """Complete messages sent."""
+        return self._messages_sent
+
+    @property
+    def payload_size(self) -> int:
+        """Bytes per fragment at the current MTU, excluding the header."""
+        size = self._bluetooth.mtu - _ATT_OVERHEAD
+        return min(size - _HEADER, _MAX_PAYLOAD) if self._framed else size
+
+    @property
+    def pending(self) -> int:
+        """Bytes queued but not yet sent."""
+        return self._pending
+
+    @property
+    def retries(self) -> int:
+        """Times the controller was busy and a fragment had to wait."""
+        return self._retries
+
+    @property
+    def rx_errors(self) -> int:
+        """Messages dropped because of a missing fragment or an oversized length."""
+        return self._rx_errors
+
+    @property
+    def rx_rate(self) -> int:
+        """Average receive throughput in bytes per second."""
+        return self.__rate(self._bytes_received)
+
+    @property
+    def tx_rate(self) -> int:
+        """Average send throughput in bytes per second."""
+        return self.__rate(self._bytes_sent)
+
+    def __deliver(self, message: bytes) -> None:
+        """Hand a complete message to the callback or the inbox."""
+        self._messages_received += 1
+        if self._on_message:
+            self._on_message(message)
+        else:
+            self._inbox.append(message)
+
+    def __on_fragment(self, data) -> None:
+        """Reassemble incoming writes/notifications (one or more fragments)."""
+        count = len(data)
+        if not count:
+            return
+        self._bytes_received += count
+
+        pos = 0
+        while pos < count:
+            kind = data[pos]
+            if not self._framed or kind not in (_KIND_START, _KIND_NEXT):
+                # unframed peer: pass the data on as it arrived
+                self.__deliver(bytes(data[pos:]))
+                return
+            head = _START_HEADER if kind == _KIND_START else _HEADER
+            if pos + head > count or pos + head + data[pos + 2] > count:
+                self._rx_buffer = None
+                self._rx_errors += 1  # truncated fragment
+                return
+            seq = data[pos + 1]
+            start = pos + head
+            pos = start + data[pos + 2]
+
+            if kind == _KIND_START:
+                if self._rx_buffer is not None:
+                    self._rx_errors += 1  # previous message never completed
+                total = int.from_bytes(data[start - 4 : start], "little")
+                if total > self._max_message:
+                    self._rx_buffer = None
+                    self._rx_errors += 1
+                    continue
+                self._rx_buffer = bytearray(total)
+                self._rx_filled = 0
+                self._rx_seq = seq
+                self.__store(data, start, pos)
+            elif self._rx_buffer is not None:
+                if seq == (self._rx_seq + 1) & _SEQ_MASK:
+                    self._rx_seq = seq
+                    self.__store(data, start, pos)
+                else:
+                    self._rx_buffer = None
+                    self._rx_errors += 1
+
+    def __rate(self, count: int) -> int:
+        """Bytes per second since the counters were reset."""
+        elapsed = ticks_diff(ticks_ms(), self._start_ms)
+        return (count * 1000) // elapsed if elapsed > 0 else 0
+
+    def __store(self, data, offset: int, end: int) -> None:
+        """Copy a fragment payload (data[offset:end]) into the reassembly buffer."""
+        buffer = self._rx_buffer
+        count = min(end - offset, len(buffer) - self._rx_filled)
+        buffer[self._rx_filled : self._rx_filled + count] = data[
+            offset : offset + count
+        ]
+        self._rx_filled += count
+        if self._rx_filled >= len(buffer):
+            self._rx_buffer = None
+            self.__deliver(bytes(buffer))
+
+    def clear(self) -> None:
+        """Drop queued outbound data and any partially received message."""
+        self._outbox.clear()
+        self._pending = 0
+        self._tx_offset = 0
+        self._rx_buffer = None
+
+    def read(self):
+        """Return the oldest received message (bytes), or None."""
+        return self._inbox.pop(0) if self._inbox else None
+
+    def reset_counters(self) -> None:
+        """Reset the throughput counters."""
+        self._bytes_received = 0
+        self._bytes_sent = 0
+        self._fragments_sent = 0
+        self._messages_received = 0
+        self._messages_sent = 0
+        self._retries = 0
+        self._rx_errors = 0
+        self._start_ms = ticks_ms()
+
+    def send(self, data) -> bool:
+        """
+        Queue a message and start sending it.
+
+        Args:
+            data: Message (str, bytes or bytearray)
+
+        Returns:
+            True if queued (False when not connected)
+        """
+        bt = self._bluetooth
+        if not (bt.is_uart_ready() or bt.is_peripheral_connected):
+            return False
+        if isinstance(data, str):
+            data = data.encode()
+        if not data:
+            return True
+        self._outbox.append(memoryview(data))
+        self._pending += len(data)
+        self.update()
+        return True
+
+    def update(self) -> int:
+        """
+        Send queued fragments until the controller is busy or the window is used up.
+
+        Call this from the app's run loop while pending is non-zero.
+
+        Returns:
+            Number of fragments sent
+        """
+        bt = self._bluetooth
+        if bt.is_uart_ready() and not self._mtu_requested:
+            # central side: ask once for a larger MTU after discovery
+            self._mtu_requested = bt.exchange_mtu()
+        elif not bt.is_connected:
+            self._mtu_requested = False
+
+        sent = 0
+        buffer = self._tx_buffer
+        while self._outbox and sent < self._window:
+            message = self._outbox[0]
+            offset = self._tx_offset
+            size = self.payload_size
+            if len(buffer) < size + _START_HEADER:
+                buffer = self._tx_buffer = bytearray(size + _START_HEADER)
+            view = memoryview(buffer)
+
+            if not self._framed:
+                head = 0
+            elif offset == 0:
+                buffer[0] = _KIND_START
+                buffer[3:_START_HEADER] = len(message).to_bytes(4, "little")
+                head = _START_HEADER
+                size -= _START_HEADER - _HEADER
+            else:
+                buffer[0] = _KIND_NEXT
+                head = _HEADER
+            count = min(size, len(message) - offset)
+            if head:
+                buffer[1] = self._tx_seq
+                buffer[2] = count
+            view[head : head + count] = message[offset : offset + count]
+
+            if not bt.transmit(view[: head + count]):
+                self._retries += 1
+                break
+            sent += 1
+            self._fragments_sent += 1
+            self._bytes_sent += head + count
+            self._pending -= count
+            self._tx_seq = (self._tx_seq + 1) & _SEQ_MASK
+            offset += count
+            if offset >= len(message):
+                self._outbox.pop(0)
+                self._messages_sent += 1
+                offset = 0
+            self._tx_offset = offset
+        return sent
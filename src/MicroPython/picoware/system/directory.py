@@ -0,0 +1,202 @@
+from micropython import const
+
+_FLAG_DIR = const(1)
+
+
+class DirectoryModel:
+    """
+    Compact, lazily sorted listing of a single directory.
+
+    Entry names are packed into one bytearray with an offset table, and the
+    per-entry flag bits and sizes live in a bytearray/array, so a folder of
+    several thousand files costs a handful of bytes per entry instead of a
+    dict and a string each. Sorting (folders first, then case-insensitive
+    name) is deferred until an entry is first accessed and the resulting
+    display order is stored as a compact index array.
+
+    When the directory is not the root, index 0 is the ".." parent entry.
+    """
+
+    __slots__ = (
+        "_path",
+        "_names",
+        "_offsets",
+        "_flags",
+        "_sizes",
+        "_order",
+        "_parent",
+    )
+
+    def __init__(self, path: str = "/"):
+        """
+        Initialize an empty model.
+
+        Args:
+            path: Directory this model describes
+        """
+        from array import array
+
+        self._path = path
+        self._names = bytearray()
+        self._offsets = array("I", [0])
+        self._flags = bytearray()
+        self._sizes = array("I")
+        self._order = None
+        self._parent = path != "/"
+
+    def __getitem__(self, index: int) -> str:
+        """Return the name of the entry at the given display index."""
+        j = self.__entry(index)
+        if j < 0:
+            return ".."
+        return str(self._names[self._offsets[j] : self._offsets[j + 1]], "utf-8")
+
+    def __len__(self) -> int:
+        """Return the number of displayed entries (including "..")."""
+        return len(self._flags) + (1 if self._parent else 0)
+
+    @property
+    def path(self) -> str:
+        """The directory this model describes."""
+        return self._path
+
+    def __entry(self, index: int) -> int:
+        """Map a display index to a raw entry index (-1 for "..")."""
+        if index < 0:
+            index += len(self)
+        if self._parent:
+            if index == 0:
+                return -1
+            index -= 1
+        if self._order is None:
+            self.__sort()
+        return self._order[index]
+
+    def __sort(self) -> None:
+        """Build the display order: folders first, then case-insensitive name."""
+        from array import array
+
+        names = self._names
+        offsets = self._offsets
+        flags = self._flags
+        count = len(flags)
+
+        # MicroPython's sort calls a key function on every comparison, so
+        # each sort key is built once and the index rides along in the tuple
+        keys = [
+            (
+                0 if flags[i] & _FLAG_DIR else 1,
+                str(names[offsets[i] : offsets[i + 1]], "utf-8").lower(),
+                i,
+            )
+            for i in range(count)
+        ]
+        keys.sort()
+        order = array("H" if count < 65536 else "I")
+        for entry in keys:
+            order.append(entry[2])
+        del keys
+        self._order = order
+
+    def append(self, name: str, is_directory: bool = False, size: int = 0) -> None:
+        """Add an entry to the model (invalidates the sort order)."""
+        self._names.extend(name.encode("utf-8"))
+        self._offsets.append(len(self._names))
+        self._flags.append(_FLAG_DIR if is_directory else 0)
+        self._sizes.append(0 if is_directory else size)
+        self._order = None
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        from array import array
+
+        self._names = bytearray()
+        self._offsets = array("I", [0])
+        self._flags = bytearray()
+        self._sizes = array("I")
+        self._order = None
+
+    def index(self, name: str) -> int:
+        """Return the display index of the entry with the given name."""
+        if self._parent and name == "..":
+            return 0
+        target = name.encode("utf-8")
+        names = self._names
+        offsets = self._offsets
+        for i in range(len(self._flags)):
+            if names[offsets[i] : offsets[i + 1]] == target:
+                if self._order is None:
+                    self.__sort()
+                pos = 0
+                for j in self._order:
+                    if j == i:
+                        return pos + (1 if self._parent else 0)
+                    pos += 1
+        raise ValueError(name)
+
+    def is_directory(self, index: int) -> bool:
+        """Return True if the entry at the display index is a directory."""
+        j = self.__entry(index)
+        return j < 0 or bool(self._flags[j] & _FLAG_DIR)
+
+    def load(
+        self,
+        storage,
+        path: str,
+        show_hidden: bool = False,
+        allowed_extensions: list = None,
+    ) -> bool:
+        """
+        Stream a directory listing from storage into the model.
+
+        Args:
+            storage: The Storage instance to read from
+            path: Directory to list
+            show_hidden: Include entries whose names start with "."
+            allowed_extensions: If given, only files with these (lowercase) extensions are kept
+
+        Returns:
+            True on success, False if the directory could not be read
+        """
+        self.clear()
+        self._path = path
+        self._parent = path != "/"
+
+        try:
+            for name, is_dir, size in storage.iter_directory(path):
+                if name in (".", "..") or (not show_hidden and name.startswith(".")):
+                    continue
+                if allowed_extensions and not is_dir:
+                    ext = name.split(".")[-1].lower() if "." in name else ""
+                    if ext not in allowed_extensions:
+                        continue
+                self.append(name, is_dir, size)
+        except Exception as e:
+            print(f"Error loading directory {path}: {e}")
+            return False
+        return True
+
+    def size(self, index: int) -> int:
+        """Return the size in bytes of the entry at the display index (0 for directories)."""
+        j = self.__entry(index)
+        return 0 if j < 0 else self._sizes[j]
+
+    def window(self, start: int, count: int):
+        """
+        Yield (index, name, is_directory, size) for the visible rows only.
+
+        Args:
+            start: First display index
+            count: Maximum number of rows
+        """
+        for i in range(max(0, start), min(len(self), start + count)):
+            j = self.__entry(i)
+            if j < 0:
+                yield i, "..", True, 0
+            else:
+                yield (
+                    i,
+                    str(self._names[self._offsets[j] : self._offsets[j + 1]], "utf-8"),
+                    bool(self._flags[j] & _FLAG_DIR),
+                    self._sizes[j],
+                )
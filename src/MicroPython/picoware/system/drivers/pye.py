@@ -92,6 +92,415 @@ KEY_UNDO_NEXT = const(0xFFE0)
 KEY_UNDO_YANK = const(0xFFDF)
 
 
+class TextBuffer:
+    """
+    List-of-lines view of a file, backed by a line-level piece table.
+
+    Unedited lines are read on demand from the original file through a
+    compact table of line start offsets and a small block cache; edited
+    lines go to an append buffer. The document itself is a list of runs
+    [source, start, count] (source 0 = original file, 1 = append buffer),
+    so a freshly opened file costs 4 bytes per line instead of a string.
+    The editor keeps using it like a list (indexing, slices, pop, insert).
+    """
+
+    BLOCK = 4096
+    MAX_BLOCKS = 8
+    MAX_LINES = 128
+
+    def __init__(self, fname, storage=None, expand=None):
+        self.fname = fname
+        self.storage = storage
+        self.expand = expand
+        self.index()
+
+    # ---- original file access ----
+
+    def read(self, start, count):
+        if self.storage:
+            return self.storage.read_chunked(self.fname, start, count)
+        with open(self.fname, "rb") as f:
+            f.seek(start)
+            return f.read(count)
+
+    def read_span(self, start, end):
+        block = start // TextBuffer.BLOCK
+        if block != (end - 1) // TextBuffer.BLOCK:
+            return self.read(start, end - start)
+        data = self.blocks.get(block)
+        if data is None:
+            if len(self.blocks) >= TextBuffer.MAX_BLOCKS:
+                self.blocks.clear()
+            data = self.read(block * TextBuffer.BLOCK, TextBuffer.BLOCK)
+            self.blocks[block] = data
+        base = block * TextBuffer.BLOCK
+        return data[start - base : end - base]
+
+    def index(self):
+        # one pass over the file recording where each line starts; the file
+        # is "clean" when writing its lines back reproduces it byte for byte
+        from array import array
+
+        self.offsets = offsets = array("I", [0])
+        self.pieces = []
+        self.add = []
+        self.blocks = {}
+        self.lines = {}
+        self.clean = True
+        pos = 0
+        last = b"\n"
+        while True:
+            chunk = self.read(pos, TextBuffer.BLOCK)
+            if not chunk:
+                break
+            if (
+                b"\t" in chunk
+                or b"\r" in chunk
+                or b" \n" in chunk
+                or (last == b" " and chunk[0] == 10)
+            ):
+                self.clean = False
+            i = chunk.find(b"\n")
+            while i >= 0:
+                offsets.append(pos + i + 1)
+                i = chunk.find(b"\n", i + 1)
+            pos += len(chunk)
+            last = chunk[-1:]
+            if len(chunk) < TextBuffer.BLOCK:
+                break
+        if pos > offsets[-1]:
+            offsets.append(pos)  # last line without a newline
+            self.clean = False
+        self.size = pos
+        self.length = len(offsets) - 1
+        if self.length:
+            self.pieces.append([0, 0, self.length])
+
+    def original(self, i):
+        line = self.lines.get(i)
+        if line is None:
+            if len(self.lines) >= TextBuffer.MAX_LINES:
+                self.lines.clear()
+            raw = self.read_span(self.offsets[i], self.offsets[i + 1])
+            line = str(raw, "utf-8").rstrip()
+            if self.expand:
+                line = self.expand(line)
+            self.lines[i] = line
+        return line
+
+    # ---- piece table ----
+
+    def locate(self, i):
+        # piece index and offset of line i (i == length -> past the end)
+        first = 0
+        for p, piece in enumerate(self.pieces):
+            if i < first + piece[2]:
+                return p, i - first
+            first += piece[2]
+        return len(self.pieces), 0
+
+    def split(self, i):
+        # make line i start a piece; returns that piece's index
+        p, off = self.locate(i)
+        if off:
+            src, start, count = self.pieces[p]
+            self.pieces[p] = [src, start, off]
+            self.pieces.insert(p + 1, [src, start + off, count - off])
+            p += 1
+        return p
+
+    def replace(self, a, b, lines):
+        n = len(lines)
+        if b - a == 1 and n == 1:
+            p, off = self.locate(a)
+            src, start, count = self.pieces[p]
+            if src == 1 and start + off == len(self.add) - 1:
+                self.add[-1] = lines[0]  # re-editing the last edited line
+                return
+        pa = self.split(a)
+        pb = self.split(b)
+        del self.pieces[pa:pb]
+        if n:
+            prev = self.pieces[pa - 1] if pa else None
+            if prev and prev[0] == 1 and prev[1] + prev[2] == len(self.add):
+                prev[2] += n
+            else:
+                self.pieces.insert(pa, [1, len(self.add), n])
+            self.add.extend(lines)
+        self.length += n - (b - a)
+        if len(self.add) > 64 and len(self.add) > 2 * self.edited():
+            self.compact()
+
+    def edited(self):
+        return sum(piece[2] for piece in self.pieces if piece[0] == 1)
+
+    def compact(self):
+        # drop append-buffer lines no longer referenced by any piece
+        add = []
+        for piece in self.pieces:
+            if piece[0] == 1:
+                start = piece[1]
+                piece[1] = len(add)
+                add.extend(self.add[start : start + piece[2]])
+        self.add = add
+
+    def line(self, i):
+        p, off = self.locate(i)
+        src, start, _ = self.pieces[p]
+        return self.add[start + off] if src else self.original(start + off)
+
+    def range(self, a, b):
+        first = 0
+        for src, start, count in self.pieces:
+            if first + count > a and first < b:
+                lo = max(a, first) - first
+                hi = min(b, first + count) - first
+                for k in range(start + lo, start + hi):
+                    yield self.add[k] if src else self.original(k)
+            first += count
+            if first >= b:
+                break
+
+    def signature(self):
+        # cheap change detector: runs of original lines plus edited text
+        res = 0
+        run_start = run_end = -1
+        for src, start, count in self.pieces + [[1, 0, 0]]:
+            if not src and start == run_end:
+                run_end += count  # split but still contiguous
+                continue
+            if run_end >= 0:
+                res = ((res * 227 + 1) ^ (run_start * 7919 + run_end)) & 0x3FFFFFFF
+                run_start = run_end = -1
+            if src:
+                for k in range(start, start + count):
+                    res = ((res * 227 + 1) ^ hash(self.add[k])) & 0x3FFFFFFF
+            else:
+                run_start, run_end = start, start + count
+        return res
+
+    # ---- list protocol ----
+
+    def __len__(self):
+        return self.length
+
+    def __iter__(self):
+        return self.range(0, self.length)
+
+    def __eq__(self, other):
+        return len(other) == self.length and all(x == y for x, y in zip(self, other))
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            a, b, _ = i.indices(self.length)
+            return list(self.range(a, b)) if a < b else []
+        if i < 0:
+            i += self.length
+        if not 0 <= i < self.length:
+            raise IndexError("line index out of range")
+        return self.line(i)
+
+    def __setitem__(self, i, value):
+        if isinstance(i, slice):
+            a, b, _ = i.indices(self.length)
+            self.replace(a, max(a, b), list(value))
+        else:
+            if i < 0:
+                i += self.length
+            self.replace(i, i + 1, [value])
+
+    def __delitem__(self, i):
+        if isinstance(i, slice):
+            a, b, _ = i.indices(self.length)
+            if a < b:
+                self.replace(a, b, [])
+        else:
+            if i < 0:
+                i += self.length
+            self.replace(i, i + 1, [])
+
+    def __iadd__(self, lines):
+        self.replace(self.length, self.length, list(lines))
+        return self
+
+    def append(self, line):
+        self.replace(self.length, self.length, [line])
+
+    def insert(self, i, line):
+        i = max(0, min(self.length, i + self.length if i < 0 else i))
+        self.replace(i, i, [line])
+
+    def pop(self, i=-1):
+        line = self[i]
+        del self[i]
+        return line
+
+    # ---- saving ----
+
+    def prefix(self):
+        # number of leading lines still identical to the start of the file
+        if self.clean and self.pieces and self.pieces[0][0] == 0:
+            if self.pieces[0][1] == 0:
+                return self.pieces[0][2]
+        return 0
+
+    def new_size(self, first):
+        size = self.offsets[first]
+        line = 0
+        for src, start, count in self.pieces:
+            if line + count > first:
+                lo = max(first - line, 0)
+                if src:
+                    for k in range(start + lo, start + count):
+                        size += len(self.add[k].encode("utf-8")) + 1
+                else:
+                    size += self.offsets[start + count] - self.offsets[start + lo]
+            line += count
+        return size
+
+    def save(self, fname, pack=None):
+        """
+        Write the buffer to fname, streaming in blocks with a CRC check.
+
+        When saving back to the original (clean) file without tab packing
+        and the file does not shrink, only the bytes from the first changed
+        line onward are rewritten in place.
+        """
+        storage = self.storage
+        first = self.prefix() if fname == self.fname and not pack else 0
+        keep = self.offsets[first]
+        size = self.new_size(first) if first else 0
+        if first and first == self.length and size == self.size:
+            return  # nothing changed
+        in_place = bool(storage) and first > 0 and size >= self.size
+
+        tmp = fname + ".pyetmp"
+        crc, offsets = write_lines(
+            self.range(first, self.length), tmp, storage, pack, keep
+        )
+        if in_place:
+            # patch the original from the first changed byte onward
+            f = storage.file_open(fname)
+            try:
+                storage.file_seek(f, keep)
+                pos = 0
+                while True:
+                    chunk = storage.read_chunked(tmp, pos, TextBuffer.BLOCK)
+                    if not chunk:
+                        break
+                    if not storage.file_write(f, chunk, "wb"):
+                        raise OSError("write failed")
+                    pos += len(chunk)
+            finally:
+                storage.file_close(f)
+            storage.remove(tmp)
+            if not verify(fname, storage, crc, keep, offsets[-1]):
+                raise OSError("checksum mismatch after write")
+            self.offsets = self.offsets[: first + 1]
+            self.offsets.extend(offsets[1:])
+        else:
+            if first:
+                # shrinking: write the whole file instead
+                crc, offsets = write_lines(iter(self), tmp, storage, pack, 0)
+            replace_file(tmp, fname, storage)
+            if not verify(fname, storage, crc, 0, offsets[-1]):
+                raise OSError("checksum mismatch after write")
+            self.offsets = offsets
+        # the file on disk now holds exactly this text
+        self.fname = fname
+        self.size = self.offsets[-1]
+        self.length = len(self.offsets) - 1
+        self.pieces = [[0, 0, self.length]] if self.length else []
+        self.add = []
+        self.blocks = {}
+        self.lines = {}
+        self.clean = not pack
+
+
+def write_lines(lines, fname, storage=None, pack=None, base=0):
+    """Stream lines to fname in blocks. Returns (crc32, line offsets starting at base)."""
+    from array import array
+
+    try:
+        from binascii import crc32
+    except ImportError:
+        crc32 = None
+
+    crc = 0
+    pos = base
+    offsets = array("I", [base])
+    parts = []
+    pending = 0
+    f = None if storage else open(fname, "wb")
+    if storage and storage.exists(fname):
+        storage.remove(fname)  # binary writes through storage append
+    try:
+        for line in lines:
+            data = ((pack(line) if pack else line) + "\n").encode("utf-8")
+            parts.append(data)
+            pending += len(data)
+            pos += len(data)
+            offsets.append(pos)
+            if pending >= TextBuffer.BLOCK:
+                chunk = b"".join(parts)
+                parts = []
+                pending = 0
+                if crc32:
+                    crc = crc32(chunk, crc)
+                if f:
+                    f.write(chunk)
+                elif not storage.write(fname, chunk, "ab"):
+                    raise OSError("write failed")
+        chunk = b"".join(parts)
+        if crc32:
+            crc = crc32(chunk, crc)
+        if f:
+            f.write(chunk)
+        elif not storage.write(fname, chunk, "ab"):
+            raise OSError("write failed")
+    finally:
+        if f:
+            f.close()
+    return crc, offsets
+
+
+def verify(fname, storage, crc, start, end):
+    """Re-read bytes [start, end) of fname and compare their CRC32."""
+    try:
+        from binascii import crc32
+    except ImportError:
+        return True  # no checksum support, trust the write
+    check = 0
+    pos = start
+    while pos < end:
+        count = min(TextBuffer.BLOCK, end - pos)
+        if storage:
+            chunk = storage.read_chunked(fname, pos, count)
+        else:
+            with open(fname, "rb") as f:
+                f.seek(pos)
+                chunk = f.read(count)
+        if not chunk:
+            return False
+        check = crc32(chunk, check)
+        pos += len(chunk)
+    return check == crc
+
+
+def replace_file(tmp, fname, storage=None):
+    if storage:
+        if storage.exists(fname):
+            storage.remove(fname)
+        if not storage.rename(tmp, fname):
+            raise OSError(f"Failed to write file {fname}")
+    else:
+        try:
+            os.remove(fname)
+        except Exception:
+            pass
+        os.rename(tmp, fname)
+
+
 class Editor:
     KEYMAP = {
         "\x1b[A": KEY_UP,
@@ -1073,7 +1482,7 @@ class Editor:
                     q = ""
                     cur_line, cur_col = self.cur_line, self.col
                     if self.mark is not None:
-                        (self.cur_line, self.col, end_line, end_col) = self.mark_range()
+                        self.cur_line, self.col, end_line, end_col = self.mark_range()
                     else:
                         end_line = self.total_lines
                         end_col = 999999
@@ -1149,9 +1558,7 @@ class Editor:
                 if fname != self.fname:
                     # Check if file exists using storage system
                     if self.storage:
-                        # Try to read the file to check if it exists
-                        existing_content = self.storage.read(fname, "r")
-                        if existing_content:  # File exists
+                        if self.storage.exists(fname):
                             res = self.line_edit(
                                 "The file exists! Overwrite (y/N)? ", "N"
                             )
@@ -1312,6 +1719,8 @@ class Editor:
         return sb.getvalue()
 
     def hash_buffer(self):
+        if isinstance(self.content, TextBuffer):
+            return self.content.signature()
         res = 0
         for line in self.content:
             res = ((res * 227 + 1) ^ hash(line)) & 0x3FFFFFFF
@@ -1340,12 +1749,11 @@ class Editor:
                 # Not a directory or doesn't exist, treat as file
                 pass
 
-            # Handle as file
-            # Use storage system for reading files
+            # Handle as file: index the lines and read them on demand
+            self.write_tabs = "n"
             if self.storage:
-                file_content = self.storage.read(fname, "r")
-                if file_content:
-                    self.content = file_content.splitlines()
+                if self.storage.exists(fname):
+                    self.content = TextBuffer(fname, self.storage, self.expandtabs)
                 else:
                     # File doesn't exist, create empty content for new file and write it
                     self.content = [""]
@@ -1354,84 +1762,30 @@ class Editor:
             else:
                 # Fallback to direct file operations if no storage
                 try:
-                    if is_micropython:
-                        with open(fname) as f:
-                            self.content = f.readlines()
-                    else:
-                        with open(fname, errors="ignore") as f:
-                            self.content = f.readlines()
+                    self.content = TextBuffer(fname, None, self.expandtabs)
                 except OSError:
                     # File doesn't exist, create empty content for new file
                     self.content = [""]
 
-            self.write_tabs = False
-            i = 0
-            for l in self.content:
-                self.content[i] = self.expandtabs(
-                    l.rstrip() if isinstance(l, str) else l
-                )
-                i += 1
-
         self.hash = self.hash_buffer()
 
     def put_file(self, fname):
-        if self.storage:
-            try:
-                # Build file content as a single string
-                file_content = ""
-                for l in self.content:
-                    if self.write_tabs == "y":
-                        file_content += self.packtabs(l)
-                    else:
-                        file_content += l
-                    file_content += "\n"
-
-                # Write using storage system
-                success = self.storage.write(fname, file_content, "w")
-
-                if not success:
-                    raise OSError(f"Failed to write file {fname}")
-
-                # Force sync/flush if storage has these methods
-                if hasattr(self.storage, "sync"):
-                    self.storage.sync()
-                elif hasattr(self.storage, "flush"):
-                    self.storage.flush()
-                else:
-                    pass
-
-                # Verify the file was written by trying to read it back
-                try:
-                    written_content = self.storage.read(fname, "r")
-                    if not written_content:
-                        raise OSError(f"File {fname} appears empty after write")
-                    if abs(len(written_content) - len(file_content)) > 10:
-                        raise OSError(f"File {fname} size mismatch after write")
-                except Exception as e:
-                    # If we can't verify, at least log the issue but don't fail
-                    print(f"Warning: Could not verify file write for {fname}: {e}")
-
-            except Exception as e:
-                raise OSError(f"Error writing file {fname}: {e}")
-        else:
-            # Fallback to direct file operations if no storage
-            tmpfile = fname + ".pyetmp"
-            with open(tmpfile, "w") as f:
-                for l in self.content:
-                    if self.write_tabs == "y":
-                        f.write(self.packtabs(l))
-                    else:
-                        f.write(l)
-                    f.write("\n")
-            try:
-                os.remove(fname)
-            except Exception:
-                pass
-            os.rename(tmpfile, fname)
+        pack = self.packtabs if self.write_tabs == "y" else None
+        try:
+            if isinstance(self.content, TextBuffer):
+                # streams in blocks and rewrites only the changed tail if it can
+                self.content.save(fname, pack)
+            else:
+                tmpfile = fname + ".pyetmp"
+                crc, offsets = write_lines(self.content, tmpfile, self.storage, pack)
+                replace_file(tmpfile, fname, self.storage)
+                if not verify(fname, self.storage, crc, 0, offsets[-1]):
+                    raise OSError("checksum mismatch after write")
+        except Exception as e:
+            raise OSError(f"Error writing file {fname}: {e}")
 
     def expandtabs(self, s):
         if "\t" in s:
-            self.write_tabs = True
             sb = StringIO()
             pos = 0
             for c in s:
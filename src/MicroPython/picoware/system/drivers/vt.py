@@ -19,7 +19,7 @@ import vt as vt_c
 
 class vt(uio.IOBase):
 
-    def __init__(self, view_manager):  # ctrl+U for screen capture
+    def __init__(self, view_manager, scrollback: int = 0):  # ctrl+U for screen capture
         self.view_manager = view_manager
         self.draw = view_manager.draw
         self.input_manager = view_manager.input_manager
@@ -41,10 +41,32 @@ class vt(uio.IOBase):
         self._render_throttle_ms = 50
         self._batch_mode = False
 
-        # Terminal buffer for text display
+        # Terminal buffer for text display: a ring of per-row bytearrays,
+        # so scrolling only advances _head instead of copying every cell
+        self._blank = b" " * self.screen_width
         self.terminal_buffer = []
         for _ in range(self.screen_height):
-            self.terminal_buffer.append([" "] * self.screen_width)
+            self.terminal_buffer.append(bytearray(self._blank))
+        self._head = 0
+
+        # Rows changed since the last render, and what each row showed then
+        self._dirty = bytearray(b"\x01" * self.screen_height)
+        self._shown = [bytearray(self._blank) for _ in range(self.screen_height)]
+        self._shown_cursor_y = 0
+
+        # Optional scrollback: one flat bytearray (lands in PSRAM on boards
+        # whose heap extends into it) holding lines that scrolled off the top
+        self._scrollback = None
+        self._sb_lines = 0
+        self._sb_head = 0
+        self._sb_count = 0
+        self._view_offset = 0
+        if scrollback > 0:
+            try:
+                self._scrollback = bytearray(scrollback * self.screen_width)
+                self._sb_lines = scrollback
+            except MemoryError:
+                print("vt: not enough memory for scrollback")
 
         # Clear the screen initially
         self.draw.clear(color=self.draw.background)
@@ -104,15 +126,38 @@ class vt(uio.IOBase):
         # Enable input when buffer is dried (editor is starting)
         self.input_enabled = True
 
+    def _row(self, y):
+        """Return the bytearray holding screen row y"""
+        return self.terminal_buffer[(self._head + y) % self.screen_height]
+
+    def _clear_row(self, y, start=0, end=-1):
+        """Blank columns [start, end) of screen row y"""
+        if end < 0:
+            end = self.screen_width
+        if start < end:
+            self._row(y)[start:end] = memoryview(self._blank)[start:end]
+            self._dirty[y] = 1
+
+    def _mark_all_dirty(self):
+        """Mark every screen row for redraw"""
+        dirty = self._dirty
+        for y in range(self.screen_height):
+            dirty[y] = 1
+
     def _scroll_up(self):
         """Scroll terminal content up by one line"""
         self._needs_render = True
-        for y in range(self.screen_height - 1):
-            for x in range(self.screen_width):
-                self.terminal_buffer[y][x] = self.terminal_buffer[y + 1][x]
-        # Clear the last line
-        for x in range(self.screen_width):
-            self.terminal_buffer[self.screen_height - 1][x] = " "
+        top = self.terminal_buffer[self._head]
+        if self._scrollback is not None:
+            width = self.screen_width
+            start = self._sb_head * width
+            self._scrollback[start : start + width] = top
+            self._sb_head = (self._sb_head + 1) % self._sb_lines
+            self._sb_count = min(self._sb_count + 1, self._sb_lines)
+        # the old top row becomes the new, blank bottom row
+        top[:] = self._blank
+        self._head = (self._head + 1) % self.screen_height
+        self._mark_all_dirty()
 
     def _print_char(self, char_code):
         """Print a character to the terminal"""
@@ -129,12 +174,17 @@ class vt(uio.IOBase):
         elif char_code == 8:  # backspace
             if self.cursor_x > 0:
                 self.cursor_x -= 1
-                self.terminal_buffer[self.cursor_y][self.cursor_x] = " "
+                self._row(self.cursor_y)[self.cursor_x] = 32
+                self._dirty[self.cursor_y] = 1
         elif char_code == 27:  # ESC - start of escape sequence, ignore for now
             pass  # We'll handle escape sequences in wr() method
         elif char_code >= 32:  # printable characters
             if self.cursor_x < self.screen_width:
-                self.terminal_buffer[self.cursor_y][self.cursor_x] = chr(char_code)
+                # cells are single bytes; anything outside ASCII shows as "?"
+                self._row(self.cursor_y)[self.cursor_x] = (
+                    char_code if char_code < 127 else 63
+                )
+                self._dirty[self.cursor_y] = 1
                 self.cursor_x += 1
                 if self.cursor_x >= self.screen_width:
                     self.cursor_x = 0
@@ -170,39 +220,34 @@ class vt(uio.IOBase):
                 # Clear line
                 if params == "K" or params == "0K":
                     # Clear from cursor to end of line
-                    for x in range(self.cursor_x, self.screen_width):
-                        self.terminal_buffer[self.cursor_y][x] = " "
+                    self._clear_row(self.cursor_y, self.cursor_x)
                 elif params == "1K":
                     # Clear from start of line to cursor
-                    for x in range(0, self.cursor_x + 1):
-                        self.terminal_buffer[self.cursor_y][x] = " "
+                    self._clear_row(
+                        self.cursor_y, 0, min(self.cursor_x + 1, self.screen_width)
+                    )
                 elif params == "2K":
                     # Clear entire line
-                    for x in range(self.screen_width):
-                        self.terminal_buffer[self.cursor_y][x] = " "
+                    self._clear_row(self.cursor_y)
             elif params.endswith("J"):
                 # Clear screen
                 if params == "J" or params == "0J":
                     # Clear from cursor to end of screen
                     for y in range(self.cursor_y, self.screen_height):
-                        start_x = self.cursor_x if y == self.cursor_y else 0
-                        for x in range(start_x, self.screen_width):
-                            self.terminal_buffer[y][x] = " "
+                        self._clear_row(y, self.cursor_x if y == self.cursor_y else 0)
                 elif params == "1J":
                     # Clear from start of screen to cursor
                     for y in range(0, self.cursor_y + 1):
                         end_x = (
-                            self.cursor_x
+                            min(self.cursor_x + 1, self.screen_width)
                             if y == self.cursor_y
-                            else self.screen_width - 1
+                            else self.screen_width
                         )
-                        for x in range(0, end_x + 1):
-                            self.terminal_buffer[y][x] = " "
+                        self._clear_row(y, 0, end_x)
                 elif params == "2J":
                     # Clear entire screen
                     for y in range(self.screen_height):
-                        for x in range(self.screen_width):
-                            self.terminal_buffer[y][x] = " "
+                        self._clear_row(y)
             elif params.endswith("r"):
                 # Set scroll region - we'll ignore this for simplicity
                 pass
@@ -218,6 +263,10 @@ class vt(uio.IOBase):
 
     def wr(self, text_input):
         """Write text, handling ANSI escape sequences"""
+        if self._view_offset:
+            # new output snaps the view back to the live screen
+            self._view_offset = 0
+            self._mark_all_dirty()
         i = 0
         while i < len(text_input):
             if text_input[i] == "\x1b":  # ESC character
@@ -269,16 +318,38 @@ class vt(uio.IOBase):
         return len(text_input)
 
     def _render_terminal(self):
-        """Render the terminal buffer to the display using C module"""
+        """Render the changed rows of the terminal buffer using the C module"""
+        dirty = self._dirty
+        rows = self.terminal_buffer
+        head = self._head
+        cursor_visible = self.cursor_visible and not self._view_offset
+        if self._view_offset:
+            rows = self._view_rows()
+            head = 0
+        else:
+            # skip rows that still show exactly what was drawn last time
+            shown = self._shown
+            for y in range(self.screen_height):
+                if dirty[y]:
+                    row = self._row(y)
+                    if row == shown[y]:
+                        dirty[y] = 0
+                    else:
+                        shown[y][:] = row
+        # the cursor is painted over its row, so both its old and new rows redraw
+        dirty[self._shown_cursor_y] = 1
+        dirty[self.cursor_y] = 1
+        self._shown_cursor_y = self.cursor_y
+
         vt_c.render(
-            self.terminal_buffer,
+            rows,
             self.screen_height,
             self.screen_width,
             self.char_height,
             self.char_width,
             self.draw.background,
             self.draw.foreground,
-            self.cursor_visible,
+            cursor_visible,
             self.cursor_x * self.char_width,
             self.cursor_y * self.char_height,
             self.char_vec.x,
@@ -287,8 +358,53 @@ class vt(uio.IOBase):
             self._syntax_map,
             self._string_color,
             self._comment_color,
+            self.draw.font,
+            dirty,
+            head,
         )
 
+    def _view_rows(self):
+        """Rows to show while looking back into the scrollback"""
+        width = self.screen_width
+        rows = []
+        for y in range(self.screen_height):
+            line = y - self._view_offset
+            if line >= 0:
+                rows.append(self._row(line))
+            else:
+                index = (self._sb_head + line) % self._sb_lines
+                rows.append(
+                    memoryview(self._scrollback)[index * width : (index + 1) * width]
+                )
+        self._mark_all_dirty()
+        # live rows never hold NUL bytes, so every row redraws when leaving
+        invalid = bytes(width)
+        for y in range(self.screen_height):
+            self._shown[y][:] = invalid
+        return rows
+
+    @property
+    def scrollback_lines(self) -> int:
+        """Number of lines currently held in the scrollback"""
+        return self._sb_count
+
+    def scroll_view(self, lines: int):
+        """
+        Move the view into the scrollback.
+
+        Args:
+            lines: Lines to scroll back (positive) or forward (negative);
+                the view returns to the live screen on the next write
+        """
+        offset = max(0, min(self._sb_count, self._view_offset + lines))
+        if offset != self._view_offset:
+            self._view_offset = offset
+            self._mark_all_dirty()
+            if self._render_enabled:
+                self._render_terminal()
+                self._needs_render = False
+                self._last_render_time = ticks_ms()
+
     def start_batch(self):
         """Start batch mode - accumulate writes without rendering"""
         self._batch_mode = True
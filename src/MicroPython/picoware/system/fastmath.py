@@ -0,0 +1,201 @@
+"""
+Integer math for animations.
+
+Angles are binary: a full turn is TURN (1024) steps, so wrapping is a mask
+instead of a modulo and a table lookup replaces every sin()/cos() call.
+Sines and cosines are Q14 fixed point (ONE = 16384 is 1.0), and scaling a
+length by one is a multiply and a shift:
+
+    x = cx + (cos(angle) * radius >> SHIFT)
+
+which is what mul_cos()/mul_sin() do. Tables are built once, on first
+import, from float math.
+
+Example:
+    from picoware.system.fastmath import degrees, mul_cos, mul_sin
+
+    angle = degrees(45)
+    x = center_x + mul_cos(angle, radius)
+    y = center_y + mul_sin(angle, radius)
+"""
+
+from micropython import const
+
+SHIFT = const(14)
+ONE = const(16384)  # 1.0 in Q14
+TURN = const(1024)  # binary angle units per full turn
+HALF_TURN = const(512)
+QUARTER_TURN = const(256)
+_MASK = const(1023)
+_ATAN_STEPS = const(128)  # resolution of the atan table over one octant
+
+
+def __build_tables():
+    """Return (sine table, atan table) as arrays."""
+    from array import array
+    from math import sin as fsin, atan as fatan, pi
+
+    step = 2 * pi / TURN
+    sines = array("h", (round(fsin(i * step) * ONE) for i in range(TURN)))
+    # atan(i / _ATAN_STEPS) for i in 0.._ATAN_STEPS, in angle units (0..128)
+    atans = array(
+        "h",
+        (round(fatan(i / _ATAN_STEPS) / step) for i in range(_ATAN_STEPS + 1)),
+    )
+    return sines, atans
+
+
+_SIN, _ATAN = __build_tables()
+
+
+def angle_diff(a: int, b: int) -> int:
+    """Return the signed shortest turn from b to a, in -HALF_TURN..HALF_TURN - 1."""
+    return ((a - b + HALF_TURN) & _MASK) - HALF_TURN
+
+
+def atan2(y: int, x: int) -> int:
+    """Return the angle of the vector (x, y) in binary angle units (0..TURN - 1)."""
+    if x == 0 and y == 0:
+        return 0
+    ax = -x if x < 0 else x
+    ay = -y if y < 0 else y
+    # angle within the first octant, then mirrored into place
+    if ax >= ay:
+        angle = _ATAN[(ay * _ATAN_STEPS + (ax >> 1)) // ax]
+    else:
+        angle = QUARTER_TURN - _ATAN[(ax * _ATAN_STEPS + (ay >> 1)) // ay]
+    if x < 0:
+        angle = HALF_TURN - angle
+    if y < 0:
+        angle = -angle
+    return angle & _MASK
+
+
+def benchmark(iterations: int = 2000) -> dict:
+    """
+    Time the lookups against float math on this board.
+
+    Returns a dict of microseconds per call for each case, e.g. from the REPL:
+
+        from picoware.system.fastmath import benchmark
+        print(benchmark())
+    """
+    from math import sin as fsin, sqrt as fsqrt
+    from utime import ticks_us, ticks_diff
+
+    def measure(function) -> float:
+        start = ticks_us()
+        function()
+        return ticks_diff(ticks_us(), start) / iterations
+
+    def float_sin():
+        total = 0.0
+        for i in range(iterations):
+            total += fsin(i * 0.0174533) * 20.0
+        return total
+
+    def table_sin():
+        total = 0
+        for i in range(iterations):
+            total += mul_sin(i, 20)
+        return total
+
+    def float_hypot():
+        total = 0.0
+        for i in range(iterations):
+            total += fsqrt(i * i + 400.0)
+        return total
+
+    def int_hypot():
+        total = 0
+        for i in range(iterations):
+            total += hypot(i, 20)
+        return total
+
+    def float_atan2():
+        from math import atan2 as fatan2
+
+        total = 0.0
+        for i in range(iterations):
+            total += fatan2(i - 1000, 300)
+        return total
+
+    def table_atan2():
+        total = 0
+        for i in range(iterations):
+            total += atan2(i - 1000, 300)
+        return total
+
+    return {
+        "float sin": measure(float_sin),
+        "table sin": measure(table_sin),
+        "float hypot": measure(float_hypot),
+        "int hypot": measure(int_hypot),
+        "float atan2": measure(float_atan2),
+        "table atan2": measure(table_atan2),
+    }
+
+
+def cos(angle: int) -> int:
+    """Return cos(angle) in Q14 (angle in binary units, any integer)."""
+    return _SIN[(angle + QUARTER_TURN) & _MASK]
+
+
+def degrees(deg) -> int:
+    """Convert degrees to binary angle units (not wrapped)."""
+    return int(deg * TURN // 360)
+
+
+def hypot(dx: int, dy: int) -> int:
+    """Return the integer length of (dx, dy)."""
+    return isqrt(dx * dx + dy * dy)
+
+
+def isqrt(n: int) -> int:
+    """Return floor(sqrt(n)) for a non-negative integer, exactly."""
+    if n <= 0:
+        return 0
+    # a (single precision) float estimate, refined so large values stay exact
+    r = int(n**0.5)
+    if n >> 24:
+        r = (r + n // r) >> 1
+        r = (r + n // r) >> 1
+    while r * r > n:
+        r -= 1
+    while (r + 1) * (r + 1) <= n:
+        r += 1
+    return r
+
+
+def mul_cos(angle: int, value: int) -> int:
+    """Return value * cos(angle) as an integer, rounded toward negative infinity."""
+    return (_SIN[(angle + QUARTER_TURN) & _MASK] * value) >> SHIFT
+
+
+def mul_sin(angle: int, value: int) -> int:
+    """Return value * sin(angle) as an integer, rounded toward negative infinity."""
+    return (_SIN[angle & _MASK] * value) >> SHIFT
+
+
+def radians(rad: float) -> int:
+    """Convert radians to binary angle units (not wrapped)."""
+    return int(rad * (TURN / 6.283185307179586))
+
+
+def sine_table():
+    """
+    Return the Q14 sine table (TURN entries) for tight loops.
+
+    Indexing it directly, e.g. table[(a + b) & (TURN - 1)], saves a call per lookup.
+    """
+    return _SIN
+
+
+def sin(angle: int) -> int:
+    """Return sin(angle) in Q14 (angle in binary units, any integer)."""
+    return _SIN[angle & _MASK]
+
+
+def to_degrees(angle: int) -> int:
+    """Convert binary angle units to whole degrees (0..359)."""
+    return (angle & _MASK) * 360 // TURN
@@ -0,0 +1,392 @@
+from micropython import const
+from utime import ticks_ms, ticks_diff
+
+FILE_OP_IDLE = const(0)
+FILE_OP_RUNNING = const(1)
+FILE_OP_DONE = const(2)
+FILE_OP_CANCELLED = const(3)
+FILE_OP_ERROR = const(4)
+
+FILE_OP_COPY = const(0)
+FILE_OP_MOVE = const(1)
+
+_SECTOR = const(512)
+
+
+class FileOperation:
+    """
+    Background copy/move engine for the SD card.
+
+    Directory trees are walked iteratively (no recursion) on a ThreadManager
+    task, data is streamed through one large sector-aligned buffer (which
+    lands in PSRAM on boards whose heap extends into it), and progress,
+    throughput and ETA are published for the UI to poll. Moves are done as
+    FAT renames where possible and fall back to copy + delete.
+
+    Example:
+        op = FileOperation(view_manager.storage, view_manager.thread_manager)
+        op.start(FILE_OP_COPY, [("/music", "/backup/music")])
+        while op.is_running:
+            loading.set_text(op.status_text)
+            ...
+    """
+
+    __slots__ = (
+        "_buffer",
+        "_buffer_size",
+        "_bytes_done",
+        "_bytes_total",
+        "_cancel",
+        "_current_file",
+        "_errors",
+        "_file_bytes_done",
+        "_file_bytes_total",
+        "_files_done",
+        "_files_total",
+        "_lock",
+        "_operation",
+        "_skip_errors",
+        "_start_ms",
+        "_state",
+        "_storage",
+        "_thread_manager",
+    )
+
+    def __init__(
+        self,
+        storage,
+        thread_manager=None,
+        buffer_size: int = 0,
+        skip_errors: bool = True,
+    ) -> None:
+        """
+        Initialize the engine.
+
+        Args:
+            storage: The Storage instance to operate on
+            thread_manager: ThreadManager to run on (a raw thread is used if None)
+            buffer_size: Copy buffer size in bytes (0 picks one based on PSRAM/free heap)
+            skip_errors: Record failing entries and continue instead of aborting
+        """
+        from _thread import allocate_lock
+
+        self._buffer = None
+        self._buffer_size = buffer_size
+        self._lock = allocate_lock()
+        self._skip_errors = skip_errors
+        self._storage = storage
+        self._thread_manager = thread_manager
+        self._state = FILE_OP_IDLE
+        self._operation = FILE_OP_COPY
+        self.__reset()
+
+    def __del__(self):
+        self.cancel()
+        self._buffer = None
+        self._errors = None
+
+    @property
+    def bytes_done(self) -> int:
+        """Bytes copied so far."""
+        return self._bytes_done
+
+    @property
+    def bytes_per_second(self) -> int:
+        """Average throughput since the operation started."""
+        elapsed = ticks_diff(ticks_ms(), self._start_ms)
+        if elapsed <= 0:
+            return 0
+        return (self._bytes_done * 1000) // elapsed
+
+    @property
+    def bytes_total(self) -> int:
+        """Total bytes to copy (known once the source trees were scanned)."""
+        return self._bytes_total
+
+    @property
+    def current_file(self) -> str:
+        """Path of the file currently being processed."""
+        return self._current_file
+
+    @property
+    def errors(self) -> list:
+        """List of (path, message) tuples for entries that failed."""
+        return self._errors
+
+    @property
+    def eta(self) -> int:
+        """Estimated seconds remaining, or -1 if unknown."""
+        rate = self.bytes_per_second
+        if rate <= 0 or self._bytes_total <= 0:
+            return -1
+        return max(0, self._bytes_total - self._bytes_done) // rate
+
+    @property
+    def file_progress(self) -> float:
+        """Progress of the current file (0.0 - 1.0)."""
+        if self._file_bytes_total <= 0:
+            return 0.0
+        return self._file_bytes_done / self._file_bytes_total
+
+    @property
+    def files_done(self) -> int:
+        """Number of files completed."""
+        return self._files_done
+
+    @property
+    def files_total(self) -> int:
+        """Number of files to process."""
+        return self._files_total
+
+    @property
+    def is_running(self) -> bool:
+        """True while the operation is in progress."""
+        with self._lock:
+            return self._state == FILE_OP_RUNNING
+
+    @property
+    def progress(self) -> float:
+        """Overall progress (0.0 - 1.0), by bytes when known, otherwise by files."""
+        if self._bytes_total > 0:
+            return min(1.0, self._bytes_done / self._bytes_total)
+        if self._files_total > 0:
+            return self._files_done / self._files_total
+        return 0.0
+
+    @property
+    def state(self) -> int:
+        """Current FILE_OP_* state."""
+        with self._lock:
+            return self._state
+
+    @property
+    def status_text(self) -> str:
+        """Short status line for the Loading overlay, e.g. "Copying 42% 1.2M/s 0:08"."""
+        verb = "Copying" if self._operation == FILE_OP_COPY else "Moving"
+        rate = self.__format_size(self.bytes_per_second)
+        text = f"{verb} {int(self.progress * 100)}% {rate}/s"
+        eta = self.eta
+        if eta >= 0:
+            text += f" {eta // 60}:{eta % 60:02}"
+        return text
+
+    def __format_size(self, value: int) -> str:
+        """Format a byte count as B/K/M."""
+        if value < 1024:
+            return f"{value}B"
+        if value < 1048576:
+            return f"{value // 1024}K"
+        return f"{value / 1048576:.1f}M"
+
+    def __reset(self) -> None:
+        """Reset the progress counters."""
+        self._bytes_done = 0
+        self._bytes_total = 0
+        self._cancel = False
+        self._current_file = ""
+        self._errors = []
+        self._file_bytes_done = 0
+        self._file_bytes_total = 0
+        self._files_done = 0
+        self._files_total = 0
+        self._start_ms = ticks_ms()
+
+    def __alloc_buffer(self) -> bytearray:
+        """Allocate the largest sector-aligned copy buffer that fits."""
+        if self._buffer is not None:
+            return self._buffer
+
+        from gc import collect, mem_free
+        from picoware.system.system import System
+
+        size = self._buffer_size
+        if size <= 0:
+            size = 64 * 1024 if System().has_psram else 16 * 1024
+        collect()
+        size = min(size, mem_free() // 4)
+        size = max(_SECTOR, size - size % _SECTOR)
+
+        while True:
+            try:
+                self._buffer = bytearray(size)
+                return self._buffer
+            except MemoryError:
+                if size <= _SECTOR:
+                    raise
+                size = max(_SECTOR, (size // 2) - (size // 2) % _SECTOR)
+
+    def __fail(self, path: str, error) -> bool:
+        """Record a failure. Returns True if the operation should continue."""
+        self._errors.append((path, str(error)))
+        return self._skip_errors
+
+    def __join(self, directory: str, name: str) -> str:
+        """Join a directory and a name."""
+        return f"/{name}" if directory in ("", "/") else f"{directory}/{name}"
+
+    def __scan(self, jobs: list) -> list:
+        """
+        Expand (source, destination) pairs into a flat plan without recursion.
+
+        Returns a list of (kind, source, destination, size) where kind is
+        "d" (create directory), "f" (copy file) or "r" (remove directory
+        after a move), ordered so parents are created before children and
+        removed after them.
+        """
+        storage = self._storage
+        plan = []
+        removals = []
+        stack = list(jobs)
+        while stack:
+            if self._cancel:
+                break
+            src, dst = stack.pop()
+            if storage.is_directory(src):
+                plan.append(("d", src, dst, 0))
+                if self._operation == FILE_OP_MOVE:
+                    removals.append(("r", src, dst, 0))
+                for name, is_dir, size in storage.iter_directory(src):
+                    if name in (".", ".."):
+                        continue
+                    child_src = self.__join(src, name)
+                    child_dst = self.__join(dst, name)
+                    if is_dir:
+                        stack.append((child_src, child_dst))
+                    else:
+                        plan.append(("f", child_src, child_dst, size))
+                        self._files_total += 1
+                        self._bytes_total += size
+            else:
+                size = storage.size(src)
+                plan.append(("f", src, dst, size))
+                self._files_total += 1
+                self._bytes_total += size
+        removals.reverse()
+        plan.extend(removals)
+        return plan
+
+    def __copy_file(self, src: str, dst: str, size: int) -> None:
+        """Stream one file through the shared buffer."""
+        storage = self._storage
+        buffer = self.__alloc_buffer()
+        view = memoryview(buffer)
+
+        self._file_bytes_done = 0
+        self._file_bytes_total = size
+
+        if storage.exists(dst):
+            storage.remove(dst)
+
+        source = storage.file_open(src)
+        if source is None:
+            raise OSError(f"cannot open {src}")
+        destination = storage.file_open(dst)
+        if destination is None:
+            storage.file_close(source)
+            raise OSError(f"cannot create {dst}")
+
+        try:
+            while not self._cancel:
+                count = storage.file_readinto(source, buffer)
+                if count <= 0:
+                    break
+                if not storage.file_write(destination, view[:count], "wb"):
+                    raise OSError(f"write failed on {dst}")
+                self._file_bytes_done += count
+                self._bytes_done += count
+        finally:
+            storage.file_close(source)
+            storage.file_close(destination)
+
+        if self._cancel:
+            storage.remove(dst)  # don't leave a truncated copy behind
+
+    def __worker(self, jobs: list) -> None:
+        """Thread body: scan, then process the plan."""
+        storage = self._storage
+        move = self._operation == FILE_OP_MOVE
+        try:
+            plan = self.__scan(jobs)
+            for kind, src, dst, size in plan:
+                if self._cancel:
+                    break
+                self._current_file = src
+                try:
+                    if kind == "d":
+                        if not storage.exists(dst) and not storage.mkdir(dst):
+                            raise OSError(f"cannot create {dst}")
+                    elif kind == "r":
+                        # keep directories that still hold entries that failed to move
+                        left = [n for n in storage.listdir(src) if n not in (".", "..")]
+                        if not left:
+                            storage.rmdir(src)
+                    else:
+                        if move:
+                            # a rename is a metadata-only operation on FAT32
+                            if storage.exists(dst):
+                                storage.remove(dst)
+                            if storage.move(src, dst):
+                                self._bytes_done += size
+                                self._files_done += 1
+                                continue
+                        self.__copy_file(src, dst, size)
+                        if move and not self._cancel:
+                            storage.remove(src)
+                        self._files_done += 1
+                except Exception as e:
+                    if not self.__fail(src, e):
+                        with self._lock:
+                            self._state = FILE_OP_ERROR
+                        return
+            with self._lock:
+                self._state = FILE_OP_CANCELLED if self._cancel else FILE_OP_DONE
+        except Exception as e:
+            self._errors.append(("", str(e)))
+            with self._lock:
+                self._state = FILE_OP_ERROR
+        finally:
+            self._current_file = ""
+            self._buffer = None  # release the (large) buffer between operations
+
+    def cancel(self) -> None:
+        """Request cancellation; the current file is removed if partially written."""
+        # the worker polls this between buffers, so a queued task still
+        # starts and finishes as cancelled instead of being skipped silently
+        self._cancel = True
+
+    def start(self, operation: int, jobs: list) -> bool:
+        """
+        Start copying or moving in the background.
+
+        Args:
+            operation: FILE_OP_COPY or FILE_OP_MOVE
+            jobs: List of (source_path, destination_path) tuples; directories are copied recursively
+
+        Returns:
+            True if the operation was started
+        """
+        with self._lock:
+            if self._state == FILE_OP_RUNNING:
+                return False
+            self._state = FILE_OP_RUNNING
+
+        self._operation = operation
+        self.__reset()
+
+        try:
+            if self._thread_manager is not None:
+                from picoware.system.thread import ThreadTask
+
+                self._thread_manager.add_task(
+                    ThreadTask("FileOperation", self.__worker, (list(jobs),))
+                )
+            else:
+                import _thread
+
+                _thread.start_new_thread(self.__worker, (list(jobs),))
+            return True
+        except Exception as e:
+            self._errors.append(("", str(e)))
+            with self._lock:
+                self._state = FILE_OP_ERROR
+            return False
@@ -20,11 +20,335 @@ HTTP_LOADING = const(1)
 HTTP_ISSUE = const(2)
 
 
+class HTTPCache:
+    """
+    On-SD cache for GET responses, revalidated with ETag / Last-Modified.
+
+    Response bodies are stored as files in one directory, with a small JSON
+    index holding each URL's validators, Cache-Control max-age, size and
+    last use. A fresh entry is served from disk without any network access;
+    a stale one is revalidated with If-None-Match / If-Modified-Since, so an
+    unchanged resource costs a header round trip (304) instead of a full
+    transfer. When the total size exceeds max_bytes the least recently used
+    entries are evicted.
+
+    Example:
+        http = HTTP(thread_manager=tm, cache=HTTPCache(view_manager.storage))
+        http.get_async(url, save_to_file="picoware/cache/list.json", storage=storage)
+    """
+
+    __slots__ = (
+        "_clock",
+        "_directory",
+        "_entries",
+        "_hits",
+        "_max_bytes",
+        "_max_entry",
+        "_misses",
+        "_revalidated",
+        "_storage",
+    )
+
+    def __init__(
+        self,
+        storage,
+        directory: str = "picoware/cache/http",
+        max_bytes: int = 512 * 1024,
+        max_entry: int = 128 * 1024,
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            storage: The Storage instance holding the cache
+            directory: Folder for the cached bodies and the index
+            max_bytes: Total size of the cached bodies before LRU eviction
+            max_entry: Largest body that is cached
+        """
+        self._storage = storage
+        self._directory = directory
+        self._max_bytes = max_bytes
+        self._max_entry = max_entry
+        self._entries = None  # loaded on first use
+        self._clock = 0
+        self._hits = 0
+        self._misses = 0
+        self._revalidated = 0
+
+    @property
+    def hits(self) -> int:
+        """Responses served from disk without contacting the server."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Responses that had to be transferred in full."""
+        return self._misses
+
+    @property
+    def revalidated(self) -> int:
+        """Responses served from disk after a 304 Not Modified."""
+        return self._revalidated
+
+    @property
+    def size(self) -> int:
+        """Total size of the cached bodies in bytes."""
+        return sum(entry[5] for entry in self.__index().values())
+
+    def __body_path(self, key: str) -> str:
+        """Return the file holding the body of an entry."""
+        return f"{self._directory}/{key}.bin"
+
+    def __copy(self, source: str, destination: str, storage) -> bool:
+        """Copy a file through a small buffer (the destination is replaced)."""
+        if storage.exists(destination):
+            storage.remove(destination)
+        src = storage.file_open(source)
+        if src is None:
+            return False
+        dst = storage.file_open(destination)
+        if dst is None:
+            storage.file_close(src)
+            return False
+        buffer = bytearray(2048)
+        view = memoryview(buffer)
+        try:
+            while True:
+                count = storage.file_readinto(src, buffer)
+                if count <= 0:
+                    break
+                storage.file_write(dst, view[:count], "wb")
+        finally:
+            storage.file_close(src)
+            storage.file_close(dst)
+        return True
+
+    def __evict(self, needed: int) -> None:
+        """Remove least recently used entries until needed bytes fit."""
+        entries = self.__index()
+        total = sum(entry[5] for entry in entries.values())
+        while entries and total + needed > self._max_bytes:
+            oldest = None
+            for key, entry in entries.items():
+                if oldest is None or entry[6] < entries[oldest][6]:
+                    oldest = key
+            total -= entries[oldest][5]
+            self.__remove(oldest)
+
+    def __header(self, headers: dict, name: str) -> str:
+        """Case-insensitive response header lookup."""
+        if headers:
+            for key in headers:
+                if key.lower() == name:
+                    return headers[key]
+        return ""
+
+    def __index(self) -> dict:
+        """Return the index, loading it from the SD card on first use."""
+        if self._entries is None:
+            self._entries = {}
+            path = f"{self._directory}/index.json"
+            if self._storage.exists(path):
+                try:
+                    from json import loads
+
+                    self._entries = loads(self._storage.read(path))
+                except Exception as e:
+                    print(f"HTTPCache: ignoring bad index: {e}")
+            for entry in self._entries.values():
+                self._clock = max(self._clock, entry[6])
+        return self._entries
+
+    def __key(self, url: str) -> str:
+        """Return the file name for a URL (32-bit FNV-1a hash)."""
+        h = 0x811C9DC5
+        for b in url.encode():
+            h = ((h ^ b) * 0x01000193) & 0xFFFFFFFF
+        return f"{h:08x}"
+
+    def __make_directory(self) -> None:
+        """Create the cache directory and any missing parent folders."""
+        parts = self._directory.split("/")
+        for i in range(1, len(parts) + 1):
+            path = "/".join(parts[:i])
+            if parts[i - 1] and not self._storage.exists(path):
+                self._storage.mkdir(path)
+
+    def __remove(self, key: str) -> None:
+        """Drop an entry and its body."""
+        path = self.__body_path(key)
+        if self._storage.exists(path):
+            self._storage.remove(path)
+        self.__index().pop(key, None)
+
+    def __save_index(self) -> None:
+        """Write the index back to the SD card."""
+        from json import dumps
+
+        self._storage.write(f"{self._directory}/index.json", dumps(self._entries))
+
+    def __serve(self, key: str, save_to_file, storage):
+        """Build a Response from a cached body (copied to save_to_file if given)."""
+        path = self.__body_path(key)
+        if save_to_file and storage:
+            if not self.__copy(path, save_to_file, storage):
+                return None
+            body = b""
+        else:
+            body = self._storage.read(path, "rb")
+        entry = self.__index()[key]
+        self._clock += 1
+        entry[6] = self._clock
+        response = Response(body)
+        response.status_code = 200
+        response.reason = "OK"
+        headers = {"X-Cache": "HIT"}
+        if entry[1]:
+            headers["ETag"] = entry[1]
+        if entry[2]:
+            headers["Last-Modified"] = entry[2]
+        response.headers = headers
+        return response
+
+    def __store(self, key: str, url: str, response, save_to_file, storage) -> None:
+        """Cache a 200 response if it carries validators or a max-age."""
+        headers = response.headers
+        control = self.__header(headers, "cache-control").lower()
+        if "no-store" in control:
+            return
+        max_age = 0
+        if "max-age=" in control and "no-cache" not in control:
+            try:
+                max_age = int(control.split("max-age=", 1)[1].split(",")[0])
+            except ValueError:
+                max_age = 0
+        etag = self.__header(headers, "etag")
+        modified = self.__header(headers, "last-modified")
+        if not etag and not modified and max_age <= 0:
+            return
+
+        path = self.__body_path(key)
+        if save_to_file and storage:
+            size = storage.size(save_to_file)
+        else:
+            size = len(response.content)
+        if size > self._max_entry:
+            self.__remove(key)
+            return
+        self.__remove(key)
+        self.__evict(size)
+
+        self.__make_directory()
+        if save_to_file and storage:
+            if not self.__copy(save_to_file, path, storage):
+                return
+        elif not self._storage.write(path, response.content, "wb"):
+            return
+
+        from time import time
+
+        self._clock += 1
+        self.__index()[key] = [url, etag, modified, time(), max_age, size, self._clock]
+
+    def clear(self) -> None:
+        """Remove every cached response."""
+        for key in list(self.__index()):
+            self.__remove(key)
+        self.__save_index()
+
+    def fetch(self, send, url: str, headers, timeout, save_to_file, storage):
+        """
+        Perform a GET through the cache.
+
+        Args:
+            send: Callable doing the network request, send(method, url, data, json_data, headers, stream, auth, timeout, parse_headers, uart, save_to_file, storage)
+            url: URL to request
+            headers: HTTP headers dict
+            timeout: Request timeout in seconds
+            save_to_file: File path to save response data to (requires storage)
+            storage: Storage object for file operations
+
+        Returns:
+            The Response (from the network or from disk)
+        """
+        from time import time
+
+        key = self.__key(url)
+        entry = self.__index().get(key)
+        if entry is not None and entry[0] != url:
+            entry = None  # hash collision, the new URL replaces the old one
+
+        if entry is not None:
+            age = time() - entry[3]
+            if 0 <= age < entry[4]:
+                response = self.__serve(key, save_to_file, storage)
+                if response is not None:
+                    self._hits += 1
+                    self.__save_index()
+                    return response
+            headers = dict(headers) if headers else {}
+            if entry[1]:
+                headers["If-None-Match"] = entry[1]
+            if entry[2]:
+                headers["If-Modified-Since"] = entry[2]
+
+        response = send(
+            "GET",
+            url,
+            None,
+            None,
+            headers,
+            None,
+            None,
+            timeout,
+            True,
+            None,
+            save_to_file,
+            storage,
+        )
+        if response is None:
+            return None
+
+        if response.status_code == 304 and entry is not None:
+            control = self.__header(response.headers, "cache-control").lower()
+            if "max-age=" in control:
+                try:
+                    entry[4] = int(control.split("max-age=", 1)[1].split(",")[0])
+                except ValueError:
+                    pass
+            entry[3] = time()
+            cached = self.__serve(key, save_to_file, storage)
+            if cached is not None:
+                self._revalidated += 1
+                self.__save_index()
+                return cached
+            self.__remove(key)
+        elif response.status_code == 200:
+            self._misses += 1
+            self.__store(key, url, response, save_to_file, storage)
+            self.__save_index()
+        return response
+
+
 class HTTP:
     """HTTP class for making HTTP requests."""
 
-    def __init__(self, chunk_size: int = (1024 * 4), thread_manager=None) -> None:
-        """Initialize the HTTP class."""
+    def __init__(
+        self,
+        chunk_size: int = (1024 * 4),
+        thread_manager=None,
+        keep_alive: bool = False,
+        cache: HTTPCache = None,
+    ) -> None:
+        """
+        Initialize the HTTP class.
+
+        Args:
+            chunk_size: Read size used when streaming a response body
+            thread_manager: ThreadManager used for async requests (a raw thread is used if None)
+            keep_alive: Keep the connection open between requests to the same host
+            cache: HTTPCache used for GET requests (None disables caching)
+        """
         from _thread import allocate_lock
 
         self._async_request_complete = False
@@ -39,12 +363,29 @@ class HTTP:
         self._chunk_size = chunk_size
         self._thread_manager = thread_manager
         self._current_task = None
+        self._keep_alive = keep_alive
+        self._cache = cache
+        self._socket = None
+        self._socket_key = None
+        self._bytes_received = 0
+        self._bytes_total = 0
 
     def __del__(self):
         """Destructor to clean up resources."""
         self.close()
+        self.disconnect()
         self._lock = None
 
+    @property
+    def cache(self) -> HTTPCache:
+        """Get the HTTPCache used for GET requests (None if caching is off)."""
+        return self._cache
+
+    @cache.setter
+    def cache(self, value: HTTPCache):
+        """Set the HTTPCache used for GET requests (None turns caching off)."""
+        self._cache = value
+
     @property
     def callback(self) -> callable:
         """Get the async callback function."""
@@ -88,6 +429,16 @@ class HTTP:
         with self._lock:
             return self._async_request_complete and self._async_error is None
 
+    @property
+    def progress(self) -> tuple:
+        """
+        Get (bytes received, total bytes) of the response body being read.
+
+        The total is 0 when the server did not send a Content-Length.
+        Safe to poll from the UI while an async request runs.
+        """
+        return self._bytes_received, self._bytes_total
+
     @property
     def response(self):
         """Get the async Response object."""
@@ -174,6 +525,16 @@ class HTTP:
             storage=storage,
         )
 
+    def disconnect(self) -> None:
+        """Close the kept-alive connection, if any, aborting a pending read on it."""
+        if self._socket is not None:
+            try:
+                self._socket.close()
+            except Exception:
+                pass
+        self._socket = None
+        self._socket_key = None
+
     def get(
         self, url, headers=None, timeout: float = 10.0, save_to_file=None, storage=None
     ) -> Response:
@@ -646,6 +1007,7 @@ class HTTP:
                     break
                 # Read the chunk data
                 chunk = s.read(chunk_size)
+                self._bytes_received += len(chunk)
                 if uart:
                     uart.write(chunk)
                     uart.flush()
@@ -709,8 +1071,45 @@ class HTTP:
             save_to_file: File path to save response data to (requires storage)
             storage: Storage object for file operations
         """
+        if self._cache is not None and method == "GET" and uart is None:
+            return self._cache.fetch(
+                self.__request, url, headers, timeout, save_to_file, storage
+            )
+        return self.__request(
+            method,
+            url,
+            data,
+            json_data,
+            headers,
+            stream,
+            auth,
+            timeout,
+            parse_headers,
+            uart,
+            save_to_file,
+            storage,
+        )
+
+    def __request(
+        self,
+        method,
+        url,
+        data=None,
+        json_data=None,
+        headers=None,
+        stream=None,
+        auth=None,
+        timeout=None,
+        parse_headers=True,
+        uart=None,
+        save_to_file=None,
+        storage=None,
+    ) -> Response:
+        """Send the request over the network (see request())."""
         with self._lock:
             self._running = True
+        self._bytes_received = 0
+        self._bytes_total = 0
 
         # Ensure headers is a dict
         if headers is None:
@@ -750,35 +1149,51 @@ class HTTP:
         if not self._should_continue():
             return
 
-        ai = usocket.getaddrinfo(host, port, 0, usocket.SOCK_STREAM)
-        ai = ai[0]
+        # reuse the kept-alive connection when it points at the same server
+        key = (proto, host, port)
+        reused = False
+        if self._socket is not None:
+            if self._socket_key == key:
+                s = self._socket
+                reused = True
+            else:
+                self.disconnect()
 
         resp_d = {}
         if parse_headers is False:
             resp_d = None
 
-        if not self._should_continue():
-            return
+        if not reused:
+            ai = usocket.getaddrinfo(host, port, 0, usocket.SOCK_STREAM)
+            ai = ai[0]
 
-        s = usocket.socket(ai[0], usocket.SOCK_STREAM, ai[2])
+            if not self._should_continue():
+                return
 
-        if timeout is not None:
-            # Note: settimeout is not supported on all platforms, will raise
-            # an AttributeError if not available.
-            try:
-                s.settimeout(timeout)
-            except AttributeError:
-                pass
+            s = usocket.socket(ai[0], usocket.SOCK_STREAM, ai[2])
+
+            if timeout is not None:
+                # Note: settimeout is not supported on all platforms, will raise
+                # an AttributeError if not available.
+                try:
+                    s.settimeout(timeout)
+                except AttributeError:
+                    pass
 
         try:
             if not self._should_continue():
                 s.close()
                 return
-            s.connect(ai[-1])
-            if proto == "https:":
-                _context = tls.SSLContext(tls.PROTOCOL_TLS_CLIENT)
-                _context.verify_mode = tls.CERT_NONE
-                s = _context.wrap_socket(s, server_hostname=host)
+            if not reused:
+                s.connect(ai[-1])
+                if proto == "https:":
+                    _context = tls.SSLContext(tls.PROTOCOL_TLS_CLIENT)
+                    _context.verify_mode = tls.CERT_NONE
+                    s = _context.wrap_socket(s, server_hostname=host)
+                if self._keep_alive:
+                    # track it straight away so disconnect() can abort a pending read
+                    self._socket = s
+                    self._socket_key = key
             s.write(b"%s /%s HTTP/1.1\r\n" % (method, path))
             if "Host" not in headers:
                 s.write(b"Host: %s\r\n" % host)
@@ -797,7 +1212,10 @@ class HTTP:
                     s.write(b"Transfer-Encoding: chunked\r\n")
                 else:
                     s.write(b"Content-Length: %d\r\n" % len(data))
-            s.write(b"Connection: close\r\n\r\n")
+            if self._keep_alive:
+                s.write(b"Connection: keep-alive\r\n\r\n")
+            else:
+                s.write(b"Connection: close\r\n\r\n")
             if data:
                 if chunked_data:
                     for chunk in data:
@@ -810,6 +1228,9 @@ class HTTP:
 
             # Read the status line
             l = s.readline()
+            if not l and reused:
+                raise OSError("kept-alive connection was closed")
+            reused = False  # the server answered, a failure from here on is not retried
             l = l.split(None, 2)
             if len(l) < 2:
                 # Invalid response
@@ -820,6 +1241,7 @@ class HTTP:
                 reason = l[2].rstrip()
             transfer_encoding = None
             content_length = None
+            server_close = False
             while True:
                 if not self._should_continue():
                     s.close()
@@ -832,6 +1254,8 @@ class HTTP:
                         transfer_encoding = "chunked"
                 elif l.startswith(b"Content-Length:"):
                     content_length = int(l.split(b":", 1)[1].strip())
+                elif l.lower().startswith(b"connection:") and b"close" in l.lower():
+                    server_close = True
                 elif l.startswith(b"Location:") and not 200 <= status <= 299:
                     if status in [301, 302, 303, 307, 308]:
                         redirect = str(l[10:-2], "utf-8")
@@ -852,12 +1276,17 @@ class HTTP:
                 s.close()
                 return
 
+            if status in (204, 304):
+                content_length = 0  # never followed by a body
+            self._bytes_total = content_length or 0
+
             # Read body
             if transfer_encoding == "chunked":
                 body = self.read_chunked(s, uart, method, save_to_file, storage)
             elif content_length is not None:
                 if not uart and not save_to_file:
                     body = s.read(content_length)
+                    self._bytes_received = len(body)
                 elif save_to_file and storage:
                     # Save directly to file
                     file = storage.file_open(save_to_file)
@@ -886,6 +1315,7 @@ class HTTP:
                                     raise e
                                 sleep_ms(10)
                         content_length -= actual_len
+                        self._bytes_received += actual_len
                     storage.file_close(file)
 
                     body = b""
@@ -908,6 +1338,7 @@ class HTTP:
                         uart.write(chunk)
                         uart.flush()
                         content_length -= actual_len
+                        self._bytes_received += actual_len
                     uart.flush()
                     uart.write("\n")
                     uart.write(f"[{method}/END]")
@@ -915,6 +1346,7 @@ class HTTP:
                 # Read until the socket is closed
                 if not uart and not save_to_file:
                     body = s.read()
+                    self._bytes_received = len(body)
                 elif save_to_file and storage:
                     # Save directly to file
                     file = storage.file_open(save_to_file)
@@ -925,6 +1357,7 @@ class HTTP:
                         chunk = s.read(self._chunk_size)
                         if not chunk:
                             break
+                        self._bytes_received += len(chunk)
                         # Write with retry
                         retries = 10
                         while retries > 0:
@@ -947,12 +1380,29 @@ class HTTP:
                         chunk = s.read(self._chunk_size)
                         if not chunk:
                             break
+                        self._bytes_received += len(chunk)
                         uart.write(chunk)
                         uart.flush()
                     uart.flush()
                     uart.write("\n")
                     uart.write(f"[{method}/END]")
 
+            if self._keep_alive:
+                # the connection can only be reused if the body was fully read
+                if (
+                    not redirect
+                    and not server_close
+                    and (transfer_encoding == "chunked" or content_length is not None)
+                    and self._should_continue()
+                ):
+                    self._socket = s
+                    self._socket_key = key
+                else:
+                    s.close()
+                    if s is self._socket:
+                        self._socket = None
+                        self._socket_key = None
+
             if redirect:
                 s.close()
                 if status in [301, 302, 303]:
@@ -985,6 +1435,25 @@ class HTTP:
 
         except OSError:
             s.close()
+            if s is self._socket:
+                self._socket = None
+                self._socket_key = None
+                if reused:
+                    # the server dropped the idle connection; retry once on a new one
+                    return self.request(
+                        method,
+                        url,
+                        data if json_data is None else None,
+                        json_data,
+                        headers,
+                        stream,
+                        auth,
+                        timeout,
+                        parse_headers,
+                        uart,
+                        save_to_file,
+                        storage,
+                    )
             raise
 
     def request_async(
@@ -0,0 +1,350 @@
+from micropython import const
+
+_QUOTE = const(0x22)
+_COMMA = const(0x2C)
+_COLON = const(0x3A)
+_LBRACE = const(0x7B)
+_RBRACE = const(0x7D)
+_LBRACKET = const(0x5B)
+_RBRACKET = const(0x5D)
+_SPACE = const(0x20)
+
+
+class JSONStream:
+    """
+    Streaming JSON reader with path-based selection.
+
+    The document is read through one fixed-size buffer from a file on the
+    SD card or from any object with readinto() (a socket, a stream), and
+    only the values matching a selector are materialised, one at a time.
+    Everything else, including whole subtrees that no selector can reach,
+    is skipped without being decoded, so memory use depends on the largest
+    selected item rather than on the size of the response.
+
+    Selectors are dotted paths where [n] picks an array element and [*]
+    (or *) matches any element or key:
+
+        "success"          top-level value
+        "tree[*]"          every element of the "tree" array
+        "tree[*].path"     the "path" of every element
+        "query.pages.*"    every value of the "pages" object
+
+    Example:
+        stream = JSONStream("picoware/github/info.json", storage)
+        for path in stream.items("tree[*].path"):
+            print(path)
+        stream.close()
+    """
+
+    __slots__ = (
+        "_buffer",
+        "_bytes_read",
+        "_capture",
+        "_capture_from",
+        "_end",
+        "_file",
+        "_max_item",
+        "_pos",
+        "_reader",
+        "_storage",
+    )
+
+    def __init__(
+        self,
+        source,
+        storage=None,
+        buffer_size: int = 1024,
+        max_item: int = 4096,
+    ) -> None:
+        """
+        Initialize the reader.
+
+        Args:
+            source: File path (when storage is given) or an object with readinto(buffer)
+            storage: The Storage instance to read the file from
+            buffer_size: Size of the read buffer in bytes
+            max_item: Largest selected value (or key) in bytes; bigger ones raise ValueError
+        """
+        self._storage = storage
+        self._file = None
+        self._reader = None
+        if storage is not None:
+            if not storage.exists(source):
+                raise OSError(f"{source} not found")
+            self._file = storage.file_open(source)
+            if self._file is None:
+                raise OSError(f"cannot open {source}")
+        else:
+            self._reader = source
+        self._buffer = bytearray(buffer_size)
+        self._bytes_read = 0
+        self._capture = None
+        self._capture_from = 0
+        self._end = 0
+        self._max_item = max_item
+        self._pos = 0
+
+    def __del__(self):
+        self.close()
+        self._buffer = None
+
+    @property
+    def bytes_read(self) -> int:
+        """Bytes consumed from the source so far (for progress display)."""
+        return self._bytes_read
+
+    def __capture_begin(self, start: int) -> None:
+        """Start recording the raw bytes from a buffer position."""
+        self._capture = bytearray()
+        self._capture_from = start
+
+    def __capture_end(self) -> bytearray:
+        """Stop recording and return the raw bytes up to the read position."""
+        self.__keep(self._pos)
+        data = self._capture
+        self._capture = None
+        return data
+
+    def __fill(self) -> bool:
+        """Read the next block into the buffer. Returns False at the end of input."""
+        if self._capture is not None:
+            self.__keep(self._end)
+            self._capture_from = 0
+        if self._file is not None:
+            count = self._storage.file_readinto(self._file, self._buffer)
+        else:
+            count = self._reader.readinto(self._buffer)
+        if not count or count < 0:
+            count = 0
+        self._pos = 0
+        self._end = count
+        self._bytes_read += count
+        return count > 0
+
+    def __keep(self, upto: int) -> None:
+        """Append the buffer bytes being recorded to the capture."""
+        if upto > self._capture_from:
+            self._capture.extend(memoryview(self._buffer)[self._capture_from : upto])
+            if len(self._capture) > self._max_item:
+                self._capture = None
+                raise ValueError("JSON value larger than max_item")
+        self._capture_from = upto
+
+    def __match(self, paths: list, keys: list, prefix: bool) -> int:
+        """
+        Return the index of the first selector matching the current path, or -1.
+
+        With prefix=True a selector only has to continue below the path.
+        """
+        depth = len(keys)
+        for i, path in enumerate(paths):
+            if len(path) < depth or (len(path) == depth) == prefix:
+                continue
+            j = 0
+            while j < depth and (path[j] is None or path[j] == keys[j]):
+                j += 1
+            if j == depth:
+                return i
+        return -1
+
+    def __next(self) -> int:
+        """Return the next byte that is not whitespace, or -1 at the end of input."""
+        buffer = self._buffer
+        while True:
+            pos = self._pos
+            end = self._end
+            while pos < end:
+                c = buffer[pos]
+                pos += 1
+                if c > _SPACE:
+                    self._pos = pos
+                    return c
+            self._pos = pos
+            if not self.__fill():
+                return -1
+
+    def __parse_selector(self, selector: str) -> list:
+        """Split "a.b[*].c" into ["a", "b", None, "c"] (None matches anything)."""
+        path = []
+        for part in selector.split("."):
+            name, _, rest = part.partition("[")
+            if name:
+                path.append(None if name == "*" else name)
+            while rest:
+                index, _, rest = rest.partition("]")
+                path.append(None if index == "*" else int(index))
+                rest = rest[1:] if rest.startswith("[") else rest
+        return path
+
+    def __skip_container(self) -> None:
+        """Skip to the end of the object/array whose opening bracket was just read."""
+        buffer = self._buffer
+        depth = 1
+        while depth:
+            pos = self._pos
+            end = self._end
+            quote = False
+            while pos < end:
+                c = buffer[pos]
+                pos += 1
+                if c == _QUOTE:
+                    quote = True
+                    break
+                if c == _LBRACE or c == _LBRACKET:
+                    depth += 1
+                elif c == _RBRACE or c == _RBRACKET:
+                    depth -= 1
+                    if not depth:
+                        break
+            self._pos = pos
+            if quote:
+                self.__skip_string()
+            elif depth and not self.__fill():
+                raise ValueError("unexpected end of JSON")
+
+    def __skip_literal(self) -> None:
+        """Skip the rest of a number, true, false or null."""
+        buffer = self._buffer
+        while True:
+            pos = self._pos
+            end = self._end
+            while pos < end:
+                c = buffer[pos]
+                if c <= _SPACE or c == _COMMA or c == _RBRACE or c == _RBRACKET:
+                    self._pos = pos
+                    return
+                pos += 1
+            self._pos = pos
+            if not self.__fill():
+                return
+
+    def __skip_string(self) -> None:
+        """Skip to just past the closing quote of the string being read."""
+        buffer = self._buffer
+        while True:
+            pos = self._pos
+            end = self._end
+            quote = buffer.find(b'"', pos, end)
+            escape = buffer.find(b"\\", pos, quote if quote >= 0 else end)
+            if escape >= 0:
+                # skip the escaped byte, which may be the first of the next block
+                pos = escape + 2
+                if pos > end:
+                    self._pos = end
+                    if not self.__fill():
+                        raise ValueError("unterminated JSON string")
+                    pos = 1
+                self._pos = pos
+                continue
+            if quote >= 0:
+                self._pos = quote + 1
+                return
+            self._pos = end
+            if not self.__fill():
+                raise ValueError("unterminated JSON string")
+
+    def __value(self, first: int, capture: bool):
+        """Consume the value starting with the byte just read, optionally returning its raw bytes."""
+        if capture:
+            self.__capture_begin(self._pos - 1)
+        if first == _QUOTE:
+            self.__skip_string()
+        elif first == _LBRACE or first == _LBRACKET:
+            self.__skip_container()
+        else:
+            self.__skip_literal()
+        return self.__capture_end() if capture else None
+
+    def close(self) -> None:
+        """Close the file (sockets and streams are left to the caller)."""
+        if self._file is not None:
+            try:
+                self._storage.file_close(self._file)
+            except Exception:
+                pass
+            self._file = None
+        self._reader = None
+
+    def each(self, selector: str, callback) -> int:
+        """
+        Call callback(value) for every value matching the selector.
+
+        Args:
+            selector: Path selector, e.g. "tree[*].path"
+            callback: Called with each decoded value; returning False stops reading
+
+        Returns:
+            Number of values passed to the callback
+        """
+        count = 0
+        for value in self.items(selector):
+            count += 1
+            if callback(value) is False:
+                break
+        return count
+
+    def first(self, selector: str, default=None):
+        """Return the first value matching the selector (reading stops there)."""
+        for value in self.items(selector):
+            return value
+        return default
+
+    def items(self, selector: str):
+        """Yield every value matching the selector, in document order."""
+        for _, value in self.select((selector,)):
+            yield value
+
+    def select(self, selectors):
+        """
+        Yield (selector_index, value) for values matching any of the selectors.
+
+        The document is read once, so several paths can be collected in a
+        single pass (e.g. ("success", "apps[*]")). A matched value is returned
+        whole and is not searched for the other selectors.
+
+        Args:
+            selectors: List or tuple of path selectors
+        """
+        from json import loads
+
+        paths = [self.__parse_selector(s) for s in selectors]
+        keys = []  # current path: key (str) or index (int) per level
+        objects = []  # True where the level is an object
+        expect_key = False
+
+        while True:
+            c = self.__next()
+            if c < 0:
+                return
+            if c == _COMMA:
+                if objects[-1]:
+                    expect_key = True
+                else:
+                    keys[-1] += 1
+                continue
+            if c == _COLON:
+                continue
+            if c == _RBRACE or c == _RBRACKET:
+                keys.pop()
+                objects.pop()
+                expect_key = False
+                continue
+            if expect_key:
+                raw = self.__value(c, True)
+                keys[-1] = loads(raw) if b"\\" in raw else str(raw[1:-1], "utf-8")
+                expect_key = False
+                continue
+
+            # a value starts here
+            match = self.__match(paths, keys, False)
+            if match >= 0:
+                yield match, loads(self.__value(c, True))
+            elif c == _LBRACE or c == _LBRACKET:
+                if self.__match(paths, keys, True) >= 0:
+                    objects.append(c == _LBRACE)
+                    keys.append(None if c == _LBRACE else 0)
+                    expect_key = c == _LBRACE
+                else:
+                    self.__skip_container()  # no selector reaches inside
+            else:
+                self.__value(c, False)
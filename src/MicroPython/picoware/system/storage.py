@@ -40,15 +40,37 @@ class Storage:
     Class to control the storage on a Raspberry Pi Pico device.
     """
 
-    __slots__ = ("_vfs_mounted", "_has_storage")
-
-    def __init__(self):
+    __slots__ = (
+        "_vfs_mounted",
+        "_has_storage",
+        "_dir_cache",
+        "_dir_cache_keys",
+        "_dir_cache_size",
+        "_open_files",
+        "_written_files",
+    )
+
+    def __init__(self, dir_cache_size: int = 8):
         """
         Initialize the storage class.
+
+        Args:
+            dir_cache_size: Number of directory listings kept in the LRU cache
+                used by read_directory/listdir (0 disables caching)
         """
         self._vfs_mounted = False
         self._has_storage = True
 
+        # normalized path -> read_directory entries
+        self._dir_cache = {}
+        # cached paths, least recently used first
+        self._dir_cache_keys = []
+        self._dir_cache_size = dir_cache_size
+        # id(handle) -> path of files opened with file_open, and the ids of
+        # those written to, whose parent listing is dropped on file_close
+        self._open_files = {}
+        self._written_files = set()
+
         if BOARD_ID in (
             BOARD_WAVESHARE_1_28_RP2350,
             BOARD_CROWPANEL_10_1,
@@ -84,6 +106,67 @@ class Storage:
             return "/sdcard"
         return "/sd"
 
+    def _dir_key(self, path: str) -> str:
+        """Normalize a directory path into a cache key ("", "/a/" and "a" style paths collapse)."""
+        return "/" + path.strip("/")
+
+    def _dir_cache_get(self, path: str):
+        """Return the cached entries for a directory (marking it most recently used) or None."""
+        key = self._dir_key(path)
+        entries = self._dir_cache.get(key)
+        if entries is not None:
+            keys = self._dir_cache_keys
+            if keys[-1] != key:
+                keys.remove(key)
+                keys.append(key)
+        return entries
+
+    def _dir_cache_put(self, path: str, entries: list) -> None:
+        """Store a directory listing, evicting the least recently used one if full."""
+        if self._dir_cache_size <= 0:
+            return
+        key = self._dir_key(path)
+        keys = self._dir_cache_keys
+        if key in self._dir_cache:
+            keys.remove(key)
+        elif len(keys) >= self._dir_cache_size:
+            del self._dir_cache[keys.pop(0)]
+        self._dir_cache[key] = entries
+        keys.append(key)
+
+    def _dir_changed(self, path: str, subtree: bool = False) -> None:
+        """
+        Invalidate the cached listing of the directory containing path.
+
+        Args:
+            path: The file or directory that was created, modified or removed
+            subtree: Also drop cached listings of path itself and everything below it
+        """
+        if not self._dir_cache:
+            return
+        key = self._dir_key(path)
+        parent = key.rsplit("/", 1)[0] or "/"
+        cache = self._dir_cache
+        keys = self._dir_cache_keys
+        if parent in cache:
+            del cache[parent]
+            keys.remove(parent)
+        if subtree:
+            prefix = key + "/"
+            for k in [k for k in keys if k == key or k.startswith(prefix)]:
+                del cache[k]
+                keys.remove(k)
+
+    def clear_cache(self) -> None:
+        """
+        Drop all cached directory listings.
+
+        Call this after changing the SD card through the VFS (open(), os.*),
+        which bypasses this class and therefore its cache invalidation.
+        """
+        self._dir_cache.clear()
+        self._dir_cache_keys.clear()
+
     def copy(
         self, source_path: str, destination_path: str, bytes_per_chunk: int = 2048
     ) -> bool:
@@ -91,6 +174,7 @@ class Storage:
         if not self._has_storage:
             return False  # No SD storage on this board
 
+        self._dir_changed(destination_path, True)
         try:
             sd_mp.copy(source_path, destination_path, bytes_per_chunk)
             return True
@@ -105,6 +189,7 @@ class Storage:
         if not self._has_storage:
             return
 
+        self._dir_changed(file_path)
         try:
             json_str = dumps(json_dict)
             sd_mp.write(file_path, json_str.encode("utf-8"), True)
@@ -131,6 +216,12 @@ class Storage:
         """Close the storage and release resources."""
         if not self._has_storage:
             return  # No SD storage on this board
+        key = id(file_obj)
+        path = self._open_files.pop(key, None)
+        if key in self._written_files:
+            self._written_files.discard(key)
+            if path is not None:
+                self._dir_changed(path)
         sd_mp.file_close(file_obj)
 
     def file_copy(
@@ -140,6 +231,7 @@ class Storage:
         if not self._has_storage:
             return False  # No SD storage on this board
 
+        self._dir_changed(destination_path, True)
         try:
             sd_mp.file_copy(source_file, destination_path, bytes_per_chunk)
             return True
@@ -154,6 +246,8 @@ class Storage:
         if not self._has_storage:
             return False  # No SD storage on this board
 
+        # the source path of an open file is unknown, so drop every listing
+        self.clear_cache()
         try:
             sd_mp.file_move(source_file, destination_path, bytes_per_chunk)
             return True
@@ -166,11 +260,23 @@ class Storage:
         if not self._has_storage:
             return None  # No SD storage on this board
 
+        # file_open creates missing files, which changes the parent listing
+        parent, name = self._dir_key(file_path).rsplit("/", 1)
+        cached = self._dir_cache_get(parent or "/")
+        if cached is not None:
+            if not any(entry["filename"] == name for entry in cached):
+                self._dir_changed(file_path)
+
         try:
-            return sd_mp.file_open(file_path)
+            file_obj = sd_mp.file_open(file_path)
         except Exception as e:
             print(f"Error opening file {file_path}: {e}")
             return None
+        if file_obj is not None:
+            key = id(file_obj)
+            self._open_files[key] = file_path
+            self._written_files.discard(key)
+        return file_obj
 
     def file_read(
         self, file_obj: FAT32File, index: int = 0, count: int = 0, decode: bool = True
@@ -209,6 +315,12 @@ class Storage:
         if not self._has_storage:
             return False  # Waveshare SD module does not support file write yet
 
+        # the cached entry size goes stale: drop the parent listing once, on close
+        key = id(file_obj)
+        if key in self._open_files:
+            self._written_files.add(key)
+        else:
+            self.clear_cache()  # not opened through file_open, the path is unknown
         try:
             if mode in ("w", "a"):
                 sd_mp.file_write(file_obj, data.encode("utf-8"))
@@ -226,9 +338,39 @@ class Storage:
 
         return sd_mp.is_directory(path)
 
+    def iter_directory(self, path: str = ""):
+        """
+        Yield (filename, is_directory, size) for each entry of a directory.
+
+        Uses the cached listing when there is one; otherwise, if the VFS is
+        mounted, streams entries with os.ilistdir so large directories are
+        never materialized as a list of dicts. Falls back to read_directory.
+
+        Args:
+            path: Directory path to list (default: "")
+        """
+        if not self._has_storage:
+            return  # No SD storage on this board
+
+        if self._vfs_mounted and self._dir_cache_get(path) is None:
+            from os import ilistdir
+
+            key = self._dir_key(path)
+            for entry in ilistdir(
+                self.vfs_prefix + key if key != "/" else self.vfs_prefix
+            ):
+                is_dir = entry[1] == 0x4000
+                yield entry[0], is_dir, entry[3] if len(entry) > 3 and not is_dir else 0
+            return
+
+        for entry in self.read_directory(path):
+            yield entry["filename"], entry["is_directory"], entry["size"]
+
     def listdir(self, path: str = "") -> list[str]:
         """List files in a directory.
 
+        Served from the directory cache when the listing is already cached.
+
         Args:
             path: Directory path to list (default: "")
 
@@ -238,6 +380,10 @@ class Storage:
         if not self._has_storage:
             return []  # Waveshare SD module does not support listdir yet
 
+        cached = self._dir_cache_get(path)
+        if cached is not None:
+            return [entry["filename"] for entry in cached]
+
         try:
             return sd_mp.list_directory(path)
         except Exception as e:
@@ -250,6 +396,7 @@ class Storage:
             if not self._has_storage:
                 return False  # No SD storage on this board
 
+            self._dir_changed(path)
             return sd_mp.create_directory(path)
         except Exception as e:
             print(f"Error creating directory {path}: {e}")
@@ -259,6 +406,7 @@ class Storage:
         """Mount the SD card."""
         if not self._has_storage:
             return False  # No SD storage on this board
+        self.clear_cache()
         try:
             return sd_mp.mount()
         except Exception as e:
@@ -320,6 +468,8 @@ class Storage:
         if not self._has_storage:
             return False  # No SD storage on this board
 
+        self._dir_changed(source_path, True)
+        self._dir_changed(destination_path, True)
         try:
             sd_mp.move(source_path, destination_path)
             return True
@@ -390,7 +540,7 @@ class Storage:
             print(f"Error reading chunk from file {file_path}: {e}")
             return b""
 
-    def read_directory(self, path: str = "") -> list[dict]:
+    def read_directory(self, path: str = "", use_cache: bool = True) -> list[dict]:
         """
         Read the contents of a directory and return a list of entries.
         Each entry is a dictionary containing:
@@ -400,12 +550,27 @@ class Storage:
             - time: The last modified time of the file or directory
             - attributes: The file attributes (e.g., read-only, hidden, system, etc)
             - is_directory: True if the entry is a directory, False if it's a file
+
+        Listings are kept in an LRU cache that the mutating methods of this
+        class invalidate, so repeated reads skip the FAT32 walk. The returned
+        list is a copy, but the entry dicts are shared and must not be modified.
+
+        Args:
+            path: Directory path to read (default: "")
+            use_cache: Set to False to force a fresh read from the card
         """
         if not self._has_storage:
             return []  # No SD storage on this board
 
+        if use_cache:
+            cached = self._dir_cache_get(path)
+            if cached is not None:
+                return list(cached)
+
         try:
-            return sd_mp.read_directory(path)
+            entries = sd_mp.read_directory(path)
+            self._dir_cache_put(path, entries)
+            return list(entries)
         except Exception as e:
             print(f"Error reading directory {path}: {e}")
             return []
@@ -414,12 +579,15 @@ class Storage:
         """Remove a file or directory."""
         if not self._has_storage:
             return False  # No SD storage on this board
+        self._dir_changed(file_path, True)
         return sd_mp.remove(file_path)
 
     def rename(self, old_path: str, new_path: str) -> bool:
         """Rename a file or directory."""
         if not self._has_storage:
             return False  # No SD storage on this board
+        self._dir_changed(old_path, True)
+        self._dir_changed(new_path, True)
         try:
             return sd_mp.rename(old_path, new_path)
         except Exception as e:
@@ -430,6 +598,7 @@ class Storage:
         """Remove a directory."""
         if not self._has_storage:
             return False  # No SD storage on this board
+        self._dir_changed(path, True)
         return sd_mp.remove(path)
 
     def serialize(self, file_path: str) -> dict:
@@ -456,6 +625,7 @@ class Storage:
         if not self._has_storage:
             return False  # No SD storage on this board
 
+        self._dir_changed(file_path)
         try:
             if mode == "w":
                 return sd_mp.write(file_path, data.encode("utf-8"), True)
@@ -471,5 +641,6 @@ class Storage:
         # Unmount VFS first if it's mounted
         if not self._has_storage:
             return False  # No SD storage on this board
+        self.clear_cache()
         sd_mp.unmount()
         return True
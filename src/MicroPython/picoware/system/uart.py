@@ -1,5 +1,12 @@
 class UART:
-    """Class representing a UART (Universal Asynchronous Receiver-Transmitter) interface."""
+    """
+    Class representing a UART (Universal Asynchronous Receiver-Transmitter) interface.
+
+    Received bytes are pumped (by poll() or, optionally, the RX IRQ) into a
+    fixed bytearray ring buffer. A framer scans each byte once for the
+    record delimiter, so partial lines are kept across calls and bytes that
+    follow a delimiter in the same read are never lost.
+    """
 
     def __init__(
         self,
@@ -8,8 +15,23 @@ class UART:
         rx_pin: int = 1,
         baud_rate: int = 115200,
         timeout: int = 2000,
+        rx_buffer_size: int = 1024,
+        delimiter: bytes = b"\n",
+        use_irq: bool = False,
     ) -> None:
-        """Initialize the UART interface."""
+        """
+        Initialize the UART interface.
+
+        Args:
+            uart_id: Hardware UART number
+            tx_pin: TX GPIO pin
+            rx_pin: RX GPIO pin
+            baud_rate: Baud rate
+            timeout: Timeout for blocking reads in milliseconds
+            rx_buffer_size: Size of the receive ring buffer in bytes
+            delimiter: Byte sequence that ends a line/record (e.g. b"\r\n")
+            use_irq: Fill the ring buffer from the RX IRQ instead of only on poll()
+        """
         from machine import UART as MachineUART
         from machine import Pin
 
@@ -19,6 +41,19 @@ class UART:
         self._baud_rate = baud_rate
         self._uart = None
 
+        # receive ring buffer: _rx_read is the oldest byte, _rx_count bytes are held
+        self._rx = bytearray(max(16, rx_buffer_size))
+        self._rx_view = memoryview(self._rx)
+        self._rx_read = 0
+        self._rx_count = 0
+        self._rx_scan = 0  # bytes after _rx_read already checked for a delimiter
+        self._rx_busy = False
+        self._delimiter = b"\n"
+        self._line = bytearray(256)
+        self._overflow_count = 0
+        self._truncated_count = 0
+        self.delimiter = delimiter
+
         try:
             self._uart = MachineUART(
                 uart_id, baudrate=baud_rate, tx=Pin(tx_pin), rx=Pin(rx_pin)
@@ -29,6 +64,12 @@ class UART:
 
         self._timeout = timeout  # milliseconds
 
+        if use_irq:
+            try:
+                self._uart.irq(self.__on_irq, MachineUART.IRQ_RXIDLE)
+            except Exception as e:
+                print(f"UART IRQ unavailable, polling instead: {e}")
+
     def __del__(self) -> None:
         """Deinitialize the UART interface."""
         self._uart.deinit()
@@ -40,16 +81,41 @@ class UART:
         """Get the baud rate of the UART interface."""
         return self._baud_rate
 
+    @property
+    def delimiter(self) -> bytes:
+        """Get the byte sequence that ends a line/record."""
+        return self._delimiter
+
+    @delimiter.setter
+    def delimiter(self, value) -> None:
+        """Set the byte sequence that ends a line/record."""
+        if isinstance(value, str):
+            value = value.encode()
+        if not value:
+            raise ValueError("delimiter must not be empty")
+        self._delimiter = bytes(value)
+        self._rx_scan = 0
+
     @property
     def has_data(self) -> bool:
         """Check if there is data available to read from the UART interface."""
-        return self._uart.any() > 0
+        return self._rx_count > 0 or self._uart.any() > 0
 
     @property
     def is_sending(self) -> bool:
         """Check if the UART interface is currently sending data."""
         return not self._uart.txdone()
 
+    @property
+    def overflow_count(self) -> int:
+        """Number of received bytes dropped because the ring buffer was full."""
+        return self._overflow_count
+
+    @property
+    def rx_buffered(self) -> int:
+        """Number of bytes waiting in the receive ring buffer."""
+        return self._rx_count
+
     @property
     def rx_pin(self) -> int:
         """Get the RX pin number."""
@@ -65,6 +131,11 @@ class UART:
         """Set the timeout value in milliseconds."""
         self._timeout = value
 
+    @property
+    def truncated_count(self) -> int:
+        """Number of records cut short because they did not fit the caller's buffer or the ring."""
+        return self._truncated_count
+
     @property
     def tx_pin(self) -> int:
         """Get the TX pin number."""
@@ -75,61 +146,181 @@ class UART:
         """Get the UART context."""
         return self._uart
 
+    def __consume(self, count: int) -> None:
+        """Drop count bytes from the front of the ring buffer."""
+        self._rx_read = (self._rx_read + count) % len(self._rx)
+        self._rx_count -= count
+        self._rx_scan = max(0, self._rx_scan - count)
+
+    def __copy_out(self, buffer, count: int) -> None:
+        """Copy the first count ring bytes into buffer (handles wrap-around)."""
+        size = len(self._rx)
+        start = self._rx_read
+        first = min(count, size - start)
+        buffer[0:first] = self._rx_view[start : start + first]
+        if count > first:
+            buffer[first:count] = self._rx_view[0 : count - first]
+
+    def __decode(self, count: int) -> str:
+        """Decode the first count bytes of the line buffer."""
+        try:
+            return str(self._line[:count], "utf-8").rstrip("\r")
+        except Exception:
+            return ""
+
+    def __find_delimiter(self) -> int:
+        """
+        Return the record length before the next delimiter, or -1.
+
+        Each byte is only examined once; the scan position survives calls.
+        """
+        rx = self._rx
+        size = len(rx)
+        delimiter = self._delimiter
+        width = len(delimiter)
+        last = delimiter[-1]
+        read = self._rx_read
+        i = self._rx_scan
+        while i < self._rx_count:
+            if rx[(read + i) % size] == last and i + 1 >= width:
+                j = 1
+                while j < width and rx[(read + i - j) % size] == delimiter[-1 - j]:
+                    j += 1
+                if j == width:
+                    self._rx_scan = 0
+                    return i + 1 - width
+            i += 1
+        self._rx_scan = i
+        return -1
+
+    def __on_irq(self, _uart) -> None:
+        """RX IRQ handler: move received bytes into the ring buffer."""
+        if not self._rx_busy:  # poll() or a read is running, the next poll() picks them up
+            self.poll()
+
     def clear(self) -> None:
         """Clear the serial buffer"""
-        while self._uart.any() > 0:
-            self._uart.read()
+        self._rx_busy = True
+        try:
+            while self._uart.any() > 0:
+                self._uart.read()
+            self._rx_read = 0
+            self._rx_count = 0
+            self._rx_scan = 0
+        finally:
+            self._rx_busy = False
 
     def flush(self) -> None:
         """Flush the UART interface."""
         self._uart.flush()
 
+    def poll(self) -> int:
+        """
+        Move any received bytes from the UART into the ring buffer.
+
+        Returns:
+            Number of bytes added (bytes that did not fit are counted in overflow_count)
+        """
+        self._rx_busy = True
+        added = 0
+        try:
+            size = len(self._rx)
+            while self._uart.any() > 0:
+                free = size - self._rx_count
+                if free == 0:
+                    # ring is full: drain the hardware FIFO so it keeps flowing
+                    dropped = self._uart.readinto(self._line)
+                    self._overflow_count += dropped or 0
+                    if not dropped:
+                        break
+                    continue
+                write = (self._rx_read + self._rx_count) % size
+                end = min(size, write + free)
+                count = self._uart.readinto(self._rx_view[write:end])
+                if not count:
+                    break
+                self._rx_count += count
+                added += count
+        finally:
+            self._rx_busy = False
+        return added
+
     def println(self, message: str) -> None:
         """Write a message followed by a newline to the UART interface."""
         self._uart.write(message + "\n")
 
     def read_into(self, buffer: bytearray) -> int:
         """Read data from the UART interface into a buffer."""
-        return self._uart.readinto(buffer)
+        self.poll()
+        self._rx_busy = True  # keep the RX IRQ from moving the ring while it is read
+        try:
+            count = min(len(buffer), self._rx_count)
+            if count:
+                self.__copy_out(buffer, count)
+                self.__consume(count)
+        finally:
+            self._rx_busy = False
+        return count
 
     def read_line(self) -> str:
         """Read a line from the UART interface with timeout handling."""
-        from time import ticks_ms
+        from time import ticks_ms, ticks_diff, sleep_ms
 
         start_time = ticks_ms()
-        message = ""
-
-        while (ticks_ms() - start_time) < self._timeout:
-            if self._uart.any() > 0:
-                try:
-                    raw_data = self._uart.read()
-                    if raw_data:
-                        # Reset the timeout when data is read
-                        start_time = ticks_ms()
-                        message += raw_data.decode()
-
-                        if "\n" in message:
-                            message = message.strip("\n")
-                            return message
-                except Exception:
-                    continue
+
+        while ticks_diff(ticks_ms(), start_time) < self._timeout:
+            count = self.readline_into(self._line)
+            if count >= 0:
+                return self.__decode(count)
+            if self._uart.any() == 0:
+                sleep_ms(1)  # nothing pending, don't spin
+            else:
+                start_time = ticks_ms()  # reset the timeout while data arrives
 
         # Timeout reached with no newline received
         return None
 
     def read_serial_line(self) -> str:
-        """Read a line from the UART interface."""
-        data = ""
+        """Read a line from the UART interface without blocking ("" if none is complete yet)."""
+        count = self.readline_into(self._line)
+        return self.__decode(count) if count >= 0 else ""
+
+    def readline_into(self, buffer: bytearray) -> int:
+        """
+        Non-blocking: copy the next complete line/record into buffer.
+
+        The delimiter is not copied. A record longer than buffer is cut to
+        fit, and a record that fills the whole ring without a delimiter is
+        returned as-is so the buffer cannot stall; both count as truncated.
+
+        Args:
+            buffer: Destination bytearray
+
+        Returns:
+            Length of the record, or -1 if no complete record is buffered yet
+        """
+        self.poll()
+        self._rx_busy = True  # keep the RX IRQ from moving the ring while it is read
         try:
-            raw_data = self._uart.read()
-            if raw_data:  # Ensures raw_data isn't empty before decoding
-                data = raw_data.decode()
-        except Exception:
-            pass  # raw_data is empty/None
-        return data
+            length = self.__find_delimiter()
+            consume = length + len(self._delimiter)
+            if length < 0:
+                if self._rx_count < len(self._rx):
+                    return -1
+                length = consume = self._rx_count
+                self._rx_scan = 0
+                self._truncated_count += 1
+            count = min(length, len(buffer))
+            if count < length:
+                self._truncated_count += 1
+            self.__copy_out(buffer, count)
+            self.__consume(consume)
+        finally:
+            self._rx_busy = False
+        return count
 
     def set_callback(self, callback) -> None:
-        """Set an interrupt handler to be called when a UART event occurs."""
+        """Set an interrupt handler to be called when a UART event occurs (replaces the RX IRQ pump)."""
         self._uart.irq(handler=callback)
 
     def write(self, message: bytes) -> None:
@@ -213,6 +213,10 @@ class USBKeyboard:
         """
         self._usbdev = None
         self._xfer_done = True
+        self._report = bytearray(8)
+        self._keytable = None
+        self._held = 0
+        self._cancelled = False
         self._manufacturer = manufacturer
         self._product = product
         self._serial = serial
@@ -250,7 +254,7 @@ class USBKeyboard:
                 0x03,
                 0x08,
                 0x00,
-                0x0A,
+                0x01,
             ]
         )
         self._xfer_done = True
@@ -279,6 +283,72 @@ class USBKeyboard:
         usbdev.active(True)
         self._usbdev = usbdev
 
+    def __key_table(self):
+        """Return the ASCII to keystroke table, building it on first use.
+
+        Each entry holds the HID usage-ID of the character, with bit 7 set
+        when the character needs the shift modifier (0 = not typeable).
+        """
+        if self._keytable is None:
+            table = bytearray(128)
+            for ch, kc in self.KEYMAP.items():
+                table[ord(ch)] = kc | (0x80 if ch in self.SHIFT_CHARS else 0)
+            self._keytable = table
+        return self._keytable
+
+    def __send_report(self, modifier, keycode):
+        """Wait for the previous report to be polled, then submit the next one.
+
+        The report buffer is reused; it is only rewritten once the host has
+        collected the previous report.
+
+        Returns:
+            True if the report was submitted, False if the host stopped polling.
+        """
+        if not self._wait():
+            return False
+        report = self._report
+        report[0] = modifier
+        report[2] = keycode
+        self._xfer_done = False
+        self._usbdev.submit_xfer(0x83, report)
+        return True
+
+    def __stream(self, data, delay_ms=0):
+        """Send the keystrokes for ASCII bytes, one HID report per character.
+
+        A key is only released when the next character uses the same key
+        (the host would otherwise see it as still held); any other change,
+        including a shift change, goes out as a single report.
+
+        Args:
+            data: Iterable of byte values.
+            delay_ms: Extra milliseconds to wait after each keystroke.
+
+        Returns:
+            Number of keystrokes sent, or -1 if the host stopped polling.
+        """
+        table = self.__key_table()
+        typed = 0
+        for b in data:
+            if self._cancelled:
+                break
+            code = table[b] if b < 128 else 0
+            if not code:
+                continue
+            keycode = code & 0x7F
+            if keycode == self._held:
+                if not self.__send_report(0, 0):
+                    return -1
+                self._held = 0
+            if not self.__send_report(self.MOD_LSHIFT if code & 0x80 else 0, keycode):
+                return -1
+            self._held = keycode
+            typed += 1
+            if delay_ms > 0:
+                time.sleep_ms(delay_ms)
+        return typed
+
     def _on_xfer_cb(self, ep, res, num_bytes):
         """Transfer-complete callback invoked by the USB stack.
 
@@ -386,23 +456,87 @@ class USBKeyboard:
         self.press(modifier, keycode)
         time.sleep_ms(delay_ms)
 
-    def type_string(self, s, delay_ms=50):
-        """Type a string by pressing each character in sequence.
+    def cancel(self):
+        """Stop ``type_string`` / ``type_file`` after the current keystroke.
 
-        Characters present in ``SHIFT_CHARS`` are automatically sent with the
-        left-shift modifier. Characters not found in ``KEYMAP`` are silently
-        skipped.
+        Safe to call from a progress callback or another thread.
+        """
+        self._cancelled = True
+
+    def type_file(self, storage, path, progress=None, chunk_size=512, delay_ms=0):
+        """Type the contents of a text file, streaming it from storage.
+
+        The file is read in chunks into one reused buffer and typed as fast
+        as the host polls the keyboard endpoint. Carriage returns and
+        characters not found in ``KEYMAP`` are skipped, so CRLF files type
+        one Enter per line.
 
         Args:
-            s: The string to type.
-            delay_ms: Milliseconds to wait between each keystroke.
+            storage: The Storage instance to read from.
+            path: Path of the file to type.
+            progress: Optional callback ``progress(bytes_done, bytes_total)`` called after each chunk.
+            chunk_size: Bytes read from the file at a time.
+            delay_ms: Extra milliseconds to wait after each keystroke.
+
+        Returns:
+            True if the whole file was typed, False on error or cancel().
         """
-        for ch in s:
-            kc = self.KEYMAP.get(ch, 0)
-            mod = self.MOD_LSHIFT if ch in self.SHIFT_CHARS else 0
-            if kc:
-                self.press(mod, kc)
-                time.sleep_ms(delay_ms)
+        if not storage.exists(path):
+            print(f"type_file: {path} not found")
+            return False
+        total = storage.size(path)
+        handle = storage.file_open(path)
+        if handle is None:
+            print(f"type_file: cannot open {path}")
+            return False
+
+        self._cancelled = False
+        buffer = bytearray(chunk_size)
+        view = memoryview(buffer)
+        done = 0
+        ok = True
+        try:
+            while not self._cancelled:
+                count = storage.file_readinto(handle, buffer)
+                if count <= 0:
+                    break
+                if self.__stream(view[:count], delay_ms) < 0:
+                    ok = False
+                    break
+                done += count
+                if progress:
+                    progress(done, total)
+        finally:
+            storage.file_close(handle)
+            if self._held:
+                self.__send_report(0, 0)
+                self._held = 0
+        return ok and not self._cancelled
+
+    def type_string(self, s, delay_ms=0):
+        """Type a string, streaming one HID report per character.
+
+        Reports are submitted as soon as the host has polled the previous
+        one, so typing speed follows the endpoint polling rate instead of a
+        fixed delay. Characters present in ``SHIFT_CHARS`` are automatically
+        sent with the left-shift modifier. Characters not found in ``KEYMAP``
+        are silently skipped.
+
+        Args:
+            s: The string (or bytes) to type.
+            delay_ms: Extra milliseconds to wait after each keystroke, for hosts that drop fast input.
+
+        Returns:
+            Number of keystrokes sent.
+        """
+        self._cancelled = False
+        if isinstance(s, str):
+            s = s.encode()
+        typed = self.__stream(s, delay_ms)
+        if self._held:
+            self.__send_report(0, 0)
+            self._held = 0
+        return max(typed, 0)
 
 
 class USBMedia:
@@ -266,7 +266,7 @@ static void vt_highlight_and_render_line(
 
 mp_obj_t vt_mp_render(size_t n_args, const mp_obj_t *args)
 {
-    // args[0]  = terminal_buffer: list of lists of single-char strings
+    // args[0]  = terminal_buffer: list of rows, each a bytearray/bytes or a list of single-char strings
     // args[1]  = screen_height (int)
     // args[2]  = screen_width (int)
     // args[3]  = char_height (int, pixels)
@@ -283,6 +283,10 @@ mp_obj_t vt_mp_render(size_t n_args, const mp_obj_t *args)
     // args[14] = string_color (uint16_t)
     // args[15] = comment_color (uint16_t)
     // args[16] = font_size (uint8_t, optional)
+    // args[17] = dirty rows (bytearray, one byte per screen row, optional)
+    //            when given, only rows with a non-zero byte are redrawn, their
+    //            bytes are cleared, and only the touched band is swapped
+    // args[18] = head (int, optional): index of the row shown at the top, for ring buffers
     if (n_args < 16)
     {
         mp_raise_ValueError(MP_ERROR_TEXT("render requires at least 16 arguments"));
@@ -309,6 +313,20 @@ mp_obj_t vt_mp_render(size_t n_args, const mp_obj_t *args)
     {
         font_size = (uint8_t)mp_obj_get_int(args[16]);
     }
+    uint8_t *dirty = NULL;
+    size_t dirty_len = 0;
+    if (n_args >= 18 && args[17] != mp_const_none)
+    {
+        mp_buffer_info_t dirty_info;
+        mp_get_buffer_raise(args[17], &dirty_info, MP_BUFFER_RW);
+        dirty = (uint8_t *)dirty_info.buf;
+        dirty_len = dirty_info.len;
+    }
+    size_t head = 0;
+    if (n_args >= 19)
+    {
+        head = (size_t)mp_obj_get_int(args[18]);
+    }
 
     // Build syntax map from Python list of (keyword, tft_color) tuples
     size_t map_count = 0;
@@ -333,13 +351,18 @@ mp_obj_t vt_mp_render(size_t n_args, const mp_obj_t *args)
         }
     }
 
-    // Clear the screen
-    LCD_MP_CLEAR(bg_color);
+    // Clear the screen (a partial render clears each dirty row instead)
+    if (dirty == NULL)
+    {
+        LCD_MP_CLEAR(bg_color);
+    }
 
-    // Get the terminal buffer (list of lists)
+    // Get the terminal buffer (list of rows)
     size_t buf_rows = 0;
     mp_obj_t *buf_row_items = NULL;
     mp_obj_get_array(terminal_buffer, &buf_rows, &buf_row_items);
+    int first_dirty = -1;
+    int last_dirty = -1;
 
     char *line_buf = (char *)m_malloc(VT_LINE_BUF_SIZE);
     vt_token_t *tokens = (vt_token_t *)m_malloc(VT_MAX_TOKENS * sizeof(vt_token_t));
@@ -349,20 +372,45 @@ mp_obj_t vt_mp_render(size_t n_args, const mp_obj_t *args)
 
     for (size_t y = 0; y < rows_to_process; y++)
     {
-        // Get this row (list of single-char strings)
-        size_t row_len = 0;
-        mp_obj_t *row_items = NULL;
-        mp_obj_get_array(buf_row_items[y], &row_len, &row_items);
+        if (dirty != NULL)
+        {
+            if (y >= dirty_len || !dirty[y])
+                continue;
+            dirty[y] = 0;
+            if (first_dirty < 0)
+                first_dirty = (int)y;
+            last_dirty = (int)y;
+            LCD_MP_FILL_RECTANGLE(0, (uint16_t)(y * char_height), LCD_MP_WIDTH, char_height, bg_color);
+        }
 
-        // Build the raw line string, rstrip spaces
-        size_t cols = (row_len < (size_t)screen_width) ? row_len : (size_t)screen_width;
-        if (cols > VT_LINE_BUF_SIZE - 1)
-            cols = VT_LINE_BUF_SIZE - 1;
+        mp_obj_t row_obj = buf_row_items[(head + y) % buf_rows];
 
-        for (size_t x = 0; x < cols; x++)
+        // Build the raw line string, rstrip spaces
+        size_t cols = 0;
+        mp_buffer_info_t row_info;
+        if (mp_get_buffer(row_obj, &row_info, MP_BUFFER_READ))
         {
-            const char *ch = mp_obj_str_get_str(row_items[x]);
-            line_buf[x] = ch[0];
+            // bytearray row: copy the cells directly
+            cols = (row_info.len < (size_t)screen_width) ? row_info.len : (size_t)screen_width;
+            if (cols > VT_LINE_BUF_SIZE - 1)
+                cols = VT_LINE_BUF_SIZE - 1;
+            memcpy(line_buf, row_info.buf, cols);
+        }
+        else
+        {
+            // list of single-char strings
+            size_t row_len = 0;
+            mp_obj_t *row_items = NULL;
+            mp_obj_get_array(row_obj, &row_len, &row_items);
+            cols = (row_len < (size_t)screen_width) ? row_len : (size_t)screen_width;
+            if (cols > VT_LINE_BUF_SIZE - 1)
+                cols = VT_LINE_BUF_SIZE - 1;
+
+            for (size_t x = 0; x < cols; x++)
+            {
+                const char *ch = mp_obj_str_get_str(row_items[x]);
+                line_buf[x] = ch[0];
+            }
         }
 
         // rstrip spaces
@@ -387,14 +435,28 @@ mp_obj_t vt_mp_render(size_t n_args, const mp_obj_t *args)
             tokens, tok_buf);
     }
 
-    // Draw cursor if visible
+    // Draw cursor if visible (a partial render expects its row to be marked dirty)
     if (cursor_visible)
     {
         LCD_MP_FILL_RECTANGLE(cursor_x, cursor_y, cursor_w, cursor_h, cursor_color);
     }
 
     // Swap buffers
-    LCD_MP_SWAP();
+    if (dirty == NULL)
+    {
+        LCD_MP_SWAP();
+    }
+    else if (first_dirty >= 0)
+    {
+#ifdef LCD_MP_SWAP_REGION
+        // only push the band of rows that changed
+        uint16_t band_y = (uint16_t)(first_dirty * char_height);
+        uint16_t band_h = (uint16_t)((last_dirty - first_dirty + 1) * char_height);
+        LCD_MP_SWAP_REGION(0, band_y, LCD_MP_WIDTH, band_h);
+#else
+        LCD_MP_SWAP();
+#endif
+    }
 
     // Free heap buffers
     m_free(tok_buf);
@@ -404,7 +466,7 @@ mp_obj_t vt_mp_render(size_t n_args, const mp_obj_t *args)
 
     return mp_const_none;
 }
-static MP_DEFINE_CONST_FUN_OBJ_VAR_BETWEEN(vt_mp_render_obj, 16, 17, vt_mp_render);
+static MP_DEFINE_CONST_FUN_OBJ_VAR_BETWEEN(vt_mp_render_obj, 16, 19, vt_mp_render);
 
 static const mp_rom_map_elem_t vt_globals_table[] = {
     {MP_ROM_QSTR(MP_QSTR___name__), MP_ROM_QSTR(MP_QSTR_vt)},
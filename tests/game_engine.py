@@ -1,326 +1,25 @@
-BIRD = bytes(
-    [
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xF6,
-        0xED,
-        0xED,
-        0xF2,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xF6,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xF6,
-        0xE9,
-        0xC0,
-        0xC0,
-        0xE4,
-        0xF6,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xF6,
-        0xC4,
-        0xFB,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFB,
-        0xC4,
-        0xE5,
-        0xE9,
-        0xEA,
-        0xE9,
-        0xC4,
-        0xF6,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xF6,
-        0xC0,
-        0xC4,
-        0xF6,
-        0xFF,
-        0xF6,
-        0xC4,
-        0xE5,
-        0xE9,
-        0xF2,
-        0xFF,
-        0xFB,
-        0xFB,
-        0xE9,
-        0xF2,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xF6,
-        0xC0,
-        0xE5,
-        0xE9,
-        0xF6,
-        0xF6,
-        0xC0,
-        0xE5,
-        0xF2,
-        0xFF,
-        0xDB,
-        0x6D,
-        0xFB,
-        0xC9,
-        0xF2,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xF6,
-        0xC0,
-        0xE5,
-        0xE5,
-        0xE9,
-        0xE9,
-        0xC0,
-        0xE9,
-        0xFB,
-        0xFF,
-        0xD6,
-        0x92,
-        0xFF,
-        0xF1,
-        0xF1,
-        0xFE,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xF6,
-        0xC0,
-        0xE5,
-        0xEA,
-        0xE5,
-        0xC0,
-        0xC0,
-        0xE9,
-        0xFB,
-        0xFB,
-        0xFB,
-        0xFF,
-        0xF6,
-        0xF5,
-        0xF9,
-        0xFA,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xF6,
-        0xC0,
-        0xE5,
-        0xEA,
-        0xE5,
-        0xE5,
-        0xC0,
-        0xE9,
-        0xF7,
-        0xFF,
-        0xFB,
-        0xF6,
-        0xC9,
-        0xF6,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xF6,
-        0xC4,
-        0xE5,
-        0xE5,
-        0xE5,
-        0xE5,
-        0xE5,
-        0xE9,
-        0xEA,
-        0xE9,
-        0xC4,
-        0xC9,
-        0xFB,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xF6,
-        0xE4,
-        0xC0,
-        0xE5,
-        0xEA,
-        0xE9,
-        0xED,
-        0xF0,
-        0xEC,
-        0xEC,
-        0xF0,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xF2,
-        0xC4,
-        0xE0,
-        0xE9,
-        0xED,
-        0xF4,
-        0xF4,
-        0xF4,
-        0xF4,
-        0xF5,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFB,
-        0xF6,
-        0xF6,
-        0xF6,
-        0xC4,
-        0xE0,
-        0xED,
-        0xF4,
-        0xF4,
-        0xF4,
-        0xF4,
-        0xF4,
-        0xF9,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xF2,
-        0xC0,
-        0xC0,
-        0xC0,
-        0xC0,
-        0xE0,
-        0xE9,
-        0xF4,
-        0xF4,
-        0xF4,
-        0xF4,
-        0xF9,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xF2,
-        0xC0,
-        0xE5,
-        0xE5,
-        0xE5,
-        0xE5,
-        0xE8,
-        0xF4,
-        0xF4,
-        0xF4,
-        0xFA,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xF2,
-        0xC0,
-        0xC0,
-        0xC0,
-        0xC0,
-        0xED,
-        0xFB,
-        0xFE,
-        0xFE,
-        0xFE,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFB,
-        0xED,
-        0xED,
-        0xED,
-        0xED,
-        0xF6,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xFF,
-    ]
+PACK = (
+    b"PAK1\x01\x00\x00\x00bird\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x14\x00\x10\x00\x01\x00"
+    b"4\x00\x00\x00@\x01\x00\x00\x00\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff"
+    b"\xff\xf6\xed\xed\xf2\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf6\xff\xff\xff"
+    b"\xff\xff\xf6\xe9\xc0\xc0\xe4\xf6\xff\xff\xff\xff\xff\xff\xff\xf6\xc4\xfb"
+    b"\xff\xff\xff\xfb\xc4\xe5\xe9\xea\xe9\xc4\xf6\xff\xff\xff\xff\xff\xff\xf6"
+    b"\xc0\xc4\xf6\xff\xf6\xc4\xe5\xe9\xf2\xff\xfb\xfb\xe9\xf2\xff\xff\xff\xff"
+    b"\xff\xf6\xc0\xe5\xe9\xf6\xf6\xc0\xe5\xf2\xff\xdbm\xfb\xc9\xf2\xff\xff\xff"
+    b"\xff\xff\xf6\xc0\xe5\xe5\xe9\xe9\xc0\xe9\xfb\xff\xd6\x92\xff\xf1\xf1\xfe"
+    b"\xff\xff\xff\xff\xf6\xc0\xe5\xea\xe5\xc0\xc0\xe9\xfb\xfb\xfb\xff\xf6\xf5"
+    b"\xf9\xfa\xff\xff\xff\xff\xf6\xc0\xe5\xea\xe5\xe5\xc0\xe9\xf7\xff\xfb\xf6"
+    b"\xc9\xf6\xff\xff\xff\xff\xff\xff\xf6\xc4\xe5\xe5\xe5\xe5\xe5\xe9\xea\xe9"
+    b"\xc4\xc9\xfb\xff\xff\xff\xff\xff\xff\xff\xff\xf6\xe4\xc0\xe5\xea\xe9\xed"
+    b"\xf0\xec\xec\xf0\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf2\xc4\xe0\xe9"
+    b"\xed\xf4\xf4\xf4\xf4\xf5\xff\xff\xff\xff\xff\xff\xff\xfb\xf6\xf6\xf6\xc4"
+    b"\xe0\xed\xf4\xf4\xf4\xf4\xf4\xf9\xff\xff\xff\xff\xff\xff\xff\xf2\xc0\xc0"
+    b"\xc0\xc0\xe0\xe9\xf4\xf4\xf4\xf4\xf9\xff\xff\xff\xff\xff\xff\xff\xff\xf2"
+    b"\xc0\xe5\xe5\xe5\xe5\xe8\xf4\xf4\xf4\xfa\xff\xff\xff\xff\xff\xff\xff\xff"
+    b"\xff\xf2\xc0\xc0\xc0\xc0\xed\xfb\xfe\xfe\xfe\xff\xff\xff\xff\xff\xff\xff"
+    b"\xff\xff\xff\xfb\xed\xed\xed\xed\xf6\xff\xff\xff\xff\xff\xff\xff\xff\xff"
+    b"\xff\xff\xff"
 )
 
 _game_engine = None
@@ -330,16 +29,18 @@ def __player_spawn(level):
     """Spawn the player in the level."""
     from picoware.engine.entity import Entity, ENTITY_TYPE_PLAYER, SPRITE_3D_NONE
     from picoware.engine.image import Image
+    from picoware.system.asset_pack import AssetPack
     from picoware.system.vector import Vector
 
-    _size = Vector(20, 16)
+    assets = AssetPack(PACK)
+    _size = assets.size("bird")
 
     player = Entity(
         "Player",  # name
         ENTITY_TYPE_PLAYER,  # type
         Vector(level.size.x // 2, level.size.y // 2),  # position
         _size,  # size
-        Image(_size, True, BIRD),  # sprite data (Image)
+        Image(_size, True, assets.get("bird")),  # sprite data (Image)
         None,  # sprite data left (Image)
         None,  # sprite data right (Image)
         None,  # start
@@ -0,0 +1,29 @@
+from io import BytesIO
+from picoware.system.json_stream import JSONStream
+
+_json = b'{"a\\"b": 1, "tree": [{"pa\\u0074h": "x\\ny"}, {"path": "z"}], "ok": true}'
+
+
+def test():
+    # a small buffer so keys and values straddle block boundaries
+    stream = JSONStream(BytesIO(_json), buffer_size=8)
+    assert stream.first('a"b') == 1
+    stream.close()
+
+    stream = JSONStream(BytesIO(_json), buffer_size=8)
+    paths = list(stream.items("tree[*].path"))
+    stream.close()
+    assert paths == ["x\ny", "z"], paths
+
+    stream = JSONStream(BytesIO(_json), buffer_size=8)
+    found = list(stream.select(("ok", "tree[*]")))
+    stream.close()
+    assert found == [
+        (1, {"path": "x\ny"}),
+        (1, {"path": "z"}),
+        (0, True),
+    ], found
+    print("escaped keys ok")
+
+
+test()
@@ -18,6 +18,24 @@ if s.remove(_txt):
     print(f"Successfully removed {_txt}")
 
 
+# a block past offset 0 must come from that offset, not from the start
+_bin = "picoware_sd_test.bin"
+_data = bytes(i & 0xFF for i in range(5000))
+if s.exists(_bin):
+    s.remove(_bin)  # "wb" appends
+if s.write(_bin, _data, "wb"):
+    _chunk = s.read_chunked(_bin, 4096, 16)
+    if _chunk == _data[4096:4112]:
+        print("Successfully read a chunk at offset 4096")
+    else:
+        print(f"Chunk at offset 4096 is wrong: {_chunk}")
+    if s.read(_bin, "rb", 4990, 64) == _data[4990:]:
+        print("Successfully read the tail of the file")
+    else:
+        print("Tail of the file is wrong")
+    s.remove(_bin)
+
+
 _dir = "picoware_sd_test_dir_2"
 if _dir not in _root:
     if s.mkdir(_dir):
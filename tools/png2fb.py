@@ -1,3 +1,4 @@
+import struct
 import sys
 
 try:
@@ -7,6 +8,59 @@ except ImportError:
         "Pillow library is required to run this module. Please install it via 'pip install Pillow'."
     )
 
+try:
+    import numpy as np
+except ImportError:
+    raise ImportError(
+        "NumPy library is required to run this module. Please install it via 'pip install numpy'."
+    )
+
+# Packed container (folder mode with --index):
+#   header  "<4sHHBBHI": magic, width, height, bits per pixel, codec, fps, frame count
+#   index   (frame count + 1) uint32 offsets from the start of the file, the
+#           last one being the end of the data, so frame i is
+#           data[offset[i]:offset[i + 1]]
+#   frames  one after the other, encoded with the codec
+#
+# CODEC_DELTA frames start with a type byte (FRAME_KEY or FRAME_DELTA)
+# followed by ops counted in pixels. Each op byte holds the op in its top
+# two bits and a count of 1-63 in the low six; a count of 0 means the count
+# follows as a 24-bit little-endian value:
+#   OP_SKIP     keep count pixels of the previous frame
+#   OP_LITERAL  count pixels follow
+#   OP_FILL     one pixel follows, repeated count times
+# Key frames use no skips, and bit 31 of a key frame's index offset is set
+# so players can find them for seeking.
+CONTAINER_MAGIC = b"PFB1"
+CONTAINER_HEADER = "<4sHHBBHI"
+CODEC_RAW = 0
+CODEC_ZLIB = 1
+CODEC_DELTA = 2
+
+FRAME_KEY = 0
+FRAME_DELTA = 1
+OP_SKIP = 0
+OP_LITERAL = 1
+OP_FILL = 2
+KEY_FLAG = 0x80000000
+
+_MIN_FILL = 4  # shorter runs are cheaper as literals
+_MIN_SKIP = 3  # shorter unchanged gaps are merged into the literal around them
+
+DITHER_NONE = "none"
+DITHER_ORDERED = "ordered"
+DITHER_FLOYD_STEINBERG = "fs"
+
+# 4x4 Bayer matrix, normalised to [-0.5, 0.5)
+_BAYER4 = (
+    np.array(
+        [[0, 8, 2, 10], [12, 4, 14, 6], [3, 11, 1, 9], [15, 7, 13, 5]],
+        dtype=np.float32,
+    )
+    / 16.0
+    - 0.5
+)
+
 
 def color(r, g, b):
     """
@@ -44,15 +98,14 @@ def color8(r, g, b):
     return (r3 << 5) | (g3 << 2) | b2
 
 
-def png2fb(file_obj):
-    """
-    Convert an image to a framebuffer (RGB565, 2 bytes/pixel).
+def _channel_bits(bit_depth):
+    """Return the (red, green, blue) bit counts of the output format."""
+    return (3, 3, 2) if bit_depth == 8 else (5, 6, 5)
 
-    Args:
-        file_obj: A file-like object (the uploaded PNG).
 
-    Returns:
-        A bytearray of the converted framebuffer in RGB565.
+def _load_rgb(file_obj):
+    """
+    Open an image and return it as an RGB Pillow image.
 
     Raises:
         ValueError: If the image is in an unsupported pixel mode.
@@ -62,75 +115,146 @@ def png2fb(file_obj):
     # Convert image to RGB if necessary:
     if inputImage.mode == "RGB":
         pass
-    elif inputImage.mode == "RGBA":
-        inputImage = inputImage.convert("RGB")
-    elif inputImage.mode in ("L", "LA", "P"):
+    elif inputImage.mode in ("RGBA", "L", "LA", "P"):
         inputImage = inputImage.convert("RGB")
     else:
         raise ValueError(
             f"Not supported pixel mode ({inputImage.mode}): Supports only RGB/RGBA/L/LA/P"
         )
+    return inputImage
 
-    pixelsIn = inputImage.tobytes()
-    pixelSize = 3  # 3 bytes per pixel (R, G, B)
-    pixelsOut = bytearray((len(pixelsIn) // pixelSize) * 2)
 
-    for i in range(0, len(pixelsIn), pixelSize):
-        r = pixelsIn[i]
-        g = pixelsIn[i + 1]
-        b = pixelsIn[i + 2]
-        c = color(r, g, b)
-        lsb = c & 0xFF
-        msb = (c >> 8) & 0xFF
-        index = (i // pixelSize) * 2
-        pixelsOut[index] = lsb
-        pixelsOut[index + 1] = msb
+def _palette332():
+    """Return a palette image whose index i is the colour of RGB332 value i."""
+    values = np.arange(256, dtype=np.uint16)
+    r = (values >> 5) & 7
+    g = (values >> 2) & 7
+    b = values & 3
+    palette = np.stack([(r * 255 + 3) // 7, (g * 255 + 3) // 7, b * 85], axis=1).astype(
+        np.uint8
+    )
+    image = Image.new("P", (1, 1))
+    image.putpalette(palette.tobytes())
+    return image
 
-    return pixelsOut
 
+def _dither_ordered(rgb, bit_depth):
+    """Add a 4x4 Bayer threshold of one quantisation step to each channel."""
+    height, width, _ = rgb.shape
+    tiles = np.tile(_BAYER4, (height // 4 + 1, width // 4 + 1))[:height, :width]
+    out = np.empty_like(rgb)
+    for channel, bits in enumerate(_channel_bits(bit_depth)):
+        step = 256.0 / (1 << bits)
+        value = rgb[:, :, channel].astype(np.float32) + tiles * step
+        out[:, :, channel] = np.clip(value, 0, 255).astype(np.uint8)
+    return out
 
-def png2fb8(file_obj):
+
+def _dither_floyd_steinberg(rgb, bit_depth):
     """
-    Convert an image to a framebuffer (8-bit, 1 byte/pixel) using a 3-3-2 color format.
+    Floyd-Steinberg error diffusion to the output bit depth.
+
+    Each row is quantised as a whole; the left-to-right error carry is the
+    only per-pixel step, done on small vectors.
+    """
+    height, width, _ = rgb.shape
+    bits = _channel_bits(bit_depth)
+    levels = np.array([(1 << b) - 1 for b in bits], dtype=np.float32)
+    work = rgb.astype(np.float32)
+    out = np.empty_like(rgb)
+    for y in range(height):
+        row = work[y]
+        below = work[y + 1] if y + 1 < height else None
+        for x in range(width):
+            old = row[x]
+            new = np.round(np.clip(old, 0, 255) * levels / 255.0) * 255.0 / levels
+            error = old - new
+            row[x] = new
+            if x + 1 < width:
+                row[x + 1] += error * (7 / 16)
+            if below is not None:
+                if x > 0:
+                    below[x - 1] += error * (3 / 16)
+                below[x] += error * (5 / 16)
+                if x + 1 < width:
+                    below[x + 1] += error * (1 / 16)
+        out[y] = np.clip(row, 0, 255).astype(np.uint8)
+    return out
+
+
+def convert_image(file_obj, bit_depth=16, dither=DITHER_NONE):
+    """
+    Convert an image to raw framebuffer bytes with NumPy.
 
     Args:
-        file_obj: A file-like object (the uploaded PNG).
+        file_obj: A file-like object or path of the image.
+        bit_depth: 16 for RGB565 (big endian, as color() produces), 8 for 3-3-2.
+        dither: DITHER_NONE, DITHER_ORDERED or DITHER_FLOYD_STEINBERG.
 
     Returns:
-        A bytearray of the converted framebuffer in 8-bit (3-3-2 format).
+        The converted pixels as bytes.
 
     Raises:
         ValueError: If the image is in an unsupported pixel mode.
     """
-    inputImage = Image.open(file_obj)
+    image = _load_rgb(file_obj)
 
-    # Convert image to RGB if necessary:
-    if inputImage.mode == "RGB":
-        pass
-    elif inputImage.mode == "RGBA":
-        inputImage = inputImage.convert("RGB")
-    elif inputImage.mode in ("L", "LA", "P"):
-        inputImage = inputImage.convert("RGB")
-    else:
-        raise ValueError(
-            f"Not supported pixel mode ({inputImage.mode}): Supports only RGB/RGBA/L/LA/P"
+    if bit_depth == 8 and dither == DITHER_FLOYD_STEINBERG:
+        # Pillow's C quantiser diffuses the error onto the 3-3-2 palette,
+        # whose indices are the output bytes themselves
+        indexed = image.quantize(
+            palette=_palette332(), dither=Image.Dither.FLOYDSTEINBERG
         )
+        return indexed.tobytes()
+
+    rgb = np.asarray(image, dtype=np.uint8)
+    if dither == DITHER_ORDERED:
+        rgb = _dither_ordered(rgb, bit_depth)
+    elif dither == DITHER_FLOYD_STEINBERG:
+        rgb = _dither_floyd_steinberg(rgb, bit_depth)
 
-    pixelsIn = inputImage.tobytes()
-    pixelSize = 3  # 3 bytes per pixel (R, G, B)
-    pixelsOut = bytearray(len(pixelsIn) // pixelSize)
+    r = rgb[:, :, 0].astype(np.uint16)
+    g = rgb[:, :, 1].astype(np.uint16)
+    b = rgb[:, :, 2].astype(np.uint16)
+    if bit_depth == 8:
+        return ((r >> 5) << 5 | (g >> 5) << 2 | (b >> 6)).astype(np.uint8).tobytes()
+    rgb565 = (r >> 3) << 11 | (g >> 2) << 5 | (b >> 3)
+    return rgb565.astype(">u2").tobytes()
 
-    for i in range(0, len(pixelsIn), pixelSize):
-        r = pixelsIn[i]
-        g = pixelsIn[i + 1]
-        b = pixelsIn[i + 2]
-        index = i // pixelSize
-        pixelsOut[index] = color8(r, g, b)
 
-    return pixelsOut
+def png2fb(file_obj):
+    """
+    Convert an image to a framebuffer (RGB565, 2 bytes/pixel).
 
+    Args:
+        file_obj: A file-like object (the uploaded PNG).
 
-def png2bin(file_obj, save_path, bit_depth=16):
+    Returns:
+        A bytearray of the converted framebuffer in RGB565.
+
+    Raises:
+        ValueError: If the image is in an unsupported pixel mode.
+    """
+    return bytearray(convert_image(file_obj, 16))
+
+
+def png2fb8(file_obj):
+    """
+    Convert an image to a framebuffer (8-bit, 1 byte/pixel) using a 3-3-2 color format.
+
+    Args:
+        file_obj: A file-like object (the uploaded PNG).
+
+    Returns:
+        A bytearray of the converted framebuffer in 8-bit (3-3-2 format).
+
+    Raises:
+        ValueError: If the image is in an unsupported pixel mode.
+    """
+    return bytearray(convert_image(file_obj, 8))
+
+
+def png2bin(file_obj, save_path, bit_depth=16, dither=DITHER_NONE):
     """
     Convert an image to raw pixel data and save it to a binary file.
 
@@ -138,14 +262,12 @@ def png2bin(file_obj, save_path, bit_depth=16):
         file_obj: A file-like object (the uploaded PNG).
         save_path: Path to save the BIN file.
         bit_depth: Bit depth for conversion (16 for RGB565, 8 for 3-3-2 format).
+        dither: DITHER_NONE, DITHER_ORDERED or DITHER_FLOYD_STEINBERG.
 
     Returns:
         The path to the saved BIN file.
     """
-    if bit_depth == 8:
-        pixel_data = png2fb8(file_obj)
-    else:
-        pixel_data = png2fb(file_obj)
+    pixel_data = convert_image(file_obj, bit_depth, dither)
 
     with open(save_path, "wb") as f:
         f.write(pixel_data)
@@ -153,10 +275,206 @@ def png2bin(file_obj, save_path, bit_depth=16):
     return save_path
 
 
+def _op(out, op, count):
+    """Append an op byte (with an extended count if needed)."""
+    if count < 64:
+        out.append(op << 6 | count)
+    else:
+        out.append(op << 6)
+        out += count.to_bytes(3, "little")
+
+
+def _runs(mask):
+    """Return (starts, ends) of the runs of True in a boolean array."""
+    edges = np.diff(np.concatenate(([False], mask, [False])).astype(np.int8))
+    return np.flatnonzero(edges == 1), np.flatnonzero(edges == -1)
+
+
+def _encode_span(out, pixels):
+    """Encode changed pixels as fills (long runs of one value) and literals."""
+    count = len(pixels)
+    starts = np.concatenate(([0], np.flatnonzero(pixels[1:] != pixels[:-1]) + 1))
+    lengths = np.diff(np.concatenate((starts, [count])))
+    literal_from = 0
+    for i in np.flatnonzero(lengths >= _MIN_FILL):
+        start = int(starts[i])
+        if start > literal_from:
+            _op(out, OP_LITERAL, start - literal_from)
+            out += pixels[literal_from:start].tobytes()
+        _op(out, OP_FILL, int(lengths[i]))
+        out += pixels[start : start + 1].tobytes()
+        literal_from = start + int(lengths[i])
+    if literal_from < count:
+        _op(out, OP_LITERAL, count - literal_from)
+        out += pixels[literal_from:].tobytes()
+
+
+def encode_frame(data, previous=None, bit_depth=16):
+    """
+    Encode converted pixels for CODEC_DELTA.
+
+    Args:
+        data: Frame bytes from convert_image().
+        previous: Bytes of the previous frame, or None for a key frame.
+        bit_depth: 16 or 8 (ops count whole pixels).
+
+    Returns:
+        The encoded frame (type byte + ops).
+    """
+    dtype = ">u2" if bit_depth == 16 else np.uint8
+    pixels = np.frombuffer(data, dtype=dtype)
+    out = bytearray([FRAME_KEY if previous is None else FRAME_DELTA])
+
+    if previous is None:
+        _encode_span(out, pixels)
+        return bytes(out)
+
+    changed = pixels != np.frombuffer(previous, dtype=dtype)
+    # absorb short unchanged gaps so a skip never costs more than it saves
+    starts, ends = _runs(~changed)
+    for start, end in zip(starts, ends):
+        if end - start < _MIN_SKIP and start > 0 and end < len(pixels):
+            changed[start:end] = True
+
+    position = 0
+    for start, end in zip(*_runs(changed)):
+        if start > position:
+            _op(out, OP_SKIP, int(start - position))
+        _encode_span(out, pixels[start:end])
+        position = int(end)
+    return bytes(out)
+
+
+def _convert_frame(job):
+    """Process pool worker: convert (and compress) one frame file."""
+    path, bit_depth, dither, codec = job
+    try:
+        data = convert_image(path, bit_depth, dither)
+        if codec == CODEC_ZLIB:
+            import zlib
+
+            data = zlib.compress(data, 9)
+        return path, data, None
+    except Exception as e:
+        return path, None, str(e)
+
+
+def pack_frames(
+    paths,
+    output_path,
+    bit_depth=16,
+    dither=DITHER_NONE,
+    index=False,
+    codec=CODEC_RAW,
+    fps=0,
+    workers=None,
+    progress=None,
+    keyframe_interval=50,
+):
+    """
+    Convert frames in parallel and stream them into one file.
+
+    Frames are converted by a process pool and written in order as soon as
+    they are ready, so memory use stays at a few frames regardless of the
+    number of frames.
+
+    Args:
+        paths: Ordered list of image paths.
+        output_path: File to write.
+        bit_depth: 16 for RGB565, 8 for 3-3-2.
+        dither: DITHER_NONE, DITHER_ORDERED or DITHER_FLOYD_STEINBERG.
+        index: Write the container header and offset index (see CONTAINER_HEADER).
+        codec: CODEC_RAW, CODEC_ZLIB or CODEC_DELTA (the last two need index=True).
+        fps: Frame rate recorded in the header (0 = unknown).
+        workers: Number of processes (None = one per CPU).
+        progress: Optional callback progress(done, total, path, size, error).
+        keyframe_interval: CODEC_DELTA only, frames between forced key frames.
+
+    Returns:
+        (frames written, bytes written)
+    """
+    from multiprocessing import Pool
+
+    if codec != CODEC_RAW and not index:
+        raise ValueError("compressed frames need the offset index")
+
+    width = height = 0
+    if index and paths:
+        with Image.open(paths[0]) as first:
+            width, height = first.size
+
+    if codec == CODEC_DELTA and bit_depth not in (8, 16):
+        raise ValueError("delta frames need 8 or 16-bit pixels")
+    jobs = [(path, bit_depth, dither, codec) for path in paths]
+    count = len(jobs)
+    offsets = []
+    written = 0
+
+    with open(output_path, "wb") as out:
+        data_start = 0
+        if index:
+            header_size = struct.calcsize(CONTAINER_HEADER)
+            data_start = header_size + 4 * (count + 1)
+            out.write(b"\0" * data_start)  # filled in once the sizes are known
+        position = data_start
+        previous = None
+        since_key = 0
+
+        with Pool(workers) as pool:
+            for done, (path, data, error) in enumerate(
+                pool.imap(_convert_frame, jobs, chunksize=4), 1
+            ):
+                flag = 0
+                if data is not None and codec == CODEC_DELTA:
+                    # deltas depend on the previous frame, so they are
+                    # encoded here in order rather than in the workers
+                    frame = data
+                    data = None
+                    if previous is not None and since_key < keyframe_interval:
+                        data = encode_frame(frame, previous, bit_depth)
+                        since_key += 1
+                        if len(data) > len(frame) // 2:
+                            data = None  # a scene cut, a key frame is cheaper
+                    if data is None:
+                        data = encode_frame(frame, None, bit_depth)
+                        since_key = 1
+                        flag = KEY_FLAG
+                    previous = frame
+                if data is not None:
+                    offsets.append(position | flag)
+                    out.write(data)
+                    position += len(data)
+                    written += 1
+                if progress:
+                    progress(done, count, path, len(data) if data else 0, error)
+
+        if index:
+            # offsets are absolute, so slots left unused by frames that
+            # failed to convert are just padding before the data
+            offsets.append(position)
+            out.seek(0)
+            out.write(
+                struct.pack(
+                    CONTAINER_HEADER,
+                    CONTAINER_MAGIC,
+                    width,
+                    height,
+                    bit_depth,
+                    codec,
+                    fps,
+                    written,
+                )
+            )
+            out.write(struct.pack(f"<{len(offsets)}I", *offsets))
+
+    return written, position
+
+
 # command line usage
 if __name__ == "__main__":
     import os
     import argparse
+    import time
 
     parser = argparse.ArgumentParser(
         description="Convert PNG images to raw pixel data (.bin files)",
@@ -166,6 +484,10 @@ if __name__ == "__main__":
   png2fb.py folder/                - Convert all PNGs in folder to RGB565 .bin files
   png2fb.py image.png --8bit       - Convert to 8-bit (3-3-2 format) .bin
   png2fb.py folder/ --8bit         - Convert all PNGs to 8-bit .bin files
+  png2fb.py folder/ --8bit --dither fs --index --zlib --fps 10
+                                   - Dithered, indexed and compressed frame pack
+  png2fb.py folder/ --8bit --delta --fps 10
+                                   - Key frame + delta video for the big-buck-bunny player
         """,
     )
     parser.add_argument("input", help="Input PNG file or folder containing PNG files")
@@ -175,10 +497,50 @@ if __name__ == "__main__":
         dest="eight_bit",
         help="Use 8-bit color (3-3-2 format) instead of 16-bit RGB565",
     )
+    parser.add_argument(
+        "--dither",
+        choices=(DITHER_NONE, DITHER_ORDERED, DITHER_FLOYD_STEINBERG),
+        default=DITHER_NONE,
+        help="Dithering: none, ordered (4x4 Bayer) or fs (Floyd-Steinberg)",
+    )
+    parser.add_argument(
+        "--index",
+        action="store_true",
+        help="Folder mode: write a header and frame offset index before the frames",
+    )
+    parser.add_argument(
+        "--zlib",
+        action="store_true",
+        help="Folder mode: zlib-compress each frame (implies --index)",
+    )
+    parser.add_argument(
+        "--delta",
+        action="store_true",
+        help="Folder mode: key frame + delta/RLE frames for the video player (implies --index)",
+    )
+    parser.add_argument(
+        "--keyframe",
+        type=int,
+        default=50,
+        help="With --delta, maximum frames between key frames (default: 50)",
+    )
+    parser.add_argument(
+        "--fps", type=int, default=0, help="Frame rate stored in the index header"
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Number of worker processes (default: one per CPU)",
+    )
+    parser.add_argument(
+        "-o", "--output", default=None, help="Output file (default: next to the input)"
+    )
 
     args = parser.parse_args()
     input_path = args.input
     bit_depth = 8 if args.eight_bit else 16
+    bit_mode = "8-bit (3-3-2)" if bit_depth == 8 else "16-bit (RGB565)"
 
     # Check if input is a file or directory
     if os.path.isfile(input_path):
@@ -188,16 +550,15 @@ if __name__ == "__main__":
             sys.exit(1)
 
         # Generate output BIN filename in same directory
-        output_bin = os.path.splitext(input_path)[0] + ".bin"
+        output_bin = args.output or os.path.splitext(input_path)[0] + ".bin"
 
         with open(input_path, "rb") as f_in:
-            png2bin(f_in, output_bin, bit_depth=bit_depth)
+            png2bin(f_in, output_bin, bit_depth=bit_depth, dither=args.dither)
 
-        bit_mode = "8-bit (3-3-2)" if bit_depth == 8 else "16-bit (RGB565)"
         print(f"Converted {input_path} to {output_bin} ({bit_mode})")
 
     elif os.path.isdir(input_path):
-        # Folder conversion - pack all PNGs into a single .bin file
+        # Folder conversion - stream all PNGs into a single .bin file
         png_files = sorted(
             [f for f in os.listdir(input_path) if f.lower().endswith(".png")]
         )
@@ -206,46 +567,35 @@ if __name__ == "__main__":
             print(f"No PNG files found in {input_path}")
             sys.exit(1)
 
-        # Prepare output file
-        output_bin = os.path.join(input_path, "packed_frames.bin")
-
-        # Collect all pixel data
-        all_pixel_data = bytearray()
-        frame_info = []
-        converted_count = 0
-
-        for png_file in png_files:
-            input_png = os.path.join(input_path, png_file)
-
-            try:
-                with open(input_png, "rb") as f_in:
-                    if bit_depth == 8:
-                        pixel_data = png2fb8(f_in)
-                    else:
-                        pixel_data = png2fb(f_in)
-
-                    offset = len(all_pixel_data)
-                    size = len(pixel_data)
-                    all_pixel_data.extend(pixel_data)
-
-                    frame_info.append(
-                        {"file": png_file, "offset": offset, "size": size}
-                    )
-
-                    converted_count += 1
-                    print(
-                        f"Frame {converted_count}: {png_file} - offset: {offset}, size: {size} bytes"
-                    )
-            except Exception as e:
-                print(f"Error converting {png_file}: {e}")
-
-        # Write packed binary file
-        with open(output_bin, "wb") as f:
-            f.write(all_pixel_data)
+        output_bin = args.output or os.path.join(input_path, "packed_frames.bin")
+        codec = CODEC_RAW
+        if args.delta:
+            codec = CODEC_DELTA
+        elif args.zlib:
+            codec = CODEC_ZLIB
+
+        def report(done, total, path, size, error):
+            if error:
+                print(f"Error converting {os.path.basename(path)}: {error}")
+            elif done % 100 == 0 or done == total:
+                print(f"Frame {done}/{total}: {os.path.basename(path)} - {size} bytes")
+
+        started = time.time()
+        converted_count, total_size = pack_frames(
+            [os.path.join(input_path, f) for f in png_files],
+            output_bin,
+            bit_depth=bit_depth,
+            dither=args.dither,
+            index=args.index or args.zlib or args.delta,
+            codec=codec,
+            fps=args.fps,
+            workers=args.jobs,
+            progress=report,
+            keyframe_interval=args.keyframe,
+        )
 
-        bit_mode = "8-bit (3-3-2)" if bit_depth == 8 else "16-bit (RGB565)"
         print(f"\nPacked {converted_count} frames into {output_bin} ({bit_mode})")
-        print(f"Total size: {len(all_pixel_data)} bytes")
+        print(f"Total size: {total_size} bytes in {time.time() - started:.1f}s")
 
     else:
         print(f"Error: {input_path} is not a valid file or directory")
@@ -0,0 +1,331 @@
+import ast
+import os
+import struct
+import sys
+
+try:
+    from PIL import Image
+except ImportError:
+    raise ImportError(
+        "Pillow library is required to run this module. Please install it via 'pip install Pillow'."
+    )
+
+from png2fb import DITHER_FLOYD_STEINBERG, DITHER_NONE, DITHER_ORDERED, convert_image
+
+# Asset pack, read on the device by picoware.system.asset_pack.AssetPack:
+#   header  "<4sHH": magic, entry count, reserved
+#   index   one "<28sHHBBII" entry per asset: NUL-padded UTF-8 name, width,
+#           height, format, flags, data offset from the start of the pack,
+#           data size
+#   data    each entry's bytes, starting on a 4-byte boundary
+PACK_MAGIC = b"PAK1"
+PACK_HEADER = "<4sHH"
+PACK_ENTRY = "<28sHHBBII"
+NAME_SIZE = 28
+
+FORMAT_RAW = 0
+FORMAT_RGB332 = 1
+FORMAT_RGB565 = 2
+FORMAT_MONO = 3
+
+FORMATS = {
+    "raw": FORMAT_RAW,
+    "rgb332": FORMAT_RGB332,
+    "rgb565": FORMAT_RGB565,
+    "mono": FORMAT_MONO,
+}
+
+_LINE_BYTES = 72  # characters of escaped data per line of a generated module
+
+
+def encode_mono(file_obj, threshold=128):
+    """
+    Convert an image to a 1-bit bitmap for Draw.image_bytearray_1bit.
+
+    Pixels at least as bright as threshold are set. Bits are MSB first and
+    every row is padded to a whole byte.
+
+    Returns:
+        (width, height, bytes)
+    """
+    image = Image.open(file_obj)
+    if image.mode in ("RGBA", "LA", "P"):
+        # transparent pixels are off
+        rgba = image.convert("RGBA")
+        background = Image.new("RGBA", rgba.size, (0, 0, 0, 255))
+        image = Image.alpha_composite(background, rgba)
+    gray = image.convert("L").point(lambda value: 255 if value >= threshold else 0)
+    return gray.width, gray.height, gray.convert("1").tobytes()
+
+
+def image_entry(path, fmt=FORMAT_RGB332, dither=DITHER_NONE):
+    """
+    Convert one image file to pack data.
+
+    Returns:
+        (width, height, bytes)
+    """
+    if fmt == FORMAT_MONO:
+        return encode_mono(path)
+    with Image.open(path) as image:
+        width, height = image.size
+    if fmt == FORMAT_RGB565:
+        return width, height, convert_image(path, 16, dither)
+    if fmt == FORMAT_RGB332:
+        return width, height, convert_image(path, 8, dither)
+    raise ValueError(f"{path}: images cannot be stored as raw entries")
+
+
+def build_pack(entries):
+    """
+    Build a pack from (name, width, height, format, data) tuples.
+
+    Returns:
+        The pack as bytes.
+    """
+    names = set()
+    index = bytearray()
+    data = bytearray()
+    offset = struct.calcsize(PACK_HEADER) + len(entries) * struct.calcsize(PACK_ENTRY)
+    offset = (offset + 3) & ~3
+    for name, width, height, fmt, blob in entries:
+        encoded = name.encode("utf-8")
+        if not encoded or len(encoded) > NAME_SIZE:
+            raise ValueError(f"asset name must be 1-{NAME_SIZE} bytes: {name!r}")
+        if name in names:
+            raise ValueError(f"duplicate asset name: {name!r}")
+        names.add(name)
+        padding = (-len(data)) & 3
+        data.extend(b"\x00" * padding)
+        index.extend(
+            struct.pack(
+                PACK_ENTRY,
+                encoded,
+                width,
+                height,
+                fmt,
+                0,
+                offset + len(data),
+                len(blob),
+            )
+        )
+        data.extend(blob)
+    header = struct.pack(PACK_HEADER, PACK_MAGIC, len(entries), 0)
+    gap = b"\x00" * ((-(len(header) + len(index))) & 3)
+    return bytes(header + index + gap + data)
+
+
+def read_pack(pack):
+    """
+    Decode a pack into a list of (name, width, height, format, data) tuples.
+
+    Raises:
+        ValueError: If the data is not an asset pack.
+    """
+    magic, count, _ = struct.unpack_from(PACK_HEADER, pack)
+    if magic != PACK_MAGIC:
+        raise ValueError("not an asset pack")
+    entries = []
+    position = struct.calcsize(PACK_HEADER)
+    for _ in range(count):
+        name, width, height, fmt, _, offset, size = struct.unpack_from(
+            PACK_ENTRY, pack, position
+        )
+        position += struct.calcsize(PACK_ENTRY)
+        name = name.rstrip(b"\x00").decode("utf-8")
+        entries.append((name, width, height, fmt, bytes(pack[offset : offset + size])))
+    return entries
+
+
+def _escape(value):
+    """Return one byte as it appears inside a double-quoted bytes literal."""
+    if 0x20 <= value < 0x7F and value not in (0x22, 0x5C):
+        return chr(value)
+    return f"\\x{value:02x}"
+
+
+def pack_to_python(pack, bind=False):
+    """
+    Return the source of a module holding the pack as a bytes literal.
+
+    A frozen module keeps the literal in flash and a .mpy loads it as one
+    object, instead of building it from a list of integers at import.
+    With bind=True the module also opens the pack as ASSETS and binds each
+    entry (a zero-copy memoryview) to a module name, so entry names must be
+    Python identifiers.
+    """
+    lines = ["# Generated by tools/pngpack.py; edit the images and regenerate."]
+    if bind:
+        lines.append("from picoware.system.asset_pack import AssetPack")
+        lines.append("")
+    lines.append("PACK = (")
+    chunk = ""
+    for value in pack:
+        chunk += _escape(value)
+        if len(chunk) >= _LINE_BYTES:
+            lines.append(f'    b"{chunk}"')
+            chunk = ""
+    if chunk:
+        lines.append(f'    b"{chunk}"')
+    lines.append(")")
+    if bind:
+        lines.append("")
+        lines.append("ASSETS = AssetPack(PACK)")
+        for name, *_ in read_pack(pack):
+            if not name.isidentifier():
+                raise ValueError(f"cannot bind {name!r}: not an identifier")
+            lines.append(f'{name} = ASSETS.get("{name}")')
+    return "\n".join(lines) + "\n"
+
+
+def python_to_pack(text):
+    """Return the PACK bytes of a module written by pack_to_python()."""
+    for node in ast.parse(text).body:
+        if isinstance(node, ast.Assign) and any(
+            isinstance(target, ast.Name) and target.id == "PACK"
+            for target in node.targets
+        ):
+            return ast.literal_eval(node.value)
+    raise ValueError("no PACK assignment found")
+
+
+def entry_to_png(entry, save_path):
+    """Save an image entry as a PNG (the inverse of image_entry())."""
+    _, width, height, fmt, data = entry
+    if fmt == FORMAT_MONO:
+        image = Image.frombytes("1", (width, height), data)
+    elif fmt == FORMAT_RGB332:
+        rgb = bytearray()
+        for value in data:
+            r, g, b = value >> 5, (value >> 2) & 7, value & 3
+            rgb += bytes(((r * 255 + 3) // 7, (g * 255 + 3) // 7, b * 85))
+        image = Image.frombytes("RGB", (width, height), bytes(rgb))
+    elif fmt == FORMAT_RGB565:
+        rgb = bytearray()
+        for (value,) in struct.iter_unpack(">H", data):
+            r, g, b = value >> 11, (value >> 5) & 63, value & 31
+            rgb += bytes(
+                ((r * 255 + 15) // 31, (g * 255 + 31) // 63, (b * 255 + 15) // 31)
+            )
+        image = Image.frombytes("RGB", (width, height), bytes(rgb))
+    else:
+        raise ValueError("raw entries are not images")
+    image.save(save_path)
+    return save_path
+
+
+def _format_name(filename):
+    """Split "name.mono.png" into ("name", "mono"); plain names give None."""
+    stem = os.path.splitext(filename)[0]
+    base, suffix = os.path.splitext(stem)
+    if suffix[1:] in FORMATS:
+        return base, suffix[1:]
+    return stem, None
+
+
+def _load_pack(path):
+    """Read a .pak file or a generated .py module."""
+    if path.endswith(".py"):
+        with open(path, "r", encoding="utf-8") as f:
+            return python_to_pack(f.read())
+    with open(path, "rb") as f:
+        return f.read()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Pack PNG images into an asset pack for picoware.system.asset_pack",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""Examples:
+  pngpack.py icons/ -o icons.pak   - Pack every PNG in icons/ (RGB332) for the SD card
+  pngpack.py icons/ -o icons.py    - The same pack as a module to freeze or compile to .mpy
+  pngpack.py sprites/ -o assets.py --bind
+                                   - Module that also binds each entry to a name
+  pngpack.py --extract icons.py -o icons/
+                                   - Write the entries of a pack back out as PNGs
+
+The entry name is the file name without its extension. A format suffix
+overrides --format for one file: logo.mono.png, photo.rgb565.png.
+        """,
+    )
+    parser.add_argument("inputs", nargs="+", help="PNG files or folders of PNG files")
+    parser.add_argument("-o", "--output", required=True, help="Output .pak or .py")
+    parser.add_argument(
+        "--format",
+        choices=("rgb332", "rgb565", "mono"),
+        default="rgb332",
+        help="Pixel format of files without a format suffix (default: rgb332)",
+    )
+    parser.add_argument(
+        "--dither",
+        choices=(DITHER_NONE, DITHER_ORDERED, DITHER_FLOYD_STEINBERG),
+        default=DITHER_NONE,
+        help="Dithering: none, ordered (4x4 Bayer) or fs (Floyd-Steinberg)",
+    )
+    parser.add_argument(
+        "--bind",
+        action="store_true",
+        help="With a .py output, bind each entry to a module name",
+    )
+    parser.add_argument(
+        "--extract",
+        action="store_true",
+        help="Read one .pak or generated .py and write its images to the output folder",
+    )
+
+    args = parser.parse_args()
+
+    if args.extract:
+        pack = _load_pack(args.inputs[0])
+        os.makedirs(args.output, exist_ok=True)
+        names = {value: key for key, value in FORMATS.items()}
+        for entry in read_pack(pack):
+            name, fmt = entry[0], entry[3]
+            if fmt == FORMAT_RAW:
+                path = os.path.join(args.output, name + ".bin")
+                with open(path, "wb") as f:
+                    f.write(entry[4])
+            else:
+                suffix = "" if fmt == FORMATS[args.format] else "." + names[fmt]
+                path = entry_to_png(
+                    entry, os.path.join(args.output, name + suffix + ".png")
+                )
+            print(f"Extracted {path}")
+        sys.exit(0)
+
+    files = []
+    for path in args.inputs:
+        if os.path.isdir(path):
+            files.extend(
+                os.path.join(path, f)
+                for f in sorted(os.listdir(path))
+                if f.lower().endswith(".png")
+            )
+        elif path.lower().endswith(".png"):
+            files.append(path)
+        else:
+            print(f"Error: {path} is not a PNG file or folder")
+            sys.exit(1)
+
+    if not files:
+        print("No PNG files found")
+        sys.exit(1)
+
+    entries = []
+    for path in files:
+        name, fmt = _format_name(os.path.basename(path))
+        fmt = FORMATS[fmt or args.format]
+        width, height, data = image_entry(path, fmt, args.dither)
+        entries.append((name, width, height, fmt, data))
+        print(f"{name}: {width}x{height}, {len(data)} bytes")
+
+    pack = build_pack(entries)
+    if args.output.endswith(".py"):
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(pack_to_python(pack, args.bind))
+    else:
+        with open(args.output, "wb") as f:
+            f.write(pack)
+    print(f"Packed {len(entries)} assets into {args.output} ({len(pack)} bytes)")